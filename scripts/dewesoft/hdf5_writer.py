@@ -25,6 +25,15 @@ import h5py
 import numpy as np
 from DWDataReaderHeader import *
 
+try:
+    # Compresses chunks on all cores and builds display overviews while
+    # writing when SpectralEdge is importable
+    from spectral_edge.utils.hdf5_chunks import ParallelChunkWriter
+    from spectral_edge.utils.hdf5_overview import OverviewBuilder
+except ImportError:
+    ParallelChunkWriter = None
+    OverviewBuilder = None
+
 
 def write_hdf5_file_chunked(lib, reader_instance, output_path, channels_info, metadata, chunk_size=100000):
     """
@@ -82,6 +91,8 @@ def write_hdf5_file_chunked(lib, reader_instance, output_path, channels_info, me
     Notes
     -----
     - Uses GZIP compression level 4 for good balance of size/speed
+    - Compresses chunks on all cores and writes each channel's display
+      overview when SpectralEdge is importable
     - Writes data in chunks to minimize memory usage
     - Compatible with SpectralEdge HDF5FlightDataLoader
     - Each channel group contains 'data' and 'time' datasets
@@ -176,24 +187,39 @@ def write_hdf5_file_chunked(lib, reader_instance, output_path, channels_info, me
                 chunk_shape = (min(chunk_size, samples_to_export),)
             
             # Create datasets with compression
-            data_dataset = ch_group.create_dataset(
-                'data',
-                shape=data_shape,
-                dtype='float64',
-                chunks=chunk_shape,
-                compression='gzip',
-                compression_opts=4  # Compression level 4 (good balance)
-            )
-            
-            time_dataset = ch_group.create_dataset(
-                'time',
-                shape=(samples_to_export,),
-                dtype='float64',
-                chunks=(min(chunk_size, samples_to_export),),
-                compression='gzip',
-                compression_opts=4
-            )
+            if ParallelChunkWriter is not None:
+                # Same layout and filters, but chunks are compressed on all cores
+                data_writer = ParallelChunkWriter(
+                    ch_group, 'data', data_shape, dtype='float64',
+                    chunk_samples=chunk_shape[0], compression_opts=4
+                )
+                time_writer = ParallelChunkWriter(
+                    ch_group, 'time', (samples_to_export,), dtype='float64',
+                    chunk_samples=chunk_shape[0], compression_opts=4
+                )
+            else:
+                data_writer = time_writer = None
+                data_dataset = ch_group.create_dataset(
+                    'data',
+                    shape=data_shape,
+                    dtype='float64',
+                    chunks=chunk_shape,
+                    compression='gzip',
+                    compression_opts=4  # Compression level 4 (good balance)
+                )
+
+                time_dataset = ch_group.create_dataset(
+                    'time',
+                    shape=(samples_to_export,),
+                    dtype='float64',
+                    chunks=(min(chunk_size, samples_to_export),),
+                    compression='gzip',
+                    compression_opts=4
+                )
             
+            # Summarize scalar channels for display as the chunks go by
+            overview = OverviewBuilder() if OverviewBuilder is not None and channel.array_size == 1 else None
+
             # Read and write data in chunks
             samples_written = 0
             for chunk_start in range(0, samples_to_export, chunk_size):
@@ -228,8 +254,14 @@ def write_hdf5_file_chunked(lib, reader_instance, output_path, channels_info, me
                     timestamps_array = np.array(timestamps)
                 
                 # Write chunk to HDF5
-                data_dataset[chunk_start:chunk_end] = values_array
-                time_dataset[chunk_start:chunk_end] = timestamps_array
+                if data_writer is not None:
+                    data_writer.write(values_array)
+                    time_writer.write(timestamps_array)
+                else:
+                    data_dataset[chunk_start:chunk_end] = values_array
+                    time_dataset[chunk_start:chunk_end] = timestamps_array
+                if overview is not None:
+                    overview.add(values_array)
                 
                 samples_written += samples_in_chunk
                 
@@ -238,6 +270,12 @@ def write_hdf5_file_chunked(lib, reader_instance, output_path, channels_info, me
                 print(f"\r  Progress: {progress:.1f}% ({samples_written:,}/{samples_to_export:,} samples)", 
                       end='', flush=True)
             
+            if data_writer is not None:
+                data_writer.close()
+                time_writer.close()
+            if overview is not None:
+                overview.write(ch_group)
+
             print()  # New line after progress
         
         print(f"\n✓ HDF5 file written successfully")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Index HDF5 Files with Display Overviews
+=======================================
+
+Writes the min/max/mean overview pyramid beside every channel's ``data``
+dataset so SpectralEdge can display long channels without reading them in
+full. Files written by the HDF5 split converters are already indexed; run
+this once on older files. Channels with a current overview are skipped.
+
+Usage:
+    python scripts/index_hdf5_overviews.py data/flight_test.h5
+    python scripts/index_hdf5_overviews.py data/*.h5 --force
+
+Author: SpectralEdge Development Team
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from spectral_edge.utils.hdf5_overview import DEFAULT_BASE_BUCKET, index_hdf5_file
+
+
+def main():
+    """Index each HDF5 file given on the command line."""
+    parser = argparse.ArgumentParser(
+        description='Write display overview pyramids into SpectralEdge HDF5 files'
+    )
+    parser.add_argument('files', nargs='+', help='HDF5 files to index (modified in place)')
+    parser.add_argument('--force', action='store_true', help='Rewrite overviews that are already current')
+    parser.add_argument(
+        '--base-bucket',
+        type=int,
+        default=DEFAULT_BASE_BUCKET,
+        help=f'Samples per row of the finest overview level (default: {DEFAULT_BASE_BUCKET})',
+    )
+    args = parser.parse_args()
+
+    exit_code = 0
+    for file_path in args.files:
+        try:
+            indexed = index_hdf5_file(file_path, force=args.force, base_bucket=args.base_bucket)
+        except (OSError, ValueError) as exc:
+            print(f"✗ {file_path}: {exc}")
+            exit_code = 1
+            continue
+        print(f"✓ {file_path}: indexed {indexed} channel(s)")
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
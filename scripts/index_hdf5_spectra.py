@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Index HDF5 Files with Segment Spectra
+=====================================
+
+Writes a segment-spectrum index beside every channel's ``data`` dataset so
+batch runs with ``psd_config.use_spectral_index`` can answer Welch and
+maximax PSDs for any event by reading a few index rows instead of the raw
+samples. Use the df, window, FFT sizing and filter overrides of the batch
+configuration the index should serve. Channels with a current index for
+those settings are skipped.
+
+Usage:
+    python scripts/index_hdf5_spectra.py data/flight_test.h5 --df 5
+    python scripts/index_hdf5_spectra.py data/*.h5 --df 2 --maximax-overlap 75 --force
+
+Author: SpectralEdge Development Team
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from spectral_edge.utils.hdf5_spectral_index import index_hdf5_file_spectra
+
+
+def main():
+    """Index each HDF5 file given on the command line."""
+    parser = argparse.ArgumentParser(
+        description='Write segment-spectrum indexes into SpectralEdge HDF5 files'
+    )
+    parser.add_argument('files', nargs='+', help='HDF5 files to index (modified in place)')
+    parser.add_argument('--df', type=float, required=True, help='PSD frequency resolution in Hz')
+    parser.add_argument('--window', default='hann', help='Window function (default: hann)')
+    parser.add_argument('--exact-fft', action='store_true', help='Do not round segments up to a power of 2')
+    parser.add_argument('--highpass', type=float, default=None, help='User highpass override in Hz')
+    parser.add_argument('--lowpass', type=float, default=None, help='User lowpass override in Hz')
+    parser.add_argument(
+        '--maximax-window', type=float, default=1.0,
+        help='Maximax window in seconds for the stored pyramid (default: 1.0)',
+    )
+    parser.add_argument(
+        '--maximax-overlap', type=float, default=50.0,
+        help='Maximax window overlap in percent (default: 50)',
+    )
+    parser.add_argument('--force', action='store_true', help='Rewrite indexes that are already current')
+    args = parser.parse_args()
+
+    exit_code = 0
+    for file_path in args.files:
+        try:
+            indexed = index_hdf5_file_spectra(
+                file_path,
+                args.df,
+                window=args.window,
+                use_efficient_fft=not args.exact_fft,
+                user_highpass=args.highpass,
+                user_lowpass=args.lowpass,
+                maximax_window=args.maximax_window,
+                maximax_overlap_percent=args.maximax_overlap,
+                force=args.force,
+            )
+        except (OSError, ValueError) as exc:
+            print(f"✗ {file_path}: {exc}")
+            exit_code = 1
+            continue
+        print(f"✓ {file_path}: indexed {indexed} channel(s)")
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -61,6 +61,7 @@ class PSDConfig:
     freq_min: float = 20.0
     freq_max: float = 2000.0
     frequency_spacing: str = "constant_bandwidth"  # constant_bandwidth or fractional octaves
+    use_spectral_index: bool = False  # answer HDF5 events from stored segment-spectrum indexes
 
     def __post_init__(self):
         """Normalize legacy frequency spacing values."""
@@ -189,6 +190,10 @@ class SpectrogramConfig:
     freq_min: float = 20.0
     freq_max: float = 2000.0
     colormap: str = "viridis"
+    crop_to_band: bool = True  # keep only freq_min..freq_max in stored results
+    max_time_columns: Optional[int] = 2000  # pool time bins down to this count (None = keep all)
+    time_pooling: str = "max"  # max or mean
+    storage: str = "float64"  # float64, float32 or db_uint8 (quantized dB)
     
     def validate(self):
         """
@@ -211,6 +216,15 @@ class SpectrogramConfig:
         if self.freq_min >= self.freq_max:
             raise ValueError("freq_min must be less than freq_max")
 
+        if self.max_time_columns is not None and self.max_time_columns < 2:
+            raise ValueError(f"Invalid max_time_columns: {self.max_time_columns}")
+
+        if self.time_pooling not in ["max", "mean"]:
+            raise ValueError(f"Invalid time_pooling: {self.time_pooling}")
+
+        if self.storage not in ["float64", "float32", "db_uint8"]:
+            raise ValueError(f"Invalid storage: {self.storage}")
+
 
 @dataclass
 class DisplayConfig:
@@ -55,7 +55,7 @@ def export_to_csv(
         created_files = []
 
         # Reorganize results by event
-        from spectral_edge.batch.output_psd import apply_frequency_spacing
+        from spectral_edge.batch.output_psd import resolve_output_spectrum
 
         events_data = {}
         for (flight_key, channel_key), event_dict in result.channel_results.items():
@@ -63,9 +63,11 @@ def export_to_csv(
                 if event_name not in events_data:
                     events_data[event_name] = {}
                 channel_id = f"{flight_key}_{channel_key}"
-                frequencies_out, psd_out = apply_frequency_spacing(
-                    event_result['frequencies'],
-                    event_result['psd'],
+                frequencies_out, psd_out = resolve_output_spectrum(
+                    result,
+                    flight_key,
+                    channel_key,
+                    event_name,
                     config.psd_config
                 )
                 events_data[event_name][channel_id] = {
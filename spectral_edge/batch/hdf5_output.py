@@ -87,13 +87,15 @@ def write_psds_to_hdf5(
     try:
         with h5py.File(source_file, 'a') as hdf_file:
             # Reorganize results by flight and event
-            from spectral_edge.batch.output_psd import apply_frequency_spacing
+            from spectral_edge.batch.output_psd import resolve_output_spectrum
 
             for (flight_key, channel_key), event_dict in result.channel_results.items():
                 for event_name, event_result in event_dict.items():
-                    frequencies_out, psd_out = apply_frequency_spacing(
-                        event_result['frequencies'],
-                        event_result['psd'],
+                    frequencies_out, psd_out = resolve_output_spectrum(
+                        result,
+                        flight_key,
+                        channel_key,
+                        event_name,
                         config.psd_config
                     )
                     _write_channel_psd_to_event(
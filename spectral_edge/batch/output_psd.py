@@ -4,7 +4,7 @@ PSD Output Utilities
 Helpers for applying display spacing to PSD outputs.
 """
 
-from typing import Tuple
+from typing import Hashable, Tuple
 import logging
 import numpy as np
 
@@ -90,3 +90,63 @@ def apply_frequency_spacing(
         if not np.any(mask):
             return np.array([], dtype=frequencies_arr.dtype), np.array([], dtype=psd_arr.dtype)
         return frequencies_arr[mask], psd_arr[mask]
+
+
+def frequency_spacing_key(psd_config) -> Tuple[Hashable, ...]:
+    """
+    Build a hashable key for the settings that affect ``apply_frequency_spacing``.
+
+    Parameters
+    ----------
+    psd_config : PSDConfig
+        PSD configuration with spacing settings.
+
+    Returns
+    -------
+    Tuple
+        (frequency_spacing, freq_min, freq_max)
+    """
+    return (
+        getattr(psd_config, "frequency_spacing", "constant_bandwidth"),
+        getattr(psd_config, "freq_min", None),
+        getattr(psd_config, "freq_max", None),
+    )
+
+
+def resolve_output_spectrum(
+    result,
+    flight_key: str,
+    channel_key: str,
+    event_name: str,
+    psd_config
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the spaced output spectrum for one channel/event result.
+
+    Uses the memoized ``BatchProcessingResult.get_output_spectrum`` when the
+    result container provides it, so every writer shares one conversion.
+    Plain result containers fall back to ``apply_frequency_spacing``.
+
+    Parameters
+    ----------
+    result : BatchProcessingResult
+        Result container holding ``channel_results``.
+    flight_key : str
+        Flight identifier.
+    channel_key : str
+        Channel identifier.
+    event_name : str
+        Event name (or 'full_duration').
+    psd_config : PSDConfig
+        PSD configuration with spacing settings.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        (frequencies_out, psd_out)
+    """
+    get_output_spectrum = getattr(result, "get_output_spectrum", None)
+    if callable(get_output_spectrum):
+        return get_output_spectrum(flight_key, channel_key, event_name, psd_config)
+    event_result = result.channel_results[(flight_key, channel_key)][event_name]
+    return apply_frequency_spacing(event_result['frequencies'], event_result['psd'], psd_config)
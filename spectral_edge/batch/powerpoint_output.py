@@ -27,13 +27,20 @@ from spectral_edge.utils.plot_theme import (
     LINE_COLOR,
     get_watermark_text,
 )
-from spectral_edge.batch.output_psd import apply_frequency_spacing
-from spectral_edge.batch.spectrogram_generator import generate_spectrogram
-from spectral_edge.batch.statistics import compute_statistics, plot_pdf, plot_running_stat
+from spectral_edge.batch.output_psd import apply_frequency_spacing, resolve_output_spectrum
+from spectral_edge.batch.spectrogram_generator import generate_spectrogram, spectrogram_to_db
+from spectral_edge.batch.statistics import (
+    compute_channel_statistics,
+    compute_statistics,
+    plot_pdf,
+    plot_running_stat,
+)
 from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+from spectral_edge.utils.hdf5_catalog import build_flight_file_map
 from spectral_edge.batch.csv_loader import load_csv_files
 from spectral_edge.utils.signal_conditioning import apply_processing_pipeline, build_processing_note
 from spectral_edge.utils.reference_curves import prepare_reference_curves_for_plot, REFERENCE_CURVE_COLOR_PALETTE
+from spectral_edge.utils.time_history_lod import minmax_decimate
 
 from spectral_edge.batch.output_utils import sanitize_filename_component as _sanitize_filename_component
 
@@ -93,9 +100,20 @@ def generate_powerpoint_report(
 
         events = _get_event_definitions(config)
 
+        # Statistics of HDF5 channels stream from the files in padded,
+        # conditioned blocks rather than from event signals held in memory
+        stream_stats = include_stats and config.source_type == "hdf5"
+        stats_flight_map = _build_flight_to_file_map(config.source_files) if stream_stats else {}
+        stats_loaders = {}
+        stats_conditioning = {
+            "filter_settings": conditioning_filter_settings,
+            "remove_mean": False,
+            "mean_window_seconds": 1.0,
+        }
+
         # Only fall back to re-loading raw data when the processor didn't
         # cache conditioned signals (e.g. results from an older run).
-        _needs_time_data = include_time or include_stats or include_spec
+        _needs_time_data = include_time or include_spec or (include_stats and not stream_stats)
         time_history_cache = None  # lazy-loaded below only when needed
 
         for event_name, start_time, end_time in events:
@@ -170,6 +188,9 @@ def generate_powerpoint_report(
                         plot_title=f"PSD: {plot_channel_title}",
                         layout=layout,
                         slot_role=psd_role,
+                        output_spectrum=resolve_output_spectrum(
+                            results, flight_key, channel_key, event_name, config.psd_config
+                        ),
                     )
 
                 # Time history plot
@@ -258,8 +279,15 @@ def generate_powerpoint_report(
                         report_gen.add_single_plot_slide(time_image, slide_title)
 
                 # Statistics slide
-                if include_stats and time_full_slice is not None and conditioned_signal_full_slice is not None and len(time_full_slice) > 0:
+                stats = None
+                if stream_stats:
+                    stats = _stream_channel_statistics(
+                        stats_loaders, stats_flight_map, flight_key, channel_key,
+                        start_time, end_time, config, stats_conditioning,
+                    )
+                elif include_stats and time_full_slice is not None and conditioned_signal_full_slice is not None and len(time_full_slice) > 0:
                     stats = compute_statistics(conditioned_signal_full_slice, sample_rate, config.statistics_config)
+                if stats is not None:
                     pdf_fig, _ = plot_pdf(stats['pdf'], config.statistics_config)
                     pdf_bytes = _fig_to_bytes(pdf_fig)
 
@@ -285,6 +313,9 @@ def generate_powerpoint_report(
                         summary
                     )
 
+        for loader in stats_loaders.values():
+            loader.close()
+
         if config.powerpoint_config.include_rms_table:
             _add_rms_summary_slides(report_gen, results, config)
 
@@ -500,16 +531,36 @@ def _event_bounds(events: List[Tuple[str, Optional[float], Optional[float]]]) ->
 
 
 def _build_flight_to_file_map(source_files: List[str]) -> Dict[str, str]:
-    mapping = {}
-    for file_path in source_files:
-        try:
-            loader = HDF5FlightDataLoader(file_path)
-            for flight_key in loader.flights.keys():
-                mapping[flight_key] = file_path
-            loader.close()
-        except Exception as exc:
-            logger.warning(f"Failed to read HDF5 metadata from {file_path}: {exc}")
-    return mapping
+    return build_flight_file_map(source_files)
+
+
+def _stream_channel_statistics(loaders, flight_map, flight_key, channel_key,
+                               start_time, end_time, config: 'BatchConfig', conditioning):
+    """
+    Statistics of one channel event streamed from its HDF5 file.
+
+    Loaders are opened on first use and kept in ``loaders`` for the caller
+    to close. Returns None when the flight's file is unknown or the channel
+    cannot be read.
+    """
+    file_path = flight_map.get(flight_key)
+    if not file_path:
+        return None
+    try:
+        if file_path not in loaders:
+            loaders[file_path] = HDF5FlightDataLoader(file_path)
+        return compute_channel_statistics(
+            loaders[file_path],
+            flight_key,
+            channel_key,
+            config.statistics_config,
+            start_time=start_time,
+            end_time=end_time,
+            conditioning=conditioning,
+        )
+    except Exception as exc:
+        logger.warning(f"Statistics failed for {flight_key}/{channel_key}: {exc}")
+        return None
 
 
 def _load_time_history_cache(results, config: 'BatchConfig', events):
@@ -583,10 +634,7 @@ def _slice_event_signal(time_array, signal_array, start_time, end_time):
 def _decimate_time_series(time_array, signal_array, max_points: int = 10000):
     if time_array is None or signal_array is None:
         return time_array, signal_array
-    if len(time_array) <= max_points:
-        return time_array, signal_array
-    step = max(1, len(time_array) // max_points)
-    return time_array[::step], signal_array[::step]
+    return minmax_decimate(time_array, signal_array, max_points)
 
 
 def _fig_to_bytes(fig) -> bytes:
@@ -623,10 +671,14 @@ def _create_psd_plot(
     plot_title: str,
     layout: str,
     slot_role: str = "single",
+    output_spectrum: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> bytes:
-    frequencies = event_result['frequencies']
-    psd_values = event_result['psd']
-    frequencies, psd_values = apply_frequency_spacing(frequencies, psd_values, config.psd_config)
+    if output_spectrum is not None:
+        frequencies, psd_values = output_spectrum
+    else:
+        frequencies, psd_values = apply_frequency_spacing(
+            event_result['frequencies'], event_result['psd'], config.psd_config
+        )
     if len(frequencies) == 0 or len(psd_values) == 0:
         frequencies = np.array([max(0.1, float(config.psd_config.freq_min))], dtype=float)
         psd_values = np.array([1e-12], dtype=float)
@@ -689,9 +741,7 @@ def _create_spectrogram_plot(
 
     frequencies = spectrogram_data['frequencies']
     times = spectrogram_data['times']
-    Sxx = spectrogram_data['Sxx']
-
-    Sxx_db = 10 * np.log10(Sxx + 1e-12)
+    Sxx_db = spectrogram_to_db(spectrogram_data)
 
     if Sxx_db.shape == (len(frequencies), len(times)):
         plot_data = Sxx_db
@@ -18,8 +18,12 @@ from datetime import datetime
 from spectral_edge.core.psd import (
     calculate_psd_welch, calculate_psd_maximax, calculate_rms_from_psd
 )
-from spectral_edge.batch.spectrogram_generator import generate_spectrogram
+from spectral_edge.batch.spectrogram_generator import compact_spectrogram, generate_spectrogram
+from spectral_edge.batch.shared_stft import compute_psd_and_spectrogram
+from spectral_edge.batch.output_psd import apply_frequency_spacing, frequency_spacing_key
 from ..utils.hdf5_loader import HDF5FlightDataLoader
+from ..utils.hdf5_catalog import build_flight_file_map, get_default_catalog
+from ..utils.hdf5_spectral_index import get_channel_spectral_index, maximax_geometry, segment_length
 from ..utils.signal_conditioning import apply_robust_filtering
 from .config import BatchConfig, EventDefinition
 from .progress_tracker import ProgressTracker, ProgressInfo
@@ -30,6 +34,9 @@ from .error_handler import ErrorHandler, BatchError, log_error_with_recovery
 # Get module logger - configuration should be done at application entry point
 logger = logging.getLogger(__name__)
 
+# Maximax averaging window (seconds) for batch PSDs
+MAXIMAX_WINDOW_SECONDS = 1.0
+
 
 class SpectrogramResult(TypedDict):
     """Spectrogram arrays produced by generate_spectrogram."""
@@ -37,6 +44,9 @@ class SpectrogramResult(TypedDict):
     frequencies: np.ndarray  # 1-D, frequency bins in Hz
     times: np.ndarray        # 1-D, time bins in seconds
     Sxx: np.ndarray          # 2-D (frequencies x times), spectral power
+    storage: NotRequired[str]      # "db_uint8" when Sxx holds quantized dB codes
+    db_offset: NotRequired[float]  # dB value of code 0 (quantized storage)
+    db_scale: NotRequired[float]   # dB per code step (quantized storage)
 
 
 class PSDResultMetadata(TypedDict, total=False):
@@ -66,6 +76,7 @@ class PSDResultMetadata(TypedDict, total=False):
     event_end_time: Optional[float]
     timestamp: str                   # ISO-8601
     spectrogram_generated: bool
+    from_spectral_index: bool        # answered from a stored spectral index
 
 
 class PSDEventResult(TypedDict, total=False):
@@ -90,6 +101,8 @@ class BatchProcessingResult:
         self.processing_log = []  # Detailed processing log
         self.start_time = None
         self.end_time = None
+        # Spaced output spectra keyed by (flight, channel, event, spacing key)
+        self._output_spectra: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = {}
         
     def add_psd_result(
         self,
@@ -142,6 +155,65 @@ class BatchProcessingResult:
             result_entry['conditioned_time'] = conditioned_time
             result_entry['conditioned_signal'] = conditioned_signal
         self.channel_results[channel_id][event_name] = result_entry
+
+        # Drop any spaced spectra derived from a previous result for this event
+        stale_keys = [
+            key for key in self._output_spectra
+            if key[:3] == (flight_key, channel_key, event_name)
+        ]
+        for key in stale_keys:
+            del self._output_spectra[key]
+
+    def get_output_spectrum(
+        self,
+        flight_key: str,
+        channel_key: str,
+        event_name: str,
+        psd_config
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the output (spacing-converted) spectrum for one channel/event.
+
+        The conversion runs once per (channel, event, spacing config) and the
+        result is shared by every writer (Excel, CSV, HDF5, PowerPoint). The
+        returned arrays are read-only because they are shared.
+
+        Parameters:
+        -----------
+        flight_key : str
+            Flight identifier
+        channel_key : str
+            Channel identifier
+        event_name : str
+            Event name (or 'full_duration')
+        psd_config : PSDConfig
+            PSD configuration with spacing settings
+
+        Returns:
+        --------
+        frequencies : np.ndarray
+            Output frequency array in Hz
+        psd : np.ndarray
+            Output PSD values
+        """
+        key = (flight_key, channel_key, event_name, frequency_spacing_key(psd_config))
+        cached = self._output_spectra.get(key)
+        if cached is not None:
+            return cached
+
+        event_result = self.channel_results[(flight_key, channel_key)][event_name]
+        frequencies_out, psd_out = apply_frequency_spacing(
+            event_result['frequencies'],
+            event_result['psd'],
+            psd_config
+        )
+        # Copy so locking the shared arrays never touches the narrowband result
+        frequencies_out = np.array(frequencies_out)
+        psd_out = np.array(psd_out)
+        frequencies_out.flags.writeable = False
+        psd_out.flags.writeable = False
+        self._output_spectra[key] = (frequencies_out, psd_out)
+        return frequencies_out, psd_out
     
     def add_error(self, message: str):
         """Add an error message to the log."""
@@ -305,7 +377,7 @@ class BatchProcessor:
 
             # Open HDF5 file
             try:
-                loader = HDF5FlightDataLoader(file_path)
+                loader = HDF5FlightDataLoader(file_path, catalog=get_default_catalog())
                 self.hdf5_loaders[file_path] = loader
                 self.result.add_log_entry(f"Opened HDF5 file: {Path(file_path).name} ({len(file_channels)} channels)")
             except FileNotFoundError:
@@ -383,7 +455,8 @@ class BatchProcessor:
         """
         Get or build the flight-to-file mapping.
 
-        This mapping is cached to avoid re-opening HDF5 files multiple times.
+        This mapping is cached for the run, and file metadata comes from the
+        persistent HDF5 catalog so unchanged files are not re-walked.
 
         Returns:
         --------
@@ -393,17 +466,7 @@ class BatchProcessor:
         if self._flight_to_file_cache is not None:
             return self._flight_to_file_cache
 
-        # Build the mapping by reading metadata from each file
-        flight_to_file = {}
-        for file_path in self.config.source_files:
-            try:
-                loader = HDF5FlightDataLoader(file_path)
-                for flight_key in loader.flights.keys():
-                    flight_to_file[flight_key] = file_path
-                loader.close()
-            except Exception as e:
-                logger.warning(f"Could not read metadata from {file_path}: {e}")
-                continue
+        flight_to_file = build_flight_file_map(self.config.source_files)
 
         self._flight_to_file_cache = flight_to_file
         return flight_to_file
@@ -465,6 +528,13 @@ class BatchProcessor:
         if self.cancel_requested:
             raise InterruptedError("Processing cancelled by user")
 
+        # Answer what a stored spectral index can before reading raw samples
+        indexed_events = self._process_events_from_spectral_index(loader, flight_key, channel_key, units)
+        include_full_duration = self._include_full_duration() and "full_duration" not in indexed_events
+        pending_events = [event for event in self.config.events if event.name not in indexed_events]
+        if not include_full_duration and not pending_events:
+            return
+
         # Calculate time bounds to optimize data loading
         # Only load the data range needed for all events (with small buffer)
         event_min_time, event_max_time = self._get_event_time_bounds()
@@ -498,7 +568,7 @@ class BatchProcessor:
         )
 
         # Process full duration if requested
-        if self._include_full_duration():
+        if include_full_duration:
             self._process_event(
                 flight_key, channel_key, "full_duration",
                 time_array, signal_array, sample_rate, units,
@@ -506,7 +576,7 @@ class BatchProcessor:
             )
 
         # Process each event
-        for event in self.config.events:
+        for event in pending_events:
             try:
                 self._process_event(
                     flight_key, channel_key, event.name,
@@ -521,6 +591,102 @@ class BatchProcessor:
         # Explicitly delete large arrays to free memory immediately
         del time_array, signal_array, data
 
+    def _process_events_from_spectral_index(
+        self,
+        loader: HDF5FlightDataLoader,
+        flight_key: str,
+        channel_key: str,
+        units: str,
+    ) -> set:
+        """
+        Compute event PSDs from a stored spectral index instead of raw samples.
+
+        Used only when ``psd_config.use_spectral_index`` is set, no
+        spectrogram is requested and the channel carries a current index for
+        the PSD settings (see ``spectral_edge.utils.hdf5_spectral_index``).
+        Index results are segment-aligned, and the channel was conditioned as
+        a whole when indexed, so they approximate the raw calculation.
+
+        Parameters:
+        -----------
+        loader : HDF5FlightDataLoader
+            Loader holding the channel's file
+        flight_key : str
+            Flight identifier
+        channel_key : str
+            Channel identifier
+        units : str
+            Signal units
+
+        Returns:
+        --------
+        set
+            Names of the events answered; the rest need the raw path
+        """
+        pc = self.config.psd_config
+        if not getattr(pc, "use_spectral_index", False) or self.config.spectrogram_config.enabled:
+            return set()
+
+        channel_group = loader.h5file[loader.channels[flight_key][channel_key].full_path]
+        _first, n_samples, sample_rate = loader.get_sample_range(flight_key, channel_key)
+        user_highpass, user_lowpass = self._resolve_user_filter_overrides()
+        nperseg = segment_length(sample_rate, pc.desired_df, pc.use_efficient_fft)
+        index = get_channel_spectral_index(
+            channel_group, nperseg, nperseg // 2, pc.window, user_highpass, user_lowpass
+        )
+        if index is None:
+            self.result.add_log_entry("  No current spectral index for these PSD settings; reading raw samples")
+            return set()
+
+        events = [("full_duration", None, None)] if self._include_full_duration() else []
+        events += [(event.name, event.start_time, event.end_time) for event in self.config.events]
+        time_dataset = channel_group['time']
+        data_start, data_end = float(time_dataset[0]), float(time_dataset[-1])
+        answered = set()
+        for event_name, start_time, end_time in events:
+            if self.cancel_requested:
+                raise InterruptedError("Processing cancelled by user")
+            if self.progress_tracker:
+                self.progress_tracker.update_event(event_name)
+            try:
+                if start_time is not None and end_time is not None:
+                    # get_sample_range clamps to the data, so check the range
+                    # exactly as the raw path does; rejected events fall
+                    # through to it and report the same error
+                    self._validate_event_range(start_time, end_time, data_start, data_end, sample_rate)
+                start_idx, end_idx, _rate = loader.get_sample_range(flight_key, channel_key, start_time, end_time)
+                if end_time is not None:
+                    # Event ranges include the sample at end_time
+                    end_idx = min(n_samples, end_idx + 1)
+                if pc.method == "maximax":
+                    window_samples, step_samples = maximax_geometry(
+                        sample_rate, MAXIMAX_WINDOW_SECONDS, pc.overlap_percent
+                    )
+                    psd = index.maximax(start_idx, end_idx, window_samples, step_samples)
+                else:
+                    psd = index.welch(start_idx, end_idx)
+            except ValueError as e:
+                logger.debug(f"    Spectral index cannot answer '{event_name}': {e}")
+                continue
+
+            frequencies = index.frequencies
+            rms = calculate_rms_from_psd(frequencies, psd)
+            metadata = self._result_metadata(
+                sample_rate, units, rms, float(frequencies[1] - frequencies[0]),
+                (user_highpass, user_lowpass), (index.applied_highpass, index.applied_lowpass), [],
+                start_time, end_time, from_spectral_index=True,
+            )
+            self.result.add_psd_result(flight_key, channel_key, event_name, frequencies, psd, metadata)
+            self.result.add_log_entry(
+                f"  Event '{event_name}': RMS = {rms:.4f} {units} (from spectral index)"
+            )
+            answered.add(event_name)
+
+        self.result.add_log_entry(
+            f"  Spectral index answered {len(answered)} of {len(events)} event(s) without raw reads"
+        )
+        return answered
+
     def _close_hdf5_loaders(self):
         """Close all HDF5 file loaders to free memory and file handles."""
         for file_path, loader in self.hdf5_loaders.items():
@@ -598,6 +764,22 @@ class BatchProcessor:
                     f"Skipped event '{event.name}' for {flight_key}/{channel_key}: {str(e)}"
                 )
     
+    @staticmethod
+    def _validate_event_range(start_time: float, end_time: float,
+                              data_start: float, data_end: float, sample_rate: float):
+        """
+        Reject events that do not lie within the channel's data.
+
+        A tolerance of one sample period accommodates sample-alignment
+        offsets from optimized loading.
+        """
+        sample_period = 1.0 / sample_rate if sample_rate > 0 else 0.0
+        if start_time < data_start - sample_period or end_time > data_end + sample_period:
+            raise ValueError(
+                f"Event time range [{start_time}, {end_time}] outside data range "
+                f"[{data_start:.2f}, {data_end:.2f}]"
+            )
+
     def _process_event(self, flight_key: str, channel_key: str, event_name: str,
                       time_array: np.ndarray, signal_array: np.ndarray,
                       sample_rate: float, units: str,
@@ -640,15 +822,8 @@ class BatchProcessor:
 
         # Extract event data
         if start_time is not None and end_time is not None:
-            # Validate time range (allow tolerance of one sample period to
-            # accommodate sample-alignment offsets from optimized loading)
-            sample_period = 1.0 / sample_rate if sample_rate > 0 else 0.0
-            if start_time < time_array[0] - sample_period or end_time > time_array[-1] + sample_period:
-                raise ValueError(
-                    f"Event time range [{start_time}, {end_time}] outside data range "
-                    f"[{time_array[0]:.2f}, {time_array[-1]:.2f}]"
-                )
-            
+            self._validate_event_range(start_time, end_time, time_array[0], time_array[-1], sample_rate)
+
             # Extract event segment
             mask = (time_array >= start_time) & (time_array <= end_time)
             event_time = time_array[mask]
@@ -685,9 +860,21 @@ class BatchProcessor:
         if self.cancel_requested:
             raise InterruptedError("Processing cancelled by user")
 
-        # Calculate PSD
+        # Calculate PSD (sharing segment FFTs with the spectrogram when possible)
         psd_start = time.perf_counter()
-        frequencies, psd = self._calculate_psd(event_signal, sample_rate)
+        shared_spectra = None
+        if self.config.spectrogram_config.enabled:
+            shared_spectra = compute_psd_and_spectrogram(
+                event_signal,
+                sample_rate,
+                self.config.psd_config,
+                self.config.spectrogram_config,
+            )
+        if shared_spectra is not None:
+            frequencies, psd, shared_spectrogram = shared_spectra
+            logger.debug("    PSD and spectrogram computed from a shared STFT")
+        else:
+            frequencies, psd = self._calculate_psd(event_signal, sample_rate)
         psd_time = time.perf_counter() - psd_start
         logger.debug(f"    PSD calculated in {psd_time:.3f}s ({len(event_signal)} samples)")
         actual_df_hz = float(frequencies[1] - frequencies[0]) if len(frequencies) > 1 else None
@@ -701,7 +888,10 @@ class BatchProcessor:
 
         # Generate spectrogram if enabled
         spectrogram_data: Optional[SpectrogramResult] = None
-        if self.config.spectrogram_config.enabled:
+        if shared_spectra is not None:
+            spec_frequencies, spec_times, Sxx = shared_spectrogram
+            spectrogram_data = self._compact_spectrogram(spec_frequencies, spec_times, Sxx)
+        elif self.config.spectrogram_config.enabled:
             try:
                 spec_start = time.perf_counter()
                 spec_frequencies, spec_times, Sxx = generate_spectrogram(
@@ -714,39 +904,18 @@ class BatchProcessor:
                 )
                 spec_time = time.perf_counter() - spec_start
                 logger.debug(f"    Spectrogram generated in {spec_time:.3f}s")
-                spectrogram_data = SpectrogramResult(
-                    frequencies=spec_frequencies,
-                    times=spec_times,
-                    Sxx=Sxx,
-                )
+                spectrogram_data = self._compact_spectrogram(spec_frequencies, spec_times, Sxx)
             except Exception as e:
                 self.result.add_warning(
                     f"Failed to generate spectrogram for {flight_key}/{channel_key}/{event_name}: {str(e)}"
                 )
         
         # Store result
-        metadata: PSDResultMetadata = {
-            'sample_rate': sample_rate,
-            'units': units,
-            'rms': rms,
-            'method': self.config.psd_config.method,
-            'window': self.config.psd_config.window,
-            'overlap_percent': self.config.psd_config.overlap_percent,
-            'frequency_spacing': self.config.psd_config.frequency_spacing,
-            'requested_df_hz': float(self.config.psd_config.desired_df),
-            'actual_df_hz': actual_df_hz,
-            'filter_applied': True,
-            'user_filter_enabled': bool(self.config.filter_config.enabled),
-            'user_highpass_hz': user_highpass,
-            'user_lowpass_hz': user_lowpass,
-            'applied_highpass_hz': applied_highpass,
-            'applied_lowpass_hz': applied_lowpass,
-            'filter_messages': list(filter_messages),
-            'event_start_time': start_time,
-            'event_end_time': end_time,
-            'timestamp': datetime.now().isoformat(),
-            'spectrogram_generated': spectrogram_data is not None
-        }
+        metadata = self._result_metadata(
+            sample_rate, units, rms, actual_df_hz,
+            (user_highpass, user_lowpass), (applied_highpass, applied_lowpass), filter_messages,
+            start_time, end_time, spectrogram_generated=spectrogram_data is not None,
+        )
         
         self.result.add_psd_result(
             flight_key, channel_key, event_name,
@@ -760,6 +929,108 @@ class BatchProcessor:
             f"  Event '{event_name}': RMS = {rms:.4f} {units} (processed in {event_total_time:.2f}s)"
         )
     
+    def _result_metadata(
+        self,
+        sample_rate: float,
+        units: str,
+        rms: float,
+        actual_df_hz: Optional[float],
+        user_filters: Tuple[Optional[float], Optional[float]],
+        applied_filters: Tuple[float, float],
+        filter_messages: List[str],
+        start_time: Optional[float],
+        end_time: Optional[float],
+        spectrogram_generated: bool = False,
+        from_spectral_index: bool = False,
+    ) -> PSDResultMetadata:
+        """Build the metadata stored with one PSD result."""
+        pc = self.config.psd_config
+        return {
+            'sample_rate': sample_rate,
+            'units': units,
+            'rms': rms,
+            'method': pc.method,
+            'window': pc.window,
+            'overlap_percent': pc.overlap_percent,
+            'frequency_spacing': pc.frequency_spacing,
+            'requested_df_hz': float(pc.desired_df),
+            'actual_df_hz': actual_df_hz,
+            'filter_applied': True,
+            'user_filter_enabled': bool(self.config.filter_config.enabled),
+            'user_highpass_hz': user_filters[0],
+            'user_lowpass_hz': user_filters[1],
+            'applied_highpass_hz': applied_filters[0],
+            'applied_lowpass_hz': applied_filters[1],
+            'filter_messages': list(filter_messages),
+            'event_start_time': start_time,
+            'event_end_time': end_time,
+            'timestamp': datetime.now().isoformat(),
+            'spectrogram_generated': spectrogram_generated,
+            'from_spectral_index': from_spectral_index,
+        }
+
+    def _spectrogram_band(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Resolve the frequency band kept in stored spectrogram results.
+
+        The configured spectrogram band is widened to include manual display
+        limits so cropping never removes content a report slide shows.
+
+        Returns:
+        --------
+        tuple
+            (freq_min, freq_max), or (None, None) when cropping is disabled
+        """
+        sc = self.config.spectrogram_config
+        if not getattr(sc, "crop_to_band", False):
+            return None, None
+
+        freq_min, freq_max = float(sc.freq_min), float(sc.freq_max)
+        dc = self.config.display_config
+        if not dc.spectrogram_auto_scale:
+            if dc.spectrogram_freq_min is not None:
+                freq_min = min(freq_min, float(dc.spectrogram_freq_min))
+            if dc.spectrogram_freq_max is not None:
+                freq_max = max(freq_max, float(dc.spectrogram_freq_max))
+        return freq_min, freq_max
+
+    def _compact_spectrogram(
+        self,
+        frequencies: np.ndarray,
+        times: np.ndarray,
+        Sxx: np.ndarray
+    ) -> SpectrogramResult:
+        """
+        Crop, pool and convert a spectrogram per the spectrogram configuration.
+
+        Parameters:
+        -----------
+        frequencies : np.ndarray
+            Frequency array in Hz
+        times : np.ndarray
+            Time array in seconds
+        Sxx : np.ndarray
+            Spectrogram values (frequencies x times)
+
+        Returns:
+        --------
+        SpectrogramResult
+            Compact spectrogram arrays for storage in the result container
+        """
+        sc = self.config.spectrogram_config
+        freq_min, freq_max = self._spectrogram_band()
+        compact = compact_spectrogram(
+            frequencies,
+            times,
+            Sxx,
+            freq_min=freq_min,
+            freq_max=freq_max,
+            max_time_columns=getattr(sc, "max_time_columns", None),
+            time_pooling=getattr(sc, "time_pooling", "max"),
+            storage=getattr(sc, "storage", "float64"),
+        )
+        return SpectrogramResult(**compact)
+
     def _calculate_psd(self, signal: np.ndarray, sample_rate: float) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate PSD using configured method.
@@ -791,6 +1062,7 @@ class BatchProcessor:
             frequencies, psd = calculate_psd_maximax(
                 signal, sample_rate,
                 window=pc.window,
+                maximax_window=MAXIMAX_WINDOW_SECONDS,
                 overlap_percent=pc.overlap_percent,
                 df=pc.desired_df,
                 use_efficient_fft=pc.use_efficient_fft,
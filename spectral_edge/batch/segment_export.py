@@ -0,0 +1,256 @@
+"""
+Headless export of segmented spectrograms.
+
+Each segment is read, conditioned, transformed and rendered to PNG with
+Matplotlib's Agg canvas, without any Qt widgets. ``export_segments`` spreads
+the segments over a pool of worker processes so exporting hundreds of
+segments scales with the number of cores and leaves the GUI thread free.
+
+Workers open HDF5-backed channels themselves (by file name and dataset
+path), so only segment bounds cross process boundaries; in-memory channels
+are sent to each worker once.
+
+Author: SpectralEdge Development Team
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import signal as scipy_signal
+
+from spectral_edge.utils.signal_conditioning import apply_processing_pipeline_to_span
+
+# Per-process state set up by _init_worker: (signal source, render settings)
+_worker_state = {}
+
+
+@dataclass
+class SegmentRenderSettings:
+    """Conditioning, FFT window and display settings shared by every exported segment."""
+
+    sample_rate: float
+    conditioning: Dict = field(default_factory=dict)  # apply_processing_pipeline_to_span kwargs
+    window: str = "hann"
+    freq_min: float = 0.0
+    freq_max: float = float("inf")
+    snr_db: float = 60.0
+    colormap: str = "viridis"
+    show_colorbar: bool = True
+    figsize: Tuple[float, float] = (14.0, 9.0)
+    dpi: int = 100
+
+
+@dataclass
+class SegmentExportTask:
+    """One segment to export: sample bounds, FFT parameters, output file and title."""
+
+    segment_idx: int
+    start_idx: int
+    end_idx: int
+    nperseg: int
+    noverlap: int
+    output_path: str
+    title: str = ""
+
+
+def segment_spectrogram(data: np.ndarray, sample_rate: float, nperseg: int,
+                        noverlap: int, window: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Spectrogram of one conditioned segment, clamping FFT parameters to its length."""
+    if len(data) < 2:
+        raise ValueError("Segment is too short to compute a spectrogram")
+
+    nperseg = min(max(2, nperseg), len(data))
+    noverlap = min(max(0, noverlap), nperseg - 1)
+    return scipy_signal.spectrogram(
+        data,
+        fs=sample_rate,
+        window=window,
+        nperseg=nperseg,
+        noverlap=noverlap,
+        scaling='density'
+    )
+
+
+def compute_segment_spectrogram(signal_data, start_idx: int, end_idx: int, sample_rate: float,
+                                conditioning: dict, nperseg: int, noverlap: int,
+                                window: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read, condition and transform one segment of a channel.
+
+    ``conditioning`` holds the keyword arguments of
+    ``apply_processing_pipeline_to_span`` (filter settings and mean removal).
+    Safe to run on worker threads.
+    """
+    conditioned = apply_processing_pipeline_to_span(
+        signal_data, start_idx, end_idx, sample_rate, **conditioning
+    )
+    return segment_spectrogram(conditioned, sample_rate, nperseg, noverlap, window)
+
+
+def render_spectrogram_png(frequencies: np.ndarray, times: np.ndarray, Sxx: np.ndarray,
+                           start_time: float, output_path: str, settings: SegmentRenderSettings,
+                           title: str = "") -> str:
+    """
+    Render a spectrogram to PNG with the viewer's display settings.
+
+    The frequency range is clipped to ``settings.freq_min``/``freq_max`` and
+    the colour scale spans ``settings.snr_db`` below the peak, as in the
+    segmented viewer. Uses a standalone Agg canvas, so it is safe outside
+    the GUI thread and in worker processes.
+
+    Returns
+    -------
+    str
+        ``output_path``
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=settings.figsize, dpi=settings.dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+
+    freq_mask = np.zeros(len(frequencies), dtype=bool)
+    if len(frequencies) and len(times):
+        low = max(settings.freq_min, float(frequencies[0]))
+        high = min(settings.freq_max, float(frequencies[-1]))
+        freq_mask = (frequencies >= low) & (frequencies <= high)
+
+    if np.any(freq_mask):
+        f_shown = frequencies[freq_mask]
+        Sxx_db = 10.0 * np.log10(np.maximum(Sxx[freq_mask, :], 1e-20))
+        max_power = float(np.nanmax(Sxx_db))
+        min_power = max_power - float(settings.snr_db)
+        t_start = start_time + float(times[0])
+        t_end = start_time + float(times[-1])
+        image = ax.imshow(
+            Sxx_db,
+            origin='lower',
+            aspect='auto',
+            interpolation='nearest',
+            cmap=settings.colormap,
+            vmin=min_power,
+            vmax=max_power,
+            extent=(t_start, max(t_end, t_start + 1e-9), float(f_shown[0]),
+                    max(float(f_shown[-1]), float(f_shown[0]) + 1e-9)),
+        )
+        if settings.show_colorbar:
+            fig.colorbar(image, ax=ax).set_label('Power (dB)')
+
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Frequency (Hz)')
+    if title:
+        ax.set_title(title)
+    fig.tight_layout()
+    fig.savefig(output_path, format='png')
+    return output_path
+
+
+def export_segment(signal_data, task: SegmentExportTask, settings: SegmentRenderSettings) -> str:
+    """Compute and render one segment to ``task.output_path``."""
+    f, t, Sxx = compute_segment_spectrogram(
+        signal_data, task.start_idx, task.end_idx, settings.sample_rate,
+        settings.conditioning, task.nperseg, task.noverlap, settings.window
+    )
+    start_time = task.start_idx / settings.sample_rate
+    return render_spectrogram_png(f, t, Sxx, start_time, task.output_path, settings, task.title)
+
+
+def _signal_source(signal_data):
+    """Picklable description of a channel: HDF5 location or an in-memory array."""
+    if hasattr(signal_data, "file") and hasattr(signal_data, "name"):
+        return ("hdf5", signal_data.file.filename, signal_data.name)
+    return np.asarray(signal_data, dtype=np.float64)
+
+
+def _init_worker(source, settings: SegmentRenderSettings):
+    if isinstance(source, tuple):
+        from spectral_edge.utils.hdf5_loader import open_shared_file
+
+        _kind, file_path, dataset_name = source
+        source = open_shared_file(file_path)[dataset_name]
+    _worker_state["signal"] = source
+    _worker_state["settings"] = settings
+
+
+def _export_in_worker(task: SegmentExportTask) -> str:
+    return export_segment(_worker_state["signal"], task, _worker_state["settings"])
+
+
+def export_segments(
+    signal_data,
+    tasks: List[SegmentExportTask],
+    settings: SegmentRenderSettings,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_event=None,
+) -> Tuple[List[str], List[Tuple[int, str]]]:
+    """
+    Export many segments to PNG, in parallel worker processes.
+
+    Parameters
+    ----------
+    signal_data : np.ndarray or h5py.Dataset
+        Raw channel samples
+    tasks : list of SegmentExportTask
+        Segments to export
+    settings : SegmentRenderSettings
+        Settings shared by all segments
+    max_workers : int, optional
+        Worker processes (default: CPU count); with one worker the segments
+        are exported in the calling thread
+    progress_callback : callable, optional
+        Called as ``progress_callback(completed, total)`` after each segment
+    cancel_event : threading.Event, optional
+        When set, segments not yet started are dropped and the export returns
+
+    Returns
+    -------
+    written : list of str
+        Paths of the images written, in completion order
+    errors : list of (int, str)
+        Segment index and error message of each failed segment
+    """
+    tasks = list(tasks)
+    total = len(tasks)
+    workers = max(1, min(max_workers or os.cpu_count() or 1, total))
+    written, errors = [], []
+
+    def cancelled():
+        return cancel_event is not None and cancel_event.is_set()
+
+    def record(task, run):
+        try:
+            written.append(run())
+        except Exception as exc:
+            errors.append((task.segment_idx, str(exc)))
+        if progress_callback is not None:
+            progress_callback(len(written) + len(errors), total)
+
+    if workers == 1:
+        for task in tasks:
+            if cancelled():
+                break
+            record(task, lambda task=task: export_segment(signal_data, task, settings))
+        return written, errors
+
+    # Spawned workers avoid forking a process that runs Qt and HDF5 threads
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(_signal_source(signal_data), settings),
+    )
+    try:
+        futures = {executor.submit(_export_in_worker, task): task for task in tasks}
+        for future in as_completed(futures):
+            if cancelled():
+                break
+            record(futures[future], future.result)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return written, errors
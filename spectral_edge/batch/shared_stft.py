@@ -0,0 +1,227 @@
+"""
+Shared STFT for batch PSD and spectrogram generation.
+
+When a batch run produces both a PSD and a spectrogram for the same
+conditioned event signal, both are built from the same kind of segment
+periodograms (detrended, windowed, density-scaled one-sided FFTs). This
+module computes each distinct segment periodogram once and derives the
+Welch average, the maximax envelope and the spectrogram columns from it.
+
+Segments are identified by their start sample, so reuse is exact: when the
+PSD and spectrogram hops line up every segment is shared, and when they do
+not only the coinciding segments are shared. If the PSD and spectrogram use
+different segment lengths or windows nothing can be shared and callers fall
+back to the independent calculations.
+
+Author: SpectralEdge Development Team
+"""
+
+import logging
+from math import ceil, log2
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy import signal as scipy_signal
+
+from spectral_edge.batch.spectrogram_generator import apply_snr_threshold
+
+logger = logging.getLogger(__name__)
+
+# Spectrograms are always generated with a Hann window
+SPECTROGRAM_WINDOW = "hann"
+
+# Upper bound on samples held in the temporary segment frame buffer
+_MAX_FRAME_SAMPLES = 1 << 22
+
+
+def _segment_length(sample_rate: float, df: float, use_efficient_fft: bool) -> int:
+    """Return nperseg for a frequency resolution, matching the PSD functions."""
+    nperseg = int(sample_rate / df)
+    if use_efficient_fft:
+        nperseg = 2 ** int(ceil(log2(nperseg)))
+    return nperseg
+
+
+def segment_starts(n_samples: int, nperseg: int, hop: int, offset: int = 0) -> np.ndarray:
+    """
+    Return the start samples of all full segments in a span.
+
+    Parameters
+    ----------
+    n_samples : int
+        Length of the span in samples
+    nperseg : int
+        Segment length in samples
+    hop : int
+        Distance between consecutive segment starts in samples
+    offset : int, optional
+        Absolute sample index of the span start (default: 0)
+
+    Returns
+    -------
+    np.ndarray
+        Absolute segment start indices (int64)
+    """
+    if n_samples < nperseg or hop <= 0:
+        return np.array([], dtype=np.int64)
+    return offset + np.arange(0, n_samples - nperseg + 1, hop, dtype=np.int64)
+
+
+def compute_segment_periodograms(
+    signal_data: np.ndarray,
+    sample_rate: float,
+    starts: np.ndarray,
+    nperseg: int,
+    window: str = "hann"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute one-sided, density-scaled periodograms for the given segments.
+
+    Each segment is mean-detrended, windowed and transformed exactly as
+    ``scipy.signal.welch`` and ``scipy.signal.spectrogram`` do internally,
+    so averaging the columns reproduces Welch and the columns themselves are
+    the spectrogram.
+
+    Parameters
+    ----------
+    signal_data : np.ndarray
+        Input signal array (1D)
+    sample_rate : float
+        Sample rate in Hz
+    starts : np.ndarray
+        Segment start indices
+    nperseg : int
+        Segment length in samples
+    window : str, optional
+        Window function name (default: 'hann')
+
+    Returns
+    -------
+    frequencies : np.ndarray
+        Frequency array in Hz (1D)
+    periodograms : np.ndarray
+        Periodograms in (frequency, segment) format (2D), signal_units^2/Hz
+    """
+    signal_data = np.asarray(signal_data, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.int64)
+    win = scipy_signal.get_window(window, nperseg)
+    scale = 1.0 / (sample_rate * np.sum(win * win))
+    frequencies = np.fft.rfftfreq(nperseg, d=1.0 / sample_rate)
+
+    periodograms = np.empty((frequencies.size, starts.size), dtype=np.float64)
+    chunk = max(1, _MAX_FRAME_SAMPLES // nperseg)
+    offsets = np.arange(nperseg, dtype=np.int64)
+    for chunk_start in range(0, starts.size, chunk):
+        chunk_starts = starts[chunk_start:chunk_start + chunk]
+        frames = signal_data[chunk_starts[:, None] + offsets]
+        frames -= frames.mean(axis=1, keepdims=True)
+        frames *= win
+        spectrum = np.fft.rfft(frames, n=nperseg, axis=1)
+        power = (spectrum.real ** 2 + spectrum.imag ** 2) * scale
+        if nperseg % 2:
+            power[:, 1:] *= 2.0
+        else:
+            power[:, 1:-1] *= 2.0
+        periodograms[:, chunk_start:chunk_start + chunk_starts.size] = power.T
+
+    return frequencies, periodograms
+
+
+def compute_psd_and_spectrogram(
+    signal_data: np.ndarray,
+    sample_rate: float,
+    psd_config,
+    spectrogram_config,
+    maximax_window: float = 1.0
+) -> Optional[Tuple[np.ndarray, np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+    """
+    Compute the batch PSD and spectrogram from one shared set of segments.
+
+    Parameters
+    ----------
+    signal_data : np.ndarray
+        Conditioned event signal (1D)
+    sample_rate : float
+        Sample rate in Hz
+    psd_config : PSDConfig
+        PSD settings (method, window, df, overlap, efficient FFT)
+    spectrogram_config : SpectrogramConfig
+        Spectrogram settings (df, overlap, SNR threshold, efficient FFT)
+    maximax_window : float, optional
+        Maximax window duration in seconds (default: 1.0)
+
+    Returns
+    -------
+    Optional[Tuple]
+        ``(frequencies, psd, (spec_frequencies, spec_times, Sxx))`` matching
+        ``calculate_psd_welch``/``calculate_psd_maximax`` and
+        ``generate_spectrogram``, or None when the two cannot share segments
+        (different segment length or window, or parameters the independent
+        functions would reject). Callers should then compute each separately.
+    """
+    n_samples = len(signal_data)
+    if n_samples == 0 or sample_rate <= 0:
+        return None
+    if psd_config.window != SPECTROGRAM_WINDOW:
+        return None
+    if psd_config.desired_df <= 0 or psd_config.desired_df >= sample_rate / 2:
+        return None
+
+    nperseg = _segment_length(sample_rate, psd_config.desired_df, psd_config.use_efficient_fft)
+    spec_nperseg = min(
+        _segment_length(
+            sample_rate, spectrogram_config.desired_df, spectrogram_config.use_efficient_fft
+        ),
+        n_samples,
+    )
+    if nperseg != spec_nperseg or nperseg > n_samples:
+        return None
+
+    psd_hop = nperseg - nperseg // 2
+    spec_hop = nperseg - int(nperseg * spectrogram_config.overlap_percent / 100)
+    if spec_hop <= 0:
+        return None
+
+    spec_starts = segment_starts(n_samples, nperseg, spec_hop)
+    if psd_config.method == "welch":
+        psd_groups = [segment_starts(n_samples, nperseg, psd_hop)]
+    elif psd_config.method == "maximax":
+        window_samples = int(maximax_window * sample_rate)
+        step_samples = window_samples - int(window_samples * psd_config.overlap_percent / 100)
+        if (
+            maximax_window > n_samples / sample_rate
+            or step_samples <= 0
+            or nperseg > window_samples
+        ):
+            return None
+        window_starts = np.arange(0, n_samples - window_samples + 1, step_samples, dtype=np.int64)
+        psd_groups = [
+            segment_starts(window_samples, nperseg, psd_hop, offset=int(ws))
+            for ws in window_starts
+        ]
+    else:
+        return None
+    if not psd_groups or psd_groups[0].size == 0 or spec_starts.size == 0:
+        return None
+
+    all_starts = np.unique(np.concatenate([spec_starts] + psd_groups))
+    frequencies, periodograms = compute_segment_periodograms(
+        signal_data, sample_rate, all_starts, nperseg, window=SPECTROGRAM_WINDOW
+    )
+
+    psd = None
+    for group in psd_groups:
+        group_psd = periodograms[:, np.searchsorted(all_starts, group)].mean(axis=1)
+        psd = group_psd if psd is None else np.maximum(psd, group_psd)
+
+    Sxx = periodograms[:, np.searchsorted(all_starts, spec_starts)]
+    if spectrogram_config.snr_threshold > 0:
+        Sxx = apply_snr_threshold(Sxx, spectrogram_config.snr_threshold)
+    spec_times = (spec_starts + nperseg / 2) / sample_rate
+
+    requested = sum(group.size for group in psd_groups) + spec_starts.size
+    logger.debug(
+        f"Shared STFT: {all_starts.size} segment FFTs for {requested} requested "
+        f"({psd_config.method} PSD + spectrogram)"
+    )
+    return frequencies, psd, (frequencies.copy(), spec_times, Sxx)
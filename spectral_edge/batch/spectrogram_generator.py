@@ -9,7 +9,7 @@ Author: SpectralEdge Development Team
 
 import numpy as np
 from scipy import signal as scipy_signal
-from typing import Tuple, Optional
+from typing import Any, Dict, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -164,6 +164,112 @@ def apply_snr_threshold(Sxx: np.ndarray, snr_threshold_db: float) -> np.ndarray:
     return Sxx_thresholded
 
 
+def compact_spectrogram(
+    frequencies: np.ndarray,
+    times: np.ndarray,
+    Sxx: np.ndarray,
+    freq_min: Optional[float] = None,
+    freq_max: Optional[float] = None,
+    max_time_columns: Optional[int] = None,
+    time_pooling: str = "max",
+    storage: str = "float64"
+) -> Dict[str, Any]:
+    """
+    Reduce a spectrogram to the band and resolution that reports display.
+    
+    Parameters
+    ----------
+    frequencies : np.ndarray
+        Frequency array in Hz (1D)
+    times : np.ndarray
+        Time array in seconds (1D)
+    Sxx : np.ndarray
+        Spectrogram values in (frequency, time) format (2D)
+    freq_min : float, optional
+        Lowest frequency to keep (default: None, keeps from the first bin)
+    freq_max : float, optional
+        Highest frequency to keep (default: None, keeps up to Nyquist)
+    max_time_columns : int, optional
+        Pool time bins down to at most this many columns (default: None, no pooling)
+    time_pooling : str, optional
+        'max' keeps the peak of each pooled group, 'mean' averages it (default: 'max')
+    storage : str, optional
+        'float64', 'float32', or 'db_uint8' to store dB values quantized to
+        256 levels between the spectrogram minimum and maximum (default: 'float64')
+        
+    Returns
+    -------
+    dict
+        Spectrogram result with 'frequencies', 'times' and 'Sxx'. Quantized
+        results also carry 'storage', 'db_offset' and 'db_scale'; use
+        ``spectrogram_to_db`` to read either form.
+        
+    Notes
+    -----
+    Pooled time bins are reported at the mean time of each group. Max pooling
+    is the default so short transients stay visible after reduction.
+    """
+    frequencies = np.asarray(frequencies)
+    times = np.asarray(times)
+    Sxx = np.asarray(Sxx)
+    
+    # Crop to the requested band
+    if freq_min is not None or freq_max is not None:
+        low = freq_min if freq_min is not None else -np.inf
+        high = freq_max if freq_max is not None else np.inf
+        band = np.flatnonzero((frequencies >= low) & (frequencies <= high))
+        if band.size > 0:
+            frequencies = frequencies[band[0]:band[-1] + 1]
+            Sxx = Sxx[band[0]:band[-1] + 1, :]
+    
+    # Pool along time in contiguous groups of (nearly) equal size
+    if max_time_columns is not None and times.size > max_time_columns:
+        group_starts = np.linspace(0, times.size, max_time_columns, endpoint=False).astype(np.int64)
+        group_sizes = np.diff(np.append(group_starts, times.size))
+        if time_pooling == "mean":
+            Sxx = np.add.reduceat(Sxx, group_starts, axis=1) / group_sizes
+        else:
+            Sxx = np.maximum.reduceat(Sxx, group_starts, axis=1)
+        times = np.add.reduceat(times, group_starts) / group_sizes
+    
+    result: Dict[str, Any] = {'frequencies': frequencies, 'times': times}
+    if storage == "db_uint8":
+        Sxx_db = 10 * np.log10(Sxx + 1e-12)
+        db_offset = float(np.min(Sxx_db)) if Sxx_db.size else 0.0
+        db_range = float(np.max(Sxx_db)) - db_offset if Sxx_db.size else 0.0
+        db_scale = db_range / 255.0 if db_range > 0 else 1.0
+        result['Sxx'] = np.round((Sxx_db - db_offset) / db_scale).astype(np.uint8)
+        result['storage'] = storage
+        result['db_offset'] = db_offset
+        result['db_scale'] = db_scale
+    elif storage == "float32":
+        result['Sxx'] = Sxx.astype(np.float32)
+    else:
+        result['Sxx'] = np.ascontiguousarray(Sxx, dtype=np.float64)
+    return result
+
+
+def spectrogram_to_db(spectrogram_data: Dict[str, Any]) -> np.ndarray:
+    """
+    Return spectrogram values in dB for any storage produced by ``compact_spectrogram``.
+    
+    Parameters
+    ----------
+    spectrogram_data : dict
+        Spectrogram result with 'Sxx' and, for quantized storage, 'db_offset'
+        and 'db_scale'
+        
+    Returns
+    -------
+    np.ndarray
+        10*log10(Sxx) values (2D)
+    """
+    Sxx = spectrogram_data['Sxx']
+    if spectrogram_data.get('storage') == "db_uint8":
+        return spectrogram_data['db_offset'] + Sxx.astype(np.float64) * spectrogram_data['db_scale']
+    return 10 * np.log10(Sxx + 1e-12)
+
+
 def save_spectrogram_plot(
     frequencies: np.ndarray,
     times: np.ndarray,
@@ -2,10 +2,9 @@
 Batch statistics utilities for report generation.
 """
 
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import numpy as np
 from scipy import stats
-from scipy.ndimage import uniform_filter1d
 import matplotlib
 
 matplotlib.use("Agg")
@@ -17,114 +16,71 @@ from spectral_edge.utils.plot_theme import (
     BASE_FONT_SIZE,
     LINE_COLOR,
 )
-from spectral_edge.utils.statistics_overlays import (
-    fit_rayleigh_from_signal,
-    build_rayleigh_curve,
+from spectral_edge.utils.statistics_overlays import build_rayleigh_curve
+from spectral_edge.utils.signal_statistics import (
+    compute_conditioned_statistics,
+    compute_hdf5_channel_statistics,
 )
 
 
 def compute_statistics(
     signal: np.ndarray,
     sample_rate: float,
-    stats_config
+    stats_config,
+    conditioning: Optional[Dict] = None,
 ) -> Dict[str, Dict]:
     """
     Compute PDF and running statistics for a signal.
 
+    Uses the shared block-streaming engine, so results match the statistics
+    window. ``conditioning`` holds ``apply_processing_pipeline_to_span``
+    keyword arguments; when given, ``signal`` is a raw channel conditioned
+    block by block instead of as a whole.
+
     Returns
     -------
     dict with keys:
       pdf, running, overall
     """
-    signal = np.asarray(signal)
-    pdf_bins = int(getattr(stats_config, "pdf_bins", 50))
-    window_seconds = float(getattr(stats_config, "running_window_seconds", 1.0))
-    max_plot_points = int(getattr(stats_config, "max_plot_points", 5000))
-
-    counts, bin_edges = np.histogram(signal, bins=pdf_bins, density=True)
-    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-
-    mean = float(np.mean(signal))
-    std = float(np.std(signal))
-    rms = float(np.sqrt(np.mean(signal ** 2)))
-    crest_factor = float(np.max(np.abs(signal)) / rms) if rms > 1e-12 else 0.0
-
-    # Running stats
-    window_samples = max(10, int(window_seconds * sample_rate))
-    running = {}
-    if len(signal) >= window_samples:
-        signal_float = signal.astype(np.float64)
-        running_mean = uniform_filter1d(signal_float, size=window_samples, mode="nearest")
-        running_sq = uniform_filter1d(signal_float ** 2, size=window_samples, mode="nearest")
-        running_std = np.sqrt(np.maximum(running_sq - running_mean ** 2, 0))
-
-        # Downsample for plotting
-        if len(running_mean) > max_plot_points:
-            step = max(1, len(running_mean) // max_plot_points)
-            running_mean = running_mean[::step]
-            running_std = running_std[::step]
-            time = np.arange(len(running_mean)) * step / sample_rate
-        else:
-            time = np.arange(len(running_mean)) / sample_rate
-
-        running["time"] = time
-        running["mean"] = running_mean
-        running["std"] = running_std
-
-        # Skewness/kurtosis sampled
-        n_samples = min(200, len(signal) // window_samples)
-        if n_samples > 0:
-            sample_step = len(signal) // n_samples
-            running_skewness = np.zeros(n_samples)
-            running_kurtosis = np.zeros(n_samples)
-            skewness_time = np.zeros(n_samples)
-
-            for j in range(n_samples):
-                start_idx = j * sample_step
-                end_idx = min(start_idx + window_samples, len(signal))
-                window = signal[start_idx:end_idx]
-                if len(window) > 10:
-                    running_skewness[j] = stats.skew(window)
-                    running_kurtosis[j] = stats.kurtosis(window)
-                skewness_time[j] = start_idx / sample_rate
-
-            running["skewness_time"] = skewness_time
-            running["skewness"] = running_skewness
-            running["kurtosis"] = running_kurtosis
-
-    # Overall skew/kurtosis
-    if len(signal) > 100000:
-        sample_indices = np.random.choice(len(signal), 100000, replace=False)
-        signal_sample = signal[sample_indices]
-        skewness = float(stats.skew(signal_sample))
-        kurtosis = float(stats.kurtosis(signal_sample))
-    else:
-        skewness = float(stats.skew(signal))
-        kurtosis = float(stats.kurtosis(signal))
-
-    rayleigh_scale, rayleigh_x_max = fit_rayleigh_from_signal(signal)
-
-    return {
-        "pdf": {
-            "bins": bin_centers,
-            "counts": counts,
-            "mean": mean,
-            "std": std,
-            "rayleigh_scale": rayleigh_scale,
-            "rayleigh_x_max": rayleigh_x_max,
-        },
-        "running": running,
-        "overall": {
-            "mean": mean,
-            "std": std,
-            "skewness": skewness,
-            "kurtosis": kurtosis,
-            "min": float(np.min(signal)),
-            "max": float(np.max(signal)),
-            "rms": rms,
-            "crest_factor": crest_factor
-        }
-    }
+    return compute_conditioned_statistics(
+        signal,
+        sample_rate,
+        conditioning=conditioning,
+        n_bins=int(getattr(stats_config, "pdf_bins", 50)),
+        window_seconds=float(getattr(stats_config, "running_window_seconds", 1.0)),
+        max_plot_points=int(getattr(stats_config, "max_plot_points", 5000)),
+    )
+
+
+def compute_channel_statistics(
+    loader,
+    flight_key: str,
+    channel_key: str,
+    stats_config,
+    start_time: Optional[float] = None,
+    end_time: Optional[float] = None,
+    conditioning: Optional[Dict] = None,
+) -> Dict[str, Dict]:
+    """
+    Compute statistics for an HDF5 channel without loading it into memory.
+
+    The channel is streamed through ``loader`` in blocks, so memory use does
+    not grow with recording length. ``conditioning`` holds
+    ``apply_processing_pipeline_to_span`` keyword arguments; when given,
+    each block is conditioned with padding from the surrounding channel.
+    Returns the same layout as :func:`compute_statistics`.
+    """
+    return compute_hdf5_channel_statistics(
+        loader,
+        flight_key,
+        channel_key,
+        start_time=start_time,
+        end_time=end_time,
+        conditioning=conditioning,
+        n_bins=int(getattr(stats_config, "pdf_bins", 50)),
+        window_seconds=float(getattr(stats_config, "running_window_seconds", 1.0)),
+        max_plot_points=int(getattr(stats_config, "max_plot_points", 5000)),
+    )
 
 
 def plot_pdf(pdf_data: Dict, stats_config) -> Tuple["mpl.Figure", "mpl.Axes"]:
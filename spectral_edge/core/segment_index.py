@@ -0,0 +1,283 @@
+"""
+Prefix-Summed Segment Spectra for Interactive PSD Updates
+
+A :class:`SegmentSpectrumIndex` computes the periodogram of every Welch
+segment of a channel once, on a fixed segment grid, and stores their
+cumulative sums. The Welch PSD of any segment-aligned span is then the
+difference of two prefix rows divided by the segment count, which costs
+O(n_freqs) regardless of the span length. Maximax envelopes use a sparse
+table (range-maximum structure) over the per-window Welch means, so they are
+also O(n_freqs) per query.
+
+Spans are segment-aligned: a span uses the grid segments that lie fully
+inside it. For spans starting on the grid this reproduces
+``calculate_psd_welch`` on the slice exactly; maximax windows are likewise
+taken on a fixed grid of window starts.
+
+The prefix sums may also live on disk (see
+``spectral_edge.utils.hdf5_spectral_index``): :meth:`SegmentSpectrumIndex.from_prefix`
+wraps any row-indexable array, such as an ``h5py.Dataset``, and queries then
+read only the rows they need.
+
+Author: SpectralEdge Development Team
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from spectral_edge.batch.shared_stft import compute_segment_periodograms, segment_starts
+
+# Upper bound on bytes held by one index (prefix sums plus maximax tables)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Segments transformed per batch while building the prefix sums
+_SEGMENTS_PER_BATCH = 256
+
+
+class SegmentSpectrumIndex:
+    """
+    Per-segment periodogram prefix sums of one channel.
+
+    Parameters
+    ----------
+    signal_data : np.ndarray
+        Conditioned channel signal (1D)
+    sample_rate : float
+        Sample rate in Hz
+    nperseg : int
+        Segment length in samples
+    noverlap : int, optional
+        Overlap between segments in samples (default: nperseg // 2)
+    window : str, optional
+        Window function name (default: 'hann')
+    max_bytes : int, optional
+        Memory budget for the index; construction raises ValueError when the
+        prefix sums alone would exceed it (default: 256 MB)
+
+    Raises
+    ------
+    ValueError
+        If the signal is shorter than one segment, the overlap is invalid, or
+        the index would exceed ``max_bytes``
+    """
+
+    def __init__(
+        self,
+        signal_data: np.ndarray,
+        sample_rate: float,
+        nperseg: int,
+        noverlap: Optional[int] = None,
+        window: str = "hann",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        signal_data = np.asarray(signal_data, dtype=np.float64)
+        nperseg = int(nperseg)
+        noverlap = nperseg // 2 if noverlap is None else int(noverlap)
+        if nperseg <= 0 or nperseg > signal_data.size:
+            raise ValueError(
+                f"nperseg ({nperseg}) must be positive and no larger than the signal "
+                f"({signal_data.size} samples)"
+            )
+        if not 0 <= noverlap < nperseg:
+            raise ValueError(f"noverlap ({noverlap}) must be in [0, nperseg)")
+
+        self.sample_rate = float(sample_rate)
+        self.nperseg = nperseg
+        self.hop = nperseg - noverlap
+        self.n_samples = int(signal_data.size)
+        self.max_bytes = int(max_bytes)
+
+        starts = segment_starts(self.n_samples, nperseg, self.hop)
+        n_freqs = nperseg // 2 + 1
+        required = (starts.size + 1) * n_freqs * 8
+        if required > self.max_bytes:
+            raise ValueError(
+                f"Segment index needs {required / 1e6:.0f} MB "
+                f"({starts.size} segments x {n_freqs} bins), over the "
+                f"{self.max_bytes / 1e6:.0f} MB budget. Use a coarser df."
+            )
+
+        # Row i holds the sum of the first i segment periodograms
+        self._prefix = np.zeros((starts.size + 1, n_freqs), dtype=np.float64)
+        self.frequencies = np.fft.rfftfreq(nperseg, d=1.0 / self.sample_rate)
+        for first in range(0, starts.size, _SEGMENTS_PER_BATCH):
+            batch = starts[first:first + _SEGMENTS_PER_BATCH]
+            _freqs, periodograms = compute_segment_periodograms(
+                signal_data, self.sample_rate, batch, nperseg, window=window
+            )
+            np.cumsum(periodograms.T, axis=0, out=self._prefix[first + 1:first + 1 + batch.size])
+            self._prefix[first + 1:first + 1 + batch.size] += self._prefix[first]
+
+        self.n_segments = int(starts.size)
+        self._maximax_tables = {}
+
+    @classmethod
+    def from_prefix(
+        cls,
+        prefix,
+        frequencies: np.ndarray,
+        sample_rate: float,
+        nperseg: int,
+        hop: int,
+        n_samples: int,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> "SegmentSpectrumIndex":
+        """
+        Wrap precomputed prefix sums without recomputing any spectra.
+
+        ``prefix`` holds ``n_segments + 1`` rows (row ``i`` is the sum of the
+        first ``i`` segment periodograms) and may be an in-memory array or an
+        on-disk dataset.
+        """
+        index = cls.__new__(cls)
+        index.sample_rate = float(sample_rate)
+        index.nperseg = int(nperseg)
+        index.hop = int(hop)
+        index.n_samples = int(n_samples)
+        index.max_bytes = int(max_bytes)
+        index.frequencies = np.asarray(frequencies, dtype=np.float64)
+        index.n_segments = int(prefix.shape[0]) - 1
+        index._prefix = prefix
+        index._maximax_tables = {}
+        return index
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the prefix sums and maximax tables."""
+        table_bytes = sum(
+            level.nbytes for levels in self._maximax_tables.values() for level in levels
+        )
+        prefix_bytes = self._prefix.nbytes if isinstance(self._prefix, np.ndarray) else 0
+        return int(prefix_bytes + table_bytes)
+
+    def _segment_range(self, start_sample: int, end_sample: int):
+        """Grid segments ``[first, stop)`` lying fully inside ``[start_sample, end_sample)``."""
+        first = -(-max(0, int(start_sample)) // self.hop)
+        last_start = min(int(end_sample), self.n_samples) - self.nperseg
+        stop = last_start // self.hop + 1 if last_start >= 0 else 0
+        return first, min(stop, self.n_segments)
+
+    def welch(self, start_sample: int, end_sample: int) -> np.ndarray:
+        """
+        Welch PSD of the samples ``[start_sample, end_sample)``.
+
+        Returns
+        -------
+        np.ndarray
+            PSD aligned with ``self.frequencies``
+
+        Raises
+        ------
+        ValueError
+            If no full segment fits in the span
+        """
+        first, stop = self._segment_range(start_sample, end_sample)
+        if stop <= first:
+            raise ValueError("Span is shorter than one PSD segment")
+        return (self._prefix[stop] - self._prefix[first]) / (stop - first)
+
+    def window_means(self, window_starts: np.ndarray, window_samples: int) -> np.ndarray:
+        """
+        Welch PSD of each window ``[start, start + window_samples)``.
+
+        Reads one contiguous block of prefix rows covering all windows.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape ``(len(window_starts), n_freqs)``
+
+        Raises
+        ------
+        ValueError
+            If a window does not cover a full grid segment
+        """
+        window_starts = np.asarray(window_starts, dtype=np.int64)
+        if self.nperseg > window_samples:
+            raise ValueError("Maximax window is shorter than one PSD segment")
+        first = -(-window_starts // self.hop)
+        stop = np.minimum((window_starts + window_samples - self.nperseg) // self.hop + 1, self.n_segments)
+        counts = stop - first
+        if window_starts.size == 0 or np.any(counts <= 0):
+            raise ValueError("Maximax windows do not cover a full PSD segment")
+
+        lo, hi = int(first.min()), int(stop.max())
+        block = np.asarray(self._prefix[lo:hi + 1], dtype=np.float64)
+        return (block[stop - lo] - block[first - lo]) / counts[:, None]
+
+    def n_windows(self, window_samples: int, step_samples: int) -> int:
+        """Number of grid windows of one maximax geometry in the channel."""
+        if window_samples > self.n_samples:
+            return 0
+        return (self.n_samples - window_samples) // step_samples + 1
+
+    def _maximax_levels(self, window_samples: int, step_samples: int) -> list:
+        """Sparse table over per-window Welch means for one maximax geometry."""
+        key = (window_samples, step_samples)
+        if key in self._maximax_tables:
+            return self._maximax_tables[key]
+
+        window_starts = np.arange(self.n_windows(window_samples, step_samples), dtype=np.int64) * step_samples
+        means = self.window_means(window_starts, window_samples)
+        levels = [means]
+        used = self.nbytes + means.nbytes
+        # Level j holds the max over 2**j consecutive windows; stop adding
+        # levels once the budget is spent (queries then scan the base level)
+        while (1 << len(levels)) <= means.shape[0]:
+            span = 1 << (len(levels) - 1)
+            previous = levels[-1]
+            if used + previous.nbytes > self.max_bytes:
+                break
+            levels.append(np.maximum(previous[:-span], previous[span:]))
+            used += levels[-1].nbytes
+        self._maximax_tables[key] = levels
+        return levels
+
+    def _window_range(self, start_sample: int, end_sample: int, window_samples: int, step_samples: int):
+        """Grid windows ``[first, last]`` lying fully inside ``[start_sample, end_sample)``."""
+        if step_samples <= 0:
+            raise ValueError("Maximax step must be positive")
+        first = -(-max(0, int(start_sample)) // step_samples)
+        last_start = min(int(end_sample), self.n_samples) - window_samples
+        last = -1
+        if last_start >= 0:
+            last = min(last_start // step_samples, self.n_windows(window_samples, step_samples) - 1)
+        if last < first:
+            raise ValueError("Span is shorter than one maximax window")
+        return first, last
+
+    def maximax(
+        self,
+        start_sample: int,
+        end_sample: int,
+        window_samples: int,
+        step_samples: int,
+    ) -> np.ndarray:
+        """
+        Maximax PSD over the grid windows inside ``[start_sample, end_sample)``.
+
+        Windows of ``window_samples`` start every ``step_samples`` samples
+        from the beginning of the channel; each window's PSD is the mean of
+        the grid segments it contains. Indexes over on-disk prefix sums build
+        no tables and scan the windows of the span instead.
+
+        Raises
+        ------
+        ValueError
+            If no full window fits in the span
+        """
+        window_samples = int(window_samples)
+        step_samples = int(step_samples)
+        first, last = self._window_range(start_sample, end_sample, window_samples, step_samples)
+        if not isinstance(self._prefix, np.ndarray):
+            starts = np.arange(first, last + 1, dtype=np.int64) * step_samples
+            return self.window_means(starts, window_samples).max(axis=0)
+        levels = self._maximax_levels(window_samples, step_samples)
+
+        count = last - first + 1
+        level = count.bit_length() - 1
+        if level < len(levels):
+            table = levels[level]
+            return np.maximum(table[first], table[last - (1 << level) + 1])
+        return levels[0][first:last + 1].max(axis=0)
@@ -0,0 +1,314 @@
+"""
+Tiled Multi-Resolution Spectrogram Pyramid
+
+A :class:`SpectrogramPyramid` serves the spectrogram of a long channel as
+fixed-size tiles at several time and frequency resolutions, much like map
+tiles. Level ``L`` has one column per ``2**L`` consecutive STFT frames and
+frequency level ``F`` one row per ``2**F`` consecutive bins; each tile holds
+``TILE_COLUMNS`` x ``TILE_ROWS`` cells of power in dB.
+
+Tiles are computed only when asked for and kept in a byte-bounded
+``ArrayLRUCache``, so a viewer can draw the visible region at screen
+resolution and refine it as the user zooms instead of transforming and
+rendering every frame of the recording.
+
+Columns and rows are power averages (the Welch estimate of the span) over
+every frame and bin they cover, reduced in batches of periodograms; level 0
+columns are exactly the frames of ``scipy.signal.spectrogram``. Averaging
+dilutes short transients in coarse columns, so each time tile also records
+the peak power of any single frame and bin in each row, from which
+:meth:`SpectrogramPyramid.peak_power_db` gives a colour scale that holds at
+every zoom level.
+
+Author: SpectralEdge Development Team
+"""
+
+from typing import Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from spectral_edge.batch.shared_stft import compute_segment_periodograms
+from spectral_edge.utils.channel_cache import ArrayLRUCache
+
+TILE_COLUMNS = 256
+TILE_ROWS = 256
+
+# Default memory budget for cached tiles
+DEFAULT_TILE_CACHE_BYTES = 256 * 1024 * 1024
+
+# Signal samples transformed per batch while building a tile
+_BATCH_SAMPLES = 1 << 22
+
+
+def _levels_needed(count: int, tile_size: int) -> int:
+    """Smallest level at which ``count`` cells fit in one tile."""
+    level = 0
+    while -(-count // (1 << level)) > tile_size:
+        level += 1
+    return level
+
+
+class SpectrogramPyramid:
+    """
+    Lazily computed spectrogram tiles of one conditioned channel.
+
+    Parameters
+    ----------
+    signal_data : np.ndarray
+        Conditioned channel signal (1D)
+    sample_rate : float
+        Sample rate in Hz
+    nperseg : int
+        STFT segment length in samples
+    noverlap : int
+        Overlap between segments in samples
+    window : str, optional
+        Window function name (default: 'hann')
+    cache : ArrayLRUCache, optional
+        Tile cache, which may be shared between pyramids (default: a new
+        cache of 256 MB)
+    key : hashable, optional
+        Prefix of this pyramid's cache keys; pyramids sharing a cache need
+        distinct keys (default: ())
+
+    Raises
+    ------
+    ValueError
+        If the signal is shorter than one segment or the overlap is invalid
+    """
+
+    def __init__(
+        self,
+        signal_data: np.ndarray,
+        sample_rate: float,
+        nperseg: int,
+        noverlap: int,
+        window: str = "hann",
+        cache: Optional[ArrayLRUCache] = None,
+        key: Hashable = (),
+    ):
+        self.signal = np.asarray(signal_data, dtype=np.float64)
+        self.sample_rate = float(sample_rate)
+        self.nperseg = int(nperseg)
+        if self.nperseg < 2 or self.nperseg > self.signal.size:
+            raise ValueError(
+                f"nperseg ({self.nperseg}) must be at least 2 and no larger than the signal "
+                f"({self.signal.size} samples)"
+            )
+        if not 0 <= int(noverlap) < self.nperseg:
+            raise ValueError(f"noverlap ({noverlap}) must be in [0, nperseg)")
+
+        self.hop = self.nperseg - int(noverlap)
+        self.window = window
+        self.cache = cache if cache is not None else ArrayLRUCache(DEFAULT_TILE_CACHE_BYTES)
+        self.key = key
+        # Peak power in dB of each row of a time tile, by (level, freq_level, time_tile)
+        self._row_peaks = {}
+
+        self.n_frames = (self.signal.size - self.nperseg) // self.hop + 1
+        self.frequencies = np.fft.rfftfreq(self.nperseg, d=1.0 / self.sample_rate)
+        self.n_bins = self.frequencies.size
+        self.df = self.sample_rate / self.nperseg
+        self.max_level = _levels_needed(self.n_frames, TILE_COLUMNS)
+        self.max_freq_level = _levels_needed(self.n_bins, TILE_ROWS)
+
+    def frame_time(self, frame):
+        """Centre time in seconds of STFT frame(s) ``frame``."""
+        return (np.asarray(frame) * self.hop + self.nperseg / 2.0) / self.sample_rate
+
+    def time_bounds(self) -> Tuple[float, float]:
+        """Centre times of the first and last frames, as ``scipy.signal.spectrogram`` reports them."""
+        return float(self.frame_time(0)), float(self.frame_time(self.n_frames - 1))
+
+    def n_columns(self, level: int) -> int:
+        return -(-self.n_frames // (1 << level))
+
+    def n_rows(self, freq_level: int) -> int:
+        return -(-self.n_bins // (1 << freq_level))
+
+    def level_for(self, time_span: float, pixels: float) -> int:
+        """Coarsest time level with at least one column per pixel over ``time_span`` seconds."""
+        frames = max(time_span, 0.0) * self.sample_rate / self.hop
+        ratio = frames / max(pixels, 1.0)
+        level = int(np.ceil(np.log2(ratio))) if ratio > 1.0 else 0
+        return min(max(level, 0), self.max_level)
+
+    def freq_level_for(self, freq_span: float, pixels: float) -> int:
+        """Coarsest frequency level with at least one row per pixel over ``freq_span`` Hz."""
+        ratio = (max(freq_span, 0.0) / self.df) / max(pixels, 1.0)
+        level = int(np.ceil(np.log2(ratio))) if ratio > 1.0 else 0
+        return min(max(level, 0), self.max_freq_level)
+
+    def tiles_in_view(
+        self,
+        level: int,
+        freq_level: int,
+        time_range: Tuple[float, float],
+        freq_range: Tuple[float, float],
+    ) -> List[Tuple[int, int, int, int]]:
+        """Tile indexes ``(level, freq_level, time_tile, freq_tile)`` overlapping a view."""
+        frames_per_tile = TILE_COLUMNS << level
+        bins_per_tile = TILE_ROWS << freq_level
+        n_time_tiles = -(-self.n_columns(level) // TILE_COLUMNS)
+        n_freq_tiles = -(-self.n_rows(freq_level) // TILE_ROWS)
+
+        frame_lo, frame_hi = (
+            (np.asarray(time_range, dtype=np.float64) * self.sample_rate - self.nperseg / 2.0) / self.hop
+        )
+        bin_lo, bin_hi = np.asarray(freq_range, dtype=np.float64) / self.df + 0.5
+        if frame_hi < -0.5 or frame_lo > self.n_frames - 0.5 or bin_hi < 0 or bin_lo > self.n_bins:
+            return []
+        t_first = min(max(int(np.floor(frame_lo / frames_per_tile)), 0), n_time_tiles - 1)
+        t_last = min(max(int(np.floor(frame_hi / frames_per_tile)), 0), n_time_tiles - 1)
+        f_first = min(max(int(np.floor(bin_lo / bins_per_tile)), 0), n_freq_tiles - 1)
+        f_last = min(max(int(np.floor(bin_hi / bins_per_tile)), 0), n_freq_tiles - 1)
+        return [
+            (level, freq_level, time_tile, freq_tile)
+            for time_tile in range(t_first, t_last + 1)
+            for freq_tile in range(f_first, f_last + 1)
+        ]
+
+    def tile_rect(self, tile: Tuple[int, int, int, int]) -> Tuple[float, float, float, float]:
+        """``(x, y, width, height)`` of a tile in seconds and Hz, cells centred on frames and bins."""
+        level, freq_level, time_tile, freq_tile = tile
+        frame_seconds = self.hop / self.sample_rate
+        first_frame = time_tile * (TILE_COLUMNS << level)
+        first_bin = freq_tile * (TILE_ROWS << freq_level)
+        n_cols, n_rows = self._tile_shape(tile)
+        return (
+            float(self.frame_time(first_frame)) - frame_seconds / 2.0,
+            (first_bin - 0.5) * self.df,
+            n_cols * (1 << level) * frame_seconds,
+            n_rows * (1 << freq_level) * self.df,
+        )
+
+    def crop_to_frequencies(
+        self,
+        tile: Tuple[int, int, int, int],
+        power_db: np.ndarray,
+        freq_range: Tuple[float, float],
+    ) -> Optional[Tuple[np.ndarray, Tuple[float, float, float, float]]]:
+        """
+        Rows of a tile covering a bin inside ``freq_range``, with their rect.
+
+        Returns
+        -------
+        tuple of (np.ndarray, tuple) or None
+            Cropped power and ``(x, y, width, height)``, or None when no row
+            of the tile lies in the range
+        """
+        _level, freq_level, _time_tile, freq_tile = tile
+        rows = freq_tile * TILE_ROWS + np.arange(power_db.shape[0])
+        first_bin = rows << freq_level
+        last_bin = np.minimum(first_bin + (1 << freq_level), self.n_bins) - 1
+        bin_lo = np.ceil(freq_range[0] / self.df - 1e-9)
+        bin_hi = np.floor(freq_range[1] / self.df + 1e-9)
+        keep = np.flatnonzero((last_bin >= bin_lo) & (first_bin <= bin_hi))
+        if keep.size == 0:
+            return None
+        start, stop = int(keep[0]), int(keep[-1]) + 1
+        x, _y, width, _height = self.tile_rect(tile)
+        rect = (
+            x,
+            (float(first_bin[start]) - 0.5) * self.df,
+            width,
+            (stop - start) * (1 << freq_level) * self.df,
+        )
+        return power_db[start:stop], rect
+
+    def cache_key(self, tile: Tuple[int, int, int, int]) -> Hashable:
+        return (self.key, tile)
+
+    def cached_tile(self, tile: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        """Tile power in dB (rows x columns) if it is cached, else None."""
+        return self.cache.get(self.cache_key(tile))
+
+    def tile(self, tile: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Tile power in dB as a float32 array of shape (rows, columns).
+
+        Computing a tile transforms its time span once and caches every
+        frequency tile of that span at the same frequency level.
+        """
+        cached = self.cached_tile(tile)
+        if cached is not None:
+            return cached
+
+        level, freq_level, time_tile, freq_tile = tile
+        blocks = self._store_time_tile(level, freq_level, time_tile)
+        if not 0 <= freq_tile < len(blocks):
+            raise IndexError(f"Frequency tile {freq_tile} out of range at level {freq_level}")
+        return blocks[freq_tile]
+
+    def peak_power_db(self, tiles, freq_range: Tuple[float, float]) -> float:
+        """
+        Largest power in dB of any single frame and bin under ``tiles`` within ``freq_range``.
+
+        Coarse tiles average frames and bins, so their own maximum falls as
+        the view zooms out; this peak does not. Returns -inf when no row of
+        the tiles lies in the range.
+        """
+        peak = -np.inf
+        for tile in tiles:
+            level, freq_level, time_tile, freq_tile = tile
+            row_peaks = self._row_peaks.get((level, freq_level, time_tile))
+            if row_peaks is None:
+                self._store_time_tile(level, freq_level, time_tile)
+                row_peaks = self._row_peaks[(level, freq_level, time_tile)]
+            rows = row_peaks[freq_tile * TILE_ROWS:(freq_tile + 1) * TILE_ROWS]
+            cropped = self.crop_to_frequencies(tile, rows[:, None], freq_range)
+            if cropped is not None:
+                peak = max(peak, float(np.max(cropped[0])))
+        return peak
+
+    def _store_time_tile(self, level: int, freq_level: int, time_tile: int) -> List[np.ndarray]:
+        """Compute one time tile and cache all of its frequency tiles, returned in order."""
+        power_db, row_peaks = self._compute_time_tile(level, freq_level, time_tile)
+        self._row_peaks[(level, freq_level, time_tile)] = row_peaks
+        blocks = []
+        for index in range(-(-power_db.shape[0] // TILE_ROWS)):
+            block = np.ascontiguousarray(power_db[index * TILE_ROWS:(index + 1) * TILE_ROWS])
+            self.cache.put(self.cache_key((level, freq_level, time_tile, index)), block)
+            blocks.append(block)
+        return blocks
+
+    def _tile_shape(self, tile: Tuple[int, int, int, int]) -> Tuple[int, int]:
+        level, freq_level, time_tile, freq_tile = tile
+        n_cols = min(TILE_COLUMNS, self.n_columns(level) - time_tile * TILE_COLUMNS)
+        n_rows = min(TILE_ROWS, self.n_rows(freq_level) - freq_tile * TILE_ROWS)
+        return max(n_cols, 0), max(n_rows, 0)
+
+    def _compute_time_tile(self, level: int, freq_level: int, time_tile: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Power in dB of every row of one time tile, and the peak frame power in dB of each row."""
+        span = 1 << level
+        first_column = time_tile * TILE_COLUMNS
+        n_cols = min(TILE_COLUMNS, self.n_columns(level) - first_column)
+        if n_cols <= 0:
+            raise IndexError(f"Time tile {time_tile} out of range at level {level}")
+        first_frame = first_column * span
+        end_frame = min(first_frame + n_cols * span, self.n_frames)
+
+        # Sum every frame into its column; a column may span several batches
+        column_sums = np.zeros((self.n_bins, n_cols), dtype=np.float64)
+        bin_peaks = np.zeros(self.n_bins, dtype=np.float64)
+        batch = max(1, _BATCH_SAMPLES // self.nperseg)
+        for start in range(first_frame, end_frame, batch):
+            frames = np.arange(start, min(start + batch, end_frame))
+            _freqs, periodograms = compute_segment_periodograms(
+                self.signal, self.sample_rate, frames * self.hop, self.nperseg, window=self.window
+            )
+            columns = (frames - first_frame) >> level
+            bounds = np.flatnonzero(np.diff(columns, prepend=-1))
+            column_sums[:, columns[bounds]] += np.add.reduceat(periodograms, bounds, axis=1)
+            np.maximum(bin_peaks, periodograms.max(axis=1), out=bin_peaks)
+
+        column_starts = np.arange(n_cols) * span
+        counts = np.minimum(column_starts + span, end_frame - first_frame) - column_starts
+        row_starts = np.arange(0, self.n_bins, 1 << freq_level)
+        row_counts = np.diff(np.append(row_starts, self.n_bins))
+        power = np.add.reduceat(column_sums / counts, row_starts, axis=0) / row_counts[:, None]
+        row_peaks = np.maximum.reduceat(bin_peaks, row_starts)
+        return (
+            (10.0 * np.log10(power + 1e-20)).astype(np.float32),
+            (10.0 * np.log10(row_peaks + 1e-20)).astype(np.float32),
+        )
@@ -65,6 +65,7 @@ from spectral_edge.batch.processor import BatchProcessor
 from spectral_edge.batch.batch_worker import BatchWorker
 from spectral_edge.gui.flight_navigator_enhanced import FlightNavigator
 from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+from spectral_edge.utils.hdf5_catalog import get_default_catalog
 from spectral_edge.utils.message_box import show_information, show_warning, show_critical, show_question
 from spectral_edge.utils.reference_curves import (
     REFERENCE_CURVE_COLOR_PALETTE,
@@ -358,6 +359,13 @@ class BatchProcessorWindow(QMainWindow):
         self.efficient_fft_checkbox = QCheckBox("Use efficient FFT size")
         self.efficient_fft_checkbox.setChecked(True)
         freq_row1.addWidget(self.efficient_fft_checkbox)
+        self.spectral_index_checkbox = QCheckBox("Use stored spectral index")
+        self.spectral_index_checkbox.setToolTip(
+            "Answer event PSDs from spectral indexes stored in the HDF5 files\n"
+            "(scripts/index_hdf5_spectra.py) instead of reading raw samples.\n"
+            "Results are segment-aligned approximations of the raw calculation."
+        )
+        freq_row1.addWidget(self.spectral_index_checkbox)
         freq_row1.addStretch()
         freq_layout.addLayout(freq_row1)
         
@@ -1522,7 +1530,7 @@ class BatchProcessorWindow(QMainWindow):
         
         # Open Enhanced Flight Navigator
         try:
-            loader = HDF5FlightDataLoader(self.config.source_files[0])
+            loader = HDF5FlightDataLoader(self.config.source_files[0], catalog=get_default_catalog())
             navigator = FlightNavigator(loader, parent=self)
         except Exception as e:
             show_critical(
@@ -1532,7 +1540,12 @@ class BatchProcessorWindow(QMainWindow):
             )
             return
         
-        if navigator.exec() == navigator.DialogCode.Accepted:
+        try:
+            accepted = navigator.exec() == navigator.DialogCode.Accepted
+        finally:
+            loader.close()
+
+        if accepted:
             self.selected_channels = navigator.get_selected_channels()
             self.config.selected_channels = self.selected_channels
             
@@ -1849,6 +1862,7 @@ class BatchProcessorWindow(QMainWindow):
         self.config.psd_config.window = self.window_combo.currentText()
         self.config.psd_config.overlap_percent = float(self.overlap_spin.value())
         self.config.psd_config.use_efficient_fft = self.efficient_fft_checkbox.isChecked()
+        self.config.psd_config.use_spectral_index = self.spectral_index_checkbox.isChecked()
         self.config.psd_config.desired_df = self.df_spin.value()
         self.config.psd_config.freq_min = self.freq_min_spin.value()
         self.config.psd_config.freq_max = self.freq_max_spin.value()
@@ -1984,6 +1998,7 @@ class BatchProcessorWindow(QMainWindow):
         self.overlap_spin.setValue(int(self.config.psd_config.overlap_percent))
         self.df_spin.setValue(self.config.psd_config.desired_df)
         self.efficient_fft_checkbox.setChecked(self.config.psd_config.use_efficient_fft)
+        self.spectral_index_checkbox.setChecked(self.config.psd_config.use_spectral_index)
         self.freq_min_spin.setValue(self.config.psd_config.freq_min)
         self.freq_max_spin.setValue(self.config.psd_config.freq_max)
 
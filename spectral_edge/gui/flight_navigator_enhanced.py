@@ -4,6 +4,10 @@ Enhanced Flight & Channel Navigator GUI
 This module provides an advanced GUI for browsing and selecting flights and channels
 from HDF5 files with search, filtering, multiple view modes, and customizable columns.
 
+The channel tree is a virtualized model/view tree: channel rows are never
+materialized as widget items, and filtering runs over precomputed search keys
+and group indexes, so files with tens of thousands of channels stay responsive.
+
 Features:
 - Advanced search across channel names, locations, sensor IDs
 - Multi-criteria filtering (sensor type, location)
@@ -18,19 +22,20 @@ Date: 2026-01-27
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTreeWidget, QTreeWidgetItem, QTreeWidgetItemIterator, QGroupBox, QLineEdit,
+    QTreeView, QAbstractItemView, QGroupBox, QLineEdit,
     QCheckBox, QScrollArea, QWidget, QRadioButton, QComboBox,
     QMessageBox, QInputDialog, QMenu
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QAbstractItemModel, QModelIndex
 from PyQt6.QtGui import QFont, QAction
 from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
 from spectral_edge.utils.selection_manager import SelectionManager
 from spectral_edge.utils.message_box import show_warning, show_information
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, Iterable, List, Dict, Tuple, Optional
 import re
 from dataclasses import dataclass
 from enum import Enum
+import numpy as np
 
 
 class ViewMode(Enum):
@@ -49,6 +54,360 @@ class ColumnConfig:
     width: int = 150
 
 
+def _safe_text(value, fallback: str = "") -> str:
+    """Convert optional metadata to a safe display/filter string."""
+    if value is None:
+        return fallback
+    text = str(value).strip()
+    if not text:
+        return fallback
+    return text
+
+
+class ChannelIndex:
+    """
+    Precomputed search keys and group indexes over the navigator channel list.
+
+    Built once when channels are loaded. Filtering and regrouping then work on
+    integer codes and row arrays instead of re-reading channel metadata.
+    """
+
+    def __init__(self, channels: List[dict]):
+        self.search_keys = []
+        locations = []
+        sensor_types = []
+        flights = []
+
+        for channel_data in channels:
+            channel_info = channel_data['channel_info']
+            location = _safe_text(getattr(channel_info, 'location', ''))
+            # Newline-joined so a search never matches across two fields
+            self.search_keys.append("\n".join((
+                _safe_text(channel_data.get('channel_key', '')),
+                location,
+                _safe_text(getattr(channel_info, 'sensor_id', '')),
+                _safe_text(getattr(channel_info, 'description', '')),
+            )).lower())
+            locations.append(location)
+            sensor_types.append(channel_data['sensor_type'])
+            flights.append(channel_data['flight_key'])
+
+        self._group_codes = {
+            ViewMode.BY_FLIGHT: self._encode(flights),
+            ViewMode.BY_LOCATION: self._encode([loc or 'Unknown' for loc in locations]),
+            ViewMode.BY_SENSOR_TYPE: self._encode(sensor_types),
+        }
+        self._location_codes = self._encode([loc.lower() for loc in locations])
+        self._sensor_codes = self._group_codes[ViewMode.BY_SENSOR_TYPE]
+
+        # Channel-name order; filtered and grouped rows keep this order
+        self._sorted_rows = np.array(
+            sorted(range(len(channels)), key=lambda r: channels[r]['channel_key']), dtype=np.intp
+        )
+        self.sorted_rows = self._sorted_rows.tolist()
+
+    @staticmethod
+    def _encode(values: List[str]) -> Tuple[List[str], np.ndarray]:
+        """Return (sorted unique labels, per-row label codes)."""
+        labels = sorted(set(values))
+        lookup = {label: code for code, label in enumerate(labels)}
+        return labels, np.array([lookup[value] for value in values], dtype=np.intp)
+
+    def filter(self, search_text: str, sensor_types: Iterable[str], location_text: str) -> List[int]:
+        """Return rows (in channel-name order) matching all active criteria."""
+        rows = self._sorted_rows
+        if sensor_types:
+            labels, codes = self._sensor_codes
+            sensor_types = set(sensor_types)
+            wanted = [code for code, label in enumerate(labels) if label in sensor_types]
+            rows = rows[np.isin(codes[rows], wanted)]
+        if location_text:
+            needle = location_text.lower()
+            labels, codes = self._location_codes
+            wanted = [code for code, label in enumerate(labels) if needle in label]
+            rows = rows[np.isin(codes[rows], wanted)]
+
+        rows = rows.tolist()
+        if search_text:
+            needle = search_text.lower()
+            keys = self.search_keys
+            rows = [row for row in rows if needle in keys[row]]
+        return rows
+
+    def group(self, rows: List[int], view_mode: ViewMode) -> List[Tuple[str, List[int]]]:
+        """Group rows by the view mode key; groups sorted by key, rows keep order."""
+        if not rows:
+            return []
+        labels, codes = self._group_codes[view_mode]
+        rows = np.asarray(rows, dtype=np.intp)
+        row_codes = codes[rows]
+        order = np.argsort(row_codes, kind='stable')
+        sorted_codes = row_codes[order]
+        bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+        grouped = np.split(rows[order], bounds)
+        starts = np.concatenate(([0], bounds))
+        return [(labels[sorted_codes[start]], group.tolist()) for start, group in zip(starts, grouped)]
+
+
+class _ChannelGroup:
+    """Top-level node of the channel tree (a flight, location or sensor type)."""
+
+    __slots__ = ('key', 'rows', 'position', 'fetched')
+
+    def __init__(self, key: str, rows: List[int], position: int, fetched: int):
+        self.key = key
+        self.rows = rows
+        self.position = position
+        self.fetched = fetched  # Child rows exposed to the view so far
+
+
+class ChannelTreeModel(QAbstractItemModel):
+    """
+    Two-level (group -> channel) tree model over the navigator channel list.
+
+    Channel rows are virtual: their indexes reference the owning group and a
+    row number, and cell text is formatted only when the view asks for it.
+    Children are handed to the view in batches: the first through
+    ``fetchMore`` when a group is expanded, later ones through ``load_more``
+    when the navigator scrolls to the end of the loaded rows. Expanding large
+    groups therefore never lays out every channel.
+    Check states are kept as a set of channel rows, so they survive filtering
+    and regrouping.
+    """
+
+    # Child rows per fetch; the first fetch of each group shares INITIAL_ROWS
+    FETCH_BATCH = 250
+    INITIAL_ROWS = 1000
+    MIN_INITIAL_ROWS = 25
+
+    check_state_changed = pyqtSignal()
+
+    _ITEM_FLAGS = (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                   | Qt.ItemFlag.ItemIsUserCheckable)
+
+    _GROUP_TYPES = {
+        ViewMode.BY_FLIGHT: 'flight',
+        ViewMode.BY_LOCATION: 'location',
+        ViewMode.BY_SENSOR_TYPE: 'sensor_type',
+    }
+
+    def __init__(self, channels: List[dict], formatter: Callable[[dict, str], str], parent=None):
+        super().__init__(parent)
+        self._channels = channels
+        self._formatter = formatter
+        self._columns: List[ColumnConfig] = []
+        self._groups: List[_ChannelGroup] = []
+        self._initial_fetch = self.FETCH_BATCH
+        self._group_type = 'flight'
+        self._checked = set()
+
+    def set_channels(self, channels: List[dict]):
+        """Replace the channel list (clears groups and check states)."""
+        self.beginResetModel()
+        self._channels = channels
+        self._groups = []
+        self._checked = set()
+        self.endResetModel()
+
+    def set_columns(self, columns: List[ColumnConfig]):
+        self.beginResetModel()
+        self._columns = list(columns)
+        self.endResetModel()
+
+    def set_groups(self, groups: List[Tuple[str, List[int]]], view_mode: ViewMode):
+        self.beginResetModel()
+        self._groups = [_ChannelGroup(key, rows, i, 0) for i, (key, rows) in enumerate(groups)]
+        self._initial_fetch = min(
+            self.FETCH_BATCH, max(self.MIN_INITIAL_ROWS, self.INITIAL_ROWS // max(len(groups), 1))
+        )
+        self._group_type = self._GROUP_TYPES[view_mode]
+        self.endResetModel()
+
+    def visible_rows(self) -> List[int]:
+        return [row for group in self._groups for row in group.rows]
+
+    def checked_rows(self) -> List[int]:
+        return sorted(self._checked)
+
+    def set_rows_checked(self, rows: Iterable[int], checked: bool):
+        """Check or uncheck channel rows in bulk."""
+        if checked:
+            self._checked.update(rows)
+        else:
+            self._checked.difference_update(rows)
+        self._emit_all_changed()
+        self.check_state_changed.emit()
+
+    def _emit_all_changed(self):
+        if not self._groups:
+            return
+        roles = [Qt.ItemDataRole.CheckStateRole]
+        self.dataChanged.emit(self.index(0, 0), self.index(len(self._groups) - 1, 0), roles)
+        for group in self._groups:
+            if group.fetched:
+                parent = self.createIndex(group.position, 0, None)
+                self.dataChanged.emit(
+                    self.index(0, 0, parent), self.index(group.fetched - 1, 0, parent), roles
+                )
+
+    def is_last_fetched_child(self, index: QModelIndex) -> bool:
+        """True if ``index`` is the last loaded channel of a partly loaded group."""
+        group = index.internalPointer() if index.isValid() else None
+        return group is not None and index.row() == group.fetched - 1 and group.fetched < len(group.rows)
+
+    def _group_check_state(self, group: _ChannelGroup) -> Qt.CheckState:
+        checked = sum(1 for row in group.rows if row in self._checked)
+        if checked == 0:
+            return Qt.CheckState.Unchecked
+        if checked == len(group.rows):
+            return Qt.CheckState.Checked
+        return Qt.CheckState.PartiallyChecked
+
+    # -- QAbstractItemModel interface ------------------------------------
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        # Bounds are checked inline (not via hasIndex): views call this per row
+        if row < 0 or not 0 <= column < len(self._columns):
+            return QModelIndex()
+        if not parent.isValid():
+            if row >= len(self._groups):
+                return QModelIndex()
+            return self.createIndex(row, column, None)
+        if parent.internalPointer() is not None:
+            return QModelIndex()
+        group = self._groups[parent.row()]
+        if row >= group.fetched:
+            return QModelIndex()
+        return self.createIndex(row, column, group)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        group = index.internalPointer()
+        if group is None:
+            return QModelIndex()
+        return self.createIndex(group.position, 0, None)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._groups)
+        if parent.column() != 0 or parent.internalPointer() is not None:
+            return 0
+        return self._groups[parent.row()].fetched
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        # Only the initial batch: QTreeView calls fetchMore on every layout
+        # pass, so later batches are requested explicitly via load_more
+        if not parent.isValid() or parent.internalPointer() is not None:
+            return False
+        group = self._groups[parent.row()]
+        return group.fetched == 0 and bool(group.rows)
+
+    def fetchMore(self, parent: QModelIndex):
+        if self.canFetchMore(parent):
+            self._fetch(parent, self._initial_fetch)
+
+    def load_more(self, parent: QModelIndex):
+        """Expose the next batch of channels of a partly loaded group."""
+        if parent.isValid() and parent.internalPointer() is None:
+            self._fetch(parent, self.FETCH_BATCH)
+
+    def _fetch(self, parent: QModelIndex, batch: int):
+        group = self._groups[parent.row()]
+        count = min(len(group.rows), group.fetched + batch)
+        if count <= group.fetched:
+            return
+        self.beginInsertRows(parent, group.fetched, count - 1)
+        group.fetched = count
+        self.endInsertRows()
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        # Views call this for every laid-out row; answer without building indexes
+        if not parent.isValid():
+            return bool(self._groups)
+        return parent.internalPointer() is None and parent.column() == 0 and bool(
+            self._groups[parent.row()].rows
+        )
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._columns)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return self._ITEM_FLAGS
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self._columns)):
+            return self._columns[section].title
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        group = index.internalPointer()
+        column = index.column()
+
+        if group is None:
+            group = self._groups[index.row()]
+            if role == Qt.ItemDataRole.DisplayRole and column == 0:
+                return f"{group.key} ({len(group.rows)} channels)"
+            if role == Qt.ItemDataRole.CheckStateRole and column == 0:
+                return self._group_check_state(group)
+            if role == Qt.ItemDataRole.UserRole:
+                return {'type': self._group_type, 'key': group.key}
+            return None
+
+        row = group.rows[index.row()]
+        channel_data = self._channels[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._formatter(channel_data, self._columns[column].name)
+        if role == Qt.ItemDataRole.CheckStateRole and column == 0:
+            return Qt.CheckState.Checked if row in self._checked else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.UserRole:
+            return {
+                'type': 'channel',
+                'flight_key': channel_data['flight_key'],
+                'channel_key': channel_data['channel_key'],
+                'channel_info': channel_data['channel_info'],
+            }
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole or index.column() != 0:
+            return False
+        if not isinstance(value, Qt.CheckState):
+            value = Qt.CheckState(value)
+        checked = value == Qt.CheckState.Checked
+
+        group = index.internalPointer()
+        roles = [Qt.ItemDataRole.CheckStateRole]
+        if group is None:
+            group = self._groups[index.row()]
+            if checked:
+                self._checked.update(group.rows)
+            else:
+                self._checked.difference_update(group.rows)
+            self.dataChanged.emit(index, index, roles)
+            if group.fetched:
+                self.dataChanged.emit(
+                    self.index(0, 0, index), self.index(group.fetched - 1, 0, index), roles
+                )
+        else:
+            row = group.rows[index.row()]
+            if checked:
+                self._checked.add(row)
+            else:
+                self._checked.discard(row)
+            self.dataChanged.emit(index, index, roles)
+            group_index = self.createIndex(group.position, 0, None)
+            self.dataChanged.emit(group_index, group_index, roles)
+
+        self.check_state_changed.emit()
+        return True
+
+
 class FlightNavigator(QDialog):
     """
     Enhanced dialog for navigating and selecting flights and channels from HDF5 files.
@@ -95,7 +454,8 @@ class FlightNavigator(QDialog):
         # Data storage
         self.selected_items = []  # List of (flight_key, channel_key, channel_info)
         self.all_channels = []  # All channels for filtering
-        self.filtered_channels = []  # Channels after filtering
+        self.channel_index = ChannelIndex([])  # Search keys/group indexes over all_channels
+        self._filtered_rows = []  # Rows of all_channels passing the filters
         
         # View mode
         self.current_view_mode = ViewMode.BY_FLIGHT
@@ -162,19 +522,19 @@ class FlightNavigator(QDialog):
                 left: 10px;
                 padding: 0 5px;
             }
-            QTreeWidget#channelTree {
+            QTreeView#channelTree {
                 background-color: #2d3748;
                 color: #e0e0e0;
                 border: 1px solid #4a5568;
                 font-size: 10pt;
             }
-            QTreeWidget#channelTree::item:hover {
+            QTreeView#channelTree::item:hover {
                 background-color: #4a5568;
             }
-            QTreeWidget#channelTree::item:selected {
+            QTreeView#channelTree::item:selected {
                 background-color: #3b82f6;
             }
-            QTreeWidget#channelTree QHeaderView::section {
+            QTreeView#channelTree QHeaderView::section {
                 background-color: #1a1f2e;
                 color: #60a5fa;
                 font-weight: bold;
@@ -302,12 +662,16 @@ class FlightNavigator(QDialog):
         view_mode_layout = self._create_view_mode_panel()
         main_layout.addLayout(view_mode_layout)
         
-        # Tree widget
-        self.tree = QTreeWidget()
+        # Channel tree (virtualized model/view)
+        self.tree_model = ChannelTreeModel(self.all_channels, self._channel_column_text, self)
+        self.tree_model.check_state_changed.connect(self._update_selection)
+        self.tree = QTreeView()
         self.tree.setObjectName("channelTree")
         self.tree.setHeaderHidden(False)
-        self.tree.setSelectionMode(QTreeWidget.SelectionMode.ExtendedSelection)
-        self.tree.itemChanged.connect(self._on_item_changed)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.tree.setModel(self.tree_model)
+        self.tree.verticalScrollBar().valueChanged.connect(self._fetch_visible_groups)
         self._apply_tree_header_styling()
         self._update_tree_columns()
         main_layout.addWidget(self.tree, stretch=1)
@@ -519,21 +883,23 @@ class FlightNavigator(QDialog):
         
         progress.close()
         
+        self.channel_index = ChannelIndex(self.all_channels)
+        self._filtered_rows = list(self.channel_index.sorted_rows)
+        self.tree_model.set_channels(self.all_channels)
+        
         # If cancelled, close dialog and return
         if cancelled:
             self.reject()
             return
-        
-        self.filtered_channels = self.all_channels.copy()
+
+    @property
+    def filtered_channels(self) -> List[dict]:
+        """Channels passing the current filters, in channel-name order."""
+        return [self.all_channels[row] for row in self._filtered_rows]
 
     def _safe_text(self, value, fallback: str = "") -> str:
         """Convert optional metadata to a safe display/filter string."""
-        if value is None:
-            return fallback
-        text = str(value).strip()
-        if not text:
-            return fallback
-        return text
+        return _safe_text(value, fallback)
 
     def _normalize_units(self, units: str) -> str:
         """Normalize units to improve robust matching across source variants."""
@@ -606,33 +972,34 @@ class FlightNavigator(QDialog):
             return "Unknown"
     
     def _update_tree_columns(self):
-        """Update tree widget columns based on configuration"""
+        """Update tree columns based on configuration"""
         visible_columns = [col for col in self.columns if col.visible]
-        self.tree.setColumnCount(len(visible_columns))
-        self.tree.setHeaderLabels([col.title for col in visible_columns])
+        self.tree_model.set_columns(visible_columns)
         
         for i, col in enumerate(visible_columns):
             self.tree.setColumnWidth(i, col.width)
     
     def _populate_tree(self):
-        """Populate tree widget based on current view mode and filters"""
-        self.tree.clear()
-        self.tree.itemChanged.disconnect(self._on_item_changed)
-        
-        if self.current_view_mode == ViewMode.BY_FLIGHT:
-            self._populate_by_flight()
-        elif self.current_view_mode == ViewMode.BY_LOCATION:
-            self._populate_by_location()
-        elif self.current_view_mode == ViewMode.BY_SENSOR_TYPE:
-            self._populate_by_sensor_type()
+        """Regroup the filtered channels for the current view mode"""
+        groups = self.channel_index.group(self._filtered_rows, self.current_view_mode)
+        self.tree_model.set_groups(groups, self.current_view_mode)
         
-        self.tree.itemChanged.connect(self._on_item_changed)
         self._update_result_label()
         if self.always_expanded_check.isChecked():
             self.tree.expandAll()
         else:
             self.tree.collapseAll()
 
+    def _fetch_visible_groups(self, *_args):
+        """Load more channels for any group whose last loaded row is on screen."""
+        viewport = self.tree.viewport()
+        index = self.tree.indexAt(viewport.rect().topLeft())
+        bottom = viewport.rect().bottom()
+        while index.isValid() and self.tree.visualRect(index).top() <= bottom:
+            if self.tree_model.is_last_fetched_child(index):
+                self.tree_model.load_more(index.parent())
+            index = self.tree.indexBelow(index)
+
     def _on_tree_expansion_changed(self, _state: int):
         """Handle Always Expanded toggle for tree item expansion."""
         if not hasattr(self, "tree"):
@@ -647,115 +1014,36 @@ class FlightNavigator(QDialog):
         super().showEvent(event)
         self._apply_tree_header_styling()
     
-    def _populate_by_flight(self):
-        """Populate tree in 'By Flight' view mode"""
-        flights = {}
-        for channel_data in self.filtered_channels:
-            flight_key = channel_data['flight_key']
-            if flight_key not in flights:
-                flights[flight_key] = []
-            flights[flight_key].append(channel_data)
-        
-        for flight_key in sorted(flights.keys()):
-            flight_info = flights[flight_key][0]['flight_info']
-            flight_item = QTreeWidgetItem(self.tree)
-            flight_item.setText(0, f"{flight_key} ({len(flights[flight_key])} channels)")
-            flight_item.setFlags(flight_item.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsAutoTristate)
-            flight_item.setCheckState(0, Qt.CheckState.Unchecked)
-            flight_item.setData(0, Qt.ItemDataRole.UserRole, {'type': 'flight', 'key': flight_key})
-            
-            for channel_data in sorted(flights[flight_key], key=lambda x: x['channel_key']):
-                channel_item = self._create_channel_item(channel_data)
-                flight_item.addChild(channel_item)
-    
-    def _populate_by_location(self):
-        """Populate tree in 'By Location' view mode"""
-        locations = {}
-        for channel_data in self.filtered_channels:
-            location = self._safe_text(getattr(channel_data['channel_info'], 'location', ''), 'Unknown')
-            if location not in locations:
-                locations[location] = []
-            locations[location].append(channel_data)
-        
-        for location in sorted(locations.keys()):
-            location_item = QTreeWidgetItem(self.tree)
-            location_item.setText(0, f"{location} ({len(locations[location])} channels)")
-            location_item.setFlags(location_item.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsAutoTristate)
-            location_item.setCheckState(0, Qt.CheckState.Unchecked)
-            location_item.setData(0, Qt.ItemDataRole.UserRole, {'type': 'location', 'key': location})
-            
-            for channel_data in sorted(locations[location], key=lambda x: x['channel_key']):
-                channel_item = self._create_channel_item(channel_data)
-                location_item.addChild(channel_item)
-    
-    def _populate_by_sensor_type(self):
-        """Populate tree in 'By Sensor Type' view mode"""
-        sensor_types = {}
-        for channel_data in self.filtered_channels:
-            sensor_type = channel_data['sensor_type']
-            if sensor_type not in sensor_types:
-                sensor_types[sensor_type] = []
-            sensor_types[sensor_type].append(channel_data)
-        
-        for sensor_type in sorted(sensor_types.keys()):
-            type_item = QTreeWidgetItem(self.tree)
-            type_item.setText(0, f"{sensor_type} ({len(sensor_types[sensor_type])} channels)")
-            type_item.setFlags(type_item.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsAutoTristate)
-            type_item.setCheckState(0, Qt.CheckState.Unchecked)
-            type_item.setData(0, Qt.ItemDataRole.UserRole, {'type': 'sensor_type', 'key': sensor_type})
-            
-            for channel_data in sorted(sensor_types[sensor_type], key=lambda x: x['channel_key']):
-                channel_item = self._create_channel_item(channel_data)
-                type_item.addChild(channel_item)
-    
-    def _create_channel_item(self, channel_data: dict) -> QTreeWidgetItem:
-        """Create a tree widget item for a channel"""
-        channel_item = QTreeWidgetItem()
-        channel_item.setFlags(channel_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-        channel_item.setCheckState(0, Qt.CheckState.Unchecked)
-        
-        # Store data
-        channel_item.setData(0, Qt.ItemDataRole.UserRole, {
-            'type': 'channel',
-            'flight_key': channel_data['flight_key'],
-            'channel_key': channel_data['channel_key'],
-            'channel_info': channel_data['channel_info']
-        })
-        
-        # Set column values based on visible columns
-        visible_columns = [col for col in self.columns if col.visible]
+    def _channel_column_text(self, channel_data: dict, column_name: str) -> str:
+        """Format one channel cell for display"""
         channel_info = channel_data['channel_info']
         
-        for i, col in enumerate(visible_columns):
-            if col.name == "name":
-                channel_item.setText(i, channel_data['channel_key'])
-            elif col.name == "units":
-                channel_item.setText(i, self._safe_text(getattr(channel_info, 'units', None), 'N/A'))
-            elif col.name == "sample_rate":
-                sr = getattr(channel_info, 'sample_rate', None)
-                if isinstance(sr, (int, float)) and sr > 0:
-                    channel_item.setText(i, f"{sr} Hz")
-                else:
-                    channel_item.setText(i, "N/A")
-            elif col.name == "location":
-                channel_item.setText(i, self._safe_text(getattr(channel_info, 'location', None), 'N/A'))
-            elif col.name == "time_range":
-                channel_item.setText(i, self._safe_text(channel_data.get('time_range', None), 'N/A'))
-            elif col.name == "sensor_id":
-                channel_item.setText(i, self._safe_text(getattr(channel_info, 'sensor_id', None), 'N/A'))
-            elif col.name == "description":
-                channel_item.setText(i, self._safe_text(getattr(channel_info, 'description', None), 'N/A'))
-            elif col.name == "range":
-                range_min = getattr(channel_info, 'range_min', None)
-                range_max = getattr(channel_info, 'range_max', None)
-                if range_min is not None and range_max is not None:
-                    channel_item.setText(i, f"{range_min} to {range_max}")
-                else:
-                    channel_item.setText(i, 'N/A')
-            elif col.name == "flight":
-                channel_item.setText(i, channel_data['flight_key'])
-        
-        return channel_item
+        if column_name == "name":
+            return channel_data['channel_key']
+        elif column_name == "units":
+            return self._safe_text(getattr(channel_info, 'units', None), 'N/A')
+        elif column_name == "sample_rate":
+            sr = getattr(channel_info, 'sample_rate', None)
+            if isinstance(sr, (int, float)) and sr > 0:
+                return f"{sr} Hz"
+            return "N/A"
+        elif column_name == "location":
+            return self._safe_text(getattr(channel_info, 'location', None), 'N/A')
+        elif column_name == "time_range":
+            return self._safe_text(channel_data.get('time_range', None), 'N/A')
+        elif column_name == "sensor_id":
+            return self._safe_text(getattr(channel_info, 'sensor_id', None), 'N/A')
+        elif column_name == "description":
+            return self._safe_text(getattr(channel_info, 'description', None), 'N/A')
+        elif column_name == "range":
+            range_min = getattr(channel_info, 'range_min', None)
+            range_max = getattr(channel_info, 'range_max', None)
+            if range_min is not None and range_max is not None:
+                return f"{range_min} to {range_max}"
+            return 'N/A'
+        elif column_name == "flight":
+            return channel_data['flight_key']
+        return ""
 
     
     def _on_search_changed(self, text: str):
@@ -779,44 +1067,11 @@ class FlightNavigator(QDialog):
     
     def _apply_filters(self):
         """Apply current search and filter criteria"""
-        self.filtered_channels = []
-        
-        for channel_data in self.all_channels:
-            # Check sensor type filter
-            if self.filter_sensor_types and channel_data['sensor_type'] not in self.filter_sensor_types:
-                continue
-            
-            # Check location filter
-            if self.filter_location:
-                channel_location = self._safe_text(
-                    getattr(channel_data['channel_info'], 'location', '')
-                ).lower()
-                if self.filter_location.lower() not in channel_location:
-                    continue
-            
-            # Check search text
-            if self.search_text:
-                search_lower = self.search_text.lower()
-                channel_key_lower = self._safe_text(channel_data.get('channel_key', '')).lower()
-                location_lower = self._safe_text(
-                    getattr(channel_data['channel_info'], 'location', '')
-                ).lower()
-                sensor_id_lower = self._safe_text(
-                    getattr(channel_data['channel_info'], 'sensor_id', '')
-                ).lower()
-                description_lower = self._safe_text(
-                    getattr(channel_data['channel_info'], 'description', '')
-                ).lower()
-                
-                if not (search_lower in channel_key_lower or
-                        search_lower in location_lower or
-                        search_lower in sensor_id_lower or
-                        search_lower in description_lower):
-                    continue
-            
-            self.filtered_channels.append(channel_data)
+        self._filtered_rows = self.channel_index.filter(
+            self.search_text, self.filter_sensor_types, self.filter_location
+        )
         
-        # Repopulate tree
+        # Regroup tree
         self._populate_tree()
     
     def _reset_filters(self):
@@ -833,7 +1088,7 @@ class FlightNavigator(QDialog):
     def _update_result_label(self):
         """Update the result count label"""
         total = len(self.all_channels)
-        filtered = len(self.filtered_channels)
+        filtered = len(self._filtered_rows)
         if filtered == total:
             self.result_label.setText(f"Showing all {total} channels")
         else:
@@ -845,29 +1100,16 @@ class FlightNavigator(QDialog):
             self.current_view_mode = mode
             self._populate_tree()
     
-    def _on_item_changed(self, item: QTreeWidgetItem, column: int):
-        """Handle item check state changes"""
-        if column == 0:
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if data and data['type'] == 'channel':
-                self._update_selection()
-    
     def _update_selection(self):
-        """Update the selected items list"""
+        """Update the selected items list from the model check states"""
         self.selected_items = []
-        
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            if item.checkState(0) == Qt.CheckState.Checked:
-                data = item.data(0, Qt.ItemDataRole.UserRole)
-                if data and data['type'] == 'channel':
-                    self.selected_items.append((
-                        data['flight_key'],
-                        data['channel_key'],
-                        data['channel_info']
-                    ))
-            iterator += 1
+        for row in self.tree_model.checked_rows():
+            channel_data = self.all_channels[row]
+            self.selected_items.append((
+                channel_data['flight_key'],
+                channel_data['channel_key'],
+                channel_data['channel_info']
+            ))
         
         # Update UI
         count = len(self.selected_items)
@@ -876,31 +1118,11 @@ class FlightNavigator(QDialog):
     
     def _select_all(self):
         """Select all visible channels"""
-        self.tree.itemChanged.disconnect(self._on_item_changed)
-        
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if data and data['type'] == 'channel':
-                item.setCheckState(0, Qt.CheckState.Checked)
-            iterator += 1
-        
-        self.tree.itemChanged.connect(self._on_item_changed)
-        self._update_selection()
+        self.tree_model.set_rows_checked(self.tree_model.visible_rows(), True)
     
     def _deselect_all(self):
         """Deselect all channels"""
-        self.tree.itemChanged.disconnect(self._on_item_changed)
-        
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            item.setCheckState(0, Qt.CheckState.Unchecked)
-            iterator += 1
-        
-        self.tree.itemChanged.connect(self._on_item_changed)
-        self._update_selection()
+        self.tree_model.set_rows_checked(range(len(self.all_channels)), False)
     
     def _customize_columns(self):
         """Open column customization dialog"""
@@ -973,20 +1195,13 @@ class FlightNavigator(QDialog):
     
     def _load_selection_data(self, selection_data: dict):
         """Load selection data and update UI"""
-        self._deselect_all()
-        
-        items_to_select = set(selection_data.get('items', []))
-        
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if data and data['type'] == 'channel':
-                if (data['flight_key'], data['channel_key']) in items_to_select:
-                    item.setCheckState(0, Qt.CheckState.Checked)
-            iterator += 1
-        
-        self._update_selection()
+        items_to_select = {tuple(item) for item in selection_data.get('items', [])}
+        rows = [
+            row for row, channel_data in enumerate(self.all_channels)
+            if (channel_data['flight_key'], channel_data['channel_key']) in items_to_select
+        ]
+        self.tree_model.set_rows_checked(range(len(self.all_channels)), False)
+        self.tree_model.set_rows_checked(rows, True)
     
     def _update_recent_combo(self):
         """Update recent selections combobox"""
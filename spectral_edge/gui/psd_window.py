@@ -14,11 +14,14 @@ from PyQt6.QtWidgets import (
     QGroupBox, QGridLayout, QMessageBox, QCheckBox, QScrollArea, QTabWidget, QLineEdit,
     QDialog, QProgressDialog, QApplication, QSizePolicy, QRadioButton, QButtonGroup, QStyle
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 import json
 import os
 import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pyqtgraph as pg
 import numpy as np
 from pathlib import Path
@@ -27,12 +30,16 @@ from typing import Optional
 # Import our custom modules
 from spectral_edge.utils.data_loader import load_csv_data, DataLoadError
 from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+from spectral_edge.utils.hdf5_catalog import get_default_catalog
+from spectral_edge.utils.time_history_lod import MinMaxPyramid
+from spectral_edge.utils.channel_cache import ArrayLRUCache, LazyArray, materialize
 from spectral_edge.core.psd import (
     calculate_psd_welch, calculate_psd_maximax, psd_to_db, calculate_rms_from_psd,
     get_window_options, convert_psd_to_octave_bands,
     calculate_csd, calculate_coherence, calculate_transfer_function
 )
 from spectral_edge.core.channel_data import ChannelData, align_channels_by_time
+from spectral_edge.core.segment_index import SegmentSpectrumIndex
 from spectral_edge.gui.spectrogram_window import SpectrogramWindow
 from spectral_edge.gui.event_manager import EventManagerWindow, Event
 from spectral_edge.gui.flight_navigator_enhanced import FlightNavigator
@@ -42,10 +49,13 @@ from spectral_edge.gui.cross_spectrum_window import CrossSpectrumWindow
 from spectral_edge.gui.statistics_window import create_statistics_window
 from spectral_edge.utils.theme import apply_context_menu_style, apply_dark_dialog_theme
 from spectral_edge.utils.signal_conditioning import (
-    apply_processing_pipeline,
     apply_robust_filtering,
     build_processing_note,
+    cached_robust_filtering,
     calculate_baseline_filters,
+    conditioned_signal_array,
+    conditioned_signal_cache,
+    discard_conditioned_signals,
 )
 from spectral_edge.utils.reference_curves import (
     REFERENCE_CURVE_COLOR_PALETTE,
@@ -267,6 +277,340 @@ class ScientificAxisItem(pg.AxisItem):
         return strings
 
 
+class _LODPlotDataItem(pg.PlotDataItem):
+    """
+    Time-history curve drawn from a min/max LOD pyramid.
+
+    The curve only holds samples for the visible window, so auto-range
+    reports the whole channel's bounds instead of the current data.
+    """
+
+    def __init__(self, pyramid, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        t_min, t_max, y_min, y_max = pyramid.bounds()
+        self._full_bounds = ([t_min, t_max], [y_min, y_max])
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        return self._full_bounds[ax]
+
+
+def _compute_psd_with_settings(signal, channel_sample_rate, settings, whole_channel=False):
+    """
+    Compute one conditioned PSD from a snapshot of the window's PSD settings.
+
+    Whole channels are conditioned through the session-wide cache shared
+    with the spectrogram and statistics views; event slices are conditioned
+    directly. Touches no widgets, so it can run on PSD worker threads.
+    """
+    if whole_channel:
+        processed_signal, applied_highpass, applied_lowpass, info_messages = cached_robust_filtering(
+            signal,
+            channel_sample_rate,
+            user_highpass=settings["user_highpass"],
+            user_lowpass=settings["user_lowpass"],
+        )
+    else:
+        processed_signal = np.asarray(signal, dtype=np.float64).copy()
+        processed_signal, applied_highpass, applied_lowpass, info_messages = apply_robust_filtering(
+            processed_signal,
+            channel_sample_rate,
+            user_highpass=settings["user_highpass"],
+            user_lowpass=settings["user_lowpass"],
+        )
+
+    if settings["maximax"]:
+        frequencies, psd = calculate_psd_maximax(
+            processed_signal,
+            channel_sample_rate,
+            df=settings["df"],
+            maximax_window=settings["maximax_window"],
+            overlap_percent=settings["maximax_overlap"],
+            window=settings["window"],
+            use_efficient_fft=settings["use_efficient_fft"],
+        )
+    else:
+        nperseg = int(channel_sample_rate / settings["df"])
+        noverlap = int(nperseg * settings["overlap"] / 100.0)
+        frequencies, psd = calculate_psd_welch(
+            processed_signal,
+            channel_sample_rate,
+            df=settings["df"],
+            noverlap=noverlap,
+            window=settings["window"],
+            use_efficient_fft=settings["use_efficient_fft"],
+        )
+
+    return frequencies, psd, applied_highpass, applied_lowpass, info_messages
+
+
+def _band_rms(frequencies, psd, freq_min, freq_max):
+    """``(rms, note)`` over a band; the RMS is NaN (with a note) when the band misses the PSD."""
+    try:
+        return calculate_rms_from_psd(frequencies, psd, freq_min=freq_min, freq_max=freq_max), None
+    except ValueError as exc:
+        return float("nan"), f"RMS not computed: {exc}"
+
+
+def _run_psd_job(signal, channel_sample_rate, settings, whole_channel=False):
+    """PSD plus ``(rms, note)`` over the settings' frequency band for one channel/event."""
+    frequencies, psd, applied_highpass, applied_lowpass, info_messages = _compute_psd_with_settings(
+        signal, channel_sample_rate, settings, whole_channel
+    )
+    band_rms = _band_rms(frequencies, psd, settings["freq_min"], settings["freq_max"])
+    return frequencies, psd, applied_highpass, applied_lowpass, info_messages, band_rms
+
+
+def _psd_spectral_key(settings) -> tuple:
+    """
+    The part of a PSD settings snapshot that shapes the spectrum.
+
+    The frequency band only affects RMS and display, and each method ignores
+    the other method's overlap settings, so those are left out.
+    """
+    names = ["window", "df", "use_efficient_fft", "maximax", "user_highpass", "user_lowpass"]
+    if settings["maximax"]:
+        names += ["maximax_window", "maximax_overlap"]
+    else:
+        names.append("overlap")
+    return tuple((name, settings[name]) for name in names)
+
+
+def _segment_index_key(settings, sample_rate) -> tuple:
+    """
+    The part of a PSD settings snapshot that shapes a channel's segment index.
+
+    Only the segment grid, window and conditioning matter: the maximax window
+    and overlap, the frequency band and display options are applied when the
+    index is queried.
+    """
+    nperseg = int(sample_rate / settings["df"])
+    if settings["use_efficient_fft"]:
+        nperseg = 2 ** int(np.ceil(np.log2(nperseg)))
+    if settings["maximax"]:
+        noverlap = nperseg // 2
+    else:
+        noverlap = int(nperseg * settings["overlap"] / 100.0)
+    return nperseg, noverlap, settings["window"], settings["user_highpass"], settings["user_lowpass"]
+
+
+def _build_segment_index(signal, channel_sample_rate, settings, whole_channel=True):
+    """
+    Segment spectrum index of one conditioned channel for the live region PSD.
+
+    Shares the PSD job signature so it runs on a ``PSDCalculationThread``.
+    Returns None when the channel is too short or the index too large.
+    """
+    nperseg, noverlap, window, user_highpass, user_lowpass = _segment_index_key(settings, channel_sample_rate)
+    try:
+        conditioned, _hp, _lp, _messages = cached_robust_filtering(
+            signal, channel_sample_rate, user_highpass=user_highpass, user_lowpass=user_lowpass
+        )
+        return SegmentSpectrumIndex(conditioned, channel_sample_rate, nperseg, noverlap, window=window)
+    except ValueError:
+        return None
+
+
+class PSDCalculationThread(QThread):
+    """
+    Background thread that computes PSD jobs on a worker pool.
+
+    Each job is ``(key, signal, sample_rate)`` with ``key`` being
+    ``(event_name, channel_idx)`` (``event_name`` is None for whole
+    channels); finished jobs are streamed back through ``result_ready`` as
+    they complete. The heavy work (filtering and FFTs) runs in NumPy/SciPy
+    code that releases the GIL, so a thread pool spreads channels across
+    cores without copying signals to other processes. ``job_function``
+    replaces :func:`_run_psd_job` for other per-channel work with the same
+    signature, such as building live region indexes.
+    """
+    result_ready = pyqtSignal(object, object)  # job key, _run_psd_job result
+    job_failed = pyqtSignal(object, str)  # job key, error message
+    progress = pyqtSignal(int, int)  # completed jobs, total jobs
+
+    def __init__(self, jobs, settings, max_workers=None, parent=None, job_function=None):
+        super().__init__(parent)
+        self.jobs = list(jobs)
+        self.settings = dict(settings)
+        self.job_function = job_function or _run_psd_job
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._cancel_event = threading.Event()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def cancel(self):
+        """Drop jobs that have not started and stop delivering results."""
+        self._cancel_event.set()
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self):
+        total = len(self.jobs)
+        workers = max(1, min(self.max_workers, total))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="psd") as executor:
+            with self._executor_lock:
+                if self._cancel_event.is_set():
+                    return
+                self._executor = executor
+                futures = {
+                    executor.submit(self.job_function, signal, sample_rate, self.settings, key[0] is None): key
+                    for key, signal, sample_rate in self.jobs
+                }
+            completed = 0
+            for future in as_completed(futures):
+                if self._cancel_event.is_set():
+                    break
+                key = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    self.job_failed.emit(key, str(exc))
+                else:
+                    self.result_ready.emit(key, result)
+                completed += 1
+                self.progress.emit(completed, total)
+
+
+def _load_channel_full_resolution(job, filter_inputs, conditioned_array):
+    """
+    Read one lazy HDF5 channel at full resolution and build its time-history views.
+
+    The samples are kept in the channel cache when they fit its remaining
+    budget. Returns a dict with the raw LOD pyramid and, when
+    ``filter_inputs`` is given, the conditioned signal (as an in-memory array
+    and a cached ``LazyArray``), its LOD pyramid and the applied filters.
+    """
+    channel_idx, _flight_key, _channel_key, time_full, signal, sample_rate = job
+    cache = signal.cache
+    if cache.nbytes + signal.nbytes <= cache.max_bytes:
+        data = signal.read()
+    else:
+        data = np.asarray(signal[:], dtype=np.float64)
+    start_time = float(time_full[0])
+    payload = {
+        "filter_inputs": filter_inputs,
+        "lod_raw": MinMaxPyramid(signal, sample_rate=sample_rate, start_time=start_time, data=data),
+    }
+    if filter_inputs is not None:
+        user_highpass, user_lowpass = filter_inputs
+        filtered, applied_highpass, applied_lowpass, messages = cached_robust_filtering(
+            signal, sample_rate, user_highpass=user_highpass, user_lowpass=user_lowpass, samples=data
+        )
+        conditioned = conditioned_array(signal, sample_rate, user_highpass, user_lowpass)
+        payload.update(
+            filtered=filtered,
+            signal_full_filtered=conditioned,
+            lod_filtered=MinMaxPyramid(
+                conditioned, sample_rate=sample_rate, start_time=start_time, data=filtered
+            ),
+            applied_highpass_hz=float(applied_highpass),
+            applied_lowpass_hz=float(applied_lowpass),
+            messages=list(messages),
+        )
+    return payload
+
+
+class ChannelLoadThread(QThread):
+    """
+    Background thread that loads selected HDF5 channels on a worker pool.
+
+    Each job is ``(channel_idx, flight_key, channel_key, time_full, signal_full,
+    sample_rate)`` with lazy full-resolution handles. Display views are read
+    first and streamed back through ``channel_ready`` so every trace can be
+    drawn as soon as it arrives; the full-resolution pass (cache warm-up,
+    conditioning and LOD pyramids, see ``_load_channel_full_resolution``)
+    follows on the same pool and is delivered through ``full_resolution_ready``.
+    h5py serializes file access, so the pool overlaps the reads of one channel
+    with the NumPy/SciPy work of the others.
+    """
+    channel_ready = pyqtSignal(int, object)  # channel index, load_display_data result
+    channel_failed = pyqtSignal(int, str)  # channel index, error message
+    full_resolution_ready = pyqtSignal(int, object)  # channel index, payload dict or None on failure
+    progress = pyqtSignal(int, int)  # channels displayed, total channels
+
+    def __init__(self, loader, jobs, filter_inputs=None, conditioned_array=None,
+                 max_workers=None, parent=None):
+        super().__init__(parent)
+        self.loader = loader
+        self.jobs = list(jobs)
+        self.filter_inputs = filter_inputs
+        self.conditioned_array = conditioned_array
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._cancel_event = threading.Event()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def cancel(self):
+        """Drop channels that have not started and stop delivering results."""
+        self._cancel_event.set()
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def _submit_full_resolution(self, executor, job):
+        with self._executor_lock:
+            if self._cancel_event.is_set():
+                return None
+            return executor.submit(
+                _load_channel_full_resolution, job, self.filter_inputs, self.conditioned_array
+            )
+
+    def run(self):
+        total = len(self.jobs)
+        workers = max(1, min(self.max_workers, total))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="channel-load") as executor:
+            with self._executor_lock:
+                if self._cancel_event.is_set():
+                    return
+                self._executor = executor
+                display_futures = {
+                    executor.submit(self.loader.load_display_data, job[1], job[2]): job
+                    for job in self.jobs
+                }
+            full_futures = {}
+            completed = 0
+            for future in as_completed(display_futures):
+                if self._cancel_event.is_set():
+                    return
+                job = display_futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    self.channel_failed.emit(job[0], str(exc))
+                else:
+                    self.channel_ready.emit(job[0], result)
+                    full_future = self._submit_full_resolution(executor, job)
+                    if full_future is not None:
+                        full_futures[full_future] = job[0]
+                completed += 1
+                self.progress.emit(completed, total)
+
+            for future in as_completed(full_futures):
+                if self._cancel_event.is_set():
+                    return
+                try:
+                    payload = future.result()
+                except Exception:
+                    payload = None
+                self.full_resolution_ready.emit(full_futures[future], payload)
+
+
+# Entries kept in the window's PSD and derived-view (RMS, octave) caches
+PSD_CACHE_SIZE = 128
+PSD_DERIVED_CACHE_SIZE = 512
+# Memory budget for full-resolution channel arrays of HDF5 channels, split
+# between raw samples (the window's channel cache) and conditioned signals
+# (the session-wide cache); channels outside it are re-read or
+# re-conditioned on use
+CHANNEL_CACHE_BYTES = 4 * 1024 ** 3
+
+
 class PSDAnalysisWindow(QMainWindow):
     """
     Main window for PSD Analysis tool.
@@ -298,7 +642,10 @@ class PSDAnalysisWindow(QMainWindow):
         self.time_data_full = None
         self.signal_data_full = None
 
-        # Per-channel storage (supports mixed sample rates and lengths)
+        # Per-channel storage (supports mixed sample rates and lengths).
+        # HDF5 channels are stored as LazyArray handles backed by
+        # _channel_cache rather than in-memory copies.
+        self._channel_cache = ArrayLRUCache(CHANNEL_CACHE_BYTES // 2)
         self.channel_time_full = []
         self.channel_signal_full = []
         self.channel_time_display = []
@@ -335,6 +682,7 @@ class PSDAnalysisWindow(QMainWindow):
         
         # HDF5 data management
         self.hdf5_loader = None
+        self._channel_loader = None  # Loader backing the lazy channel handles
         self.flight_navigator = None
 
         # Comparison curves storage
@@ -362,6 +710,42 @@ class PSDAnalysisWindow(QMainWindow):
         self.time_history_cache = {}
         self._cached_filter_messages = []
         self._full_resolution_warning_shown = False
+        self._time_history_items = {}  # channel index -> decimated PlotDataItem
+
+        # Background PSD calculation state
+        self._psd_thread = None
+        self._psd_run = None
+        self._psd_progress = None
+        self._retired_psd_threads = []
+        self._psd_plot_timer = QTimer(self)
+        self._psd_plot_timer.setSingleShot(True)
+        self._psd_plot_timer.setInterval(100)
+        self._psd_plot_timer.timeout.connect(self._refresh_psd_plot)
+
+        # Background HDF5 channel loading state
+        self._channel_load_thread = None
+        self._channel_load_run = None
+        self._retired_channel_load_threads = []
+        self._channel_full_pending = set()  # channels whose full-resolution pass is running
+        self._loading_plot_timer = QTimer(self)
+        self._loading_plot_timer.setSingleShot(True)
+        self._loading_plot_timer.setInterval(100)
+        self._loading_plot_timer.timeout.connect(self._refresh_loading_time_history)
+
+        # Computed spectra keyed by channel, time span and spectral settings,
+        # and views derived from them (band RMS, octave bands) keyed by the
+        # display settings, so display-only changes never recompute spectra
+        self._psd_cache = OrderedDict()
+        self._psd_derived_cache = OrderedDict()
+        self._psd_result_keys = {}  # psd_results key -> (cache key, frequencies key)
+        self._psd_event_mode = False
+
+        # Live region PSD: draggable region plus per-channel segment indexes
+        self._live_region = None
+        self._live_region_indexes = {}  # channel index -> (index key, SegmentSpectrumIndex or None)
+        self._live_index_thread = None
+        self._live_index_keys = {}  # channel index -> index key being built
+        self._psd_curve_items = {}  # channel name -> (narrowband curve, legend prefix, unit)
 
         # Apply styling
         self._apply_styling()
@@ -395,8 +779,13 @@ class PSDAnalysisWindow(QMainWindow):
 
         return 0.0, 0.0
 
-    def _get_channel_full(self, channel_idx: int):
-        """Get full-resolution (time, signal, sample_rate) for one channel."""
+    def _get_channel_full(self, channel_idx: int, lazy: bool = False):
+        """
+        Get full-resolution (time, signal, sample_rate) for one channel.
+
+        HDF5 channels are read (or taken from the channel cache) on demand;
+        pass ``lazy=True`` to get their ``LazyArray`` handles instead.
+        """
         if 0 <= channel_idx < len(self.channel_signal_full):
             time_data = self.channel_time_full[channel_idx]
             signal = self.channel_signal_full[channel_idx]
@@ -415,8 +804,28 @@ class PSDAnalysisWindow(QMainWindow):
         else:
             sample_rate = self.sample_rate
 
+        if not lazy:
+            time_data, signal = materialize(time_data), materialize(signal)
         return time_data, signal, sample_rate
 
+    def _set_channel_loader(self, loader):
+        """Record the HDF5 loader backing the lazy channels, closing the one it replaces."""
+        previous = self._channel_loader
+        self._channel_loader = loader
+        if previous is not None and previous is not loader and previous is not self.hdf5_loader:
+            previous.close()
+
+    def set_channel_memory_budget(self, max_bytes: int):
+        """
+        Change the memory budget for full-resolution HDF5 channel arrays.
+
+        Half of it holds raw samples and half sizes the session-wide cache
+        of conditioned signals, so both together stay within ``max_bytes``.
+        """
+        raw_bytes = int(max_bytes) // 2
+        self._channel_cache.resize(raw_bytes)
+        conditioned_signal_cache().resize(int(max_bytes) - raw_bytes)
+
     def _get_channel_display(self, channel_idx: int):
         """Get display-resolution (time, signal, sample_rate) for one channel."""
         if 0 <= channel_idx < len(self.channel_signal_display):
@@ -438,10 +847,17 @@ class PSDAnalysisWindow(QMainWindow):
 
         return time_data, signal, sample_rate
 
-    def _compute_display_indices(self, time_full, time_display) -> np.ndarray:
+    def _compute_display_indices(self, time_full, time_display, sample_rate=None) -> np.ndarray:
         """Map display timestamps to deterministic indices in the full-resolution array."""
-        full = np.asarray(time_full, dtype=np.float64)
         display = np.asarray(time_display, dtype=np.float64)
+        if isinstance(time_full, LazyArray) and sample_rate:
+            # Uniformly sampled HDF5 channel: avoid reading its time vector
+            if len(time_full) == 0 or display.size == 0:
+                return np.array([], dtype=np.int64)
+            indices = np.rint((display - float(time_full[0])) * float(sample_rate)).astype(np.int64)
+            indices = np.clip(indices, 0, len(time_full) - 1)
+            return np.maximum.accumulate(indices) if indices.size > 1 else indices
+        full = np.asarray(time_full, dtype=np.float64)
         if full.size == 0 or display.size == 0:
             return np.array([], dtype=np.int64)
         if full.size == display.size and np.array_equal(full, display):
@@ -585,80 +1001,103 @@ class PSDAnalysisWindow(QMainWindow):
         self.time_history_cache = {}
         all_messages = []
         user_highpass, user_lowpass = self._get_user_filter_inputs()
-        large_data_threshold = 10_000_000
+        # Conditioned arrays of the previous filter settings are stale
+        discard_conditioned_signals(self.channel_signal_full, user_highpass, user_lowpass)
 
-        for channel_idx, channel_name in enumerate(self.channel_names or []):
-            time_display, signal_display, sample_rate = self._get_channel_display(channel_idx)
-            time_full, signal_full, _ = self._get_channel_full(channel_idx)
-            if signal_display is None or time_display is None or sample_rate is None:
+        for channel_idx in range(len(self.channel_names or [])):
+            entry = self._time_history_cache_entry(channel_idx, user_highpass, user_lowpass)
+            if entry is None:
                 continue
-            if signal_full is None or time_full is None:
-                signal_full = signal_display
-                time_full = time_display
-
-            decimated_raw = np.asarray(signal_display, dtype=np.float64).copy()
-            full_raw = np.asarray(signal_full, dtype=np.float64).copy()
-            display_indices = self._compute_display_indices(time_full, time_display)
-            if display_indices.size != decimated_raw.size:
-                if decimated_raw.size == 0:
-                    display_indices = np.array([], dtype=np.int64)
-                else:
-                    display_indices = np.linspace(
-                        0,
-                        max(0, full_raw.size - 1),
-                        num=decimated_raw.size,
-                        dtype=np.int64,
-                    )
+            all_messages.extend(entry["filter_messages"])
+            self.time_history_cache[channel_idx] = entry
 
-            decimated_filtered = None
-            applied_highpass, applied_lowpass = self._predict_applied_filter_bounds(
-                float(sample_rate),
-                user_highpass,
-                user_lowpass,
+        self._cached_filter_messages = all_messages
+        self._show_time_history_applied_filters()
+        self._set_info_messages(all_messages)
+
+    def _show_time_history_applied_filters(self):
+        """Show the filters applied to the first cached time-history channel."""
+        if not hasattr(self, "applied_filters_label"):
+            return
+        if self.time_history_cache:
+            first = self.time_history_cache[next(iter(self.time_history_cache))]
+            self.applied_filters_label.setText(
+                "Applied filters: "
+                f"HP {first['applied_highpass_hz']:.2f} Hz, "
+                f"LP {first['applied_lowpass_hz']:.2f} Hz"
             )
-            filter_messages = []
-            full_filtered = None
-            full_filter_deferred = len(full_raw) > large_data_threshold
-            if not full_filter_deferred:
-                full_filtered, applied_highpass, applied_lowpass, full_messages = apply_robust_filtering(
-                    full_raw,
-                    float(sample_rate),
-                    user_highpass=user_highpass,
-                    user_lowpass=user_lowpass,
-                )
-                decimated_filtered = full_filtered[display_indices] if display_indices.size > 0 else np.array([], dtype=np.float64)
-                filter_messages.extend(full_messages)
-
-            prefixed = [f"{channel_name}: {msg}" for msg in filter_messages]
-            all_messages.extend(prefixed)
-            self.time_history_cache[channel_idx] = {
-                "time_decimated": time_display,
-                "signal_decimated_raw": decimated_raw,
-                "signal_decimated_filtered": decimated_filtered,
-                "display_indices": display_indices,
-                "time_full": time_full,
-                "signal_full_raw": full_raw,
-                "signal_full_filtered": full_filtered,
-                "full_filter_deferred": full_filter_deferred,
-                "sample_rate": float(sample_rate),
-                "applied_highpass_hz": float(applied_highpass),
-                "applied_lowpass_hz": float(applied_lowpass),
-                "filter_messages": prefixed,
-            }
+        else:
+            self.applied_filters_label.setText("Applied filters: N/A")
 
-        self._cached_filter_messages = all_messages
-        if hasattr(self, "applied_filters_label"):
-            if self.time_history_cache:
-                first = self.time_history_cache[next(iter(self.time_history_cache))]
-                self.applied_filters_label.setText(
-                    "Applied filters: "
-                    f"HP {first['applied_highpass_hz']:.2f} Hz, "
-                    f"LP {first['applied_lowpass_hz']:.2f} Hz"
-                )
+    def _time_history_cache_entry(self, channel_idx: int, user_highpass, user_lowpass):
+        """
+        Time-history cache entry of one channel, or None while it has no display data.
+
+        Channels whose full-resolution views are still being loaded in the
+        background are marked ``full_resolution_pending`` so the plot does
+        not read or condition them on the UI thread.
+        """
+        channel_name = self.channel_names[channel_idx]
+        large_data_threshold = 10_000_000
+        time_display, signal_display, sample_rate = self._get_channel_display(channel_idx)
+        time_full, signal_full, _ = self._get_channel_full(channel_idx, lazy=True)
+        if signal_display is None or time_display is None or sample_rate is None:
+            return None
+        if signal_full is None or time_full is None:
+            signal_full = signal_display
+            time_full = time_display
+
+        decimated_raw = np.asarray(signal_display, dtype=np.float64).copy()
+        # HDF5 channels stay lazy; in-memory channels are referenced, not copied
+        lazy_channel = isinstance(signal_full, LazyArray)
+        full_raw = signal_full if lazy_channel else np.asarray(signal_full, dtype=np.float64)
+        display_indices = self._compute_display_indices(time_full, time_display, sample_rate)
+        if display_indices.size != decimated_raw.size:
+            if decimated_raw.size == 0:
+                display_indices = np.array([], dtype=np.int64)
             else:
-                self.applied_filters_label.setText("Applied filters: N/A")
+                display_indices = np.linspace(
+                    0,
+                    max(0, full_raw.size - 1),
+                    num=decimated_raw.size,
+                    dtype=np.int64,
+                )
 
-        self._set_info_messages(all_messages)
+        decimated_filtered = None
+        applied_highpass, applied_lowpass = self._predict_applied_filter_bounds(
+            float(sample_rate),
+            user_highpass,
+            user_lowpass,
+        )
+        filter_messages = []
+        full_filtered = None
+        # Lazy channels are conditioned on first use, through the channel cache
+        full_filter_deferred = lazy_channel or len(full_raw) > large_data_threshold
+        if not full_filter_deferred:
+            full_filtered, applied_highpass, applied_lowpass, full_messages = cached_robust_filtering(
+                full_raw,
+                float(sample_rate),
+                user_highpass=user_highpass,
+                user_lowpass=user_lowpass,
+            )
+            decimated_filtered = full_filtered[display_indices] if display_indices.size > 0 else np.array([], dtype=np.float64)
+            filter_messages.extend(full_messages)
+
+        return {
+            "time_decimated": time_display,
+            "signal_decimated_raw": decimated_raw,
+            "signal_decimated_filtered": decimated_filtered,
+            "display_indices": display_indices,
+            "time_full": time_full,
+            "signal_full_raw": full_raw,
+            "signal_full_filtered": full_filtered,
+            "full_filter_deferred": full_filter_deferred,
+            "full_resolution_pending": channel_idx in self._channel_full_pending,
+            "sample_rate": float(sample_rate),
+            "applied_highpass_hz": float(applied_highpass),
+            "applied_lowpass_hz": float(applied_lowpass),
+            "filter_messages": [f"{channel_name}: {msg}" for msg in filter_messages],
+        }
 
     def _resolve_time_history_signal(self, channel_idx: int):
         """Resolve current time-history data vector from selected mode and cache."""
@@ -683,25 +1122,27 @@ class PSDAnalysisWindow(QMainWindow):
                 )
             cache["display_indices"] = display_indices
 
-        if use_filtered and cache["signal_full_filtered"] is None:
+        # Channels still loading in the background show their raw display
+        # trace until the loader delivers the conditioned signal
+        if use_filtered and cache["signal_full_filtered"] is None and not cache.get("full_resolution_pending"):
             user_highpass = self.low_cutoff_spin.value() if self.enable_filter_checkbox.isChecked() else None
             user_lowpass = self.high_cutoff_spin.value() if self.enable_filter_checkbox.isChecked() else None
-            (
-                cache["signal_full_filtered"],
-                cache["applied_highpass_hz"],
-                cache["applied_lowpass_hz"],
-                msgs,
-            ) = apply_robust_filtering(
+            full_filtered, cache["applied_highpass_hz"], cache["applied_lowpass_hz"], msgs = cached_robust_filtering(
                 cache["signal_full_raw"],
                 cache["sample_rate"],
                 user_highpass=user_highpass,
                 user_lowpass=user_lowpass,
             )
             cache["signal_decimated_filtered"] = (
-                cache["signal_full_filtered"][display_indices]
+                full_filtered[display_indices]
                 if len(display_indices) > 0
                 else np.array([], dtype=np.float64)
             )
+            if isinstance(cache["signal_full_raw"], LazyArray):
+                full_filtered = self._conditioned_channel_array(
+                    cache["signal_full_raw"], cache["sample_rate"], user_highpass, user_lowpass
+                )
+            cache["signal_full_filtered"] = full_filtered
             if hasattr(self, "applied_filters_label"):
                 self.applied_filters_label.setText(
                     "Applied filters: "
@@ -721,8 +1162,8 @@ class PSDAnalysisWindow(QMainWindow):
                 )
 
         if use_full:
-            time_data = cache["time_full"]
-            signal_data = cache["signal_full_filtered"] if use_filtered else cache["signal_full_raw"]
+            time_data = materialize(cache["time_full"])
+            signal_data = materialize(cache["signal_full_filtered"] if use_filtered else cache["signal_full_raw"])
             shown_points = len(signal_data)
             total_points = len(cache["signal_full_raw"])
         else:
@@ -734,6 +1175,72 @@ class PSDAnalysisWindow(QMainWindow):
             total_points = len(cache["signal_full_raw"])
 
         return time_data, signal_data, cache["sample_rate"], shown_points, total_points, info_messages
+
+    def _time_history_pyramid(self, channel_idx: int):
+        """Cached min/max LOD pyramid of the full-resolution filtered/raw signal."""
+        cache = self.time_history_cache.get(channel_idx)
+        if cache is None:
+            return None
+        use_filtered = (
+            self.time_filtering_mode == "filtered" and cache.get("signal_full_filtered") is not None
+        )
+        key = "lod_filtered" if use_filtered else "lod_raw"
+        pyramid = cache.get(key)
+        if pyramid is None and cache.get("full_resolution_pending"):
+            return None
+        if pyramid is None:
+            signal = cache["signal_full_filtered"] if use_filtered else cache.get("signal_full_raw")
+            time_full = cache.get("time_full")
+            if signal is None or time_full is None or len(signal) == 0 or len(time_full) != len(signal):
+                return None
+            if isinstance(time_full, LazyArray):
+                # Scan lazy channels in blocks; uniform HDF5 time needs no time vector
+                pyramid = MinMaxPyramid(
+                    signal,
+                    sample_rate=cache["sample_rate"],
+                    start_time=float(time_full[0]),
+                    data=signal.read() if use_filtered else None,
+                )
+            else:
+                pyramid = MinMaxPyramid(signal, time=time_full)
+            cache[key] = pyramid
+        return pyramid
+
+    def _conditioned_channel_array(self, raw, sample_rate, user_highpass, user_lowpass) -> LazyArray:
+        """
+        Conditioned full-resolution signal of a lazy channel.
+
+        The samples live only in the session-wide conditioned-signal cache,
+        keyed by the channel's file and dataset, and are re-conditioned on
+        use after eviction.
+        """
+        return conditioned_signal_array(
+            raw, sample_rate, user_highpass=user_highpass, user_lowpass=user_lowpass
+        )
+
+    def _time_history_lod_points(self) -> int:
+        """Point budget for decimated traces: two (min/max) per screen pixel."""
+        width = int(self.time_plot_widget.getPlotItem().vb.width())
+        return max(2000, 2 * width)
+
+    def _refresh_time_history_lod(self):
+        """Re-render decimated traces from the LOD pyramids for the current view."""
+        if self.time_resolution_mode != "decimated" or not self._time_history_items:
+            return
+        x_min, x_max = self.time_plot_widget.getPlotItem().vb.viewRange()[0]
+        max_points = self._time_history_lod_points()
+        shown_points = 0
+        total_points = 0
+        for channel_idx, item in self._time_history_items.items():
+            pyramid = self._time_history_pyramid(channel_idx)
+            if pyramid is None:
+                continue
+            time_data, signal_data = pyramid.view(x_min, x_max, max_points)
+            item.setData(time_data, signal_data)
+            shown_points = max(shown_points, len(signal_data))
+            total_points = max(total_points, pyramid.n_samples)
+        if total_points:
+            self.time_points_label.setText(f"Showing {shown_points:,} of {total_points:,} points")
     
     def _apply_styling(self):
         """Apply aerospace-inspired styling to the window."""
@@ -1498,7 +2005,7 @@ class PSDAnalysisWindow(QMainWindow):
         self.freq_min_spin.setRange(0.1, 10000)
         self.freq_min_spin.setValue(20.0)
         self.freq_min_spin.setDecimals(1)
-        self.freq_min_spin.valueChanged.connect(self._on_parameter_changed)
+        self.freq_min_spin.valueChanged.connect(self._on_frequency_range_changed)
         layout.addWidget(self.freq_min_spin, 0, 1)
         
         # Max frequency
@@ -1507,7 +2014,7 @@ class PSDAnalysisWindow(QMainWindow):
         self.freq_max_spin.setRange(1, 100000)
         self.freq_max_spin.setValue(2000.0)
         self.freq_max_spin.setDecimals(1)
-        self.freq_max_spin.valueChanged.connect(self._on_parameter_changed)
+        self.freq_max_spin.valueChanged.connect(self._on_frequency_range_changed)
         layout.addWidget(self.freq_max_spin, 1, 1)
         self._apply_compact_parameter_input_sizing([
             self.freq_min_spin,
@@ -1696,6 +2203,16 @@ class PSDAnalysisWindow(QMainWindow):
         self.show_crosshair_checkbox.stateChanged.connect(self._toggle_crosshair)
         layout.addWidget(self.show_crosshair_checkbox)
 
+        # Live region PSD checkbox
+        self.live_region_checkbox = QCheckBox("Live Region PSD")
+        self.live_region_checkbox.setChecked(False)
+        self.live_region_checkbox.setToolTip(
+            "Drag a region on the time history to update the PSD live.\n"
+            "Uses whole PSD segments inside the region; Calculate PSD gives the exact result."
+        )
+        self.live_region_checkbox.toggled.connect(self._on_live_region_toggled)
+        layout.addWidget(self.live_region_checkbox)
+
         # Data resolution toggle
         layout.addWidget(QLabel("Data Resolution:"))
         resolution_row = QHBoxLayout()
@@ -2434,27 +2951,17 @@ class PSDAnalysisWindow(QMainWindow):
             "running_mean_window_s": mean_window_seconds,
         }
 
-        # Prepare channel data
+        # Raw channels are conditioned block by block as the statistics
+        # stream through them, or sliced from the session cache when the PSD
+        # or spectrogram views have already conditioned the whole channel
         channels_data = []
         for i, name in enumerate(self.channel_names):
-            _, signal, _ = self._get_channel_full(i)
+            _, signal, _ = self._get_channel_full(i, lazy=True)
             if signal is None:
                 continue
-            channel_sample_rate = (
-                self.channel_sample_rates[i]
-                if i < len(self.channel_sample_rates)
-                else self.sample_rate
-            )
-            conditioned_signal = apply_processing_pipeline(
-                signal,
-                channel_sample_rate,
-                filter_settings=filter_settings,
-                remove_mean=remove_mean,
-                mean_window_seconds=mean_window_seconds,
-            )
             unit = self.channel_units[i] if i < len(self.channel_units) else ''
             flight = self.channel_flight_names[i] if i < len(self.channel_flight_names) else ''
-            channels_data.append((name, conditioned_signal, unit, flight))
+            channels_data.append((name, signal, unit, flight))
 
         self._statistics_processing_note = processing_note
 
@@ -2466,6 +2973,11 @@ class PSDAnalysisWindow(QMainWindow):
                 parent=self,
                 processing_note=processing_note,
                 processing_flags=processing_flags,
+                conditioning={
+                    "filter_settings": filter_settings,
+                    "remove_mean": remove_mean,
+                    "mean_window_seconds": mean_window_seconds,
+                },
             )
             self.statistics_window.show()
         else:
@@ -2684,20 +3196,18 @@ class PSDAnalysisWindow(QMainWindow):
         if not selected_indices:
             return None
         channel_idx = selected_indices[0]
-        _, signal, channel_sample_rate = self._get_channel_full(channel_idx)
+        _, signal, channel_sample_rate = self._get_channel_full(channel_idx, lazy=True)
         if signal is None or len(signal) < 10 or channel_sample_rate is None:
             return None
 
         filter_settings = self._get_statistics_filter_settings()
         remove_mean = False
         mean_window_seconds = 1.0
-        conditioned_signal = apply_processing_pipeline(
-            signal,
-            channel_sample_rate,
-            filter_settings=filter_settings,
-            remove_mean=remove_mean,
-            mean_window_seconds=mean_window_seconds,
-        )
+        conditioning = {
+            "filter_settings": filter_settings,
+            "remove_mean": remove_mean,
+            "mean_window_seconds": mean_window_seconds,
+        }
         show_rayleigh = False
         if self.statistics_window is not None and hasattr(self.statistics_window, "rayleigh_checkbox"):
             show_rayleigh = bool(self.statistics_window.rayleigh_checkbox.isChecked())
@@ -2720,7 +3230,7 @@ class PSDAnalysisWindow(QMainWindow):
             show_uniform = False
         _StatsConfig.show_rayleigh = bool(show_rayleigh)
 
-        stats = compute_statistics(conditioned_signal, channel_sample_rate, _StatsConfig())
+        stats = compute_statistics(signal, channel_sample_rate, _StatsConfig(), conditioning=conditioning)
         pdf_fig, _ = plot_pdf(stats["pdf"], _StatsConfig())
         mean_fig, _ = plot_running_stat(stats["running"], "mean", "Running Mean", "Mean")
         std_fig, _ = plot_running_stat(stats["running"], "std", "Running Std", "Std")
@@ -2782,6 +3292,15 @@ class PSDAnalysisWindow(QMainWindow):
         
         # Connect click event for interactive event selection
         self.time_plot_widget.scene().sigMouseClicked.connect(self._on_time_plot_clicked)
+
+        # Re-render decimated traces at screen resolution after zoom/pan
+        self._time_lod_timer = QTimer(self)
+        self._time_lod_timer.setSingleShot(True)
+        self._time_lod_timer.setInterval(50)
+        self._time_lod_timer.timeout.connect(self._refresh_time_history_lod)
+        self.time_plot_widget.getPlotItem().vb.sigXRangeChanged.connect(
+            lambda *_args: self._time_lod_timer.start()
+        )
         
         layout.addWidget(self.time_plot_widget, stretch=1)
         
@@ -2918,18 +3437,69 @@ class PSDAnalysisWindow(QMainWindow):
         self._update_comparison_list()
 
     def _on_parameter_changed(self):
-        """Handle parameter changes - clear PSD results to force recalculation."""
-        # Clear PSD results
+        """Handle spectral parameter changes - clear PSD results to force recalculation."""
+        # Clear PSD results; earlier spectra stay in the PSD cache
         self.frequencies = {}
         self.psd_results = {}
         self.rms_values = {}
+        self._psd_result_keys = {}
+
+        # Clear the PSD plot but keep time history
+        self._clear_psd_plot()
+        if self._live_region is not None:
+            self._update_live_region_psd()
 
-        # Recalculate RMS for comparison curves (frequency range may have changed)
+    def _on_frequency_range_changed(self):
+        """Handle frequency range changes - re-derive RMS and redraw without recomputing PSDs."""
         if self.comparison_curves:
             self._recalculate_comparison_rms()
+        if self._live_region is not None:
+            self._update_live_region_psd()
+            return
 
-        # Clear the PSD plot but keep time history
-        self._clear_psd_plot()
+        for psd_key, (cache_key, frequencies_key) in self._psd_result_keys.items():
+            if psd_key in self.psd_results and frequencies_key in self.frequencies:
+                self.rms_values[psd_key], _note = self._cached_band_rms(
+                    cache_key, self.frequencies[frequencies_key], self.psd_results[psd_key]
+                )
+        self._refresh_psd_plot()
+
+    def _clear_psd_cache(self):
+        """Drop cached spectra and derived views (the channel data changed)."""
+        self._psd_cache.clear()
+        self._psd_derived_cache.clear()
+        self._psd_result_keys = {}
+        self._cancel_live_region_indexes()
+        self._live_region_indexes = {}
+
+    def _cached_psd_view(self, cache_key, view: tuple, compute):
+        """Derived view of a cached PSD (band RMS, octave bands), computed once per ``view``."""
+        if cache_key is None:
+            return compute()
+        key = (cache_key,) + view
+        if key in self._psd_derived_cache:
+            self._psd_derived_cache.move_to_end(key)
+            return self._psd_derived_cache[key]
+        value = compute()
+        self._psd_derived_cache[key] = value
+        while len(self._psd_derived_cache) > PSD_DERIVED_CACHE_SIZE:
+            self._psd_derived_cache.popitem(last=False)
+        return value
+
+    def _cached_band_rms(self, cache_key, frequencies, psd):
+        """``(rms, note)`` of a PSD over the current frequency range."""
+        freq_min = self.freq_min_spin.value()
+        freq_max = self.freq_max_spin.value()
+        return self._cached_psd_view(
+            cache_key,
+            ("rms", freq_min, freq_max),
+            lambda: _band_rms(frequencies, psd, freq_min, freq_max),
+        )
+
+    def _psd_cache_key(self, channel_idx, sample_rate, span, spectral_key) -> tuple:
+        """Cache key of one channel's PSD over the sample range ``span``."""
+        flight_name = self.channel_flight_names[channel_idx] if channel_idx < len(self.channel_flight_names) else ""
+        return (flight_name, self.channel_names[channel_idx], float(sample_rate), tuple(span), spectral_key)
 
     def _get_active_events_for_calculation(self):
         """Resolve active events, preferring Event Manager checkbox state."""
@@ -2939,44 +3509,278 @@ class PSDAnalysisWindow(QMainWindow):
             return enabled_events
         return list(self.events)
 
+    def _psd_settings(self) -> dict:
+        """Snapshot PSD parameters from the UI for off-thread computation."""
+        user_highpass, user_lowpass = self._get_user_filter_inputs()
+        return {
+            "window": self.window_combo.currentText().lower(),
+            "df": self.df_spin.value(),
+            "use_efficient_fft": self.efficient_fft_checkbox.isChecked(),
+            "maximax": self.maximax_checkbox.isChecked(),
+            "maximax_window": self.maximax_window_spin.value(),
+            "maximax_overlap": self.maximax_overlap_spin.value(),
+            "overlap": self.overlap_spin.value(),
+            "user_highpass": user_highpass,
+            "user_lowpass": user_lowpass,
+            "freq_min": self.freq_min_spin.value(),
+            "freq_max": self.freq_max_spin.value(),
+        }
+
     def _compute_channel_psd(self, signal, channel_sample_rate):
         """Compute PSD for one channel signal slice using robust baseline filtering."""
-        window = self.window_combo.currentText().lower()
-        df = self.df_spin.value()
-        use_efficient_fft = self.efficient_fft_checkbox.isChecked()
+        return _compute_psd_with_settings(signal, channel_sample_rate, self._psd_settings())
 
-        processed_signal = np.asarray(signal, dtype=np.float64).copy()
-        user_highpass, user_lowpass = self._get_user_filter_inputs()
-        processed_signal, applied_highpass, applied_lowpass, info_messages = apply_robust_filtering(
-            processed_signal,
-            channel_sample_rate,
-            user_highpass=user_highpass,
-            user_lowpass=user_lowpass,
-        )
+    def _start_psd_calculation(self, jobs, event_mode: bool, skipped=None):
+        """
+        Compute PSD jobs on a background worker pool.
 
-        if self.maximax_checkbox.isChecked():
-            frequencies, psd = calculate_psd_maximax(
-                processed_signal,
-                channel_sample_rate,
-                df=df,
-                maximax_window=self.maximax_window_spin.value(),
-                overlap_percent=self.maximax_overlap_spin.value(),
-                window=window,
-                use_efficient_fft=use_efficient_fft,
-            )
+        Each job is ``(key, signal, sample_rate, span)`` where ``span`` is the
+        sample range of the channel it covers. Spectra already in the PSD
+        cache are reused; the rest stream into ``frequencies``/``psd_results``/
+        ``rms_values`` and the plot as channels finish. Warnings and the final
+        plot are handled once every job has completed.
+        """
+        self._cancel_psd_calculation(notify=False)
+        self.frequencies = {}
+        self.psd_results = {}
+        self.rms_values = {}
+        self._psd_result_keys = {}
+        self._psd_event_mode = event_mode
+        settings = self._psd_settings()
+        spectral_key = _psd_spectral_key(settings)
+        self._psd_run = {
+            "event_mode": event_mode,
+            "order": [job[0] for job in jobs],
+            "cache_keys": {},
+            "skipped": list(skipped or []),
+            "messages": {},
+            "applied": {},
+        }
+
+        pending = []
+        for key, signal, sample_rate, span in jobs:
+            cache_key = self._psd_cache_key(key[1], sample_rate, span, spectral_key)
+            self._psd_run["cache_keys"][key] = cache_key
+            cached = self._psd_cache.get(cache_key)
+            if cached is None:
+                pending.append((key, signal, sample_rate))
+                continue
+            self._psd_cache.move_to_end(cache_key)
+            frequencies, psd = cached[0], cached[1]
+            self._store_psd_result(key, cached + (self._cached_band_rms(cache_key, frequencies, psd),))
+
+        if not pending:
+            self._finish_psd_calculation()
+            return
+
+        progress = QProgressDialog("Calculating PSDs...", "Cancel", 0, len(pending), self)
+        progress.setWindowTitle("PSD Analysis")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.setValue(0)
+        progress.setStyleSheet("""
+            QProgressDialog {
+                background-color: #ffffff;
+            }
+            QProgressDialog QLabel {
+                color: #000000;
+            }
+            QProgressDialog QPushButton {
+                color: #000000;
+            }
+        """)
+        progress.canceled.connect(self._cancel_psd_calculation)
+        self._psd_progress = progress
+
+        thread = PSDCalculationThread(pending, settings, parent=self)
+        thread.result_ready.connect(self._on_psd_result)
+        thread.job_failed.connect(self._on_psd_job_failed)
+        thread.progress.connect(self._on_psd_progress)
+        thread.finished.connect(self._on_psd_thread_finished)
+        self._psd_thread = thread
+        if hasattr(self, "calc_button"):
+            self.calc_button.setEnabled(False)
+        thread.start()
+
+    def _psd_job_label(self, key) -> str:
+        event_name, channel_idx = key
+        channel_name = self.channel_names[channel_idx]
+        return channel_name if event_name is None else f"{event_name} / {channel_name}"
+
+    def _on_psd_result(self, key, result):
+        """Cache one streamed PSD result, store it and schedule a plot refresh."""
+        if self.sender() is not self._psd_thread:
+            return
+        cache_key = self._psd_run["cache_keys"][key]
+        frequencies, psd, band_rms = result[0], result[1], result[5]
+        self._psd_cache[cache_key] = result[:5]
+        while len(self._psd_cache) > PSD_CACHE_SIZE:
+            self._psd_cache.popitem(last=False)
+        settings = self.sender().settings
+        self._psd_derived_cache[(cache_key, "rms", settings["freq_min"], settings["freq_max"])] = band_rms
+        self._store_psd_result(key, result[:5] + (self._cached_band_rms(cache_key, frequencies, psd),))
+        self._psd_plot_timer.start()
+
+    def _store_psd_result(self, key, result):
+        """Store one PSD job result in the window's result dictionaries."""
+        frequencies, psd, applied_hp, applied_lp, info_messages, (rms, rms_note) = result
+        event_name, channel_idx = key
+        channel_name = self.channel_names[channel_idx]
+        psd_key = channel_name if event_name is None else f"{event_name}_{channel_name}"
+        self.frequencies[channel_name] = frequencies
+        self.psd_results[psd_key] = psd
+        self.rms_values[psd_key] = rms
+        self._psd_result_keys[psd_key] = (self._psd_run["cache_keys"][key], channel_name)
+        label = self._psd_job_label(key)
+        messages = list(info_messages) + ([rms_note] if rms_note else [])
+        self._psd_run["messages"][key] = [f"{label}: {msg}" for msg in messages]
+        self._psd_run["applied"][key] = (applied_hp, applied_lp)
+
+    def _on_psd_job_failed(self, key, message: str):
+        if self.sender() is not self._psd_thread:
+            return
+        self._psd_run["skipped"].append(f"{self._psd_job_label(key)}: {message}")
+
+    def _on_psd_progress(self, completed: int, total: int):
+        if self.sender() is not self._psd_thread or self._psd_progress is None:
+            return
+        self._psd_progress.setLabelText(f"Calculated {completed}/{total} PSDs")
+        self._psd_progress.setValue(completed)
+
+    def _refresh_psd_plot(self):
+        """Redraw the PSD plot from the current (possibly partial) results."""
+        if not self.psd_results:
+            return
+        if self._psd_event_mode:
+            self._update_plot_with_events()
         else:
-            nperseg = int(channel_sample_rate / df)
-            noverlap = int(nperseg * self.overlap_spin.value() / 100.0)
-            frequencies, psd = calculate_psd_welch(
-                processed_signal,
-                channel_sample_rate,
-                df=df,
-                noverlap=noverlap,
-                window=window,
-                use_efficient_fft=use_efficient_fft,
+            self._update_plot()
+
+    def _on_psd_thread_finished(self):
+        thread = self.sender()
+        if thread in self._retired_psd_threads:
+            self._retired_psd_threads.remove(thread)
+            thread.deleteLater()
+            return
+        if thread is not self._psd_thread:
+            return
+        self._psd_thread = None
+        thread.deleteLater()
+        self._finish_psd_calculation()
+
+    def _close_psd_progress(self):
+        if self._psd_progress is not None:
+            self._psd_progress.canceled.disconnect(self._cancel_psd_calculation)
+            self._psd_progress.close()
+            self._psd_progress = None
+        if hasattr(self, "calc_button"):
+            self.calc_button.setEnabled(True)
+
+    def _cancel_psd_calculation(self, notify: bool = True):
+        """
+        Cancel a running PSD calculation.
+
+        Jobs that have not started are dropped and late results are ignored;
+        the UI is released immediately while in-flight jobs wind down.
+        """
+        thread = self._psd_thread
+        if thread is None:
+            return
+        thread.cancel()
+        self._psd_thread = None
+        self._retired_psd_threads.append(thread)
+        self._psd_plot_timer.stop()
+        self._close_psd_progress()
+        self._psd_run = None
+        if notify:
+            self.frequencies = {}
+            self.psd_results = {}
+            self.rms_values = {}
+            self._clear_psd_plot()
+            show_warning(self, "Calculation Canceled", "PSD calculation was canceled.")
+
+    def _wait_for_psd_calculation(self):
+        """Block until the running PSD calculation has delivered its results."""
+        thread = self._psd_thread
+        if thread is not None:
+            thread.wait()
+        QApplication.processEvents()
+
+    def _finish_psd_calculation(self):
+        """Order streamed results, report skipped jobs and draw the final plot."""
+        self._psd_plot_timer.stop()
+        self._close_psd_progress()
+        run = self._psd_run
+        if run is None:
+            return
+        event_mode = run["event_mode"]
+
+        # Results arrive in completion order; present them in job order
+        psd_order = []
+        for event_name, channel_idx in run["order"]:
+            channel_name = self.channel_names[channel_idx]
+            psd_order.append(channel_name if event_name is None else f"{event_name}_{channel_name}")
+        self.psd_results = {k: self.psd_results[k] for k in psd_order if k in self.psd_results}
+        self.rms_values = {k: self.rms_values[k] for k in psd_order if k in self.rms_values}
+
+        info_messages = []
+        first_applied = None
+        for key in run["order"]:
+            info_messages.extend(run["messages"].get(key, []))
+            if first_applied is None:
+                first_applied = run["applied"].get(key)
+
+        skipped = run["skipped"]
+        if skipped:
+            skipped_text = "\n".join(f"• {msg}" for msg in skipped[:12])
+            if len(skipped) > 12:
+                skipped_text += f"\n• ... and {len(skipped) - 12} more"
+            if event_mode:
+                show_warning(
+                    self,
+                    "Event PSD Warnings",
+                    "Some event/channel PSD calculations were skipped:\n\n"
+                    f"{skipped_text}",
+                )
+            else:
+                show_warning(
+                    self,
+                    "PSD Calculation Warnings",
+                    "Some channels were skipped during PSD calculation:\n\n"
+                    f"{skipped_text}",
+                )
+
+        if not event_mode and first_applied is not None and hasattr(self, "applied_filters_label"):
+            self.applied_filters_label.setText(
+                f"Applied filters: HP {first_applied[0]:.2f} Hz, LP {first_applied[1]:.2f} Hz"
             )
+        self._set_info_messages(info_messages or self._cached_filter_messages)
 
-        return frequencies, psd, applied_highpass, applied_lowpass, info_messages
+        if not self.psd_results:
+            self._clear_psd_plot()
+            if event_mode:
+                show_warning(
+                    self,
+                    "No Event PSD Results",
+                    "No valid PSD results were produced for the enabled events.",
+                )
+            else:
+                show_warning(self, "No PSD Results", "No valid PSD results were produced for the selected channels.")
+            return
+
+        if event_mode:
+            self._update_plot_with_events()
+        else:
+            self._update_plot()
+
+    def closeEvent(self, event):
+        """Stop background PSD and channel-loading work before the window goes away."""
+        self._cancel_psd_calculation(notify=False)
+        self._cancel_live_region_indexes()
+        self._cancel_channel_loading()
+        for thread in list(self._retired_psd_threads) + list(self._retired_channel_load_threads):
+            thread.wait()
+        super().closeEvent(event)
     
     def _validate_overlap(self):
         """Validate overlap percentage in real-time."""
@@ -3059,6 +3863,7 @@ class PSDAnalysisWindow(QMainWindow):
     def _clear_psd_plot(self):
         """Clear only the PSD plot."""
         self.plot_widget.clear()
+        self._psd_curve_items = {}
         
         # Re-add crosshair and label
         self.plot_widget.addItem(self.vLine, ignoreBounds=True)
@@ -3126,7 +3931,10 @@ class PSDAnalysisWindow(QMainWindow):
             else:
                 signal_columns = [signal_data[:, i] for i in range(signal_data.shape[1])]
 
+            self._cancel_channel_loading()
             self.channel_signal_full = [sig.copy() for sig in signal_columns]
+            self._channel_cache.clear()
+            self._set_channel_loader(None)
             self.channel_signal_display = [sig.copy() for sig in signal_columns]
             self.channel_time_full = [time_data for _ in signal_columns]
             self.channel_time_display = [time_data for _ in signal_columns]
@@ -3181,6 +3989,7 @@ class PSDAnalysisWindow(QMainWindow):
             self.frequencies = {}
             self.psd_results = {}
             self.rms_values = {}
+            self._clear_psd_cache()
 
             # Reset and rebuild adaptive time-history cache.
             self._reset_time_history_defaults()
@@ -3241,7 +4050,10 @@ class PSDAnalysisWindow(QMainWindow):
         """Handle channel selection changes."""
         # Update both time history and PSD plots
         self._plot_time_history()
-        self._update_plot()
+        if self._live_region is not None:
+            self._update_live_region_psd()
+        else:
+            self._update_plot()
 
     def _on_time_resolution_changed(self):
         """Handle decimated/full-resolution toggle changes."""
@@ -3288,6 +4100,9 @@ class PSDAnalysisWindow(QMainWindow):
         self.time_legend.setVisible(True)
 
         colors = ['#60a5fa', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6', '#ec4899']
+        self._time_history_items = {}
+        use_lod = self.time_resolution_mode == "decimated"
+        lod_points = self._time_history_lod_points()
         plot_count = 0
         shown_points = 0
         total_points = 0
@@ -3305,14 +4120,21 @@ class PSDAnalysisWindow(QMainWindow):
             if signal_data is None or time_data is None or len(signal_data) == 0:
                 continue
 
-            shown_points = max(shown_points, int(shown))
-            total_points = max(total_points, int(total))
             info_messages.extend(messages)
 
             if primary_signal is None:
                 primary_signal = np.asarray(signal_data, dtype=np.float64)
                 primary_channel_name = channel_name
 
+            # Decimated traces are min/max envelopes of the full-resolution
+            # signal; zoom/pan refines them via _refresh_time_history_lod
+            pyramid = self._time_history_pyramid(i) if use_lod else None
+            if pyramid is not None:
+                time_data, signal_data = pyramid.view(max_points=lod_points)
+                shown = len(signal_data)
+            shown_points = max(shown_points, int(shown))
+            total_points = max(total_points, int(total))
+
             color = colors[plot_count % len(colors)]
             pen = pg.mkPen(color=color, width=1.5)
             if flight_name:
@@ -3324,7 +4146,12 @@ class PSDAnalysisWindow(QMainWindow):
             view_suffix = "Filtered" if self.time_filtering_mode == "filtered" else "Raw"
             legend_label = f"{legend_label} ({view_suffix})"
 
-            self.time_plot_widget.plot(time_data, signal_data, pen=pen, name=legend_label)
+            if pyramid is not None:
+                item = _LODPlotDataItem(pyramid, time_data, signal_data, pen=pen, name=legend_label)
+                self.time_plot_widget.addItem(item)
+                self._time_history_items[i] = item
+            else:
+                self.time_plot_widget.plot(time_data, signal_data, pen=pen, name=legend_label)
             plot_count += 1
 
         resolution_label = "Full Resolution" if self.time_resolution_mode == "full" else "Decimated"
@@ -3362,6 +4189,7 @@ class PSDAnalysisWindow(QMainWindow):
             try:
                 self.time_plot_widget.setXRange(previous_x[0], previous_x[1], padding=0)
                 self.time_plot_widget.setYRange(previous_y[0], previous_y[1], padding=0)
+                self._refresh_time_history_lod()
             except Exception:
                 self.time_plot_widget.enableAutoRange()
         elif plot_count > 0:
@@ -3423,106 +4251,20 @@ class PSDAnalysisWindow(QMainWindow):
                 self._calculate_event_psds(events=active_events)
                 return
 
-            freq_min = self.freq_min_spin.value()
-            freq_max = self.freq_max_spin.value()
-
             # Determine number of channels from selected dataset
             num_channels = len(self.channel_names) if self.channel_names else 0
             if num_channels == 0 and self.signal_data_full is not None:
                 num_channels = 1 if self.signal_data_full.ndim == 1 else self.signal_data_full.shape[1]
 
-            self.frequencies = {}
-            self.psd_results = {}
-            self.rms_values = {}
-            skipped_channels = []
-            filter_info_messages = []
-            first_applied = None
-
-            progress = QProgressDialog("Calculating PSDs...", "Cancel", 0, num_channels, self)
-            progress.setWindowTitle("PSD Analysis")
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.setMinimumDuration(500)
-            progress.setValue(0)
-            progress.setStyleSheet("""
-                QProgressDialog {
-                    background-color: #ffffff;
-                }
-                QProgressDialog QLabel {
-                    color: #000000;
-                }
-                QProgressDialog QPushButton {
-                    color: #000000;
-                }
-            """)
-
-            try:
-                for channel_idx in range(num_channels):
-                    if progress.wasCanceled():
-                        self.frequencies = {}
-                        self.psd_results = {}
-                        self.rms_values = {}
-                        self._clear_psd_plot()
-                        show_warning(self, "Calculation Canceled", "PSD calculation was canceled.")
-                        return
-
-                    channel_name = self.channel_names[channel_idx]
-                    progress.setLabelText(f"Calculating: {channel_name} ({channel_idx + 1}/{num_channels})")
-                    progress.setValue(channel_idx)
-                    QApplication.processEvents()
-
-                    _, signal_full, channel_sample_rate = self._get_channel_full(channel_idx)
-                    if signal_full is None or channel_sample_rate is None or len(signal_full) == 0:
-                        continue
-
-                    try:
-                        frequencies, psd, applied_hp, applied_lp, info_messages = self._compute_channel_psd(
-                            signal_full,
-                            channel_sample_rate,
-                        )
-                    except Exception as exc:
-                        skipped_channels.append(f"{channel_name}: {exc}")
-                        continue
-
-                    self.frequencies[channel_name] = frequencies
-                    self.psd_results[channel_name] = psd
-                    if first_applied is None:
-                        first_applied = (applied_hp, applied_lp)
-                    filter_info_messages.extend(f"{channel_name}: {msg}" for msg in info_messages)
-
-                    rms = calculate_rms_from_psd(
-                        frequencies,
-                        psd,
-                        freq_min=freq_min,
-                        freq_max=freq_max
-                    )
-                    self.rms_values[channel_name] = rms
-            finally:
-                progress.setValue(num_channels)
-                progress.close()
-
-            if skipped_channels:
-                skipped_text = "\n".join(f"• {msg}" for msg in skipped_channels[:12])
-                if len(skipped_channels) > 12:
-                    skipped_text += f"\n• ... and {len(skipped_channels) - 12} more"
-                show_warning(
-                    self,
-                    "PSD Calculation Warnings",
-                    "Some channels were skipped during PSD calculation:\n\n"
-                    f"{skipped_text}",
-                )
-
-            if first_applied is not None and hasattr(self, "applied_filters_label"):
-                self.applied_filters_label.setText(
-                    f"Applied filters: HP {first_applied[0]:.2f} Hz, LP {first_applied[1]:.2f} Hz"
-                )
-            self._set_info_messages(filter_info_messages or self._cached_filter_messages)
+            jobs = []
+            for channel_idx in range(num_channels):
+                # Lazy HDF5 channels are read by the PSD workers, one at a time per worker
+                _, signal_full, channel_sample_rate = self._get_channel_full(channel_idx, lazy=True)
+                if signal_full is None or channel_sample_rate is None or len(signal_full) == 0:
+                    continue
+                jobs.append(((None, channel_idx), signal_full, channel_sample_rate, (0, len(signal_full))))
 
-            if not self.psd_results:
-                self._clear_psd_plot()
-                show_warning(self, "No PSD Results", "No valid PSD results were produced for the selected channels.")
-                return
-
-            self._update_plot()
+            self._start_psd_calculation(jobs, event_mode=False)
 
         except Exception as e:
             show_critical(self, "Calculation Error", f"Failed to calculate PSD: {e}\n\nPlease try adjusting the frequency resolution or frequency range.")
@@ -3633,12 +4375,17 @@ class PSDAnalysisWindow(QMainWindow):
                 # Convert to octave bands if requested
                 if use_octave and octave_fraction is not None:
                     try:
-                        frequencies_plot_oct, psd_oct = convert_psd_to_octave_bands(
-                            frequencies,  # Full frequency array
-                            self.psd_results[channel_name],  # Full PSD array
-                            octave_fraction=octave_fraction,
-                            freq_min=actual_freq_min,
-                            freq_max=actual_freq_max
+                        cache_key = self._psd_result_keys.get(channel_name, (None, None))[0]
+                        frequencies_plot_oct, psd_oct = self._cached_psd_view(
+                            cache_key,
+                            ("octave", octave_fraction, actual_freq_min, actual_freq_max),
+                            lambda: convert_psd_to_octave_bands(
+                                frequencies,  # Full frequency array
+                                self.psd_results[channel_name],  # Full PSD array
+                                octave_fraction=octave_fraction,
+                                freq_min=actual_freq_min,
+                                freq_max=actual_freq_max
+                            ),
                         )
                         octave_name = self.octave_combo.currentText()
                         frequencies_to_plot = frequencies_plot_oct
@@ -3699,12 +4446,13 @@ class PSDAnalysisWindow(QMainWindow):
                         name=legend_label
                     )
                 else:
-                    self.plot_widget.plot(
+                    curve_item = self.plot_widget.plot(
                         frequencies_to_plot, 
                         psd_to_plot, 
                         pen=pen,
                         name=legend_label
                     )
+                    self._psd_curve_items[channel_name] = (curve_item, legend_prefix, unit)
                 
                 plot_count += 1
         
@@ -3801,10 +4549,12 @@ class PSDAnalysisWindow(QMainWindow):
         time_data_for_window = None
         for idx in selected_channels:
             channel_name = self.channel_names[idx]
-            # Use FULL resolution data for spectrogram calculations
-            time_full, signal, channel_sr = self._get_channel_full(idx)
+            # Use FULL resolution data for spectrogram calculations; lazy
+            # handles let the spectrogram share conditioned signals by channel
+            time_full, signal, channel_sr = self._get_channel_full(idx, lazy=True)
             if signal is None or time_full is None:
                 continue
+            time_full = materialize(time_full)
             unit = self.channel_units[idx] if idx < len(self.channel_units) else ''
             # Get flight name for this specific channel (empty for CSV)
             flight_name = self.channel_flight_names[idx] if idx < len(self.channel_flight_names) else ''
@@ -3906,6 +4656,212 @@ class PSDAnalysisWindow(QMainWindow):
         # Calculate PSDs for all events
         self._calculate_event_psds(events=events)
     
+    def _on_live_region_toggled(self, enabled):
+        """Show or hide the draggable live PSD region on the time history."""
+        if self._live_region is not None:
+            self.time_plot_widget.removeItem(self._live_region)
+            self._live_region = None
+        if not enabled:
+            self._cancel_live_region_indexes()
+            self._live_region_indexes = {}
+            self.frequencies = {}
+            self.psd_results = {}
+            self.rms_values = {}
+            self._clear_psd_plot()
+            return
+
+        x_min, x_max = self.time_plot_widget.getPlotItem().vb.viewRange()[0]
+        width = x_max - x_min
+        self._live_region = pg.LinearRegionItem(
+            values=[x_min + 0.4 * width, x_max - 0.4 * width],
+            brush=pg.mkBrush(96, 165, 250, 40),
+            pen=pg.mkPen(96, 165, 250, 200, width=2),
+            movable=True,
+        )
+        self._live_region.sigRegionChanged.connect(self._update_live_region_psd)
+        self.time_plot_widget.addItem(self._live_region)
+        self._update_live_region_psd()
+
+    def _live_region_index(self, channel_idx, settings, sample_rate):
+        """
+        Segment spectrum index of one channel for the current PSD settings.
+
+        Returns ``(ready, index)``; ``ready`` is False while the index is
+        still being built on the worker pool, and ``index`` is None when the
+        channel cannot be indexed.
+        """
+        cached = self._live_region_indexes.get(channel_idx)
+        if cached is not None and cached[0] == _segment_index_key(settings, sample_rate):
+            return True, cached[1]
+        return False, None
+
+    def _build_live_region_indexes(self, channels, settings):
+        """
+        Build missing live region indexes on a background worker pool.
+
+        A build already running for these channels and keys is left alone;
+        otherwise it is cancelled and replaced.
+        """
+        keys = {}
+        jobs = []
+        for channel_idx in channels:
+            _time, signal, sample_rate = self._get_channel_full(channel_idx, lazy=True)
+            keys[channel_idx] = _segment_index_key(settings, sample_rate)
+            jobs.append(((None, channel_idx), signal, sample_rate))
+        running = self._live_index_keys
+        if self._live_index_thread is not None and all(running.get(idx) == key for idx, key in keys.items()):
+            return
+        self._cancel_live_region_indexes()
+        thread = PSDCalculationThread(jobs, settings, parent=self, job_function=_build_segment_index)
+        thread.result_ready.connect(self._on_live_region_index_ready)
+        thread.job_failed.connect(self._on_live_region_index_failed)
+        thread.finished.connect(self._on_live_index_thread_finished)
+        self._live_index_thread = thread
+        self._live_index_keys = keys
+        thread.start()
+
+    def _on_live_region_index_ready(self, key, index):
+        """Store a finished live region index and refresh the live PSD."""
+        if self.sender() is not self._live_index_thread:
+            return
+        channel_idx = key[1]
+        self._live_region_indexes[channel_idx] = (self._live_index_keys[channel_idx], index)
+        self._update_live_region_psd()
+
+    def _on_live_region_index_failed(self, key, _message: str):
+        if self.sender() is not self._live_index_thread:
+            return
+        channel_idx = key[1]
+        self._live_region_indexes[channel_idx] = (self._live_index_keys[channel_idx], None)
+
+    def _on_live_index_thread_finished(self):
+        thread = self.sender()
+        if thread in self._retired_psd_threads:
+            self._retired_psd_threads.remove(thread)
+        elif thread is self._live_index_thread:
+            self._live_index_thread = None
+            self._live_index_keys = {}
+        thread.deleteLater()
+
+    def _cancel_live_region_indexes(self):
+        """Stop building live region indexes; finished indexes are kept."""
+        thread = self._live_index_thread
+        if thread is None:
+            return
+        thread.cancel()
+        self._live_index_thread = None
+        self._live_index_keys = {}
+        self._retired_psd_threads.append(thread)
+
+    def _wait_for_live_region_indexes(self):
+        """Block until the running live region index build has delivered its indexes."""
+        thread = self._live_index_thread
+        if thread is not None:
+            thread.wait()
+        QApplication.processEvents()
+
+    def _time_span_indices(self, time_full, start_time, end_time, sample_rate=None):
+        """
+        Sample range ``[start, end)`` of a channel inside ``[start_time, end_time]``.
+
+        Lazy HDF5 channels are uniformly sampled, so the range follows from
+        their start time and sample rate without reading the time vector.
+        """
+        if isinstance(time_full, LazyArray) and sample_rate:
+            n_samples = len(time_full)
+            if n_samples == 0:
+                return 0, 0
+            first_time = float(time_full[0])
+            start_idx = int(np.ceil((start_time - first_time) * sample_rate - 1e-9))
+            end_idx = int(np.floor((end_time - first_time) * sample_rate + 1e-9)) + 1
+            start_idx = min(max(start_idx, 0), n_samples)
+            return start_idx, min(max(end_idx, start_idx), n_samples)
+        return (
+            int(np.searchsorted(time_full, start_time, side='left')),
+            int(np.searchsorted(time_full, end_time, side='right')),
+        )
+
+    def _update_live_region_psd(self):
+        """Recompute the PSD of the live region from per-segment prefix sums."""
+        if self._live_region is None or not self.channel_names:
+            return
+        self._cancel_psd_calculation(notify=False)
+        start_time, end_time = self._live_region.getRegion()
+        settings = self._psd_settings()
+
+        self.frequencies = {}
+        self.psd_results = {}
+        self.rms_values = {}
+        self._psd_result_keys = {}
+        self._psd_event_mode = False
+        missing = []
+        for channel_idx, checkbox in enumerate(self.channel_checkboxes):
+            if not checkbox.isChecked() or channel_idx >= len(self.channel_names):
+                continue
+            time_full, signal_full, channel_sample_rate = self._get_channel_full(channel_idx, lazy=True)
+            if signal_full is None or not channel_sample_rate or len(signal_full) == 0:
+                continue
+            ready, index = self._live_region_index(channel_idx, settings, channel_sample_rate)
+            if not ready:
+                missing.append(channel_idx)
+                continue
+            if index is None:
+                continue
+            start_idx, end_idx = self._time_span_indices(time_full, start_time, end_time, channel_sample_rate)
+            try:
+                if settings["maximax"]:
+                    window_samples = int(settings["maximax_window"] * channel_sample_rate)
+                    step_samples = window_samples - int(window_samples * settings["maximax_overlap"] / 100)
+                    psd = index.maximax(start_idx, end_idx, window_samples, step_samples)
+                else:
+                    psd = index.welch(start_idx, end_idx)
+            except ValueError:
+                continue
+            channel_name = self.channel_names[channel_idx]
+            self.frequencies[channel_name] = index.frequencies
+            self.psd_results[channel_name] = psd
+            self.rms_values[channel_name], _note = _band_rms(
+                index.frequencies, psd, settings["freq_min"], settings["freq_max"]
+            )
+        if missing:
+            self._build_live_region_indexes(missing, settings)
+
+        if not self.psd_results:
+            self._clear_psd_plot()
+        elif not self._move_live_region_curves():
+            self._update_plot()
+
+    def _move_live_region_curves(self) -> bool:
+        """
+        Update plotted narrowband curves in place with new live-region PSDs.
+
+        Rebuilding every curve and legend entry dominates a drag update, so
+        when the plotted channels are unchanged only their data and legend
+        text change. Returns False when a full redraw is needed.
+        """
+        if self.octave_checkbox.isChecked() or set(self._psd_curve_items) != set(self.psd_results):
+            return False
+        freq_min = self.freq_min_spin.value()
+        freq_max = self.freq_max_spin.value()
+        for channel_name, (curve_item, legend_prefix, unit) in self._psd_curve_items.items():
+            frequencies = self.frequencies[channel_name]
+            psd = self.psd_results[channel_name]
+            mask = (
+                (frequencies >= max(freq_min, frequencies[0]))
+                & (frequencies <= min(freq_max, frequencies[-1]))
+                & np.isfinite(psd)
+                & (frequencies > 0)
+                & (psd > 0)
+            )
+            if not np.any(mask):
+                return False
+            curve_item.setData(frequencies[mask], psd[mask])
+            label = self.legend.getLabel(curve_item) if self.legend is not None else None
+            if label is not None:
+                rms_text = self._format_rms_with_unit(self.rms_values[channel_name], unit)
+                label.setText(f"{legend_prefix}: RMS={rms_text}")
+        return True
+
     def _on_interactive_mode_changed(self, enabled):
         """
         Handle interactive selection mode toggle.
@@ -4026,27 +4982,22 @@ class PSDAnalysisWindow(QMainWindow):
             return
 
         try:
-            freq_min = self.freq_min_spin.value()
-            freq_max = self.freq_max_spin.value()
-
             num_channels = len(self.channel_names) if self.channel_names else 0
             if num_channels == 0:
                 return
 
-            self.frequencies = {}
-            self.psd_results = {}
-            self.rms_values = {}
+            jobs = []
             skipped_entries = []
-            filter_info_messages = []
-
             for event in active_events:
                 for channel_idx in range(num_channels):
                     channel_name = self.channel_names[channel_idx]
-                    time_full, signal_full, channel_sample_rate = self._get_channel_full(channel_idx)
+                    time_full, signal_full, channel_sample_rate = self._get_channel_full(channel_idx, lazy=True)
                     if time_full is None or signal_full is None or len(signal_full) == 0:
                         continue
                     if channel_sample_rate is None or channel_sample_rate <= 0:
                         continue
+                    # Slices of lazy HDF5 channels read only the event's samples
+                    time_full = materialize(time_full)
 
                     start_idx = int(np.searchsorted(time_full, event.start_time, side='left'))
                     end_idx = int(np.searchsorted(time_full, event.end_time, side='right'))
@@ -4056,53 +5007,14 @@ class PSDAnalysisWindow(QMainWindow):
                         skipped_entries.append(f"{event.name} / {channel_name}: insufficient samples")
                         continue
 
-                    signal_segment = signal_full[start_idx:end_idx]
+                    jobs.append((
+                        (event.name, channel_idx),
+                        signal_full[start_idx:end_idx],
+                        channel_sample_rate,
+                        (start_idx, end_idx),
+                    ))
 
-                    try:
-                        frequencies, psd, _hp, _lp, info_messages = self._compute_channel_psd(
-                            signal_segment,
-                            channel_sample_rate,
-                        )
-                    except Exception as exc:
-                        skipped_entries.append(f"{event.name} / {channel_name}: {exc}")
-                        continue
-
-                    self.frequencies[channel_name] = frequencies
-                    key = f"{event.name}_{channel_name}"
-                    self.psd_results[key] = psd
-                    self.rms_values[key] = calculate_rms_from_psd(
-                        frequencies,
-                        psd,
-                        freq_min=freq_min,
-                        freq_max=freq_max,
-                    )
-                    filter_info_messages.extend(
-                        f"{event.name} / {channel_name}: {msg}" for msg in info_messages
-                    )
-
-            if skipped_entries:
-                skipped_text = "\n".join(f"• {msg}" for msg in skipped_entries[:12])
-                if len(skipped_entries) > 12:
-                    skipped_text += f"\n• ... and {len(skipped_entries) - 12} more"
-                show_warning(
-                    self,
-                    "Event PSD Warnings",
-                    "Some event/channel PSD calculations were skipped:\n\n"
-                    f"{skipped_text}",
-                )
-
-            self._set_info_messages(filter_info_messages or self._cached_filter_messages)
-
-            if not self.psd_results:
-                self._clear_psd_plot()
-                show_warning(
-                    self,
-                    "No Event PSD Results",
-                    "No valid PSD results were produced for the enabled events.",
-                )
-                return
-
-            self._update_plot_with_events()
+            self._start_psd_calculation(jobs, event_mode=True, skipped=skipped_entries)
 
         except Exception as e:
             show_critical(self, "Calculation Error", f"Failed to calculate event PSDs: {e}")
@@ -4328,12 +5240,12 @@ class PSDAnalysisWindow(QMainWindow):
             if not file_path:
                 return
             
-            # Close existing loader if any
-            if self.hdf5_loader is not None:
+            # Close existing loader if any (kept open while its channels are loaded)
+            if self.hdf5_loader is not None and self.hdf5_loader is not self._channel_loader:
                 self.hdf5_loader.close()
             
             # Create new loader
-            self.hdf5_loader = HDF5FlightDataLoader(file_path)
+            self.hdf5_loader = HDF5FlightDataLoader(file_path, catalog=get_default_catalog())
             
             # Open flight navigator
             self.flight_navigator = FlightNavigator(self.hdf5_loader, self)
@@ -4388,118 +5300,77 @@ class PSDAnalysisWindow(QMainWindow):
     def _on_hdf5_data_selected(self, selected_items):
         """
         Handle data selection from flight navigator.
-        
+
+        Channel metadata and lazy full-resolution handles are set up at once;
+        display views load on a background worker pool (``ChannelLoadThread``)
+        and each channel's trace is drawn as soon as it arrives. Loading
+        completes in ``_finish_channel_loading``.
+
         Parameters:
         -----------
         selected_items : list of tuples
             List of (flight_key, channel_key, channel_info) tuples
         """
+        if not selected_items:
+            return
+
         try:
-            print("\n=== HDF5 DATA LOADING DEBUG ===")
-            print(f"Selected items: {len(selected_items)}")
-            
-            if not selected_items:
-                print("No items selected")
-                return
-            
-            # Load all selected channels
-            print(f"Loading {len(selected_items)} channel(s)...")
-            
+            self._cancel_channel_loading()
+            self._cancel_psd_calculation(notify=False)
+
+            # Full-resolution samples from the previous selection are no
+            # longer needed; a fresh cache also keeps late writes from a
+            # cancelled load out of the new selection
+            self._channel_cache = ArrayLRUCache(self._channel_cache.max_bytes)
+
+            jobs = []
             all_time_full = []
-            all_time_display = []
             all_signals_full = []
-            all_signals_display = []
+            all_sample_rates = []
             all_channel_names = []
             all_channel_units = []
-            all_sample_rates = []  # Store sample rate for each channel
-            sample_rate = None  # Reference sample rate (will be max of all)
-            decimation_factor = 1
             flight_info = []
-            
-            # First pass: collect all data and find max sample rate
-            channel_data_list = []
             for idx, (flight_key, channel_key, channel_info) in enumerate(selected_items):
-                print(f"\nChannel {idx+1}/{len(selected_items)}:")
-                print(f"  Flight key: {flight_key}")
-                print(f"  Channel key: {channel_key}")
-                print(f"  Sample rate: {channel_info.sample_rate} Hz")
-                
-                # Load data - returns dict with both full and decimated data
-                result = self.hdf5_loader.load_channel_data(flight_key, channel_key, decimate_for_display=True)
-                print(f"  Full data: time shape={result['time_full'].shape}, signal shape={result['data_full'].shape}")
-                print(f"  Display data: time shape={result['time_display'].shape}, signal shape={result['data_display'].shape}")
-                print(f"  Decimation factor: {result.get('decimation_factor', 1)}")
-                
-                channel_data_list.append({
-                    'result': result,
-                    'channel_key': channel_key,
-                    'flight_key': flight_key,
-                    'units': channel_info.units
-                })
-                
-                # Track max sample rate
-                if sample_rate is None or result['sample_rate'] > sample_rate:
-                    sample_rate = result['sample_rate']
-                decimation_factor = max(decimation_factor, result.get('decimation_factor', 1))
-            
-            print(f"\nReference sample rate (max): {sample_rate} Hz")
-            
-            # Second pass: collect per-channel data (no padding/resampling)
-            for idx, ch_data in enumerate(channel_data_list):
-                result = ch_data['result']
-
-                # Check if sample rates differ
-                if result['sample_rate'] != sample_rate:
-                    print(f"  Channel {idx+1}: Different sample rate {result['sample_rate']} Hz (reference: {sample_rate} Hz)")
-                    print(f"    Multi-rate support: Each channel will use its own sample rate for PSD calculation")
-
-                all_time_full.append(result['time_full'])
-                all_time_display.append(result['time_display'])
-                all_signals_full.append(result['data_full'])
-                all_signals_display.append(result['data_display'])
-                all_channel_names.append(ch_data['channel_key'])
-                all_channel_units.append(ch_data['units'])
-                all_sample_rates.append(result['sample_rate'])  # Store each channel's sample rate
-                flight_info.append(ch_data['flight_key'])
-
-            # Store canonical per-channel data for all mixed-rate operations
+                # Full-resolution samples stay in the file as lazy handles
+                channel_group = self.hdf5_loader.h5file[channel_info.full_path]
+                time_full = LazyArray.from_dataset(
+                    channel_group['time'], self._channel_cache, ("time", idx)
+                )
+                signal_full = LazyArray.from_dataset(
+                    channel_group['data'], self._channel_cache, ("raw", idx)
+                )
+                sample_rate = self.hdf5_loader.get_sample_rate(flight_key, channel_key)
+                jobs.append((idx, flight_key, channel_key, time_full, signal_full, sample_rate))
+                all_time_full.append(time_full)
+                all_signals_full.append(signal_full)
+                all_sample_rates.append(sample_rate)
+                all_channel_names.append(channel_key)
+                all_channel_units.append(channel_info.units)
+                flight_info.append(flight_key)
+
+            # Store canonical per-channel data for all mixed-rate operations;
+            # display views are filled in as the loader delivers them
             self.channel_time_full = all_time_full
-            self.channel_time_display = all_time_display
             self.channel_signal_full = all_signals_full
-            self.channel_signal_display = all_signals_display
+            self.channel_time_display = [None] * len(jobs)
+            self.channel_signal_display = [None] * len(jobs)
+            self._set_channel_loader(self.hdf5_loader)
 
             # Keep legacy references for compatibility with older code paths.
-            self.time_data_full = all_time_full[0] if all_time_full else None
-            self.time_data_display = all_time_display[0] if all_time_display else None
-            if len(all_signals_full) == 1:
-                self.signal_data_full = all_signals_full[0].reshape(-1, 1)
-                self.signal_data_display = all_signals_display[0].reshape(-1, 1)
-            else:
-                same_full_length = len(set(len(sig) for sig in all_signals_full)) == 1
-                same_display_length = len(set(len(sig) for sig in all_signals_display)) == 1
-                same_full_time = all(np.array_equal(t, all_time_full[0]) for t in all_time_full[1:]) if len(all_time_full) > 1 else True
-                same_display_time = all(np.array_equal(t, all_time_display[0]) for t in all_time_display[1:]) if len(all_time_display) > 1 else True
-                if same_full_length and same_full_time:
-                    self.signal_data_full = np.column_stack(all_signals_full)
-                else:
-                    self.signal_data_full = all_signals_full[0].reshape(-1, 1)
-                if same_display_length and same_display_time:
-                    self.signal_data_display = np.column_stack(all_signals_display)
-                else:
-                    self.signal_data_display = all_signals_display[0].reshape(-1, 1)
-
-            self.sample_rate = sample_rate  # Reference sample rate (max)
+            # The full-resolution matrix is not assembled: every path reads
+            # HDF5 channels through _get_channel_full.
+            self.time_data_full = all_time_full[0]
+            self.signal_data_full = None
+            self.time_data_display = None
+            self.signal_data_display = None
+
+            self.sample_rate = max(all_sample_rates)  # Reference sample rate (max)
             self.channel_names = all_channel_names
             self.channel_units = all_channel_units
             self.channel_sample_rates = all_sample_rates  # Store each channel's sample rate
             self.channel_flight_names = flight_info  # Store flight name for each channel
-            
-            # Update validator with Nyquist frequency
-            if self.sample_rate is not None:
-                nyquist_freq = self.sample_rate / 2
-                self.validator.set_nyquist_frequency(nyquist_freq)
-                print(f"Validator: Nyquist frequency set to {nyquist_freq} Hz")
-            
+            self.validator.set_nyquist_frequency(self.sample_rate / 2)
+
             # Create file label and set flight name
             if len(set(flight_info)) == 1:
                 self.current_file = f"{flight_info[0]} ({len(selected_items)} channels)"
@@ -4507,80 +5378,30 @@ class PSDAnalysisWindow(QMainWindow):
             else:
                 self.current_file = f"Multiple flights ({len(selected_items)} channels)"
                 self.flight_name = "Multiple flights"  # Multiple flights
-            
-            print(f"\nLoaded channels: {len(self.channel_names)}")
-            for idx, (name, sr, sig, t) in enumerate(zip(self.channel_names, self.channel_sample_rates, self.channel_signal_full, self.channel_time_full), start=1):
-                print(f"  [{idx}] {name}: sr={sr}, samples={len(sig)}, t=[{float(t[0]):.3f}, {float(t[-1]):.3f}]")
-            
-            # Calculate global duration from per-channel time bounds
-            time_min, time_max = self._get_time_bounds()
-            duration = max(0.0, time_max - time_min)
-            
-            # Update UI
+
             self.file_label.setText(f"Loaded: {self.current_file}")
-            if decimation_factor > 1:
-                self.info_label.setText(
-                    f"Reference SR: {self.sample_rate:.0f} Hz | "
-                    f"Duration: {duration:.2f} s | "
-                    f"Channels: {len(self.channel_names)} | "
-                    f"Decimated {decimation_factor}x for display"
-                )
-            else:
-                self.info_label.setText(
-                    f"Reference SR: {self.sample_rate:.0f} Hz | "
-                    f"Duration: {duration:.2f} s | "
-                    f"Channels: {len(self.channel_names)} (Full resolution)"
-                )
-            
-            # Create channel selection checkboxes
+            self.info_label.setText(f"Loading {len(jobs)} channel(s)...")
             self._create_channel_checkboxes()
-            
-            # Enable buttons
-            self.calc_button.setEnabled(True)
-            self.spec_button.setEnabled(True)
-            self.event_button.setEnabled(True)
-            self.channel_selector_button.setEnabled(True)
-            self.cross_spectrum_button.setEnabled(len(self.channel_names) >= 2)
-            self.report_button.setEnabled(PPTX_AVAILABLE)
-            self.statistics_button.setEnabled(True)
+
+            # Analysis tools wait for every display view to arrive
+            for button in (
+                self.calc_button, self.spec_button, self.event_button, self.channel_selector_button,
+                self.cross_spectrum_button, self.report_button, self.statistics_button,
+            ):
+                button.setEnabled(False)
 
             # Clear previous results
             self.frequencies = {}
             self.psd_results = {}
             self.rms_values = {}
+            self._clear_psd_cache()
             self._clear_psd_plot()
-            
-            # Reset and rebuild adaptive time-history cache.
+
             self._reset_time_history_defaults()
             self._update_filter_info_display()
-            self._build_time_history_cache()
-            self._plot_time_history()
-            
-            # Update nperseg display
             self._update_nperseg_from_df()
-            
-            # Create message based on decimation
-            if decimation_factor > 1:
-                message = (
-                    f"Successfully loaded {len(self.channel_names)} channel(s)\n"
-                    f"Channels: {', '.join(self.channel_names)}\n"
-                    f"Reference Sample Rate: {self.sample_rate:.0f} Hz\n"
-                    f"Duration: {duration:.2f} seconds\n"
-                    f"Time Range: {time_min:.3f} to {time_max:.3f} s\n\n"
-                    f"Note: Data decimated {decimation_factor}x for display.\n"
-                    f"Full resolution will be used for PSD calculations."
-                )
-            else:
-                message = (
-                    f"Successfully loaded {len(self.channel_names)} channel(s)\n"
-                    f"Channels: {', '.join(self.channel_names)}\n"
-                    f"Reference Sample Rate: {self.sample_rate:.0f} Hz\n"
-                    f"Duration: {duration:.2f} seconds\n"
-                    f"Time Range: {time_min:.3f} to {time_max:.3f} s"
-                )
-            
-            show_information(self, "Data Loaded", message)
-            
+            self._start_channel_loading(jobs)
+
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
@@ -4589,7 +5410,232 @@ class PSDAnalysisWindow(QMainWindow):
             print(f"Error type: {type(e).__name__}")
             print(f"Error message: {str(e)}")
             show_critical(self, "Load Error", f"Failed to load HDF5 data: {e}\n\nSee console for full traceback.")
-    
+
+    def _start_channel_loading(self, jobs):
+        """Load the selected channels on a ``ChannelLoadThread``."""
+        self._channel_load_run = {
+            "total": len(jobs),
+            "decimation_factor": 1,
+            "failed": [],
+        }
+        self._channel_full_pending = {job[0] for job in jobs}
+        self.time_history_cache = {}
+        self._cached_filter_messages = []
+        self._plot_time_history()
+
+        # The conditioned signal is only needed for the filtered view
+        filter_inputs = self._get_user_filter_inputs() if self.time_filtering_mode == "filtered" else None
+        thread = ChannelLoadThread(
+            self.hdf5_loader,
+            jobs,
+            filter_inputs=filter_inputs,
+            conditioned_array=self._conditioned_channel_array,
+            parent=self,
+        )
+        thread.channel_ready.connect(self._on_channel_display_loaded)
+        thread.channel_failed.connect(self._on_channel_load_failed)
+        thread.full_resolution_ready.connect(self._on_channel_full_resolution_loaded)
+        thread.progress.connect(self._on_channel_load_progress)
+        thread.finished.connect(self._on_channel_load_thread_finished)
+        self._channel_load_thread = thread
+        thread.start()
+
+    def _on_channel_display_loaded(self, channel_idx: int, result):
+        """Store one channel's display view and schedule a time-history redraw."""
+        if self.sender() is not self._channel_load_thread:
+            return
+        self.channel_time_display[channel_idx] = result['time_display']
+        self.channel_signal_display[channel_idx] = result['data_display']
+        run = self._channel_load_run
+        run["decimation_factor"] = max(run["decimation_factor"], result.get('decimation_factor', 1))
+
+        entry = self._time_history_cache_entry(channel_idx, *self._get_user_filter_inputs())
+        if entry is not None:
+            self.time_history_cache[channel_idx] = entry
+        self._loading_plot_timer.start()
+
+    def _on_channel_load_failed(self, channel_idx: int, message: str):
+        if self.sender() is not self._channel_load_thread:
+            return
+        self._channel_full_pending.discard(channel_idx)
+        self._channel_load_run["failed"].append(f"{self.channel_names[channel_idx]}: {message}")
+
+    def _on_channel_full_resolution_loaded(self, channel_idx: int, payload):
+        """Attach the background-built full-resolution views to the time-history cache."""
+        if self.sender() is not self._channel_load_thread:
+            return
+        self._channel_full_pending.discard(channel_idx)
+        cache = self.time_history_cache.get(channel_idx)
+        if cache is None:
+            return
+        cache["full_resolution_pending"] = False
+        if payload is None:
+            return
+        cache.setdefault("lod_raw", payload["lod_raw"])
+        # Filter settings may have changed while the channel was loading
+        if (
+            "filtered" in payload
+            and cache["signal_full_filtered"] is None
+            and payload["filter_inputs"] == self._get_user_filter_inputs()
+        ):
+            display_indices = cache["display_indices"]
+            cache["signal_full_filtered"] = payload["signal_full_filtered"]
+            cache["signal_decimated_filtered"] = (
+                payload["filtered"][display_indices]
+                if len(display_indices) > 0
+                else np.array([], dtype=np.float64)
+            )
+            cache["lod_filtered"] = payload["lod_filtered"]
+            cache["applied_highpass_hz"] = payload["applied_highpass_hz"]
+            cache["applied_lowpass_hz"] = payload["applied_lowpass_hz"]
+            cache["filter_messages"] = [
+                f"{self.channel_names[channel_idx]}: {msg}" for msg in payload["messages"]
+            ]
+            for msg in cache["filter_messages"]:
+                if msg not in self._cached_filter_messages:
+                    self._cached_filter_messages.append(msg)
+        self._loading_plot_timer.start()
+
+    def _on_channel_load_progress(self, completed: int, total: int):
+        if self.sender() is not self._channel_load_thread:
+            return
+        if completed < total:
+            self.info_label.setText(f"Loading channels: {completed}/{total}")
+        else:
+            self._finish_channel_loading()
+
+    def _refresh_loading_time_history(self):
+        """Redraw the time history with the channels delivered so far."""
+        self._show_time_history_applied_filters()
+        self._plot_time_history()
+        self.time_plot_widget.enableAutoRange()
+
+    def _on_channel_load_thread_finished(self):
+        thread = self.sender()
+        if thread in self._retired_channel_load_threads:
+            self._retired_channel_load_threads.remove(thread)
+            thread.deleteLater()
+            return
+        if thread is not self._channel_load_thread:
+            return
+        self._channel_load_thread = None
+        self._channel_full_pending.clear()
+        for cache in self.time_history_cache.values():
+            cache["full_resolution_pending"] = False
+        thread.deleteLater()
+        if self._loading_plot_timer.isActive():
+            self._loading_plot_timer.stop()
+            self._refresh_loading_time_history()
+
+    def _cancel_channel_loading(self):
+        """Stop a running channel load; late results are ignored."""
+        thread = self._channel_load_thread
+        if thread is None:
+            return
+        thread.cancel()
+        self._channel_load_thread = None
+        self._retired_channel_load_threads.append(thread)
+        self._loading_plot_timer.stop()
+        self._channel_load_run = None
+        self._channel_full_pending.clear()
+
+    def _wait_for_channel_loading(self):
+        """Block until the running channel load has delivered its results."""
+        thread = self._channel_load_thread
+        if thread is not None:
+            thread.wait()
+        QApplication.processEvents()
+
+    def _finish_channel_loading(self):
+        """Complete the selection once every display view has arrived."""
+        run = self._channel_load_run
+        if run is None:
+            return
+        self._channel_load_run = None
+        self._loading_plot_timer.stop()
+
+        all_signals_display = [sig for sig in self.channel_signal_display if sig is not None]
+        all_time_display = [t for t in self.channel_time_display if t is not None]
+        if not all_signals_display:
+            self.info_label.setText("No channels loaded")
+            show_critical(
+                self,
+                "Load Error",
+                "Failed to load HDF5 data:\n\n" + "\n".join(run["failed"]),
+            )
+            return
+
+        # Keep legacy display references for compatibility with older code paths
+        self.time_data_display = all_time_display[0]
+        if len(all_signals_display) == 1:
+            self.signal_data_display = all_signals_display[0].reshape(-1, 1)
+        else:
+            same_display_length = len(set(len(sig) for sig in all_signals_display)) == 1
+            same_display_time = all(np.array_equal(t, all_time_display[0]) for t in all_time_display[1:])
+            if same_display_length and same_display_time:
+                self.signal_data_display = np.column_stack(all_signals_display)
+            else:
+                self.signal_data_display = all_signals_display[0].reshape(-1, 1)
+
+        # Calculate global duration from per-channel time bounds
+        time_min, time_max = self._get_time_bounds()
+        duration = max(0.0, time_max - time_min)
+        decimation_factor = run["decimation_factor"]
+
+        # Update UI
+        if decimation_factor > 1:
+            self.info_label.setText(
+                f"Reference SR: {self.sample_rate:.0f} Hz | "
+                f"Duration: {duration:.2f} s | "
+                f"Channels: {len(self.channel_names)} | "
+                f"Decimated {decimation_factor}x for display"
+            )
+        else:
+            self.info_label.setText(
+                f"Reference SR: {self.sample_rate:.0f} Hz | "
+                f"Duration: {duration:.2f} s | "
+                f"Channels: {len(self.channel_names)} (Full resolution)"
+            )
+
+        # Enable buttons
+        self.calc_button.setEnabled(True)
+        self.spec_button.setEnabled(True)
+        self.event_button.setEnabled(True)
+        self.channel_selector_button.setEnabled(True)
+        self.cross_spectrum_button.setEnabled(len(self.channel_names) >= 2)
+        self.report_button.setEnabled(PPTX_AVAILABLE)
+        self.statistics_button.setEnabled(True)
+
+        self._refresh_loading_time_history()
+
+        if run["failed"]:
+            failed_text = "\n".join(f"• {msg}" for msg in run["failed"][:12])
+            if len(run["failed"]) > 12:
+                failed_text += f"\n• ... and {len(run['failed']) - 12} more"
+            show_warning(self, "Channel Load Warnings", f"Some channels failed to load:\n\n{failed_text}")
+
+        # Create message based on decimation
+        if decimation_factor > 1:
+            message = (
+                f"Successfully loaded {len(self.channel_names)} channel(s)\n"
+                f"Channels: {', '.join(self.channel_names)}\n"
+                f"Reference Sample Rate: {self.sample_rate:.0f} Hz\n"
+                f"Duration: {duration:.2f} seconds\n"
+                f"Time Range: {time_min:.3f} to {time_max:.3f} s\n\n"
+                f"Note: Data decimated {decimation_factor}x for display.\n"
+                f"Full resolution will be used for PSD calculations."
+            )
+        else:
+            message = (
+                f"Successfully loaded {len(self.channel_names)} channel(s)\n"
+                f"Channels: {', '.join(self.channel_names)}\n"
+                f"Reference Sample Rate: {self.sample_rate:.0f} Hz\n"
+                f"Duration: {duration:.2f} seconds\n"
+                f"Time Range: {time_min:.3f} to {time_max:.3f} s"
+            )
+
+        show_information(self, "Data Loaded", message)
+
     def _on_maximax_toggled(self):
         """Handle maximax checkbox toggle."""
         is_maximax = self.maximax_checkbox.isChecked()
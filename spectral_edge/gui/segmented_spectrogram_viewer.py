@@ -7,11 +7,12 @@ and allows users to navigate through them.
 
 Key Features:
 - Handles arbitrarily long recordings without memory issues
+- Segments are read from HDF5 on demand; the channel is never loaded whole
 - On-demand spectrogram generation with LRU caching
 - Navigation controls (First/Prev/Next/Last/Slider)
 - Keyboard shortcuts for quick navigation
 - Adjustable spectrogram parameters
-- Export individual or all segments
+- Export individual segments, or all segments in parallel background processes
 
 Author: SpectralEdge Development Team
 Date: 2026-02-08
@@ -23,11 +24,13 @@ from PyQt6.QtWidgets import (
     QGroupBox, QGridLayout, QSlider, QProgressDialog,
     QLineEdit, QCheckBox, QAbstractSpinBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QChildEvent
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal, QChildEvent
 from PyQt6.QtGui import QFont, QKeyEvent
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import numpy as np
-from scipy import signal
 from typing import List, Tuple, Optional
 from collections import OrderedDict
 import pyqtgraph as pg
@@ -37,30 +40,55 @@ from matplotlib import colormaps
 # Import utilities
 from spectral_edge.utils.message_box import show_information, show_warning, show_critical
 from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
-from spectral_edge.utils.signal_conditioning import apply_processing_pipeline, build_processing_note
+from spectral_edge.batch.segment_export import (
+    SegmentExportTask,
+    SegmentRenderSettings,
+    compute_segment_spectrogram,
+    export_segments,
+    segment_spectrogram,
+)
+from spectral_edge.utils.signal_conditioning import apply_processing_pipeline_to_span, build_processing_note
 from spectral_edge.utils.theme import apply_context_menu_style
 from spectral_edge.gui.flight_navigator_enhanced import FlightNavigator
 
 
+# Default memory budget for cached segment spectrograms
+SPECTROGRAM_CACHE_BYTES = 256 * 1024 * 1024
+# Segments precomputed on each side of the displayed one
+PREFETCH_SEGMENTS = 3
+
+
+def _spectrogram_nbytes(spectrogram: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> int:
+    return int(sum(np.asarray(part).nbytes for part in spectrogram))
+
+
 class SpectrogramCache:
     """
-    LRU cache for spectrograms to minimize memory usage.
+    LRU cache for spectrograms bounded by memory rather than entry count.
     
     Stores recently generated spectrograms and automatically removes
-    oldest entries when cache size limit is reached.
+    least recently used entries when the byte budget is exceeded. A
+    spectrogram larger than the whole budget is not cached.
     """
     
-    def __init__(self, max_size: int = 10):
+    def __init__(self, max_bytes: int = SPECTROGRAM_CACHE_BYTES):
         """
         Initialize spectrogram cache.
         
         Parameters
         ----------
-        max_size : int, default=10
-            Maximum number of spectrograms to cache
+        max_bytes : int, default=256 MB
+            Maximum total size of cached spectrograms in bytes
         """
-        self.cache = OrderedDict()  # Maintains insertion order
-        self.max_size = max_size
+        self.cache = OrderedDict()  # Maintains recency order
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+
+    def __contains__(self, segment_idx: int) -> bool:
+        return segment_idx in self.cache
+
+    def __len__(self) -> int:
+        return len(self.cache)
     
     def get(self, segment_idx: int) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
         """
@@ -93,16 +121,33 @@ class SpectrogramCache:
         spectrogram : tuple of (f, t, Sxx)
             Spectrogram data (frequency, time, power)
         """
-        # Remove oldest if cache is full
-        if len(self.cache) >= self.max_size:
-            self.cache.popitem(last=False)  # Remove oldest (first) item
-        
-        # Add new spectrogram
+        self.discard(segment_idx)
+        size = _spectrogram_nbytes(spectrogram)
+        if size > self.max_bytes:
+            return
         self.cache[segment_idx] = spectrogram
+        self.nbytes += size
+        # Remove least recently used entries until back within budget
+        while self.nbytes > self.max_bytes:
+            _idx, oldest = self.cache.popitem(last=False)
+            self.nbytes -= _spectrogram_nbytes(oldest)
+
+    def discard(self, segment_idx: int):
+        """Remove one spectrogram if cached."""
+        spectrogram = self.cache.pop(segment_idx, None)
+        if spectrogram is not None:
+            self.nbytes -= _spectrogram_nbytes(spectrogram)
+
+    def capacity(self) -> Optional[int]:
+        """Approximate number of entries that fit the budget, or None before any entry exists."""
+        if not self.cache:
+            return None
+        return max(1, int(self.max_bytes // max(1, self.nbytes // len(self.cache))))
     
     def clear(self):
         """Clear all cached spectrograms."""
         self.cache.clear()
+        self.nbytes = 0
 
 
 class SpectrogramGenerator(QThread):
@@ -144,27 +189,122 @@ class SpectrogramGenerator(QThread):
     def run(self):
         """Generate spectrogram in background thread."""
         try:
-            if len(self.signal_data) < 2:
-                raise ValueError("Segment is too short to compute a spectrogram")
-
-            nperseg = min(max(2, self.nperseg), len(self.signal_data))
-            noverlap = min(max(0, self.noverlap), nperseg - 1)
-            
-            f, t, Sxx = signal.spectrogram(
-                self.signal_data,
-                fs=self.sample_rate,
-                window=self.window,
-                nperseg=nperseg,
-                noverlap=noverlap,
-                scaling='density'
+            f, t, Sxx = segment_spectrogram(
+                self.signal_data, self.sample_rate, self.nperseg, self.noverlap, self.window
             )
-            
             self.generation_complete.emit(self.segment_idx, (f, t, Sxx))
         
         except Exception as e:
             self.generation_error.emit(str(e))
 
 
+class SegmentPrefetcher(QObject):
+    """
+    Worker pool that precomputes segment spectrograms ahead of navigation.
+    
+    Each job is tagged with a generation number so the receiver can drop
+    results computed for a superseded segmentation or settings. Jobs still
+    queued when the view moves elsewhere can be cancelled.
+    """
+    
+    segment_ready = pyqtSignal(int, int, object)  # (generation, segment_idx, (f, t, Sxx))
+    segment_failed = pyqtSignal(int, int, str)  # (generation, segment_idx, error message)
+    
+    def __init__(self, max_workers: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="segment-prefetch")
+        self._futures = {}  # segment_idx -> Future
+        self._lock = threading.Lock()
+
+    def in_flight(self, segment_idx: int) -> bool:
+        """True while a job for ``segment_idx`` is queued or running."""
+        with self._lock:
+            return segment_idx in self._futures
+
+    def submit(self, generation: int, segment_idx: int, job):
+        """Queue ``job()`` (returning ``(f, t, Sxx)``) for one segment."""
+        with self._lock:
+            if segment_idx in self._futures:
+                return
+            future = self._executor.submit(self._run, generation, segment_idx, job)
+            self._futures[segment_idx] = future
+        future.add_done_callback(lambda done, idx=segment_idx: self._forget(idx, done))
+
+    def cancel_except(self, keep):
+        """Cancel queued jobs whose segment is not in ``keep``; running jobs finish."""
+        with self._lock:
+            stale = [future for idx, future in self._futures.items() if idx not in keep]
+        # Future.cancel runs done callbacks (_forget) immediately, so call it unlocked
+        for future in stale:
+            future.cancel()
+
+    def cancel_all(self):
+        """Cancel every queued job and forget running ones."""
+        with self._lock:
+            futures = list(self._futures.values())
+            self._futures.clear()
+        for future in futures:
+            future.cancel()
+
+    def shutdown(self):
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _forget(self, segment_idx: int, future):
+        with self._lock:
+            if self._futures.get(segment_idx) is future:
+                del self._futures[segment_idx]
+
+    def _run(self, generation: int, segment_idx: int, job):
+        try:
+            result = job()
+        except Exception as e:
+            self.segment_failed.emit(generation, segment_idx, str(e))
+        else:
+            self.segment_ready.emit(generation, segment_idx, result)
+
+
+class SegmentExportThread(QThread):
+    """
+    Background thread that exports segment spectrograms to PNG.
+
+    Runs ``export_segments`` (computation and Agg rendering in worker
+    processes) so the viewer stays responsive; cancelling drops segments
+    that have not started.
+    """
+    progress = pyqtSignal(int, int)  # completed segments, total segments
+    export_finished = pyqtSignal(object, object)  # written paths, [(segment_idx, error)]
+
+    def __init__(self, signal_data, tasks, settings, max_workers=None, parent=None):
+        super().__init__(parent)
+        self.signal_data = signal_data
+        self.tasks = list(tasks)
+        self.settings = settings
+        self.max_workers = max_workers
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self):
+        try:
+            written, errors = export_segments(
+                self.signal_data,
+                self.tasks,
+                self.settings,
+                max_workers=self.max_workers,
+                progress_callback=self.progress.emit,
+                cancel_event=self._cancel_event,
+            )
+        except Exception as e:
+            written, errors = [], [(-1, str(e))]
+        self.export_finished.emit(written, errors)
+
+
 class SegmentedSpectrogramDisplayWindow(QMainWindow):
     """
     Dedicated popup display window for segmented spectrogram plots.
@@ -306,7 +446,7 @@ class SegmentedSpectrogramViewer(QMainWindow):
         
         # State variables
         self.hdf5_loader = None
-        self.signal_data = None
+        self.signal_data = None  # On-disk channel dataset; segments are read on demand
         self.sample_rate = None
         self.channel_name = None
         self.flight_key = None
@@ -314,8 +454,17 @@ class SegmentedSpectrogramViewer(QMainWindow):
         
         self.segments = []  # List of (start_idx, end_idx) tuples
         self.current_segment_idx = 0
-        self.spectrogram_cache = SpectrogramCache(max_size=10)
+        self.spectrogram_cache = SpectrogramCache()
         self.generator_thread = None
+        # Neighbouring segments are precomputed after every navigation;
+        # the generation number invalidates results of older segmentations
+        self.prefetch_count = PREFETCH_SEGMENTS
+        self.segment_generation = 0
+        self.prefetcher = SegmentPrefetcher(parent=self)
+        self.prefetcher.segment_ready.connect(self._on_segment_prefetched)
+        self.prefetcher.segment_failed.connect(self._on_segment_prefetch_failed)
+        self.export_thread = None
+        self.export_progress = None
         self.display_window = None
         self.mean_window_seconds = 1.0
         self._efficient_fft_base_label = "Use efficient FFT size"
@@ -1161,7 +1310,7 @@ class SegmentedSpectrogramViewer(QMainWindow):
         self.channel_units = ""
         self.segments = []
         self.current_segment_idx = 0
-        self.spectrogram_cache.clear()
+        self._invalidate_segments()
         self.total_segments_label.setText("Total Segments: 0")
         self.selected_flight_value.setText("None selected")
         self.selected_channel_value.setText("None selected")
@@ -1178,29 +1327,27 @@ class SegmentedSpectrogramViewer(QMainWindow):
         self._refresh_actual_df_preview()
 
     def _apply_selected_channel(self, flight_key: str, channel_name: str, channel_info):
-        """Load selected channel data and update UI state."""
+        """Open the selected channel for on-demand segment reads and update UI state."""
         if self.hdf5_loader is None:
             return
 
         try:
-            data_dict = self.hdf5_loader.load_channel_data(
-                flight_key,
-                channel_name,
-                decimate_for_display=False,
-            )
+            # The channel stays on disk; each segment reads only its sample range
+            signal_dataset = self.hdf5_loader.get_channel_dataset(flight_key, channel_name)
+            sample_rate = self.hdf5_loader.get_sample_rate(flight_key, channel_name)
         except Exception as e:
             show_critical(self, "Error", f"Failed to load channel data:\n\n{str(e)}")
             self._clear_selected_channel()
             return
 
-        self.signal_data = data_dict['data_full']
-        self.sample_rate = float(data_dict['sample_rate'])
+        self.signal_data = signal_dataset
+        self.sample_rate = float(sample_rate)
         self.channel_name = channel_name
         self.flight_key = flight_key
         self.channel_units = str(getattr(channel_info, "units", "") or "")
         self.segments = []
         self.current_segment_idx = 0
-        self.spectrogram_cache.clear()
+        self._invalidate_segments()
         self.total_segments_label.setText("Total Segments: 0")
 
         duration = len(self.signal_data) / self.sample_rate
@@ -1273,7 +1420,7 @@ class SegmentedSpectrogramViewer(QMainWindow):
         self.export_current_button.setEnabled(True)
         self.export_all_button.setEnabled(True)
 
-        self.spectrogram_cache.clear()
+        self._invalidate_segments()
         self._display_segment(self.current_segment_idx)
 
     def _display_segment(self, segment_idx: int):
@@ -1303,16 +1450,18 @@ class SegmentedSpectrogramViewer(QMainWindow):
         if cached_spec is not None:
             f, t, Sxx = cached_spec
             self._plot_spectrogram(f, t, Sxx, start_time)
+            self._schedule_prefetch(segment_idx)
             return
 
-        segment_data = self.signal_data[start_idx:end_idx]
-        conditioned_segment_data = apply_processing_pipeline(
-            segment_data,
-            self.sample_rate,
-            filter_settings=self._build_conditioning_filter_settings(),
-            remove_mean=self.conditioning_remove_mean_checkbox.isChecked(),
-            mean_window_seconds=self.mean_window_seconds,
-        )
+        if self.prefetcher.in_flight(segment_idx):
+            # Already being precomputed; _on_segment_prefetched plots it
+            self.display_window.segment_info_label.setText(
+                f"Generating spectrogram for segment {segment_idx + 1}..."
+            )
+            self._schedule_prefetch(segment_idx)
+            return
+
+        conditioned_segment_data = self._read_conditioned_segment(start_idx, end_idx)
         nperseg, noverlap, _ = self._calculate_fft_parameters(sample_count=len(conditioned_segment_data))
         window = self.window_combo.currentText().lower()
 
@@ -1324,6 +1473,7 @@ class SegmentedSpectrogramViewer(QMainWindow):
             window,
         )
         self.generator_thread.segment_idx = segment_idx
+        self.generator_thread.generation = self.segment_generation
         self.generator_thread.generation_complete.connect(self._on_spectrogram_generated)
         self.generator_thread.generation_error.connect(self._on_generation_error)
         self.generator_thread.start()
@@ -1332,9 +1482,93 @@ class SegmentedSpectrogramViewer(QMainWindow):
             f"Generating spectrogram for segment {segment_idx + 1}..."
         )
         self._update_conditioning_note_labels()
+        self._schedule_prefetch(segment_idx)
+
+    def _invalidate_segments(self):
+        """Drop cached and pending spectrograms after segments or settings change."""
+        self.segment_generation += 1
+        self.prefetcher.cancel_all()
+        self.spectrogram_cache.clear()
+
+    def _conditioning_kwargs(self) -> dict:
+        """Conditioning settings for ``apply_processing_pipeline_to_span``."""
+        return {
+            "filter_settings": self._build_conditioning_filter_settings(),
+            "remove_mean": self.conditioning_remove_mean_checkbox.isChecked(),
+            "mean_window_seconds": self.mean_window_seconds,
+        }
+
+    def _segment_job(self, segment_idx: int):
+        """Snapshot of the current settings as a worker-thread job for one segment."""
+        start_idx, end_idx = self.segments[segment_idx]
+        nperseg, noverlap, _ = self._calculate_fft_parameters(sample_count=end_idx - start_idx)
+        return partial(
+            compute_segment_spectrogram,
+            self.signal_data,
+            start_idx,
+            end_idx,
+            self.sample_rate,
+            self._conditioning_kwargs(),
+            nperseg,
+            noverlap,
+            self.window_combo.currentText().lower(),
+        )
+
+    def _prefetch_order(self, segment_idx: int) -> List[int]:
+        """Neighbours of ``segment_idx`` nearest first, next before previous."""
+        count = self.prefetch_count
+        capacity = self.spectrogram_cache.capacity()
+        if capacity is not None:
+            # Keep the displayed segment and its neighbours within the cache budget
+            count = min(count, max(0, (capacity - 1) // 2))
+        order = []
+        for distance in range(1, count + 1):
+            for neighbour in (segment_idx + distance, segment_idx - distance):
+                if 0 <= neighbour < len(self.segments):
+                    order.append(neighbour)
+        return order
+
+    def _schedule_prefetch(self, segment_idx: int):
+        """Precompute the segments around ``segment_idx`` on the prefetch pool."""
+        if self.signal_data is None or self.sample_rate is None or self.prefetch_count <= 0:
+            return
+        order = self._prefetch_order(segment_idx)
+        self.prefetcher.cancel_except(set(order) | {segment_idx})
+        for neighbour in order:
+            if neighbour not in self.spectrogram_cache:
+                self.prefetcher.submit(self.segment_generation, neighbour, self._segment_job(neighbour))
+
+    def _on_segment_prefetched(self, generation: int, segment_idx: int, spectrogram_data):
+        """Cache a precomputed spectrogram, plotting it if its segment is on screen."""
+        if generation != self.segment_generation:
+            return
+        self._on_spectrogram_generated(segment_idx, spectrogram_data)
+
+    def _on_segment_prefetch_failed(self, generation: int, segment_idx: int, error_msg: str):
+        # Only report failures of the segment on screen; others retry when displayed
+        if generation == self.segment_generation and segment_idx == self.current_segment_idx:
+            self._on_generation_error(error_msg)
+
+    def _read_conditioned_segment(self, start_idx: int, end_idx: int) -> np.ndarray:
+        """
+        Read and condition one segment of the channel.
+
+        Only the segment plus conditioning padding is read, so filtering and
+        mean removal stay continuous across segment boundaries.
+        """
+        return apply_processing_pipeline_to_span(
+            self.signal_data,
+            start_idx,
+            end_idx,
+            self.sample_rate,
+            **self._conditioning_kwargs(),
+        )
 
     def _on_spectrogram_generated(self, segment_idx: int, spectrogram_data):
         """Handle spectrogram generation completion."""
+        generation = getattr(self.sender(), "generation", self.segment_generation)
+        if generation != self.segment_generation or segment_idx >= len(self.segments):
+            return
         f, t, Sxx = spectrogram_data
         self.spectrogram_cache.put(segment_idx, (f, t, Sxx))
 
@@ -1486,8 +1720,11 @@ class SegmentedSpectrogramViewer(QMainWindow):
             show_critical(self, "Export Error", f"Failed to export spectrogram:\n\n{str(e)}")
 
     def _on_export_all_clicked(self):
-        """Export all segment spectrograms."""
-        if not self.segments:
+        """Export all segment spectrograms in the background."""
+        if not self.segments or self.signal_data is None:
+            return
+        if self.export_thread is not None:
+            show_information(self, "Export In Progress", "An export of all segments is already running.")
             return
 
         output_dir = QFileDialog.getExistingDirectory(
@@ -1497,76 +1734,100 @@ class SegmentedSpectrogramViewer(QMainWindow):
         if not output_dir:
             return
 
-        self._ensure_display_window()
+        self.export_thread = SegmentExportThread(
+            self.signal_data,
+            self._export_tasks(output_dir),
+            self._render_settings(),
+            parent=self,
+        )
+        self.export_thread.output_dir = output_dir
+        self.export_thread.progress.connect(self._on_export_progress)
+        self.export_thread.export_finished.connect(self._on_export_all_finished)
 
-        progress = QProgressDialog(
+        self.export_progress = QProgressDialog(
             "Exporting spectrograms...", "Cancel", 0, len(self.segments), self
         )
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
+        self.export_progress.setMinimumDuration(0)
+        self.export_progress.setAutoClose(False)
+        self.export_progress.setAutoReset(False)
+        self.export_progress.canceled.connect(self.export_thread.cancel)
+        self.export_progress.show()
+        self.export_thread.start()
+
+    def _render_settings(self) -> SegmentRenderSettings:
+        """Current conditioning and display settings for headless export."""
+        return SegmentRenderSettings(
+            sample_rate=self.sample_rate,
+            conditioning=self._conditioning_kwargs(),
+            window=self.window_combo.currentText().lower(),
+            freq_min=self.freq_min_spin.value(),
+            freq_max=self.freq_max_spin.value(),
+            snr_db=self.snr_spin.value(),
+            colormap=self.colormap_combo.currentText(),
+            show_colorbar=self.show_colorbar_checkbox.isChecked(),
+        )
 
-        try:
-            from PyQt6.QtWidgets import QApplication
-
-            for i in range(len(self.segments)):
-                if progress.wasCanceled():
-                    break
-
-                progress.setValue(i)
-                progress.setLabelText(f"Exporting segment {i + 1} of {len(self.segments)}...")
-
-                if self.spectrogram_cache.get(i) is None:
-                    start_idx, end_idx = self.segments[i]
-                    segment_data = self.signal_data[start_idx:end_idx]
-                    conditioned_segment_data = apply_processing_pipeline(
-                        segment_data,
-                        self.sample_rate,
-                        filter_settings=self._build_conditioning_filter_settings(),
-                        remove_mean=self.conditioning_remove_mean_checkbox.isChecked(),
-                        mean_window_seconds=self.mean_window_seconds,
-                    )
-
-                    nperseg, noverlap, _ = self._calculate_fft_parameters(sample_count=len(conditioned_segment_data))
-                    window = self.window_combo.currentText().lower()
-
-                    f, t, Sxx = signal.spectrogram(
-                        conditioned_segment_data,
-                        fs=self.sample_rate,
-                        window=window,
-                        nperseg=nperseg,
-                        noverlap=noverlap,
-                        scaling='density'
-                    )
-
-                    self.spectrogram_cache.put(i, (f, t, Sxx))
-
-                self.current_segment_idx = i
-                self.display_window.segment_slider.blockSignals(True)
-                self.display_window.segment_slider.setValue(i)
-                self.display_window.segment_slider.blockSignals(False)
-
-                start_idx, _ = self.segments[i]
-                start_time = start_idx / self.sample_rate
-                f, t, sxx = self.spectrogram_cache.get(i)
-                self._plot_spectrogram(f, t, sxx, start_time)
-
-                QApplication.processEvents()
-
-                file_path = os.path.join(output_dir, f"spectrogram_segment_{i+1:03d}.png")
-                exporter = pg.exporters.ImageExporter(self.display_window.spectrogram_plot.plotItem)
-                exporter.export(file_path)
-
-            progress.setValue(len(self.segments))
+    def _export_tasks(self, output_dir: str) -> List[SegmentExportTask]:
+        """One export task per segment, named ``spectrogram_segment_NNN.png``."""
+        tasks = []
+        for i, (start_idx, end_idx) in enumerate(self.segments):
+            nperseg, noverlap, _ = self._calculate_fft_parameters(sample_count=end_idx - start_idx)
+            tasks.append(SegmentExportTask(
+                segment_idx=i,
+                start_idx=start_idx,
+                end_idx=end_idx,
+                nperseg=nperseg,
+                noverlap=noverlap,
+                output_path=os.path.join(output_dir, f"spectrogram_segment_{i+1:03d}.png"),
+                title=(
+                    f"{self.channel_name or 'Channel'} | Segment {i + 1}/{len(self.segments)} | "
+                    f"SNR: {self.snr_spin.value()} dB"
+                ),
+            ))
+        return tasks
+
+    def _on_export_progress(self, completed: int, total: int):
+        if self.sender() is not self.export_thread or self.export_progress is None:
+            return
+        self.export_progress.setValue(completed)
+        self.export_progress.setLabelText(f"Exported {completed} of {total} segments...")
 
+    def _on_export_all_finished(self, written, errors):
+        """Report the outcome of a background export."""
+        thread = self.sender()
+        if thread is not self.export_thread:
+            return
+        thread.wait()
+        self.export_thread = None
+        if self.export_progress is not None:
+            # Closing the dialog emits canceled; the export is already over
+            self.export_progress.canceled.disconnect(thread.cancel)
+            self.export_progress.close()
+            self.export_progress = None
+
+        if errors:
+            details = "\n".join(
+                f"Segment {idx + 1}: {message}" if idx >= 0 else message
+                for idx, message in errors[:10]
+            )
+            show_critical(
+                self,
+                "Export Error",
+                f"Exported {len(written)} spectrograms; {len(errors)} failed:\n\n{details}"
+            )
+        elif thread.is_cancelled():
+            show_information(
+                self,
+                "Export Cancelled",
+                f"Exported {len(written)} of {len(thread.tasks)} spectrograms to:\n{thread.output_dir}"
+            )
+        else:
             show_information(
                 self,
                 "Export Complete",
-                f"Exported {len(self.segments)} spectrograms to:\n{output_dir}"
+                f"Exported {len(written)} spectrograms to:\n{thread.output_dir}"
             )
 
-        except Exception as e:
-            show_critical(self, "Export Error", f"Failed to export spectrograms:\n\n{str(e)}")
-
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard shortcuts."""
         if event.key() == Qt.Key.Key_Left:
@@ -1582,6 +1843,14 @@ class SegmentedSpectrogramViewer(QMainWindow):
 
     def closeEvent(self, event):
         """Close popup display window when controller closes."""
+        self.prefetcher.shutdown()
+        if self.export_thread is not None:
+            self.export_thread.cancel()
+            self.export_thread.wait()
+            self.export_thread = None
+        if self.export_progress is not None:
+            self.export_progress.close()
+            self.export_progress = None
         if self.display_window is not None:
             self.display_window.close()
         super().closeEvent(event)
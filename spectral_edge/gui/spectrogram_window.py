@@ -11,6 +11,8 @@ Features:
 - Colorbar visibility toggle
 - Parameter and display panel separation
 - Vertical carousel navigation
+- Tiled multi-resolution rendering that refines as the view zooms
+- Channels conditioned and transformed in the background, drawn as they finish
 
 Author: SpectralEdge Development Team
 """
@@ -19,18 +21,22 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QComboBox, QSpinBox, QDoubleSpinBox, QLineEdit,
     QGroupBox, QGridLayout, QRadioButton, QButtonGroup, QCheckBox, QScrollArea,
-    QAbstractSpinBox
+    QAbstractSpinBox, QApplication
 )
-from PyQt6.QtCore import Qt, QChildEvent
+from PyQt6.QtCore import Qt, QChildEvent, QObject, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as wait_for_futures
+from functools import lru_cache, partial
 import pyqtgraph as pg
 import numpy as np
-from scipy import signal as scipy_signal
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
-from typing import Mapping, Optional
+from matplotlib import colormaps
+from typing import Mapping, Optional, Tuple
 from spectral_edge.core.psd import get_window_options
-from spectral_edge.utils.signal_conditioning import apply_processing_pipeline, build_processing_note
+from spectral_edge.core.spectrogram_tiles import DEFAULT_TILE_CACHE_BYTES, SpectrogramPyramid
+from spectral_edge.utils.channel_cache import ArrayLRUCache
+from spectral_edge.utils.signal_conditioning import build_processing_note, cached_processing_pipeline
 from spectral_edge.utils.theme import apply_context_menu_style
 
 
@@ -53,6 +59,144 @@ class ColorBarItem(pg.GraphicsObject):
         return pg.QtCore.QRectF(0, 0, 1, 1)
 
 
+@lru_cache(maxsize=16)
+def _colormap_lut(name: str):
+    """256-entry RGBA lookup table and matching pyqtgraph ColorMap for a Matplotlib colormap."""
+    positions = np.linspace(0, 1, 256)
+    lut = np.ascontiguousarray((colormaps.get_cmap(name)(positions) * 255).astype(np.ubyte))
+    return lut, pg.ColorMap(positions, lut)
+
+
+def _overview_tiles(pyramid: SpectrogramPyramid, freq_limits: Tuple[float, float],
+                    pixels: Tuple[float, float]):
+    """
+    Tiles covering a channel's whole record at the resolution of its plot.
+
+    Returns ``(time_range, freq_range, [(tile, (power_db, rect)), ...])``
+    with tiles cropped to the displayed frequencies, or None when no
+    frequency bin lies within ``freq_limits``.
+    """
+    freqs = pyramid.frequencies
+    # Clip to available frequency range (don't error if user sets range beyond data)
+    freq_mask = (freqs >= max(freq_limits[0], freqs[0])) & (freqs <= min(freq_limits[1], freqs[-1]))
+    if not np.any(freq_mask):
+        return None
+    freq_range = (float(freqs[freq_mask][0]), float(freqs[freq_mask][-1]))
+    time_range = pyramid.time_bounds()
+    width, height = pixels
+    overview = []
+    for tile in pyramid.tiles_in_view(
+        pyramid.level_for(time_range[1] - time_range[0], width),
+        pyramid.freq_level_for(freq_range[1] - freq_range[0], height),
+        time_range,
+        freq_range,
+    ):
+        cropped = pyramid.crop_to_frequencies(tile, pyramid.tile(tile), freq_range)
+        if cropped is not None:
+            overview.append((tile, cropped))
+    return time_range, freq_range, overview
+
+
+def _prepare_channel(signal_data, sample_rate: float, conditioning: dict, nperseg: int,
+                     noverlap: int, window: str, cache: ArrayLRUCache, key,
+                     freq_limits: Tuple[float, float], pixels: Tuple[float, float]) -> SpectrogramPyramid:
+    """Condition one channel and compute its overview tiles; runs on the worker pool."""
+    # Shared with the PSD and statistics views through the session cache
+    conditioned_signal = cached_processing_pipeline(signal_data, sample_rate, **conditioning)
+    pyramid = SpectrogramPyramid(
+        conditioned_signal, sample_rate, nperseg, noverlap, window=window, cache=cache, key=key
+    )
+    _overview_tiles(pyramid, freq_limits, pixels)
+    return pyramid
+
+
+class SpectrogramTileLoader(QObject):
+    """
+    Worker pool that computes spectrograms off the GUI thread.
+
+    Channel jobs condition a channel and compute its overview; tile jobs,
+    keyed by ``(channel_idx, tile)``, compute finer tiles as the view
+    zooms. Both are tagged with a generation number so results computed
+    for superseded settings can be dropped. Tile jobs still queued when the
+    view moves elsewhere can be cancelled.
+    """
+
+    tile_ready = pyqtSignal(int, object, object)  # generation, (channel_idx, tile), power in dB
+    channel_ready = pyqtSignal(int, int, object)  # generation, channel_idx, SpectrogramPyramid
+    channel_failed = pyqtSignal(int, int, str)  # generation, channel_idx, error message
+
+    def __init__(self, max_workers: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="spectrogram-tiles")
+        self._futures = {}  # (channel_idx, tile) -> Future
+        self._channel_futures = {}  # channel_idx -> Future
+        self._lock = threading.Lock()
+
+    def submit_channel(self, generation: int, channel_idx: int, job):
+        """Queue ``job()``, which returns the channel's SpectrogramPyramid."""
+        with self._lock:
+            future = self._executor.submit(self._run_channel, generation, channel_idx, job)
+            self._channel_futures[channel_idx] = future
+
+    def wait_for_channels(self):
+        """Block until every queued channel job has finished."""
+        with self._lock:
+            futures = list(self._channel_futures.values())
+        wait_for_futures(futures)
+
+    def submit(self, generation: int, key, pyramid: SpectrogramPyramid):
+        """Queue computation of tile ``key[1]`` of ``pyramid``."""
+        with self._lock:
+            if key in self._futures:
+                return
+            future = self._executor.submit(self._run, generation, key, pyramid)
+            self._futures[key] = future
+        future.add_done_callback(lambda done, key=key: self._forget(key, done))
+
+    def cancel_except(self, keep):
+        """Cancel queued jobs whose key is not in ``keep``; running jobs finish."""
+        with self._lock:
+            stale = [future for key, future in self._futures.items() if key not in keep]
+        # Future.cancel runs done callbacks (_forget) immediately, so call it unlocked
+        for future in stale:
+            future.cancel()
+
+    def cancel_all(self):
+        """Cancel every queued job and forget running ones."""
+        with self._lock:
+            futures = list(self._futures.values()) + list(self._channel_futures.values())
+            self._futures.clear()
+            self._channel_futures.clear()
+        for future in futures:
+            future.cancel()
+
+    def shutdown(self):
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def _run(self, generation: int, key, pyramid: SpectrogramPyramid):
+        try:
+            power_db = pyramid.tile(key[1])
+        except Exception:
+            # A missing detail tile leaves the overview showing; nothing to report
+            return
+        self.tile_ready.emit(generation, key, power_db)
+
+    def _run_channel(self, generation: int, channel_idx: int, job):
+        try:
+            pyramid = job()
+        except Exception as e:
+            self.channel_failed.emit(generation, channel_idx, str(e))
+            return
+        self.channel_ready.emit(generation, channel_idx, pyramid)
+
+
 class SpectrogramWindow(QMainWindow):
     """
     Window for displaying spectrogram of signal data.
@@ -113,8 +257,23 @@ class SpectrogramWindow(QMainWindow):
             self.sample_rate = sample_rates
             self.sample_rates = [sample_rates] * self.n_channels
         
-        # Spectrogram data for each channel
-        self.spec_data = []  # List of (times, freqs, power_db) tuples
+        # Spectrogram tiles for each channel, computed for the visible region
+        self.pyramids = [None] * self.n_channels  # SpectrogramPyramid per channel, None until computed
+        self.power_levels = [None] * self.n_channels  # (min, max) dB colour levels, None if nothing to show
+        self.freq_ranges = [None] * self.n_channels  # Displayed (min, max) frequency per channel
+        self.tile_items = [{} for _ in range(self.n_channels)]  # tile -> ImageItem
+        self.wanted_tiles = [set() for _ in range(self.n_channels)]
+        self.tile_cache = ArrayLRUCache(DEFAULT_TILE_CACHE_BYTES)
+        self.tile_generation = 0
+        self.tile_loader = SpectrogramTileLoader(parent=self)
+        self.tile_loader.tile_ready.connect(self._on_tile_ready)
+        self.tile_loader.channel_ready.connect(self._on_channel_ready)
+        self.tile_loader.channel_failed.connect(self._on_channel_failed)
+        self._tile_refresh_timer = QTimer(self)
+        self._tile_refresh_timer.setSingleShot(True)
+        self._tile_refresh_timer.setInterval(50)
+        self._tile_refresh_timer.timeout.connect(self._refresh_tiles)
+        self._lut = None  # Lookup table of the current colormap
         
         # Store actual parameters used
         self.actual_df = None
@@ -413,6 +572,11 @@ class SpectrogramWindow(QMainWindow):
         plot_widget.setLabel('bottom', 'Time (s)', color='#e0e0e0', size='11pt')
         plot_widget.setLabel('left', 'Frequency (Hz)', color='#e0e0e0', size='11pt')
         plot_widget.setTitle(f"{channel_name}", color='#e0e0e0', size='12pt')
+
+        # Refine the tiles whenever the visible region or plot size changes
+        view_box = plot_widget.getViewBox()
+        view_box.sigRangeChanged.connect(self._schedule_tile_refresh)
+        view_box.sigResized.connect(self._schedule_tile_refresh)
         
         return plot_widget
     
@@ -852,31 +1016,31 @@ class SpectrogramWindow(QMainWindow):
             plot_widget.setYRange(freq_min, freq_max, padding=0)
         
     def _calculate_spectrograms(self):
-        """Calculate spectrograms for all channels."""
+        """Condition and transform every channel on the worker pool."""
         # Get parameters
         window_type = self.window_combo.currentText().lower()
         df = self.df_spin.value()
         overlap_percent = self.overlap_spin.value()
         efficient_fft = self.efficient_fft_checkbox.isChecked()
-        filter_settings = self._build_conditioning_filter_settings()
-        remove_mean = self.conditioning_remove_mean_checkbox.isChecked()
+        conditioning = {
+            'filter_settings': self._build_conditioning_filter_settings(),
+            'remove_mean': self.conditioning_remove_mean_checkbox.isChecked(),
+            'mean_window_seconds': self.mean_window_seconds,
+        }
         self._update_conditioning_note()
+        freq_limits = self._display_freq_limits()
         
         # Clear previous data
-        self.spec_data = []
+        self._invalidate_tiles()
+        self.pyramids = [None] * self.n_channels
+        self.power_levels = [None] * self.n_channels
+        self.freq_ranges = [None] * self.n_channels
         
-        # Calculate spectrogram for each channel (using per-channel sample rates)
+        # Queue each channel (using per-channel sample rates); plots are
+        # drawn one by one as their results arrive
         for i, (channel_name, signal_data, unit, flight_name) in enumerate(self.channels_data):
             # Get this channel's sample rate
             channel_sample_rate = self.sample_rates[i]
-            
-            conditioned_signal = apply_processing_pipeline(
-                signal_data,
-                channel_sample_rate,
-                filter_settings=filter_settings,
-                remove_mean=remove_mean,
-                mean_window_seconds=self.mean_window_seconds,
-            )
 
             # Calculate nperseg from df for this channel
             nperseg = max(2, int(channel_sample_rate / max(df, 1e-6)))
@@ -885,8 +1049,9 @@ class SpectrogramWindow(QMainWindow):
             if efficient_fft:
                 nperseg = 2 ** int(np.ceil(np.log2(nperseg)))
 
-            if conditioned_signal.size < nperseg:
-                nperseg = max(2, int(conditioned_signal.size))
+            # Conditioning preserves the number of samples
+            if len(signal_data) < nperseg:
+                nperseg = max(2, len(signal_data))
             noverlap = min(int(nperseg * overlap_percent / 100), max(nperseg - 1, 0))
             
             # Calculate actual df for this channel
@@ -898,172 +1063,259 @@ class SpectrogramWindow(QMainWindow):
                 self.actual_df = actual_df_channel
                 self.actual_df_label.setText(f"{self.actual_df:.3f}")
             
-            # Calculate spectrogram
-            freqs, times, Sxx = scipy_signal.spectrogram(
-                conditioned_signal,
-                fs=channel_sample_rate,  # Use channel-specific sample rate
-                window=window_type,
-                nperseg=nperseg,
-                noverlap=noverlap,
-                scaling='density'
-            )
-            
-            # Convert to dB
-            Sxx_db = 10 * np.log10(Sxx + 1e-20)
-            
-            # Store
-            self.spec_data.append((times, freqs, Sxx_db))
-        
-        # Update plots
-        self._update_plots()
-    
-    def _update_plots(self):
-        """Update all spectrogram plots."""
-        if not self.spec_data:
+            self._clear_channel_plot(i)
+            self.tile_loader.submit_channel(self.tile_generation, i, partial(
+                _prepare_channel,
+                signal_data,
+                channel_sample_rate,  # Use channel-specific sample rate
+                conditioning,
+                nperseg,
+                noverlap,
+                window_type,
+                self.tile_cache,
+                (self.tile_generation, i),
+                freq_limits,
+                self._view_pixels(self.plot_widgets[i]),
+            ))
+
+    def _wait_for_spectrograms(self):
+        """Block until every queued channel has been computed and drawn."""
+        self.tile_loader.wait_for_channels()
+        QApplication.processEvents()
+
+    def _on_channel_ready(self, generation: int, channel_idx: int, pyramid):
+        """Draw a channel computed in the background."""
+        if generation != self.tile_generation:
             return
-        
+        self.pyramids[channel_idx] = pyramid
+        self._update_channel_plot(channel_idx)
+        self._schedule_tile_refresh()
+
+    def _on_channel_failed(self, generation: int, channel_idx: int, error_msg: str):
+        if generation != self.tile_generation:
+            return
+        channel_name = self.channels_data[channel_idx][0]
+        self.plot_widgets[channel_idx].setTitle(
+            f"{channel_name} | Spectrogram failed: {error_msg}", color='#e0e0e0', size='12pt'
+        )
+
+    def _display_freq_limits(self) -> Tuple[float, float]:
+        """Frequency range typed in the display options."""
         # Parse frequency values from text fields
         try:
-            freq_min = float(self.freq_min_edit.text())
-            freq_max = float(self.freq_max_edit.text())
+            return float(self.freq_min_edit.text()), float(self.freq_max_edit.text())
         except ValueError:
             # If parsing fails, use default values
-            freq_min = 20.0
-            freq_max = 2000.0
+            return 20.0, 2000.0
+
+    def _clear_channel_plot(self, channel_idx: int):
+        self.plot_widgets[channel_idx].clear()
+        self.tile_items[channel_idx] = {}
+        self.wanted_tiles[channel_idx] = set()
+        self.image_items[channel_idx] = None
+    
+    def _update_plots(self):
+        """Update all spectrogram plots that have been computed."""
+        for i, pyramid in enumerate(self.pyramids):
+            if pyramid is not None:
+                self._update_channel_plot(i)
+        self._schedule_tile_refresh()
+
+    def _update_channel_plot(self, i: int):
+        """Redraw one channel's overview, colorbar and title."""
+        pyramid = self.pyramids[i]
         colormap_name = self.colormap_combo.currentText()
         snr_db = self.snr_spin.value()
         show_colorbar = self.show_colorbar_checkbox.isChecked()
         
-        # Get colormap from matplotlib
-        mpl_cmap = cm.get_cmap(colormap_name)
+        # Lookup table for the images and colormap for the colorbar, built once per colormap
+        self._lut, pg_colormap = _colormap_lut(colormap_name)
         
-        # Create PyQtGraph ColorMap for colorbar
-        # Sample matplotlib colormap at 256 points
-        colors_normalized = mpl_cmap(np.linspace(0, 1, 256))  # RGBA values 0-1
-        colors_255 = (colors_normalized * 255).astype(np.ubyte)  # Convert to 0-255
-        positions = np.linspace(0, 1, 256)
-        pg_colormap = pg.ColorMap(positions, colors_255)
+        plot_widget = self.plot_widgets[i]
+        channel_name, _, unit, flight_name = self.channels_data[i]
         
-        for i, (times, freqs, Sxx_db) in enumerate(self.spec_data):
-            plot_widget = self.plot_widgets[i]
-            channel_name, _, unit, flight_name = self.channels_data[i]
-            
-            # Clear previous plot
-            plot_widget.clear()
-            
-            # Filter frequency range
-            # Clip to available frequency range (don't error if user sets range beyond data)
-            actual_freq_min = max(freq_min, freqs[0])
-            actual_freq_max = min(freq_max, freqs[-1])
-            freq_mask = (freqs >= actual_freq_min) & (freqs <= actual_freq_max)
-            freqs_plot = freqs[freq_mask]
-            Sxx_plot = Sxx_db[freq_mask, :]
-            
-            if len(freqs_plot) == 0:
-                continue
-            
-            # Calculate color scale based on SNR
-            max_power = np.max(Sxx_plot)
-            min_power = max_power - snr_db
-            
-            # Create image item
-            img = pg.ImageItem()
-            plot_widget.addItem(img)
-            
-            # Set data with SNR-based levels
-            # Transpose so frequency is on y-axis and time is on x-axis
-            img.setImage(Sxx_plot.T, autoLevels=False, levels=(min_power, max_power))
-            
-            # Set position and scale (always use actual frequency values)
-            img.setRect(pg.QtCore.QRectF(
-                times[0],
-                freqs_plot[0],
-                times[-1] - times[0],
-                freqs_plot[-1] - freqs_plot[0]
-            ))
-            
-            # Set Y-axis to linear scale only
-            plot_widget.setLogMode(x=False, y=False)
-            plot_widget.setLabel('left', 'Frequency (Hz)', color='#e0e0e0', size='11pt')
-            
-            # Reset to automatic ticks for linear scale
-            left_axis = plot_widget.getPlotItem().getAxis('left')
-            left_axis.setTicks(None)
-            
-            # Apply colormap using matplotlib colormap
-            colors = []
-            for j in range(256):
-                rgba = mpl_cmap(j / 255.0)
-                colors.append((int(rgba[0] * 255), int(rgba[1] * 255), int(rgba[2] * 255), 255))
-            
-            lut = np.array(colors, dtype=np.ubyte)
-            img.setLookupTable(lut)
-            
-            # Store image item
-            self.image_items[i] = img
+        # Clear previous plot
+        self._clear_channel_plot(i)
+        self.power_levels[i] = None
+        self.freq_ranges[i] = None
+        
+        # Overview tiles of the whole record are drawn now, beneath the
+        # finer tiles requested as the view changes; they also set the
+        # colour scale so it stays fixed while zooming
+        result = _overview_tiles(pyramid, self._display_freq_limits(), self._view_pixels(plot_widget))
+        if result is None or not result[2]:
+            return
+        time_range, freq_range, overview = result
+        self.freq_ranges[i] = freq_range
+        
+        # Calculate color scale based on SNR, from the peak of every frame
+        # rather than the averaged overview columns
+        max_power = pyramid.peak_power_db([tile for tile, _cropped in overview], freq_range)
+        min_power = max_power - snr_db
+        self.power_levels[i] = (min_power, max_power)
+        
+        for tile, cropped in overview:
+            self._add_tile_item(i, tile, cropped, overview=True)
+        img = self.tile_items[i][overview[0][0]]
+        
+        # Set Y-axis to linear scale only
+        plot_widget.setLogMode(x=False, y=False)
+        plot_widget.setLabel('left', 'Frequency (Hz)', color='#e0e0e0', size='11pt')
+        
+        # Reset to automatic ticks for linear scale
+        left_axis = plot_widget.getPlotItem().getAxis('left')
+        left_axis.setTicks(None)
+        
+        # Store image item
+        self.image_items[i] = img
+        
+        # Remove existing colorbar if present
+        if self.colorbars[i] is not None:
+            try:
+                plot_widget.plotItem.layout.removeItem(self.colorbars[i])
+                self.colorbars[i] = None
+            except:
+                pass
+        
+        # Add colorbar if requested
+        if show_colorbar:
+            # Create colorbar using ColorBarItem with improved styling
+            colorbar = pg.ColorBarItem(
+                values=(min_power, max_power),
+                colorMap=pg_colormap,  # Use PyQtGraph ColorMap
+                label='Power (dB)',
+                limits=(min_power, max_power),
+                rounding=0.1,
+                width=20,  # Width of colorbar in pixels
+                interactive=False,  # Disable interactive handles for cleaner look
+                pen='#e0e0e0',  # Border color
+                hoverPen='#ffffff',  # Hover border color
+                hoverBrush='#2d3748'  # Hover background color
+            )
             
-            # Remove existing colorbar if present
-            if self.colorbars[i] is not None:
-                try:
-                    plot_widget.plotItem.layout.removeItem(self.colorbars[i])
-                    self.colorbars[i] = None
-                except:
-                    pass
+            # Use insert_in parameter to properly position colorbar outside plot area
+            # This automatically positions it on the right side for vertical orientation
+            colorbar.setImageItem(img, insert_in=plot_widget.plotItem)
             
-            # Add colorbar if requested
-            if show_colorbar:
-                # Create colorbar using ColorBarItem with improved styling
-                colorbar = pg.ColorBarItem(
-                    values=(min_power, max_power),
-                    colorMap=pg_colormap,  # Use PyQtGraph ColorMap
-                    label='Power (dB)',
-                    limits=(min_power, max_power),
-                    rounding=0.1,
-                    width=20,  # Width of colorbar in pixels
-                    interactive=False,  # Disable interactive handles for cleaner look
-                    pen='#e0e0e0',  # Border color
-                    hoverPen='#ffffff',  # Hover border color
-                    hoverBrush='#2d3748'  # Hover background color
-                )
-                
-                # Use insert_in parameter to properly position colorbar outside plot area
-                # This automatically positions it on the right side for vertical orientation
-                colorbar.setImageItem(img, insert_in=plot_widget.plotItem)
-                
-                # Style the colorbar axis
-                colorbar.axis.setStyle(tickFont=pg.QtGui.QFont('Arial', 9))
-                colorbar.axis.setPen('#e0e0e0')
-                colorbar.axis.setTextPen('#e0e0e0')
-                
-                self.colorbars[i] = colorbar
+            # Style the colorbar axis
+            colorbar.axis.setStyle(tickFont=pg.QtGui.QFont('Arial', 9))
+            colorbar.axis.setPen('#e0e0e0')
+            colorbar.axis.setTextPen('#e0e0e0')
             
-            # Update title with individual flight name if available
-            if flight_name:
-                # Remove 'flight_' prefix for cleaner display
-                clean_flight_name = flight_name.replace('flight_', '')
-                if unit:
-                    plot_widget.setTitle(f"{clean_flight_name} - {channel_name} ({unit}) | SNR: {snr_db} dB", 
-                                        color='#e0e0e0', size='12pt')
-                else:
-                    plot_widget.setTitle(f"{clean_flight_name} - {channel_name} | SNR: {snr_db} dB", 
-                                        color='#e0e0e0', size='12pt')
+            self.colorbars[i] = colorbar
+        
+        # Update title with individual flight name if available
+        if flight_name:
+            # Remove 'flight_' prefix for cleaner display
+            clean_flight_name = flight_name.replace('flight_', '')
+            if unit:
+                plot_widget.setTitle(f"{clean_flight_name} - {channel_name} ({unit}) | SNR: {snr_db} dB", 
+                                    color='#e0e0e0', size='12pt')
             else:
-                if unit:
-                    plot_widget.setTitle(f"{channel_name} ({unit}) | SNR: {snr_db} dB", 
-                                        color='#e0e0e0', size='12pt')
+                plot_widget.setTitle(f"{clean_flight_name} - {channel_name} | SNR: {snr_db} dB", 
+                                    color='#e0e0e0', size='12pt')
+        else:
+            if unit:
+                plot_widget.setTitle(f"{channel_name} ({unit}) | SNR: {snr_db} dB", 
+                                    color='#e0e0e0', size='12pt')
+            else:
+                plot_widget.setTitle(f"{channel_name} | SNR: {snr_db} dB", 
+                                    color='#e0e0e0', size='12pt')
+        
+        # Set axis labels
+        plot_widget.setLabel('bottom', 'Time (s)', color='#e0e0e0', size='11pt')
+        
+        # Set time limits if auto
+        if self.auto_limits_checkbox.isChecked():
+            plot_widget.setXRange(time_range[0], time_range[1], padding=0.02)
+            plot_widget.setYRange(freq_range[0], freq_range[1], padding=0.02)
+            # Update text fields for reference
+            self.time_min_edit.setText(f"{time_range[0]:.3f}")
+            self.time_max_edit.setText(f"{time_range[1]:.3f}")
+
+    def _view_pixels(self, plot_widget):
+        """Width and height of a plot's view box in pixels."""
+        rect = plot_widget.getViewBox().boundingRect()
+        return max(rect.width(), 1.0), max(rect.height(), 1.0)
+
+    def _add_tile_item(self, channel_idx: int, tile, cropped, overview: bool = False):
+        """Draw one tile; overview tiles sit beneath the detail tiles."""
+        power_db, (x, y, width, height) = cropped
+        img = pg.ImageItem()
+        # Transpose so frequency is on y-axis and time is on x-axis
+        img.setImage(power_db.T, autoLevels=False, levels=self.power_levels[channel_idx])
+        img.setLookupTable(self._lut)
+        img.setRect(pg.QtCore.QRectF(x, y, width, height))
+        img.setZValue(-1 if overview else 0)
+        self.plot_widgets[channel_idx].addItem(img)
+        self.tile_items[channel_idx][tile] = img
+
+    def _invalidate_tiles(self):
+        """Drop cached and pending tiles after the spectrogram settings change."""
+        self.tile_generation += 1
+        self.tile_loader.cancel_all()
+        self.tile_cache.clear()
+
+    def _schedule_tile_refresh(self, *_args):
+        self._tile_refresh_timer.start()
+
+    def _refresh_tiles(self):
+        """Show or request tiles at screen resolution for each plot's visible region."""
+        jobs = set()
+        for i, pyramid in enumerate(self.pyramids):
+            if self.power_levels[i] is None:
+                continue
+            plot_widget = self.plot_widgets[i]
+            (time_lo, time_hi), (freq_lo, freq_hi) = plot_widget.getViewBox().viewRange()
+            freq_lo = max(freq_lo, self.freq_ranges[i][0])
+            freq_hi = min(freq_hi, self.freq_ranges[i][1])
+            width, height = self._view_pixels(plot_widget)
+            tiles = pyramid.tiles_in_view(
+                pyramid.level_for(time_hi - time_lo, width),
+                pyramid.freq_level_for(freq_hi - freq_lo, height),
+                (time_lo, time_hi),
+                (freq_lo, freq_hi),
+            ) if freq_hi > freq_lo else []
+            self.wanted_tiles[i] = set(tiles)
+
+            # Detail tiles outside the view or at another level are dropped;
+            # the overview stays beneath until finer tiles arrive
+            for tile, item in list(self.tile_items[i].items()):
+                if tile not in self.wanted_tiles[i] and item.zValue() >= 0:
+                    plot_widget.removeItem(item)
+                    del self.tile_items[i][tile]
+
+            for tile in tiles:
+                if tile in self.tile_items[i]:
+                    continue
+                power_db = pyramid.cached_tile(tile)
+                if power_db is not None:
+                    self._show_tile(i, tile, power_db)
                 else:
-                    plot_widget.setTitle(f"{channel_name} | SNR: {snr_db} dB", 
-                                        color='#e0e0e0', size='12pt')
-            
-            # Set axis labels
-            plot_widget.setLabel('bottom', 'Time (s)', color='#e0e0e0', size='11pt')
-            
-            # Set time limits if auto
-            if self.auto_limits_checkbox.isChecked():
-                plot_widget.setXRange(times[0], times[-1], padding=0.02)
-                # Update text fields for reference
-                self.time_min_edit.setText(f"{times[0]:.3f}")
-                self.time_max_edit.setText(f"{times[-1]:.3f}")
+                    jobs.add((i, tile))
+                    self.tile_loader.submit(self.tile_generation, (i, tile), pyramid)
+        self.tile_loader.cancel_except(jobs)
+
+    def _show_tile(self, channel_idx: int, tile, power_db):
+        cropped = self.pyramids[channel_idx].crop_to_frequencies(
+            tile, power_db, self.freq_ranges[channel_idx]
+        )
+        if cropped is not None:
+            self._add_tile_item(channel_idx, tile, cropped)
+
+    def _on_tile_ready(self, generation: int, key, power_db):
+        """Draw a tile computed in the background if it is still in view."""
+        channel_idx, tile = key
+        if generation != self.tile_generation or channel_idx >= len(self.pyramids):
+            return
+        if tile in self.wanted_tiles[channel_idx] and tile not in self.tile_items[channel_idx]:
+            self._show_tile(channel_idx, tile, power_db)
+
+    def closeEvent(self, event):
+        """Stop background tile computation when the window closes."""
+        self._tile_refresh_timer.stop()
+        self.tile_loader.shutdown()
+        super().closeEvent(event)
 
     def _apply_frequency_range(self):
         """Apply custom frequency range and update plots."""
@@ -24,14 +24,14 @@ from PyQt6.QtGui import QFont
 import pyqtgraph as pg
 import numpy as np
 from scipy import stats
-from scipy.ndimage import uniform_filter1d
 from typing import List, Tuple, Optional, Dict
 
 from spectral_edge.utils.message_box import show_information, show_warning, show_critical
 from spectral_edge.utils.report_generator import ReportGenerator, export_plot_to_image, PPTX_AVAILABLE
 from spectral_edge.utils.signal_conditioning import build_processing_note
 from spectral_edge.utils.theme import apply_context_menu_style
-from spectral_edge.utils.statistics_overlays import fit_rayleigh_from_signal, build_rayleigh_curve
+from spectral_edge.utils.statistics_overlays import build_rayleigh_curve
+from spectral_edge.utils.signal_statistics import compute_conditioned_statistics
 from spectral_edge.utils.plot_theme import get_watermark_text
 
 
@@ -41,13 +41,15 @@ class StatisticsCalculationThread(QThread):
     progress = pyqtSignal(int, str)  # percent, message
     error = pyqtSignal(str)
 
-    def __init__(self, channels_data, channel_selection, n_bins, window_seconds, sample_rate):
+    def __init__(self, channels_data, channel_selection, n_bins, window_seconds, sample_rate,
+                 conditioning=None):
         super().__init__()
         self.channels_data = channels_data
         self.channel_selection = channel_selection
         self.n_bins = n_bins
         self.window_seconds = window_seconds
         self.sample_rate = sample_rate
+        self.conditioning = conditioning
 
     def run(self):
         try:
@@ -61,103 +63,25 @@ class StatisticsCalculationThread(QThread):
             for idx, (i, (name, signal, unit, _)) in enumerate(selected_channels):
                 self.progress.emit(int(100 * idx / max(total, 1)), f"Processing {name}...")
 
-                # Calculate PDF (fast)
-                counts, bin_edges = np.histogram(signal, bins=self.n_bins, density=True)
-                bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-
-                mean = np.mean(signal)
-                std = np.std(signal)
-
-                pdf_data[name] = {
-                    'bins': bin_centers,
-                    'counts': counts,
-                    'mean': mean,
-                    'std': std,
-                    'unit': unit
-                }
-                rayleigh_scale, rayleigh_x_max = fit_rayleigh_from_signal(signal)
-                pdf_data[name]["rayleigh_scale"] = rayleigh_scale
-                pdf_data[name]["rayleigh_x_max"] = rayleigh_x_max
-
-                # Calculate running statistics using optimized uniform_filter1d
-                window_samples = int(self.window_seconds * self.sample_rate)
-                window_samples = max(10, window_samples)
-
-                n = len(signal)
-                if n > window_samples:
-                    # Use uniform_filter1d for O(n) running mean (much faster than convolve)
-                    signal_float = signal.astype(np.float64)
-                    running_mean = uniform_filter1d(signal_float, size=window_samples, mode='nearest')
-
-                    # Running std using uniform_filter1d
-                    running_sq = uniform_filter1d(signal_float**2, size=window_samples, mode='nearest')
-                    running_std = np.sqrt(np.maximum(running_sq - running_mean**2, 0))
-
-                    # Downsample for display (keep max 5000 points)
-                    max_points = 5000
-                    if len(running_mean) > max_points:
-                        step = len(running_mean) // max_points
-                        running_mean = running_mean[::step]
-                        running_std = running_std[::step]
-                        time = np.arange(len(running_mean)) * step / self.sample_rate
-                    else:
-                        time = np.arange(len(running_mean)) / self.sample_rate
-
-                    # Calculate sampled skewness and kurtosis (limit to 200 points for speed)
-                    n_samples = min(200, len(signal) // window_samples)
-                    if n_samples > 0:
-                        sample_step = len(signal) // n_samples
-                        running_skewness = np.zeros(n_samples)
-                        running_kurtosis = np.zeros(n_samples)
-                        skewness_time = np.zeros(n_samples)
-
-                        for j in range(n_samples):
-                            start_idx = j * sample_step
-                            end_idx = min(start_idx + window_samples, len(signal))
-                            window = signal[start_idx:end_idx]
-                            if len(window) > 10:
-                                running_skewness[j] = stats.skew(window)
-                                running_kurtosis[j] = stats.kurtosis(window)
-                            skewness_time[j] = start_idx / self.sample_rate
-                    else:
-                        running_skewness = np.array([0])
-                        running_kurtosis = np.array([0])
-                        skewness_time = np.array([0])
-
-                    running_stats[name] = {
-                        'time': time,
-                        'mean': running_mean,
-                        'std': running_std,
-                        'skewness_time': skewness_time,
-                        'skewness': running_skewness,
-                        'kurtosis': running_kurtosis,
-                        'unit': unit
-                    }
-
-                # Overall statistics (use faster numpy where possible)
-                rms = np.sqrt(np.mean(signal**2))
-                crest_factor = np.max(np.abs(signal)) / rms if rms > 1e-12 else 0.0
-
-                # For large signals, sample for skewness/kurtosis
-                if len(signal) > 100000:
-                    sample_indices = np.random.choice(len(signal), 100000, replace=False)
-                    signal_sample = signal[sample_indices]
-                    skewness = stats.skew(signal_sample)
-                    kurtosis = stats.kurtosis(signal_sample)
-                else:
-                    skewness = stats.skew(signal)
-                    kurtosis = stats.kurtosis(signal)
-
-                pdf_data[name]['overall'] = {
-                    'mean': mean,
-                    'std': std,
-                    'skewness': skewness,
-                    'kurtosis': kurtosis,
-                    'min': np.min(signal),
-                    'max': np.max(signal),
-                    'rms': rms,
-                    'crest_factor': crest_factor
-                }
+                # Shared engine: exact overall moments, running stats for every
+                # window, streamed block by block (conditioned per block when
+                # the window was given raw channels)
+                statistics = compute_conditioned_statistics(
+                    signal,
+                    self.sample_rate,
+                    conditioning=self.conditioning,
+                    n_bins=self.n_bins,
+                    window_seconds=self.window_seconds,
+                    max_plot_points=5000,
+                )
+
+                pdf_data[name] = dict(statistics['pdf'])
+                pdf_data[name]['unit'] = unit
+                pdf_data[name]['overall'] = statistics['overall']
+
+                if statistics['running']:
+                    running_stats[name] = dict(statistics['running'])
+                    running_stats[name]['unit'] = unit
 
             self.progress.emit(100, "Complete")
             self.finished.emit(pdf_data, running_stats)
@@ -185,6 +109,7 @@ class StatisticsWindow(QMainWindow):
         parent=None,
         processing_note: str = "",
         processing_flags: Optional[Dict[str, object]] = None,
+        conditioning: Optional[Dict[str, object]] = None,
     ):
         """
         Initialize the Statistics Analysis window.
@@ -197,6 +122,11 @@ class StatisticsWindow(QMainWindow):
             Sample rate in Hz.
         parent : QWidget, optional
             Parent widget.
+        conditioning : dict, optional
+            ``apply_processing_pipeline_to_span`` keyword arguments. When
+            given, the signals are raw channels (arrays, ``LazyArray`` or
+            ``h5py.Dataset``) conditioned block by block while the
+            statistics are computed; otherwise they are already conditioned.
         """
         super().__init__(parent)
 
@@ -210,6 +140,7 @@ class StatisticsWindow(QMainWindow):
             mean_window_seconds=1.0,
         )
         self.processing_flags = processing_flags or {}
+        self.conditioning = conditioning
 
         # Channel selection checkboxes
         self.channel_checkboxes = []
@@ -632,7 +563,8 @@ class StatisticsWindow(QMainWindow):
             channel_selection=channel_selection,
             n_bins=self.bins_spin.value(),
             window_seconds=self.window_spin.value(),
-            sample_rate=self.sample_rate
+            sample_rate=self.sample_rate,
+            conditioning=self.conditioning,
         )
         self.calc_thread.finished.connect(self._on_calculation_finished)
         self.calc_thread.progress.connect(self._on_calculation_progress)
@@ -926,6 +858,7 @@ def create_statistics_window(
     parent=None,
     processing_note: str = "",
     processing_flags: Optional[Dict[str, object]] = None,
+    conditioning: Optional[Dict[str, object]] = None,
 ):
     """
     Factory function to create a StatisticsWindow.
@@ -941,6 +874,8 @@ def create_statistics_window(
         Sample rate in Hz.
     parent : QWidget, optional
         Parent widget.
+    conditioning : dict, optional
+        Block-wise conditioning of raw channels (see ``StatisticsWindow``).
 
     Returns
     -------
@@ -953,4 +888,5 @@ def create_statistics_window(
         parent,
         processing_note=processing_note,
         processing_flags=processing_flags,
+        conditioning=conditioning,
     )
@@ -0,0 +1,210 @@
+"""Memory-bounded, lazily loaded channel arrays.
+
+Windows that hold many long channels keep each one as a :class:`LazyArray`
+instead of an in-memory copy. A lazy array knows its length and how to load
+its samples; the samples themselves live in a shared :class:`ArrayLRUCache`
+with a byte budget, so only the most recently used channels (raw or
+conditioned) stay resident and the rest are re-read from HDF5 or
+re-conditioned on next use.
+
+Small reads (``arr[0]``, ``arr[a:b]``) of an HDF5-backed array go straight to
+the dataset without loading the whole channel.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+
+DEFAULT_CACHE_BYTES = 2 * 1024 ** 3
+
+
+class ArrayLRUCache:
+    """
+    Least-recently-used cache of numpy arrays bounded by total bytes.
+
+    An array larger than the whole budget is returned to the caller but not
+    kept. Safe to share between threads; concurrent misses on the same key
+    may each load it. ``on_evict``, when given, is called with the key of
+    every array that leaves the cache (evicted, discarded, cleared or too
+    large to keep), but not when an array is replaced under the same key;
+    it runs with the cache lock held.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES,
+                 on_evict: Optional[Callable[[Hashable], None]] = None):
+        self.max_bytes = int(max_bytes)
+        self._arrays: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._on_evict = on_evict
+        self.nbytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._arrays
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    def peek(self, key: Hashable) -> Optional[np.ndarray]:
+        """Cached array for ``key`` without touching its recency, or None."""
+        return self._arrays.get(key)
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """Cached array for ``key`` (marked most recently used), or None."""
+        with self._lock:
+            array = self._arrays.get(key)
+            if array is not None:
+                self._arrays.move_to_end(key)
+            return array
+
+    def put(self, key: Hashable, array: np.ndarray) -> np.ndarray:
+        """Cache ``array`` under ``key``, evicting old entries to stay in budget."""
+        with self._lock:
+            self._discard(key, notify=False)
+            if array.nbytes <= self.max_bytes:
+                self._arrays[key] = array
+                self.nbytes += array.nbytes
+                self._evict()
+            elif self._on_evict is not None:
+                self._on_evict(key)
+        return array
+
+    def get_or_load(self, key: Hashable, load: Callable[[], np.ndarray]) -> np.ndarray:
+        """Cached array for ``key``, calling ``load()`` and caching on a miss."""
+        array = self.get(key)
+        if array is None:
+            array = self.put(key, load())
+        return array
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key satisfies ``predicate``."""
+        with self._lock:
+            for key in [key for key in self._arrays if predicate(key)]:
+                self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._arrays):
+                self._discard(key)
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the budget, evicting entries if it shrank."""
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def _discard(self, key: Hashable, notify: bool = True) -> None:
+        array = self._arrays.pop(key, None)
+        if array is not None:
+            self.nbytes -= array.nbytes
+            if notify and self._on_evict is not None:
+                self._on_evict(key)
+
+    def _evict(self) -> None:
+        while self.nbytes > self.max_bytes and self._arrays:
+            self._discard(next(iter(self._arrays)))
+
+
+class LazyArray:
+    """
+    1-D array-like whose samples are loaded on demand through an ``ArrayLRUCache``.
+
+    Supports ``len()``, integer/slice indexing and ``np.asarray()``; any other
+    indexing loads the full array. ``read_slice``, when given, serves integer
+    and forward-slice reads while the array is not cached (for example
+    directly from an ``h5py.Dataset``). ``source``, when given, identifies
+    the underlying data independently of this handle and its cache key.
+    """
+
+    ndim = 1
+
+    def __init__(
+        self,
+        cache: ArrayLRUCache,
+        key: Hashable,
+        load: Callable[[], np.ndarray],
+        length: int,
+        dtype=np.float64,
+        read_slice: Optional[Callable[[object], np.ndarray]] = None,
+        source: Optional[Hashable] = None,
+    ):
+        self.cache = cache
+        self.key = key
+        self._load = load
+        self._length = int(length)
+        self.dtype = np.dtype(dtype)
+        self._read_slice = read_slice
+        self.source = source
+
+    @classmethod
+    def from_dataset(cls, dataset, cache: ArrayLRUCache, key: Hashable) -> "LazyArray":
+        """Lazy float64 view of a 1-D ``h5py.Dataset``."""
+        from spectral_edge.utils.hdf5_chunks import read_samples
+
+        return cls(
+            cache,
+            key,
+            lambda: np.asarray(read_samples(dataset), dtype=np.float64),
+            dataset.shape[0],
+            read_slice=lambda item: np.asarray(dataset[item], dtype=np.float64),
+            source=("hdf5", dataset.file.filename, dataset.name),
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def shape(self) -> tuple:
+        return (self._length,)
+
+    @property
+    def size(self) -> int:
+        return self._length
+
+    @property
+    def nbytes(self) -> int:
+        return self._length * self.dtype.itemsize
+
+    def read(self) -> np.ndarray:
+        """Full array, from the cache or freshly loaded."""
+        return self.cache.get_or_load(self.key, self._load)
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.read()
+        if dtype is not None and np.dtype(dtype) != array.dtype:
+            return array.astype(dtype)
+        return array.copy() if copy else array
+
+    def __getitem__(self, item):
+        cached = self.cache.peek(self.key)
+        if cached is not None:
+            return cached[item]
+        if self._read_slice is not None:
+            if isinstance(item, (int, np.integer)):
+                index = int(item) + self._length if item < 0 else int(item)
+                if not 0 <= index < self._length:
+                    raise IndexError(f"index {item} out of range for length {self._length}")
+                return self._read_slice(index)
+            if isinstance(item, slice):
+                start, stop, step = item.indices(self._length)
+                if step > 0:
+                    if stop <= start:
+                        return np.empty(0, dtype=self.dtype)
+                    return self._read_slice(slice(start, stop, step))
+        return self.read()[item]
+
+
+def materialize(array) -> Optional[np.ndarray]:
+    """In-memory ndarray for an array or ``LazyArray`` (None passes through)."""
+    if array is None or isinstance(array, np.ndarray):
+        return array
+    if isinstance(array, LazyArray):
+        return array.read()
+    return np.asarray(array)
@@ -26,6 +26,11 @@ from typing import Optional, List, Tuple, Callable, Dict, Any
 from pathlib import Path
 from scipy.io import savemat
 
+from spectral_edge.utils.hdf5_chunks import (
+    chunk_filters, copy_dataset_slice, read_samples, write_compressed_dataset,
+)
+from spectral_edge.utils.hdf5_overview import OverviewBuilder, get_channel_overview
+
 # Import DEWESoft library wrapper
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts', 'dewesoft'))
 from DWDataReaderHeader import *
@@ -415,6 +420,7 @@ def convert_dxd_to_format(
                 time_range=time_range,
                 progress_callback=lambda p, m: progress_callback(85 + int(p * 0.15), m) if progress_callback else None
             )
+            # The writer builds each channel's display overview as it goes
             output_files = [output_path]
         
         if progress_callback:
@@ -982,14 +988,97 @@ def _copy_non_flight_top_level_items(
         f_in.copy(key, f_out, name=key)
 
 
+def _chunk_aligned_times(
+    flights: List[Tuple[str, h5py.Group]],
+    start_time: float,
+    end_time: float
+) -> Tuple[float, float]:
+    """
+    Snap a segment's time window to chunk boundaries shared by every channel.
+
+    Each boundary snaps to the nearest chunk edge of the compressed channel
+    with the longest chunks, and only when that time is also a chunk edge of
+    every other compressed channel, so all channels of a segment still cover
+    the same window. Boundaries snap on their own, so consecutive segments
+    still tile the flights; the end of the data, windows shorter than two
+    chunks, and boundaries no shared edge fits are returned unchanged.
+    """
+    grids = []
+    duration = np.inf
+    for flight_key, flight_group in flights:
+        for channel_name, ch_in in flight_group['channels'].items():
+            if 'data' not in ch_in:
+                continue
+            data_in = ch_in['data']
+            sample_rate = _get_channel_sample_rate(ch_in, channel_name, flight_key)
+            duration = min(duration, data_in.shape[0] / sample_rate)
+            if chunk_filters(data_in) is not None:
+                grids.append((sample_rate, data_in.chunks[0]))
+    if not grids:
+        return start_time, end_time
+
+    coarse_rate, coarse_len = max(grids, key=lambda grid: grid[1] / grid[0])
+    chunk_seconds = coarse_len / coarse_rate
+    if end_time - start_time < 2 * chunk_seconds:
+        return start_time, end_time
+
+    def snap(time):
+        snapped = int(round(time / chunk_seconds)) * coarse_len / coarse_rate
+        if time >= duration or snapped > duration:
+            return time
+        for sample_rate, chunk_len in grids:
+            position = snapped * sample_rate
+            if abs(position - round(position)) > 1e-6 or round(position) % chunk_len:
+                return time
+        return snapped
+
+    return snap(start_time), snap(end_time)
+
+
+def _copy_channel_data(ch_in: h5py.Group, ch_out: h5py.Group, start_idx: int, end_idx: int) -> None:
+    """
+    Copy a channel's data slice and write its display overview.
+
+    The overview reuses whole rows of the source overview when the slice
+    starts on one of its buckets; otherwise it is summarized from the blocks
+    the copy streams through, so the slice is never held in memory.
+    """
+    data_in = ch_in['data']
+    if data_in.ndim != 1:
+        write_compressed_dataset(ch_out, 'data', data_in[start_idx:end_idx])
+        return
+
+    source_overview = get_channel_overview(ch_in)
+    base_bucket = int(source_overview.attrs['base_bucket']) if source_overview is not None else None
+    if base_bucket and start_idx % base_bucket == 0:
+        overview = OverviewBuilder(base_bucket)
+        first_row, last_row = start_idx // base_bucket, end_idx // base_bucket
+        overview.add_rows(source_overview['level_0'][first_row:last_row])
+        overview.add(read_samples(data_in, last_row * base_bucket, end_idx))
+        copy_dataset_slice(data_in, ch_out, 'data', start_idx, end_idx)
+    else:
+        overview = OverviewBuilder()
+        copy_dataset_slice(data_in, ch_out, 'data', start_idx, end_idx, on_values=overview.add)
+    overview.write(ch_out)
+
+
 def _write_hdf5_segment_file(
     f_in: h5py.File,
     output_path: str,
     flights: List[Tuple[str, h5py.Group]],
     start_time: float,
-    end_time: float
+    end_time: float,
+    align_to_chunks: bool = False
 ) -> None:
-    """Write one split HDF5 file for the requested time window."""
+    """
+    Write one split HDF5 file for the requested time window.
+
+    With ``align_to_chunks`` the window is snapped to chunk boundaries that
+    every channel shares (see :func:`_chunk_aligned_times`) so whole chunks
+    are copied without recompressing.
+    """
+    if align_to_chunks:
+        start_time, end_time = _chunk_aligned_times(flights, start_time, end_time)
     flight_keys = [flight_key for flight_key, _ in flights]
     with h5py.File(output_path, 'w') as f_out:
         _copy_non_flight_top_level_items(f_in, f_out, flight_keys)
@@ -1021,30 +1110,29 @@ def _write_hdf5_segment_file(
                 end_idx = max(start_idx, min(int(end_time * sample_rate), total_samples))
 
                 ch_out = channels_out.create_group(channel_name)
-                ch_out.create_dataset('data', data=ch_in['data'][start_idx:end_idx])
+                _copy_channel_data(ch_in, ch_out, start_idx, end_idx)
 
                 if 'time' in ch_in:
-                    time_slice = ch_in['time'][start_idx:end_idx]
+                    time_out = copy_dataset_slice(ch_in['time'], ch_out, 'time', start_idx, end_idx)
                 else:
                     channel_start_time = float(ch_in.attrs.get('start_time', 0.0))
-                    time_slice = channel_start_time + (
+                    time_out = write_compressed_dataset(ch_out, 'time', channel_start_time + (
                         np.arange(start_idx, end_idx, dtype=np.float64) / sample_rate
-                    )
-
-                ch_out.create_dataset('time', data=time_slice)
+                    ))
 
                 for key, value in ch_in.attrs.items():
                     ch_out.attrs[key] = value
 
-                if len(time_slice) > 0:
-                    ch_out.attrs['start_time'] = float(time_slice[0])
+                if len(time_out) > 0:
+                    ch_out.attrs['start_time'] = float(time_out[0])
 
 
 def split_hdf5_by_count(
     input_path: str,
     output_dir: str,
     num_segments: int,
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    align_to_chunks: bool = False
 ) -> List[str]:
     """
     Split an HDF5 file into N equal segments.
@@ -1059,6 +1147,10 @@ def split_hdf5_by_count(
         Number of segments to create
     progress_callback : callable, optional
         Function(percentage: int, message: str) for progress updates
+    align_to_chunks : bool, optional
+        Snap segment boundaries to compressed storage chunk boundaries that
+        every channel shares, so whole chunks are copied without
+        recompressing (default: False, segments have equal duration)
     
     Returns
     -------
@@ -1079,9 +1171,15 @@ def split_hdf5_by_count(
     
     Notes
     -----
-    - Each segment contains equal duration of data
+    - Each segment contains equal duration of data, unless
+      ``align_to_chunks`` moves the boundaries
     - Maintains SpectralEdge-compatible HDF5 structure
     - Preserves all metadata in each segment
+    - Writes a min/max/mean display overview for each channel
+    - Channels are gzip compressed on all cores; compressed sources keep
+      their chunking and level, and whole chunks aligned with the source
+      are copied without recompressing
+    - Channel data is streamed in blocks, never held in memory whole
     """
     if num_segments < 1:
         raise ValueError("num_segments must be >= 1")
@@ -1110,7 +1208,7 @@ def split_hdf5_by_count(
             end_time = ((seg_idx + 1) * min_duration) / num_segments
             output_name = f"{base_name}_segment_{seg_idx+1:03d}.hdf5"
             output_path = os.path.join(output_dir, output_name)
-            _write_hdf5_segment_file(f_in, output_path, flights, start_time, end_time)
+            _write_hdf5_segment_file(f_in, output_path, flights, start_time, end_time, align_to_chunks)
             
             output_files.append(output_path)
             
@@ -1127,7 +1225,8 @@ def split_hdf5_by_time_slices(
     input_path: str,
     output_dir: str,
     time_slices: List[Tuple[float, float]],
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    align_to_chunks: bool = False
 ) -> List[str]:
     """
     Split an HDF5 file by custom time ranges.
@@ -1142,6 +1241,10 @@ def split_hdf5_by_time_slices(
         Time ranges in seconds to extract
     progress_callback : callable, optional
         Function(percentage: int, message: str) for progress updates
+    align_to_chunks : bool, optional
+        Snap slice boundaries to compressed storage chunk boundaries that
+        every channel shares, so whole chunks are copied without
+        recompressing (default: False, slices are cut at the requested times)
     
     Returns
     -------
@@ -1158,6 +1261,11 @@ def split_hdf5_by_time_slices(
     - Time slices can overlap or have gaps
     - Each slice is an independent HDF5 file
     - Maintains SpectralEdge-compatible structure
+    - Writes a min/max/mean display overview for each channel
+    - Channels are gzip compressed on all cores; compressed sources keep
+      their chunking and level, and whole chunks aligned with the source
+      are copied without recompressing
+    - Channel data is streamed in blocks, never held in memory whole
     """
     if not os.path.exists(input_path):
         raise FileNotFoundError(f"Input file not found: {input_path}")
@@ -1189,7 +1297,7 @@ def split_hdf5_by_time_slices(
             
             output_name = f"{base_name}_slice_{slice_idx+1:03d}.hdf5"
             output_path = os.path.join(output_dir, output_name)
-            _write_hdf5_segment_file(f_in, output_path, flights, start_time, end_time)
+            _write_hdf5_segment_file(f_in, output_path, flights, start_time, end_time, align_to_chunks)
             
             output_files.append(output_path)
             
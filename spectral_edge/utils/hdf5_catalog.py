@@ -0,0 +1,401 @@
+"""
+Persistent HDF5 Flight/Channel Catalog
+
+This module keeps a SQLite index of the flights, channels, attributes, sample
+counts and time bounds found in HDF5 flight test files. Opening a file that
+has not changed since it was catalogued (same size and modification time)
+costs a single indexed query instead of walking every group and attribute in
+the file, so projects with hundreds of files open instantly.
+
+The catalog is a cache only: entries are rebuilt transparently whenever a
+file changes, entries of deleted files are dropped, and any catalog failure
+falls back to scanning the file.
+
+The shared catalog lives in ``~/.spectral_edge``; set the
+``SPECTRAL_EDGE_HDF5_CATALOG`` environment variable to use another database
+file, or to an empty string to disable it.
+
+Author: SpectralEdge Development Team
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import h5py
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout changes; older catalogs are rebuilt
+CATALOG_SCHEMA_VERSION = 1
+
+# Overrides the location of the shared catalog ('' disables it)
+CATALOG_PATH_ENV = 'SPECTRAL_EDGE_HDF5_CATALOG'
+
+# Top-level groups that never hold flights
+_NON_FLIGHT_GROUPS = ('metadata', 'file_metadata', 'info')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    file_metadata TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS flights (
+    path TEXT NOT NULL,
+    flight_key TEXT NOT NULL,
+    metadata TEXT,
+    PRIMARY KEY (path, flight_key)
+);
+CREATE TABLE IF NOT EXISTS channels (
+    path TEXT NOT NULL,
+    flight_key TEXT NOT NULL,
+    channel_key TEXT NOT NULL,
+    attributes TEXT NOT NULL,
+    n_samples INTEGER NOT NULL,
+    time_start REAL,
+    time_end REAL,
+    PRIMARY KEY (path, flight_key, channel_key)
+);
+"""
+
+
+def _json_safe(value):
+    """Convert HDF5 attribute values (numpy scalars/arrays, bytes) to JSON types."""
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    if isinstance(value, np.ndarray):
+        return [_json_safe(v) for v in value.tolist()]
+    if isinstance(value, np.generic):
+        return _json_safe(value.item())
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def _attrs_to_json(attrs) -> str:
+    return json.dumps({str(k): _json_safe(v) for k, v in dict(attrs).items()})
+
+
+def scan_hdf5_file(h5file: h5py.File) -> Dict:
+    """
+    Walk an open HDF5 file and collect catalog metadata.
+
+    Flight groups are found the same way ``HDF5FlightDataLoader`` finds them
+    (any top-level group with a 'channels' subgroup). Flights without a
+    'metadata' group are recorded with ``None`` metadata.
+
+    Parameters
+    ----------
+    h5file : h5py.File
+        Open HDF5 file
+
+    Returns
+    -------
+    dict with keys:
+        'file_metadata' : dict
+            Attributes of the top-level 'metadata' group
+        'flights' : dict
+            flight_key -> metadata dict (or None)
+        'channels' : dict
+            flight_key -> channel_key -> dict with 'attributes', 'n_samples',
+            'time_start' and 'time_end'
+    """
+    file_metadata = json.loads(_attrs_to_json(h5file['metadata'].attrs)) if 'metadata' in h5file else {}
+    flights: Dict[str, Optional[Dict]] = {}
+    channels: Dict[str, Dict[str, Dict]] = {}
+
+    for flight_key in h5file.keys():
+        if flight_key in _NON_FLIGHT_GROUPS:
+            continue
+        flight_group = h5file[flight_key]
+        if not isinstance(flight_group, h5py.Group) or 'channels' not in flight_group:
+            continue
+
+        flights[flight_key] = (
+            json.loads(_attrs_to_json(flight_group['metadata'].attrs))
+            if 'metadata' in flight_group else None
+        )
+        channels[flight_key] = {}
+        for channel_key, channel_group in flight_group['channels'].items():
+            n_samples = len(channel_group['data']) if 'data' in channel_group else 0
+            time_start = time_end = None
+            if 'time' in channel_group and len(channel_group['time']) > 0:
+                time_dataset = channel_group['time']
+                time_start = float(time_dataset[0])
+                time_end = float(time_dataset[-1])
+            channels[flight_key][channel_key] = {
+                'attributes': json.loads(_attrs_to_json(channel_group.attrs)),
+                'n_samples': int(n_samples),
+                'time_start': time_start,
+                'time_end': time_end,
+            }
+
+    return {'file_metadata': file_metadata, 'flights': flights, 'channels': channels}
+
+
+class HDF5Catalog:
+    """
+    SQLite-backed catalog of HDF5 flight/channel metadata.
+
+    Entries are keyed by absolute file path and invalidated by file size and
+    modification time. A connection is opened per operation, so one catalog
+    instance can be shared between the GUI and worker threads.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the catalog, creating the database if needed.
+
+        Parameters
+        ----------
+        db_path : str
+            Path to the SQLite database file
+        """
+        self.db_path = str(db_path)
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != CATALOG_SCHEMA_VERSION:
+                conn.executescript(
+                    "DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS flights; "
+                    "DROP TABLE IF EXISTS channels;"
+                )
+                conn.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction (committed on success)."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _file_key(file_path: str) -> str:
+        return os.path.abspath(file_path)
+
+    @staticmethod
+    def _file_signature(file_path: str):
+        stat = os.stat(file_path)
+        return int(stat.st_size), int(stat.st_mtime_ns)
+
+    def get_entry(self, file_path: str, h5file: Optional[h5py.File] = None) -> Dict:
+        """
+        Return catalog metadata for a file, rescanning it if it changed.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the HDF5 file
+        h5file : h5py.File, optional
+            Already-open handle to scan from on a cache miss
+
+        Returns
+        -------
+        dict
+            Same layout as :func:`scan_hdf5_file`
+        """
+        key = self._file_key(file_path)
+        try:
+            size, mtime_ns = self._file_signature(file_path)
+        except FileNotFoundError:
+            self.invalidate([file_path])
+            raise
+        entry = self._read_entry(key, size, mtime_ns)
+        if entry is not None:
+            return entry
+
+        if h5file is not None:
+            entry = scan_hdf5_file(h5file)
+        else:
+            with h5py.File(file_path, 'r') as handle:
+                entry = scan_hdf5_file(handle)
+        self._write_entry(key, size, mtime_ns, entry)
+        return entry
+
+    def _read_entry(self, key: str, size: int, mtime_ns: int) -> Optional[Dict]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT size, mtime_ns, file_metadata FROM files WHERE path = ?", (key,)
+            ).fetchone()
+            if row is None or row[0] != size or row[1] != mtime_ns:
+                return None
+
+            flights = {
+                flight_key: (json.loads(metadata) if metadata is not None else None)
+                for flight_key, metadata in conn.execute(
+                    "SELECT flight_key, metadata FROM flights WHERE path = ? ORDER BY rowid", (key,)
+                )
+            }
+            channels: Dict[str, Dict[str, Dict]] = {flight_key: {} for flight_key in flights}
+            for flight_key, channel_key, attributes, n_samples, time_start, time_end in conn.execute(
+                "SELECT flight_key, channel_key, attributes, n_samples, time_start, time_end "
+                "FROM channels WHERE path = ? ORDER BY rowid",
+                (key,),
+            ):
+                channels.setdefault(flight_key, {})[channel_key] = {
+                    'attributes': json.loads(attributes),
+                    'n_samples': n_samples,
+                    'time_start': time_start,
+                    'time_end': time_end,
+                }
+        return {'file_metadata': json.loads(row[2]), 'flights': flights, 'channels': channels}
+
+    def _write_entry(self, key: str, size: int, mtime_ns: int, entry: Dict) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM files WHERE path = ?", (key,))
+            conn.execute("DELETE FROM flights WHERE path = ?", (key,))
+            conn.execute("DELETE FROM channels WHERE path = ?", (key,))
+            conn.execute(
+                "INSERT INTO files (path, size, mtime_ns, file_metadata) VALUES (?, ?, ?, ?)",
+                (key, size, mtime_ns, json.dumps(entry['file_metadata'])),
+            )
+            conn.executemany(
+                "INSERT INTO flights (path, flight_key, metadata) VALUES (?, ?, ?)",
+                [
+                    (key, flight_key, json.dumps(metadata) if metadata is not None else None)
+                    for flight_key, metadata in entry['flights'].items()
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO channels (path, flight_key, channel_key, attributes, n_samples, "
+                "time_start, time_end) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        key, flight_key, channel_key, json.dumps(info['attributes']),
+                        info['n_samples'], info['time_start'], info['time_end'],
+                    )
+                    for flight_key, flight_channels in entry['channels'].items()
+                    for channel_key, info in flight_channels.items()
+                ],
+            )
+
+    def flight_file_map(self, file_paths: Iterable[str]) -> Dict[str, str]:
+        """
+        Map flight keys to the file that contains them.
+
+        Files that cannot be read are logged and skipped.
+
+        Parameters
+        ----------
+        file_paths : iterable of str
+            HDF5 files to index
+
+        Returns
+        -------
+        dict
+            flight_key -> file_path (as given)
+        """
+        self.prune_missing()
+        mapping = {}
+        for file_path in file_paths:
+            try:
+                entry = self.get_entry(file_path)
+            except Exception as exc:
+                logger.warning(f"Could not read metadata from {file_path}: {exc}")
+                continue
+            for flight_key, metadata in entry['flights'].items():
+                if metadata is not None:
+                    mapping[flight_key] = file_path
+        return mapping
+
+    def prune_missing(self) -> int:
+        """Drop entries of files that no longer exist; returns how many were dropped."""
+        with self._connect() as conn:
+            missing = [
+                path for (path,) in conn.execute("SELECT path FROM files")
+                if not os.path.exists(path)
+            ]
+        if missing:
+            self.invalidate(missing)
+        return len(missing)
+
+    def invalidate(self, file_paths: Optional[List[str]] = None) -> None:
+        """Drop catalog entries for the given files (all files when None)."""
+        with self._connect() as conn:
+            if file_paths is None:
+                for table in ('files', 'flights', 'channels'):
+                    conn.execute(f"DELETE FROM {table}")
+                return
+            for file_path in file_paths:
+                key = self._file_key(file_path)
+                for table in ('files', 'flights', 'channels'):
+                    conn.execute(f"DELETE FROM {table} WHERE path = ?", (key,))
+
+
+_default_catalogs: Dict[str, HDF5Catalog] = {}
+_default_catalog_lock = threading.Lock()
+
+
+def default_catalog_path() -> Optional[str]:
+    """Database file of the shared catalog, or None when it is disabled."""
+    db_path = os.environ.get(CATALOG_PATH_ENV)
+    if db_path is None:
+        return os.path.join(os.path.expanduser('~/.spectral_edge'), 'hdf5_catalog.sqlite')
+    return os.path.abspath(os.path.expanduser(db_path)) if db_path.strip() else None
+
+
+def get_default_catalog() -> Optional[HDF5Catalog]:
+    """
+    Return the shared catalog (see :func:`default_catalog_path`).
+
+    Returns None when the catalog is disabled or cannot be created (e.g.
+    read-only home directory); callers then scan files directly. Entries of
+    deleted files are dropped when the catalog is first opened.
+    """
+    db_path = default_catalog_path()
+    if db_path is None:
+        return None
+    with _default_catalog_lock:
+        catalog = _default_catalogs.get(db_path)
+        if catalog is None:
+            try:
+                catalog = HDF5Catalog(db_path)
+                catalog.prune_missing()
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning(f"HDF5 catalog unavailable ({exc}); scanning files directly")
+                return None
+            _default_catalogs[db_path] = catalog
+        return catalog
+
+
+def build_flight_file_map(file_paths: Iterable[str], catalog: Optional[HDF5Catalog] = None) -> Dict[str, str]:
+    """
+    Map flight keys to files, using the catalog when available.
+
+    Falls back to opening each file with ``HDF5FlightDataLoader`` when no
+    catalog can be used.
+    """
+    file_paths = list(file_paths)
+    catalog = catalog if catalog is not None else get_default_catalog()
+    if catalog is not None:
+        try:
+            return catalog.flight_file_map(file_paths)
+        except sqlite3.Error as exc:
+            logger.warning(f"HDF5 catalog query failed ({exc}); scanning files directly")
+
+    from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+
+    mapping = {}
+    for file_path in file_paths:
+        try:
+            loader = HDF5FlightDataLoader(file_path)
+            for flight_key in loader.flights.keys():
+                mapping[flight_key] = file_path
+            loader.close()
+        except Exception as exc:
+            logger.warning(f"Could not read metadata from {file_path}: {exc}")
+    return mapping
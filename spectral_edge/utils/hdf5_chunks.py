@@ -0,0 +1,388 @@
+"""
+Parallel reads and writes of compressed HDF5 channels.
+
+h5py runs the filter pipeline (gzip inflate, byte shuffle) for every chunk
+serially under its global lock, so reading a large compressed channel is
+bound to one core. ``read_samples`` instead fetches the raw bytes of each
+chunk with ``read_direct_chunk`` and inflates and unshuffles the chunks on a
+thread pool (zlib releases the GIL while it works) straight into a
+preallocated output array.
+
+Only 1-D chunked datasets whose filters are gzip and/or shuffle take the
+fast path; anything else (contiguous storage, other filters, small reads)
+falls back to ordinary slicing with the same result.
+
+``ParallelChunkWriter`` is the write-side counterpart: it compresses whole
+chunks on the same pool and stores them with ``write_direct_chunk``. The
+datasets it creates declare the usual gzip/shuffle filters, so the files are
+read by h5py, MATLAB and the HDF5 tools like any other compressed file.
+``copy_dataset_slice`` goes further when splitting files: chunks that line up
+with the source are copied still compressed, without being decoded at all.
+
+Author: SpectralEdge Development Team
+"""
+
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import h5py
+import numpy as np
+
+# Reads smaller than this are not worth splitting across threads
+PARALLEL_READ_MIN_BYTES = 4 * 1024 ** 2
+
+# Chunk length (samples) of datasets written by ParallelChunkWriter
+DEFAULT_CHUNK_SAMPLES = 100_000
+
+# Samples decoded at a time when copying a dataset slice
+COPY_BLOCK_SAMPLES = 1 << 22
+
+_SUPPORTED_FILTERS = {h5py.h5z.FILTER_DEFLATE, h5py.h5z.FILTER_SHUFFLE}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _chunk_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = max(1, os.cpu_count() or 1)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hdf5-chunks")
+        return _executor
+
+
+def chunk_filters(dataset) -> Optional[tuple]:
+    """
+    Filter ids of ``dataset`` in pipeline (write) order, or None if the
+    dataset cannot be decoded by :func:`decode_chunk`.
+    """
+    if dataset.chunks is None or dataset.ndim != 1 or dataset.dtype.kind not in "iuf":
+        return None
+    plist = dataset.id.get_create_plist()
+    filters = tuple(plist.get_filter(i)[0] for i in range(plist.get_nfilters()))
+    if not set(filters) <= _SUPPORTED_FILTERS:
+        return None
+    return filters
+
+
+def decode_chunk(raw: bytes, filter_mask: int, filters: tuple, dtype: np.dtype) -> np.ndarray:
+    """Undo the gzip and shuffle filters of one raw chunk (skipping masked filters)."""
+    for index in reversed(range(len(filters))):
+        if filter_mask & (1 << index):
+            continue
+        if filters[index] == h5py.h5z.FILTER_DEFLATE:
+            raw = zlib.decompress(raw)
+        elif dtype.itemsize > 1:
+            shuffled = np.frombuffer(raw, dtype=np.uint8)
+            raw = shuffled.reshape(dtype.itemsize, -1).T.tobytes()
+    return np.frombuffer(raw, dtype=dtype)
+
+
+def _read_chunks(dataset, filters, out, start, chunk_indices):
+    """Decode the given chunks of ``dataset`` into their part of ``out``."""
+    chunk_len = dataset.chunks[0]
+    end = start + len(out)
+    for chunk_idx in chunk_indices:
+        chunk_start = chunk_idx * chunk_len
+        lo = max(start, chunk_start)
+        hi = min(end, chunk_start + chunk_len)
+        try:
+            filter_mask, raw = dataset.id.read_direct_chunk((chunk_start,))
+        except (KeyError, RuntimeError, OSError):
+            # Never written: HDF5 returns the fill value
+            out[lo - start:hi - start] = dataset.fillvalue
+            continue
+        values = decode_chunk(raw, filter_mask, filters, dataset.dtype)
+        out[lo - start:hi - start] = values[lo - chunk_start:hi - chunk_start]
+
+
+def read_samples(dataset, start: int = 0, end: Optional[int] = None,
+                 max_workers: Optional[int] = None) -> np.ndarray:
+    """
+    Read ``dataset[start:end]``, decompressing chunks in parallel when possible.
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset
+        1-D channel dataset
+    start, end : int, optional
+        Sample range (``end`` defaults to the dataset length)
+    max_workers : int, optional
+        Threads to decode with (default: CPU count)
+
+    Returns
+    -------
+    np.ndarray
+        Samples, with the dataset's dtype
+    """
+    length = dataset.shape[0] if dataset.ndim == 1 else None
+    filters = chunk_filters(dataset)
+    if length is None or filters is None:
+        return dataset[start:end]
+
+    start, end, _step = slice(start, end).indices(length)
+    end = max(start, end)
+    if (end - start) * dataset.dtype.itemsize < PARALLEL_READ_MIN_BYTES:
+        return dataset[start:end]
+
+    out = np.empty(end - start, dtype=dataset.dtype)
+    chunk_len = dataset.chunks[0]
+    chunks = list(range(start // chunk_len, (end - 1) // chunk_len + 1))
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(chunks)))
+    if workers == 1:
+        _read_chunks(dataset, filters, out, start, chunks)
+        return out
+
+    # Contiguous runs of chunks, a few per worker so uneven chunks balance out
+    runs = np.array_split(np.asarray(chunks), workers * 4)
+    executor = _chunk_executor()
+    futures = [
+        executor.submit(_read_chunks, dataset, filters, out, start, run.tolist())
+        for run in runs if len(run)
+    ]
+    for future in futures:
+        future.result()
+    return out
+
+
+def encode_chunk(values: np.ndarray, level: int, shuffle: bool) -> bytes:
+    """Apply the shuffle and gzip filters to one chunk, as HDF5 would on write."""
+    raw = np.ascontiguousarray(values)
+    itemsize = raw.dtype.itemsize
+    data = raw.tobytes()
+    if shuffle and itemsize > 1:
+        data = np.frombuffer(data, dtype=np.uint8).reshape(-1, itemsize).T.tobytes()
+    return zlib.compress(data, level)
+
+
+class ParallelChunkWriter:
+    """
+    Write a gzip-compressed dataset, compressing its chunks on a thread pool.
+
+    Values are appended in order with :meth:`write`; every completed chunk is
+    compressed on a worker thread and stored with ``write_direct_chunk`` in
+    the calling thread. A few chunks are kept in flight per worker, so memory
+    stays bounded however long the channel is. Chunking is along the first
+    axis (``(chunk_samples,) + shape[1:]``). Call :meth:`close` (or use the
+    writer as a context manager) to store the final, partial chunk.
+
+    Parameters
+    ----------
+    group : h5py.Group
+        Group to create the dataset in
+    name : str
+        Dataset name
+    shape : tuple
+        Dataset shape
+    dtype : numpy dtype, optional
+        Dataset dtype (default: float64)
+    chunk_samples : int, optional
+        Samples per chunk along the first axis
+    compression_opts : int, optional
+        Gzip level (default: 4, as written by the converters)
+    shuffle : bool, optional
+        Byte-shuffle before compressing (default: False)
+    max_workers : int, optional
+        Compression threads (default: CPU count)
+    """
+
+    def __init__(self, group, name: str, shape: tuple, dtype=np.float64,
+                 chunk_samples: int = DEFAULT_CHUNK_SAMPLES, compression_opts: int = 4,
+                 shuffle: bool = False, max_workers: Optional[int] = None):
+        shape = tuple(int(n) for n in shape)
+        self.chunk_samples = max(1, min(int(chunk_samples), shape[0] or 1))
+        self.dataset = group.create_dataset(
+            name,
+            shape=shape,
+            dtype=dtype,
+            chunks=(self.chunk_samples,) + shape[1:],
+            compression='gzip',
+            compression_opts=compression_opts,
+            shuffle=shuffle,
+        )
+        self.level = compression_opts
+        self.shuffle = shuffle
+        self.workers = max(1, max_workers or os.cpu_count() or 1)
+        self._buffer = np.zeros((self.chunk_samples,) + shape[1:], dtype=self.dataset.dtype)
+        self._buffered = 0
+        self._position = 0
+        self._pending = []  # (chunk offset, future) in write order
+
+    @property
+    def length(self) -> int:
+        return self.dataset.shape[0]
+
+    def write(self, values) -> None:
+        """Append ``values`` (along the first axis) after the samples written so far."""
+        values = np.asarray(values, dtype=self.dataset.dtype)
+        if self._position + self._buffered + len(values) > self.length:
+            raise ValueError(
+                f"Writing {len(values)} samples overflows dataset '{self.dataset.name}' "
+                f"of length {self.length}"
+            )
+        offset = 0
+        while offset < len(values):
+            if self._buffered == 0 and len(values) - offset >= self.chunk_samples:
+                # Whole chunks go straight from the caller's array
+                count = (len(values) - offset) // self.chunk_samples * self.chunk_samples
+                for start in range(offset, offset + count, self.chunk_samples):
+                    self._submit(values[start:start + self.chunk_samples])
+                offset += count
+                continue
+            take = min(self.chunk_samples - self._buffered, len(values) - offset)
+            self._buffer[self._buffered:self._buffered + take] = values[offset:offset + take]
+            self._buffered += take
+            offset += take
+            if self._buffered == self.chunk_samples:
+                self._submit(self._buffer.copy())
+                self._buffered = 0
+
+    def _submit(self, chunk: np.ndarray) -> None:
+        chunk_offset = (self._position,) + (0,) * (chunk.ndim - 1)
+        self._position += self.chunk_samples
+        if self.workers == 1:
+            self._store(chunk_offset, encode_chunk(chunk, self.level, self.shuffle))
+            return
+        future = _chunk_executor().submit(encode_chunk, chunk, self.level, self.shuffle)
+        self._pending.append((chunk_offset, future))
+        while len(self._pending) > 2 * self.workers:
+            self._store_oldest()
+
+    def _store_oldest(self) -> None:
+        chunk_offset, future = self._pending.pop(0)
+        self._store(chunk_offset, future.result())
+
+    def _store(self, chunk_offset: tuple, data: bytes) -> None:
+        self.dataset.id.write_direct_chunk(chunk_offset, data)
+
+    def close(self) -> None:
+        """Store the final partial chunk (zero padded, as HDF5 does) and wait for the rest."""
+        if self._buffered:
+            self._buffer[self._buffered:] = 0
+            self._submit(self._buffer.copy())
+            self._buffered = 0
+        while self._pending:
+            self._store_oldest()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            for _offset, future in self._pending:
+                future.cancel()
+            self._pending.clear()
+
+
+def write_compressed_dataset(group, name: str, data, **kwargs):
+    """
+    Create ``group[name]`` holding ``data``, compressed with :class:`ParallelChunkWriter`.
+
+    Keyword arguments are passed to the writer. Returns the new dataset.
+    """
+    data = np.asarray(data)
+    if data.ndim == 0 or len(data) == 0:
+        return group.create_dataset(name, data=data)
+    kwargs.setdefault('dtype', data.dtype)
+    with ParallelChunkWriter(group, name, data.shape, **kwargs) as writer:
+        writer.write(data)
+    return writer.dataset
+
+
+def copy_dataset_slice(source, group, name: str, start: int, end: int,
+                       on_values: Optional[Callable[[np.ndarray], None]] = None,
+                       block_samples: int = COPY_BLOCK_SAMPLES):
+    """
+    Create ``group[name]`` holding ``source[start:end]`` with the source's
+    chunking and filters, streaming in blocks of about ``block_samples``.
+
+    When ``start`` falls on a chunk boundary of a compressed 1-D source,
+    every whole chunk of the slice is copied verbatim
+    (``read_direct_chunk``/``write_direct_chunk``) and only the partial tail
+    chunk is encoded again. Otherwise the slice is re-encoded in parallel
+    with :class:`ParallelChunkWriter`.
+
+    Parameters
+    ----------
+    source : h5py.Dataset
+        1-D dataset to copy from
+    group : h5py.Group
+        Group to create the copy in
+    name : str
+        Name of the new dataset
+    start, end : int
+        Sample range of ``source`` to copy
+    on_values : callable, optional
+        Called with consecutive blocks of ``source[start:end]``, e.g. to
+        summarize the copy; verbatim chunks are decoded only for it
+    block_samples : int, optional
+        Samples decoded at a time
+
+    Returns
+    -------
+    h5py.Dataset
+        The new dataset
+    """
+    start, end, _step = slice(start, end).indices(source.shape[0])
+    end = max(start, end)
+    length = end - start
+    filters = chunk_filters(source)
+    chunk_len = source.chunks[0] if filters is not None else 1
+    block = max(chunk_len, int(block_samples) // chunk_len * chunk_len)
+
+    def blocks(lo, hi):
+        for block_start in range(lo, hi, block):
+            values = read_samples(source, block_start, min(hi, block_start + block))
+            if on_values is not None:
+                on_values(values)
+            yield values
+
+    if length == 0:
+        return group.create_dataset(name, shape=(0,), dtype=source.dtype)
+
+    if filters is None or h5py.h5z.FILTER_DEFLATE not in filters:
+        writer_options = {}
+    elif start % chunk_len or length < chunk_len:
+        writer_options = dict(
+            chunk_samples=chunk_len,
+            compression_opts=source.compression_opts,
+            shuffle=source.shuffle,
+        )
+    else:
+        writer_options = None
+    if writer_options is not None:
+        with ParallelChunkWriter(group, name, (length,), dtype=source.dtype, **writer_options) as writer:
+            for values in blocks(start, end):
+                writer.write(values)
+        return writer.dataset
+
+    target = group.create_dataset(
+        name,
+        shape=(length,),
+        dtype=source.dtype,
+        chunks=(chunk_len,),
+        compression='gzip',
+        compression_opts=source.compression_opts,
+        shuffle=source.shuffle,
+        fillvalue=source.fillvalue,
+    )
+    whole = length // chunk_len * chunk_len
+    for block_offset in range(0, whole, block):
+        block_end = min(whole, block_offset + block)
+        for offset in range(block_offset, block_end, chunk_len):
+            try:
+                filter_mask, raw = source.id.read_direct_chunk((start + offset,))
+            except (KeyError, RuntimeError, OSError):
+                continue  # Never written: the copy reads the same fill value
+            target.id.write_direct_chunk((offset,), raw, filter_mask)
+        if on_values is not None:
+            on_values(read_samples(source, start + block_offset, start + block_end))
+    if whole < length:
+        target[whole:] = np.concatenate(list(blocks(start + whole, end)))
+    return target
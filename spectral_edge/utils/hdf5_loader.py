@@ -8,8 +8,11 @@ into memory.
 Key Features:
 - Lazy loading: Only metadata is read initially
 - Chunked reading: Data loaded in segments as needed
+- Parallel decompression: gzip chunks of large reads inflated on all cores
 - Decimation: Automatic downsampling for display
 - Cross-flight support: Identify common channels across flights
+- Shared handles: loaders of the same file share one open file (with a
+  chunk cache sized for our reads) and its parsed metadata
 
 Author: SpectralEdge Development Team
 Date: 2025-01-21
@@ -18,8 +21,94 @@ Date: 2025-01-21
 import h5py
 import numpy as np
 import json
+import logging
+import os
+import threading
 from typing import Dict, List, Tuple, Optional
 
+from spectral_edge.utils.hdf5_chunks import read_samples
+from spectral_edge.utils.hdf5_overview import get_channel_overview, read_overview_window
+from spectral_edge.utils.time_history_lod import minmax_decimate
+
+logger = logging.getLogger(__name__)
+
+# Raw-data chunk cache of each shared file. h5py's 1 MiB default holds only a
+# few compressed chunks, so span reads and re-reads from other windows would
+# decompress them again; 64 MiB keeps several channels' chunks warm.
+CHUNK_CACHE_BYTES = 64 * 1024 ** 2
+CHUNK_CACHE_SLOTS = 100_003  # Prime, about 100x the chunks that fit
+CHUNK_CACHE_W0 = 0.75  # HDF5 default: prefer evicting fully read chunks
+
+
+class _SharedHDF5File:
+    """An open read-only file and its parsed metadata, shared by every loader of the file."""
+
+    def __init__(self, path: str):
+        self.h5file = h5py.File(
+            path, 'r',
+            rdcc_nbytes=CHUNK_CACHE_BYTES,
+            rdcc_nslots=CHUNK_CACHE_SLOTS,
+            rdcc_w0=CHUNK_CACHE_W0,
+        )
+        self.refs = 0
+        self.lock = threading.Lock()
+        self.metadata = None  # (file_metadata, flights, channels, time_bounds) once parsed
+        self.from_catalog = False
+
+
+_shared_files: Dict[str, _SharedHDF5File] = {}
+_shared_files_lock = threading.Lock()
+
+
+def _shared_file_key(file_path: str) -> str:
+    return os.path.realpath(os.fspath(file_path))
+
+
+def _acquire_shared_file(file_path: str) -> _SharedHDF5File:
+    key = _shared_file_key(file_path)
+    with _shared_files_lock:
+        shared = _shared_files.get(key)
+        if shared is None:
+            shared = _shared_files[key] = _SharedHDF5File(key)
+        shared.refs += 1
+        return shared
+
+
+def _release_shared_file(shared: _SharedHDF5File) -> None:
+    with _shared_files_lock:
+        shared.refs -= 1
+        if shared.refs > 0:
+            return
+        for key, entry in list(_shared_files.items()):
+            if entry is shared:
+                del _shared_files[key]
+    shared.h5file.close()
+
+
+def open_shared_file(file_path: str) -> h5py.File:
+    """
+    Read-only handle of ``file_path`` from the process-wide pool.
+
+    The handle is shared with every loader and caller of the same file and
+    stays open until each of them has called :func:`release_shared_file`
+    (or closed its loader).
+    """
+    return _acquire_shared_file(file_path).h5file
+
+
+def release_shared_file(file_path: str) -> None:
+    """Release a handle obtained from :func:`open_shared_file`."""
+    with _shared_files_lock:
+        shared = _shared_files.get(_shared_file_key(file_path))
+    if shared is not None:
+        _release_shared_file(shared)
+
+
+def shared_file_count() -> int:
+    """Number of files currently open in the pool."""
+    with _shared_files_lock:
+        return len(_shared_files)
+
 
 class FlightInfo:
     """Container for flight metadata."""
@@ -97,9 +186,12 @@ class HDF5FlightDataLoader:
     - Read data in chunks
     - Decimate data for display
     - Manage multiple flights and channels
+
+    Loaders of the same file (in any window) share one open handle and its
+    parsed metadata; the file closes when the last of them is closed.
     """
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, catalog=None):
         """
         Initialize HDF5 data loader.
         
@@ -107,19 +199,44 @@ class HDF5FlightDataLoader:
         -----------
         file_path : str
             Path to HDF5 file
+        catalog : HDF5Catalog, optional
+            Persistent metadata catalog. When given, flight/channel metadata
+            and time bounds come from the catalog instead of walking the file.
         """
         self.file_path = file_path
         self.h5file = None
+        self._shared = None
         self.flights = {}  # Dict of flight_key -> FlightInfo
         self.channels = {}  # Dict of flight_key -> Dict of channel_key -> ChannelInfo
         self.file_metadata = {}
+        self.catalog = catalog
+        self._time_bounds = {}  # Dict of (flight_key, channel_key) -> (first, last) time
         
         # Open file and load metadata
         self._load_metadata()
     
     def _load_metadata(self):
-        """Load file and flight metadata without reading data arrays."""
-        self.h5file = h5py.File(self.file_path, 'r')
+        """Take the shared file handle and its metadata, parsing it on first open."""
+        shared = _acquire_shared_file(self.file_path)
+        self._shared = shared
+        self.h5file = shared.h5file
+        with shared.lock:
+            # A catalog also supplies time bounds, so it upgrades a plain scan
+            if shared.metadata is None or (self.catalog is not None and not shared.from_catalog):
+                shared.from_catalog = self._parse_metadata()
+                shared.metadata = (self.file_metadata, self.flights, self.channels, self._time_bounds)
+            else:
+                self.file_metadata, self.flights, self.channels, self._time_bounds = shared.metadata
+
+    def _parse_metadata(self) -> bool:
+        """Read file and flight metadata without reading data arrays; True if from the catalog."""
+        if self.catalog is not None:
+            try:
+                self._load_metadata_from_catalog()
+                return True
+            except Exception as e:
+                logger.warning(f"Catalog lookup failed for {self.file_path}: {e}")
+                self.flights, self.channels, self._time_bounds = {}, {}, {}
         
         # Load file-level metadata
         if 'metadata' in self.h5file:
@@ -158,6 +275,24 @@ class HDF5FlightDataLoader:
                     self.channels[key][channel_key] = ChannelInfo(
                         channel_key, key, channel_attrs
                     )
+        return False
+    
+    def _load_metadata_from_catalog(self):
+        """Populate metadata from the persistent catalog (scans on a miss)."""
+        entry = self.catalog.get_entry(self.file_path, h5file=self.h5file)
+        self.file_metadata = entry['file_metadata']
+        for flight_key, metadata in entry['flights'].items():
+            if metadata is not None:
+                self.flights[flight_key] = FlightInfo(flight_key, metadata)
+            self.channels[flight_key] = {}
+            for channel_key, info in entry['channels'].get(flight_key, {}).items():
+                self.channels[flight_key][channel_key] = ChannelInfo(
+                    channel_key, flight_key, info['attributes']
+                )
+                if info['time_start'] is not None:
+                    self._time_bounds[(flight_key, channel_key)] = (
+                        info['time_start'], info['time_end']
+                    )
     
     def get_flights(self) -> List[FlightInfo]:
         """
@@ -279,7 +414,34 @@ class HDF5FlightDataLoader:
         if flight_key in self.channels and channel_key in self.channels[flight_key]:
             return self.channels[flight_key][channel_key]
         return None
-    
+
+    def get_channel_dataset(self, flight_key: str, channel_key: str, name: str = 'data'):
+        """
+        On-disk dataset of a channel (``'data'`` or ``'time'``) for reading sample ranges.
+
+        Slicing the returned ``h5py.Dataset`` reads only the requested
+        samples; it stays valid until the loader is closed.
+        """
+        channel_info = self.get_channel_info(flight_key, channel_key)
+        if channel_info is None:
+            raise ValueError(f"Channel {channel_key} not found in {flight_key}")
+        channel_group = self.h5file[channel_info.full_path]
+        if name not in channel_group:
+            raise ValueError(f"Missing '{name}' dataset in {channel_info.full_path}")
+        return channel_group[name]
+
+    def get_sample_rate(self, flight_key: str, channel_key: str) -> float:
+        """
+        Sample rate of a channel in Hz without loading its samples.
+
+        Uses the channel metadata, falling back to the first two time values.
+        """
+        channel_info = self.get_channel_info(flight_key, channel_key)
+        if channel_info is None:
+            raise ValueError(f"Channel {channel_key} not found in {flight_key}")
+        time_dataset = self.h5file[channel_info.full_path]['time']
+        return self._resolve_sample_rate(channel_info, time_dataset)
+
     def load_channel_data(self, flight_key: str, channel_key: str,
                          start_time: Optional[float] = None,
                          end_time: Optional[float] = None,
@@ -303,7 +465,8 @@ class HDF5FlightDataLoader:
             End time in seconds (None = end)
         decimate_for_display : bool, optional
             If True, also returns decimated data for plotting (default: True)
-            Decimation targets ~10,000 points for responsive plotting
+            Decimation targets ~10,000 points for responsive plotting and
+            keeps the min/max of each bucket so peaks are preserved
         
         Returns:
         --------
@@ -356,53 +519,20 @@ class HDF5FlightDataLoader:
             # Re-raise with context
             raise RuntimeError(f"Error accessing HDF5 data: {str(e)}") from e
 
-        # Get sample rate from channel info (already loaded in metadata)
-        sample_rate = channel_info.sample_rate
-        if not sample_rate or sample_rate <= 0:
-            if len(time_dataset) > 1:
-                t0 = float(time_dataset[0])
-                t1 = float(time_dataset[1])
-                if t1 > t0:
-                    sample_rate = 1.0 / (t1 - t0)
-            if not sample_rate or sample_rate <= 0:
-                raise ValueError(
-                    f"Invalid sample rate for {channel_info.full_path}. "
-                    "Ensure channel metadata includes sample_rate or time data is valid."
-                )
-        total_samples = len(data_dataset)
+        sample_rate = self._resolve_sample_rate(channel_info, time_dataset)
 
-        # Determine indices for time range using efficient calculation
-        # Instead of loading the full time array, we calculate indices mathematically
         if start_time is not None or end_time is not None:
-            # Read only the first time value (O(1) operation)
-            data_start_time = float(time_dataset[0])
-
-            # Calculate start index
-            if start_time is not None:
-                start_idx = max(0, int((start_time - data_start_time) * sample_rate))
-            else:
-                start_idx = 0
-
-            # Calculate end index
-            if end_time is not None:
-                end_idx = min(total_samples, int((end_time - data_start_time) * sample_rate))
-            else:
-                end_idx = total_samples
-
-            # Validate indices
-            if start_idx >= end_idx:
-                raise ValueError(
-                    f"Invalid time range: start_idx={start_idx}, end_idx={end_idx}. "
-                    f"Requested range [{start_time}, {end_time}] may be outside data bounds."
-                )
+            start_idx, end_idx = self._time_range_indices(
+                time_dataset, sample_rate, len(data_dataset), start_time, end_time
+            )
 
             # Load only the required slice directly from HDF5 (memory efficient)
-            time_full = time_dataset[start_idx:end_idx]
-            data_full = data_dataset[start_idx:end_idx]
+            time_full = read_samples(time_dataset, start_idx, end_idx)
+            data_full = read_samples(data_dataset, start_idx, end_idx)
         else:
             # Load full data - still needs full array but no intermediate copy
-            time_full = time_dataset[:]
-            data_full = data_dataset[:]
+            time_full = read_samples(time_dataset)
+            data_full = read_samples(data_dataset)
 
         # Prepare result dictionary with full resolution data
         result = {
@@ -414,10 +544,10 @@ class HDF5FlightDataLoader:
         
         # Calculate decimated data for display if requested
         if decimate_for_display and len(data_full) > 10000:
-            # Auto-decimate to ~10k points for responsive plotting
+            # Auto-decimate to ~10k points with a min/max envelope so short
+            # transients stay visible in the plot
             decimate_factor = max(1, len(data_full) // 10000)
-            time_display = time_full[::decimate_factor]
-            data_display = data_full[::decimate_factor]
+            time_display, data_display = minmax_decimate(time_full, data_full, 10000)
             
             result['time_display'] = time_display
             result['data_display'] = data_display
@@ -429,6 +559,198 @@ class HDF5FlightDataLoader:
         
         return result
     
+    def load_display_data(self, flight_key: str, channel_key: str,
+                          start_time: Optional[float] = None,
+                          end_time: Optional[float] = None,
+                          max_points: int = 10000) -> dict:
+        """
+        Load a peak-preserving display view of a channel.
+        
+        When the file carries an overview pyramid (see
+        ``spectral_edge.utils.hdf5_overview``) the view is read from the
+        level matching ``max_points``, costing kilobytes of I/O regardless of
+        channel length. Otherwise the requested range is read and reduced to
+        a min/max envelope.
+        
+        Parameters:
+        -----------
+        flight_key : str
+            Flight key
+        channel_key : str
+            Channel key
+        start_time : float, optional
+            Start time in seconds (None = beginning)
+        end_time : float, optional
+            End time in seconds (None = end)
+        max_points : int, optional
+            Approximate number of display points (default: 10000)
+        
+        Returns:
+        --------
+        dict with keys:
+            'time_display' : ndarray
+                Display time vector
+            'data_display' : ndarray
+                Display signal values
+            'sample_rate' : float
+                Original sample rate in Hz
+            'decimation_factor' : int
+                Samples represented per display point pair (1 = raw samples)
+            'from_overview' : bool
+                True when served from the stored overview pyramid
+        """
+        channel_info = self.get_channel_info(flight_key, channel_key)
+        if channel_info is None:
+            raise ValueError(f"Channel {channel_key} not found in {flight_key}")
+
+        channel_group = self.h5file[channel_info.full_path]
+        time_dataset = channel_group['time']
+        sample_rate = self._resolve_sample_rate(channel_info, time_dataset)
+        start_idx, end_idx = self._time_range_indices(
+            time_dataset, sample_rate, len(channel_group['data']), start_time, end_time
+        )
+
+        overview = get_channel_overview(channel_group)
+        window = None
+        if overview is not None:
+            window = read_overview_window(overview, start_idx, end_idx, max_points)
+        if window is not None:
+            positions, values, bucket = window
+            return {
+                'time_display': float(time_dataset[0]) + positions / sample_rate,
+                'data_display': values,
+                'sample_rate': sample_rate,
+                'decimation_factor': int(bucket),
+                'from_overview': True,
+            }
+
+        time_display, data_display = minmax_decimate(
+            time_dataset[start_idx:end_idx], channel_group['data'][start_idx:end_idx], max_points
+        )
+        return {
+            'time_display': time_display,
+            'data_display': data_display,
+            'sample_rate': sample_rate,
+            'decimation_factor': max(1, (end_idx - start_idx) // max(1, len(data_display))),
+            'from_overview': False,
+        }
+
+    @staticmethod
+    def _resolve_sample_rate(channel_info: ChannelInfo, time_dataset) -> float:
+        """Sample rate from channel metadata, falling back to the time vector."""
+        sample_rate = channel_info.sample_rate
+        if not sample_rate or sample_rate <= 0:
+            if len(time_dataset) > 1:
+                t0 = float(time_dataset[0])
+                t1 = float(time_dataset[1])
+                if t1 > t0:
+                    sample_rate = 1.0 / (t1 - t0)
+            if not sample_rate or sample_rate <= 0:
+                raise ValueError(
+                    f"Invalid sample rate for {channel_info.full_path}. "
+                    "Ensure channel metadata includes sample_rate or time data is valid."
+                )
+        return sample_rate
+
+    @staticmethod
+    def _time_range_indices(time_dataset, sample_rate: float, total_samples: int,
+                            start_time: Optional[float],
+                            end_time: Optional[float]) -> Tuple[int, int]:
+        """
+        Convert a time range to sample indices without loading the time array.
+
+        Only the first time value is read; indices are computed from the
+        sample rate.
+        """
+        if start_time is None and end_time is None:
+            return 0, total_samples
+
+        data_start_time = float(time_dataset[0])
+
+        if start_time is not None:
+            start_idx = max(0, int((start_time - data_start_time) * sample_rate))
+        else:
+            start_idx = 0
+
+        if end_time is not None:
+            end_idx = min(total_samples, int((end_time - data_start_time) * sample_rate))
+        else:
+            end_idx = total_samples
+
+        if start_idx >= end_idx:
+            raise ValueError(
+                f"Invalid time range: start_idx={start_idx}, end_idx={end_idx}. "
+                f"Requested range [{start_time}, {end_time}] may be outside data bounds."
+            )
+        return start_idx, end_idx
+
+    def get_sample_range(self, flight_key: str, channel_key: str,
+                         start_time: Optional[float] = None,
+                         end_time: Optional[float] = None) -> Tuple[int, int, float]:
+        """
+        Resolve a time range to sample indices without reading signal data.
+        
+        Parameters:
+        -----------
+        flight_key : str
+            Flight key
+        channel_key : str
+            Channel key
+        start_time : float, optional
+            Start time in seconds (None = beginning)
+        end_time : float, optional
+            End time in seconds (None = end)
+        
+        Returns:
+        --------
+        start_idx : int
+            First sample index
+        end_idx : int
+            End sample index (exclusive)
+        sample_rate : float
+            Sample rate in Hz
+        """
+        channel_info = self.get_channel_info(flight_key, channel_key)
+        if channel_info is None:
+            raise ValueError(f"Channel {channel_key} not found in {flight_key}")
+
+        channel_group = self.h5file[channel_info.full_path]
+        time_dataset = channel_group['time']
+        sample_rate = self._resolve_sample_rate(channel_info, time_dataset)
+        start_idx, end_idx = self._time_range_indices(
+            time_dataset, sample_rate, len(channel_group['data']), start_time, end_time
+        )
+        return start_idx, end_idx, sample_rate
+
+    def read_channel_samples(self, flight_key: str, channel_key: str,
+                             start_idx: int, end_idx: int) -> np.ndarray:
+        """
+        Read a block of signal samples by index, without the time vector.
+        
+        Used by block-streaming computations that only need the data values.
+        
+        Parameters:
+        -----------
+        flight_key : str
+            Flight key
+        channel_key : str
+            Channel key
+        start_idx : int
+            Starting index
+        end_idx : int
+            Ending index (exclusive)
+        
+        Returns:
+        --------
+        ndarray
+            Signal data block
+        """
+        channel_info = self.get_channel_info(flight_key, channel_key)
+        if channel_info is None:
+            raise ValueError(f"Channel {channel_key} not found in {flight_key}")
+
+        return read_samples(self.h5file[channel_info.full_path]['data'], start_idx, end_idx)
+
     def load_channel_chunk(self, flight_key: str, channel_key: str,
                           start_idx: int, end_idx: int) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -459,8 +781,8 @@ class HDF5FlightDataLoader:
             raise ValueError(f"Channel {channel_key} not found in {flight_key}")
         
         channel_group = self.h5file[channel_info.full_path]
-        time = channel_group['time'][start_idx:end_idx]
-        data = channel_group['data'][start_idx:end_idx]
+        time = read_samples(channel_group['time'], start_idx, end_idx)
+        data = read_samples(channel_group['data'], start_idx, end_idx)
         
         return time, data
     
@@ -548,7 +870,7 @@ class HDF5FlightDataLoader:
             if 'time' not in channel_group:
                 return None
             
-            return channel_group['time'][:]
+            return read_samples(channel_group['time'])
         except Exception:
             return None
     
@@ -578,6 +900,10 @@ class HDF5FlightDataLoader:
         - New method (get_time_range): Reads only 2 values (16 bytes)
         - Speedup: 30-200x faster depending on array size
         """
+        bounds = self._time_bounds.get((flight_key, channel_key))
+        if bounds is not None:
+            return f"{bounds[0]:.1f}s - {bounds[1]:.1f}s"
+        
         try:
             if self.h5file is None:
                 return "N/A"
@@ -604,10 +930,11 @@ class HDF5FlightDataLoader:
             return "N/A"
     
     def close(self):
-        """Close the HDF5 file."""
-        if self.h5file is not None:
-            self.h5file.close()
-            self.h5file = None
+        """Release the shared HDF5 file; it closes once no loader uses it."""
+        shared, self._shared = getattr(self, "_shared", None), None
+        self.h5file = None
+        if shared is not None:
+            _release_shared_file(shared)
     
     def __enter__(self):
         """Context manager entry."""
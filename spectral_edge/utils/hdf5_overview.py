@@ -0,0 +1,323 @@
+"""Min/max/mean overview pyramids stored inside SpectralEdge HDF5 files.
+
+Each indexed channel gets an ``overview`` group beside its ``data`` dataset::
+
+    /<flight>/channels/<channel>/
+        data
+        time
+        overview/            attrs: version, base_bucket, n_samples, data_signature
+            level_0          (n_samples / base_bucket, 3) float64 [min, max, mean]
+            level_1          (level_0 rows / 2, 3)
+            ...
+
+Level ``k`` summarizes ``base_bucket * 2**k`` samples per row, so a display
+request for a multi-hour channel reads a few kilobytes of the matching level
+instead of the full ``data`` dataset. Overviews are written by the DXD
+converter and the HDF5 split converters while they write each channel (see
+:class:`OverviewBuilder`) and by :func:`index_hdf5_file` (see
+``scripts/index_hdf5_overviews.py``).
+
+An overview is ignored when stale: ``data_signature`` fingerprints the data
+dataset (length, storage size, object address and a few sampled values), so
+data rewritten in place, even with the same length, is noticed without
+reading the channel.
+"""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from typing import Callable, Optional, Tuple
+
+import h5py
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+OVERVIEW_GROUP = "overview"
+OVERVIEW_VERSION = 2
+DEFAULT_BASE_BUCKET = 256
+# Coarsest level kept; smaller levels are cheaper to derive from this one
+MIN_LEVEL_ROWS = 256
+# Samples read to fingerprint a data dataset
+SIGNATURE_PROBES = 16
+
+
+def _summarize_block(values: np.ndarray, bucket: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rows of ``[min, max, mean]`` and sample counts per ``bucket`` samples."""
+    n = values.size
+    n_full = n // bucket
+    rows = np.empty((n_full + (1 if n % bucket else 0), 3), dtype=np.float64)
+    counts = np.full(rows.shape[0], bucket, dtype=np.int64)
+    if n_full:
+        blocks = values[: n_full * bucket].reshape(n_full, bucket)
+        rows[:n_full, 0] = blocks.min(axis=1)
+        rows[:n_full, 1] = blocks.max(axis=1)
+        rows[:n_full, 2] = blocks.mean(axis=1)
+    if n % bucket:
+        tail = values[n_full * bucket:]
+        rows[-1] = (tail.min(), tail.max(), tail.mean())
+        counts[-1] = tail.size
+    return rows, counts
+
+
+def _coarsen(rows: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge adjacent row pairs; the mean is weighted by sample counts."""
+    if rows.shape[0] % 2:
+        rows = np.vstack([rows, rows[-1:]])
+        counts = np.append(counts, 0)
+    left, right = rows[0::2], rows[1::2]
+    c_left, c_right = counts[0::2], counts[1::2]
+    merged_counts = c_left + c_right
+    merged = np.empty_like(left)
+    merged[:, 0] = np.minimum(left[:, 0], right[:, 0])
+    merged[:, 1] = np.maximum(left[:, 1], right[:, 1])
+    merged[:, 2] = (left[:, 2] * c_left + right[:, 2] * c_right) / merged_counts
+    return merged, merged_counts
+
+
+class OverviewBuilder:
+    """
+    Accumulate an overview pyramid from samples appended in order.
+
+    Writers feed each block as they store it (:meth:`add`), so the overview
+    costs no second pass over the channel; whole level-0 rows taken from
+    another overview can be appended with :meth:`add_rows`.
+    """
+
+    def __init__(self, base_bucket: int = DEFAULT_BASE_BUCKET):
+        self.base_bucket = int(base_bucket)
+        self.n_samples = 0
+        self._rows = []
+        self._counts = []
+        self._pending = np.empty(0, dtype=np.float64)
+
+    def add(self, values) -> None:
+        """Append a block of samples."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self.n_samples += values.size
+        if self._pending.size:
+            values = np.concatenate([self._pending, values])
+        n_full = values.size // self.base_bucket * self.base_bucket
+        if n_full:
+            rows, counts = _summarize_block(values[:n_full], self.base_bucket)
+            self._rows.append(rows)
+            self._counts.append(counts)
+        self._pending = values[n_full:].copy()
+
+    def add_rows(self, rows: np.ndarray) -> None:
+        """Append full level-0 rows (``base_bucket`` samples each) summarized elsewhere."""
+        if self._pending.size:
+            raise ValueError("Overview rows can only follow whole buckets")
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, 3)
+        self.n_samples += rows.shape[0] * self.base_bucket
+        self._rows.append(rows)
+        self._counts.append(np.full(rows.shape[0], self.base_bucket, dtype=np.int64))
+
+    def levels(self) -> list[np.ndarray]:
+        """Levels of the samples added so far, finest first."""
+        rows, counts = list(self._rows), list(self._counts)
+        if self._pending.size:
+            tail_rows, tail_counts = _summarize_block(self._pending, self.base_bucket)
+            rows.append(tail_rows)
+            counts.append(tail_counts)
+        if not rows:
+            return []
+
+        level, level_counts = np.vstack(rows), np.concatenate(counts)
+        levels = [level]
+        while level.shape[0] > MIN_LEVEL_ROWS:
+            level, level_counts = _coarsen(level, level_counts)
+            levels.append(level)
+        return levels
+
+    def write(self, channel_group: h5py.Group) -> int:
+        """Store the overview in ``channel_group`` (see :func:`write_overview_levels`)."""
+        return write_overview_levels(channel_group, self.levels(), self.base_bucket, self.n_samples)
+
+
+def compute_overview_levels(
+    read_block: Callable[[int, int], np.ndarray],
+    n_samples: int,
+    base_bucket: int = DEFAULT_BASE_BUCKET,
+    block_samples: int = 1 << 22,
+) -> list[np.ndarray]:
+    """
+    Build overview levels by streaming ``read_block(start, stop)`` blocks.
+
+    Returns a list of ``(rows, 3)`` arrays, finest first.
+    """
+    block = max(base_bucket, int(block_samples) // base_bucket * base_bucket)
+    builder = OverviewBuilder(base_bucket)
+    for start in range(0, n_samples, block):
+        builder.add(read_block(start, min(n_samples, start + block)))
+    return builder.levels()
+
+
+def data_signature(data_dataset: h5py.Dataset) -> int:
+    """
+    Cheap fingerprint of a channel's data dataset.
+
+    Combines the length, allocated storage size, object address and
+    ``SIGNATURE_PROBES`` evenly spaced sample values, so it changes when the
+    data is rewritten without reading the whole channel.
+    """
+    n_samples = int(data_dataset.shape[0])
+    layout = np.array(
+        [n_samples, data_dataset.id.get_storage_size(), h5py.h5o.get_info(data_dataset.id).addr],
+        dtype=np.int64,
+    )
+    signature = zlib.crc32(layout.tobytes())
+    if n_samples:
+        probes = np.unique(np.linspace(0, n_samples - 1, SIGNATURE_PROBES).astype(np.int64))
+        values = np.ascontiguousarray(data_dataset[probes], dtype=np.float64)
+        signature = zlib.crc32(values.tobytes(), signature)
+    return signature
+
+
+def write_overview_levels(
+    channel_group: h5py.Group,
+    levels: list[np.ndarray],
+    base_bucket: int,
+    n_samples: int,
+) -> int:
+    """
+    Store precomputed overview levels of the channel's ``data`` dataset.
+
+    ``n_samples`` is the number of samples the levels summarize; nothing is
+    written (and 0 returned) unless it matches the dataset, or when the
+    channel is too short to benefit. Call once the data is fully written,
+    since the overview records the data's signature.
+    """
+    data_dataset = channel_group["data"]
+    if (data_dataset.ndim != 1 or n_samples != data_dataset.shape[0]
+            or n_samples < 2 * base_bucket or not levels):
+        return 0
+
+    # Allocate buffered chunks so the storage size in the signature is final
+    channel_group.file.flush()
+    if OVERVIEW_GROUP in channel_group:
+        del channel_group[OVERVIEW_GROUP]
+    group = channel_group.create_group(OVERVIEW_GROUP)
+    group.attrs["version"] = OVERVIEW_VERSION
+    group.attrs["base_bucket"] = int(base_bucket)
+    group.attrs["n_samples"] = int(n_samples)
+    group.attrs["data_signature"] = data_signature(data_dataset)
+    for index, level in enumerate(levels):
+        group.create_dataset(
+            f"level_{index}",
+            data=level,
+            chunks=(min(level.shape[0], 4096), 3),
+        )
+    return len(levels)
+
+
+def write_channel_overview(
+    channel_group: h5py.Group,
+    base_bucket: int = DEFAULT_BASE_BUCKET,
+    data: Optional[np.ndarray] = None,
+) -> int:
+    """
+    Write (or replace) the overview pyramid of one channel group.
+
+    ``data`` may pass the channel's samples when they are already in memory,
+    avoiding a second read. Returns the number of levels written; channels
+    too short to benefit, or with multi-column data, are skipped.
+    """
+    data_dataset = channel_group["data"]
+    if data_dataset.ndim != 1 or data_dataset.shape[0] < 2 * base_bucket:
+        return 0
+    n_samples = int(data_dataset.shape[0])
+    source = data_dataset if data is None else np.asarray(data)
+    levels = compute_overview_levels(lambda a, b: source[a:b], n_samples, base_bucket)
+    return write_overview_levels(channel_group, levels, base_bucket, n_samples)
+
+
+def get_channel_overview(channel_group: h5py.Group) -> Optional[h5py.Group]:
+    """Overview group of a channel, or None when absent or stale."""
+    group = channel_group.get(OVERVIEW_GROUP)
+    if not isinstance(group, h5py.Group):
+        return None
+    try:
+        if int(group.attrs.get("version", -1)) != OVERVIEW_VERSION:
+            return None
+        data_dataset = channel_group["data"]
+        if int(group.attrs["n_samples"]) != int(data_dataset.shape[0]):
+            return None
+        if int(group.attrs["data_signature"]) != data_signature(data_dataset):
+            return None
+        if "level_0" not in group:
+            return None
+    except (KeyError, TypeError, ValueError):
+        return None
+    return group
+
+
+def read_overview_window(
+    overview: h5py.Group,
+    start_idx: int,
+    end_idx: int,
+    max_points: int,
+) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+    """
+    Min/max envelope of samples ``[start_idx, end_idx)`` from an overview.
+
+    Returns ``(sample_positions, values, bucket_size)`` with two points per
+    row of the finest level that fits ``max_points``, or None when even the
+    finest level is coarser than needed (read the raw samples instead).
+    Positions are fractional sample indices; each row's min is placed in the
+    first half of its bucket and its max in the second half.
+    """
+    base_bucket = int(overview.attrs["base_bucket"])
+    n_rows_needed = max(1, int(max_points) // 2)
+    bucket_needed = (end_idx - start_idx) / n_rows_needed
+    if bucket_needed < base_bucket:
+        return None
+
+    level_index = int(np.ceil(np.log2(bucket_needed / base_bucket)))
+    while level_index > 0 and f"level_{level_index}" not in overview:
+        level_index -= 1
+    level = overview[f"level_{level_index}"]
+    bucket = base_bucket << level_index
+    first = start_idx // bucket
+    last = min(level.shape[0], -(-end_idx // bucket))
+    rows = level[first:last]
+
+    starts = np.arange(first, first + rows.shape[0], dtype=np.float64) * bucket
+    positions = np.column_stack((starts + 0.25 * bucket, starts + 0.75 * bucket)).ravel()
+    values = rows[:, :2].ravel()
+    return positions, values, bucket
+
+
+def index_hdf5_file(
+    file_path: str,
+    force: bool = False,
+    base_bucket: int = DEFAULT_BASE_BUCKET,
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+) -> int:
+    """
+    Write overview pyramids for every channel of a SpectralEdge HDF5 file.
+
+    Channels that already have a current overview are skipped unless
+    ``force`` is set. Returns the number of channels indexed.
+    """
+    with h5py.File(file_path, "r+") as h5file:
+        channel_groups = []
+        for flight_key in h5file.keys():
+            flight_group = h5file[flight_key]
+            if not isinstance(flight_group, h5py.Group) or "channels" not in flight_group:
+                continue
+            for channel_key, channel_group in flight_group["channels"].items():
+                if isinstance(channel_group, h5py.Group) and "data" in channel_group:
+                    channel_groups.append((f"{flight_key}/{channel_key}", channel_group))
+
+        indexed = 0
+        for position, (label, channel_group) in enumerate(channel_groups, start=1):
+            if force or get_channel_overview(channel_group) is None:
+                if write_channel_overview(channel_group, base_bucket):
+                    indexed += 1
+            if progress_callback:
+                progress_callback(int(position / len(channel_groups) * 100), f"Indexed {label}")
+
+    logger.info("Wrote overviews for %d channel(s) in %s", indexed, file_path)
+    return indexed
@@ -0,0 +1,361 @@
+"""Segment-spectrum indexes stored inside SpectralEdge HDF5 files.
+
+An indexed channel gets one group per segment geometry beside its ``data``
+dataset::
+
+    /<flight>/channels/<channel>/
+        data
+        time
+        spectral_index/
+            hann_4096_2048/      attrs: version, n_samples, sample_rate, nperseg,
+                                        noverlap, window, user/applied filters
+                frequencies      (n_freqs,) float64
+                prefix           (n_segments + 1, n_freqs) float64 cumulative
+                                 sums of the conditioned segment periodograms
+                maximax_<window>_<step>/
+                    level_0      (n_windows, n_freqs) per-window Welch PSDs
+                    level_1      max of row pairs of level_0
+                    ...
+
+The Welch PSD of any span is the difference of two ``prefix`` rows divided by
+the segment count, and the maximax PSD of a span is the maximum of
+``O(log n_windows)`` pyramid rows, so batch runs answer arbitrary events by
+reading kilobytes of the index instead of decompressing and transforming the
+raw samples. Spans are segment-aligned (see
+:class:`spectral_edge.core.segment_index.SegmentSpectrumIndex`), and the
+whole channel is conditioned once before indexing, so results match the raw
+path except for segment phase and filter settling at event edges. Indexes are
+written by :func:`index_hdf5_file_spectra` (see
+``scripts/index_hdf5_spectra.py``) and are ignored when stale.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Optional
+
+import h5py
+import numpy as np
+
+from spectral_edge.batch.shared_stft import compute_segment_periodograms, segment_starts
+from spectral_edge.core.segment_index import SegmentSpectrumIndex
+from spectral_edge.utils.signal_conditioning import apply_robust_filtering
+
+logger = logging.getLogger(__name__)
+
+SPECTRAL_INDEX_GROUP = "spectral_index"
+SPECTRAL_INDEX_VERSION = 1
+# Segments transformed and written per batch
+_SEGMENTS_PER_BATCH = 256
+# Target bytes per dataset chunk; queries read single rows
+_CHUNK_BYTES = 1 << 18
+
+
+def segment_length(sample_rate: float, df: float, use_efficient_fft: bool = True) -> int:
+    """Welch segment length for a frequency resolution, as ``calculate_psd_welch`` derives it."""
+    nperseg = int(sample_rate / df)
+    if use_efficient_fft:
+        nperseg = 2 ** int(np.ceil(np.log2(nperseg)))
+    return nperseg
+
+
+def maximax_geometry(sample_rate: float, maximax_window: float, overlap_percent: float) -> tuple[int, int]:
+    """``(window_samples, step_samples)`` used by ``calculate_psd_maximax``."""
+    window_samples = int(maximax_window * sample_rate)
+    step_samples = window_samples - int(window_samples * overlap_percent / 100)
+    return window_samples, step_samples
+
+
+def spectral_index_name(nperseg: int, noverlap: int, window: str) -> str:
+    """Group name of the index for one segment geometry."""
+    return f"{window}_{int(nperseg)}_{int(noverlap)}"
+
+
+def _optional_attr(value: Optional[float]) -> float:
+    return np.nan if value is None else float(value)
+
+
+def _same_optional(stored, value: Optional[float]) -> bool:
+    stored = float(stored)
+    if value is None:
+        return bool(np.isnan(stored))
+    return bool(np.isclose(stored, float(value)))
+
+
+def _chunk_rows(n_rows: int, n_freqs: int) -> int:
+    return max(1, min(n_rows, _CHUNK_BYTES // (8 * n_freqs)))
+
+
+def _channel_sample_rate(channel_group: h5py.Group) -> float:
+    sample_rate = float(channel_group.attrs.get("sample_rate", 0.0) or 0.0)
+    if sample_rate <= 0 and "time" in channel_group and channel_group["time"].shape[0] > 1:
+        t0, t1 = channel_group["time"][:2]
+        if t1 > t0:
+            sample_rate = 1.0 / float(t1 - t0)
+    return sample_rate
+
+
+class StoredSpectralIndex(SegmentSpectrumIndex):
+    """
+    Segment-spectrum index backed by an HDF5 ``spectral_index`` group.
+
+    Welch queries read two ``prefix`` rows. Maximax queries for the stored
+    window geometry read the pyramid; other geometries scan the span's
+    windows from the prefix sums.
+    """
+
+    group: h5py.Group
+    applied_highpass: float
+    applied_lowpass: float
+
+    @classmethod
+    def from_group(cls, group: h5py.Group) -> "StoredSpectralIndex":
+        """Wrap a ``spectral_index/<name>`` group without reading its rows."""
+        nperseg = int(group.attrs["nperseg"])
+        index = cls.from_prefix(
+            group["prefix"],
+            group["frequencies"][:],
+            float(group.attrs["sample_rate"]),
+            nperseg,
+            nperseg - int(group.attrs["noverlap"]),
+            int(group.attrs["n_samples"]),
+        )
+        index.group = group
+        index.applied_highpass = float(group.attrs["applied_highpass"])
+        index.applied_lowpass = float(group.attrs["applied_lowpass"])
+        return index
+
+    def maximax(
+        self,
+        start_sample: int,
+        end_sample: int,
+        window_samples: int,
+        step_samples: int,
+    ) -> np.ndarray:
+        """Maximax PSD of a span (see :meth:`SegmentSpectrumIndex.maximax`)."""
+        window_samples = int(window_samples)
+        step_samples = int(step_samples)
+        pyramid = self.group.get(f"maximax_{window_samples}_{step_samples}")
+        if not isinstance(pyramid, h5py.Group):
+            return super().maximax(start_sample, end_sample, window_samples, step_samples)
+
+        first, last = self._window_range(start_sample, end_sample, window_samples, step_samples)
+        # Bottom-up range-max over aligned row pairs: at most two rows per level
+        result = None
+        lo, hi, level = first, last + 1, 0
+        while lo < hi:
+            rows = []
+            if lo & 1:
+                rows.append(lo)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                rows.append(hi)
+            for row in rows:
+                values = pyramid[f"level_{level}"][row]
+                result = values if result is None else np.maximum(result, values)
+            lo >>= 1
+            hi >>= 1
+            level += 1
+        return result
+
+
+def _write_max_pyramid(
+    group: h5py.Group,
+    index: SegmentSpectrumIndex,
+    window_samples: int,
+    step_samples: int,
+) -> None:
+    """Write per-window PSDs and their pairwise-max levels, streaming by blocks."""
+    n_rows = index.n_windows(window_samples, step_samples)
+    n_freqs = index.frequencies.size
+    block = 2 * _SEGMENTS_PER_BATCH
+
+    level = group.create_dataset(
+        "level_0", (n_rows, n_freqs), dtype=np.float64, chunks=(_chunk_rows(n_rows, n_freqs), n_freqs)
+    )
+    for first in range(0, n_rows, block):
+        starts = np.arange(first, min(n_rows, first + block), dtype=np.int64) * step_samples
+        level[first:first + starts.size] = index.window_means(starts, window_samples)
+
+    depth = 0
+    while n_rows > 1:
+        next_rows = -(-n_rows // 2)
+        depth += 1
+        coarser = group.create_dataset(
+            f"level_{depth}", (next_rows, n_freqs), dtype=np.float64,
+            chunks=(_chunk_rows(next_rows, n_freqs), n_freqs),
+        )
+        for first in range(0, n_rows, block):
+            rows = level[first:min(n_rows, first + block)]
+            if rows.shape[0] % 2:
+                rows = np.vstack([rows, rows[-1:]])
+            coarser[first // 2:first // 2 + rows.shape[0] // 2] = np.maximum(rows[0::2], rows[1::2])
+        level, n_rows = coarser, next_rows
+
+
+def write_channel_spectral_index(
+    channel_group: h5py.Group,
+    df: float,
+    window: str = "hann",
+    use_efficient_fft: bool = True,
+    user_highpass: Optional[float] = None,
+    user_lowpass: Optional[float] = None,
+    maximax_window: Optional[float] = 1.0,
+    maximax_overlap_percent: float = 50.0,
+    data: Optional[np.ndarray] = None,
+) -> Optional[h5py.Group]:
+    """
+    Write (or replace) the spectral index of one channel group.
+
+    The channel is conditioned with ``apply_robust_filtering`` using the
+    given user overrides, then its 50%-overlap Welch segments at ``df`` are
+    transformed and summed. A maximax pyramid is added for
+    ``maximax_window`` seconds at ``maximax_overlap_percent`` unless
+    ``maximax_window`` is None. ``data`` may pass the channel's samples when
+    already in memory. Returns the index group, or None for channels that
+    are multi-column or shorter than one segment.
+    """
+    data_dataset = channel_group["data"]
+    sample_rate = _channel_sample_rate(channel_group)
+    if data_dataset.ndim != 1 or sample_rate <= 0:
+        return None
+    nperseg = segment_length(sample_rate, df, use_efficient_fft)
+    noverlap = nperseg // 2
+    n_samples = int(data_dataset.shape[0])
+    if nperseg > n_samples:
+        return None
+
+    source = data_dataset[:] if data is None else np.asarray(data)
+    conditioned, applied_highpass, applied_lowpass, _messages = apply_robust_filtering(
+        source, sample_rate, user_highpass=user_highpass, user_lowpass=user_lowpass
+    )
+
+    parent = channel_group.require_group(SPECTRAL_INDEX_GROUP)
+    name = spectral_index_name(nperseg, noverlap, window)
+    if name in parent:
+        del parent[name]
+    group = parent.create_group(name)
+
+    starts = segment_starts(n_samples, nperseg, nperseg - noverlap)
+    n_freqs = nperseg // 2 + 1
+    group.create_dataset("frequencies", data=np.fft.rfftfreq(nperseg, d=1.0 / sample_rate))
+    prefix = group.create_dataset(
+        "prefix", (starts.size + 1, n_freqs), dtype=np.float64,
+        chunks=(_chunk_rows(starts.size + 1, n_freqs), n_freqs),
+    )
+    carry = np.zeros(n_freqs, dtype=np.float64)
+    prefix[0] = carry
+    for first in range(0, starts.size, _SEGMENTS_PER_BATCH):
+        batch = starts[first:first + _SEGMENTS_PER_BATCH]
+        _freqs, periodograms = compute_segment_periodograms(
+            conditioned, sample_rate, batch, nperseg, window=window
+        )
+        rows = np.cumsum(periodograms.T, axis=0) + carry
+        prefix[first + 1:first + 1 + batch.size] = rows
+        carry = rows[-1]
+    del conditioned
+
+    if maximax_window is not None:
+        window_samples, step_samples = maximax_geometry(sample_rate, maximax_window, maximax_overlap_percent)
+        index = SegmentSpectrumIndex.from_prefix(
+            prefix, group["frequencies"][:], sample_rate, nperseg, nperseg - noverlap, n_samples
+        )
+        if step_samples > 0 and nperseg <= window_samples <= n_samples:
+            pyramid = group.create_group(f"maximax_{window_samples}_{step_samples}")
+            _write_max_pyramid(pyramid, index, window_samples, step_samples)
+
+    # Attributes last, so an interrupted write is never mistaken for a current index
+    group.attrs["n_samples"] = n_samples
+    group.attrs["sample_rate"] = float(sample_rate)
+    group.attrs["nperseg"] = int(nperseg)
+    group.attrs["noverlap"] = int(noverlap)
+    group.attrs["window"] = str(window)
+    group.attrs["user_highpass"] = _optional_attr(user_highpass)
+    group.attrs["user_lowpass"] = _optional_attr(user_lowpass)
+    group.attrs["applied_highpass"] = float(applied_highpass)
+    group.attrs["applied_lowpass"] = float(applied_lowpass)
+    group.attrs["version"] = SPECTRAL_INDEX_VERSION
+    return group
+
+
+def get_channel_spectral_index(
+    channel_group: h5py.Group,
+    nperseg: int,
+    noverlap: int,
+    window: str = "hann",
+    user_highpass: Optional[float] = None,
+    user_lowpass: Optional[float] = None,
+) -> Optional[StoredSpectralIndex]:
+    """Stored index of a channel for one geometry and conditioning, or None when absent or stale."""
+    parent = channel_group.get(SPECTRAL_INDEX_GROUP)
+    if not isinstance(parent, h5py.Group):
+        return None
+    group = parent.get(spectral_index_name(nperseg, noverlap, window))
+    if not isinstance(group, h5py.Group):
+        return None
+    try:
+        attrs = group.attrs
+        if int(attrs.get("version", -1)) != SPECTRAL_INDEX_VERSION:
+            return None
+        if int(attrs["n_samples"]) != int(channel_group["data"].shape[0]):
+            return None
+        if not np.isclose(float(attrs["sample_rate"]), _channel_sample_rate(channel_group)):
+            return None
+        if not (_same_optional(attrs["user_highpass"], user_highpass)
+                and _same_optional(attrs["user_lowpass"], user_lowpass)):
+            return None
+        return StoredSpectralIndex.from_group(group)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def index_hdf5_file_spectra(
+    file_path: str,
+    df: float,
+    window: str = "hann",
+    use_efficient_fft: bool = True,
+    user_highpass: Optional[float] = None,
+    user_lowpass: Optional[float] = None,
+    maximax_window: Optional[float] = 1.0,
+    maximax_overlap_percent: float = 50.0,
+    force: bool = False,
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+) -> int:
+    """
+    Write spectral indexes for every channel of a SpectralEdge HDF5 file.
+
+    Channels that already have a current index for the geometry are skipped
+    unless ``force`` is set. Returns the number of channels indexed.
+    """
+    with h5py.File(file_path, "r+") as h5file:
+        channel_groups = []
+        for flight_key in h5file.keys():
+            flight_group = h5file[flight_key]
+            if not isinstance(flight_group, h5py.Group) or "channels" not in flight_group:
+                continue
+            for channel_key, channel_group in flight_group["channels"].items():
+                if isinstance(channel_group, h5py.Group) and "data" in channel_group:
+                    channel_groups.append((f"{flight_key}/{channel_key}", channel_group))
+
+        indexed = 0
+        for position, (label, channel_group) in enumerate(channel_groups, start=1):
+            sample_rate = _channel_sample_rate(channel_group)
+            current = None
+            if not force and sample_rate > 0:
+                nperseg = segment_length(sample_rate, df, use_efficient_fft)
+                current = get_channel_spectral_index(
+                    channel_group, nperseg, nperseg // 2, window, user_highpass, user_lowpass
+                )
+            if current is None:
+                group = write_channel_spectral_index(
+                    channel_group, df, window, use_efficient_fft, user_highpass, user_lowpass,
+                    maximax_window, maximax_overlap_percent,
+                )
+                if group is not None:
+                    indexed += 1
+            if progress_callback:
+                progress_callback(int(position / len(channel_groups) * 100), f"Indexed {label}")
+
+    logger.info("Wrote spectral indexes for %d channel(s) in %s", indexed, file_path)
+    return indexed
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Mapping, Optional, Tuple
+import itertools
+import weakref
+from typing import Hashable, Mapping, Optional, Tuple
 
 import numpy as np
 from scipy import signal as scipy_signal
 from scipy.ndimage import uniform_filter1d
 
+from spectral_edge.utils.channel_cache import ArrayLRUCache, LazyArray, materialize
+
 RUNNING_MEAN_REMOVED_TEMPLATE = "Running Mean Removed ({window_seconds}s)"
 RUNNING_MEAN_NOT_REMOVED = "Running Mean Not Removed"
 
@@ -15,6 +19,12 @@ BASELINE_HIGHPASS_HZ = 1.0
 BASELINE_LOWPASS_FRACTION = 0.45
 BASELINE_FILTER_ORDER = 4
 
+# Cycles of the baseline highpass kept as context around a conditioned span
+CONDITIONING_PAD_HIGHPASS_CYCLES = 5.0
+
+# Byte budget of the session-wide cache of conditioned signals
+CONDITIONED_CACHE_BYTES = 2 * 1024 ** 3
+
 
 def _coerce_optional_float(value) -> Optional[float]:
     """Convert a value to float when possible, else None."""
@@ -213,6 +223,14 @@ def remove_running_mean(
     return signal_arr - running_mean
 
 
+def _pipeline_user_cutoffs(filter_settings: Optional[Mapping[str, object]]) -> Tuple[Optional[float], Optional[float]]:
+    """User cutoffs the processing pipeline applies for a settings mapping."""
+    settings = dict(filter_settings or {})
+    if bool(settings.get("enabled", False)) or "user_highpass_hz" in settings or "user_lowpass_hz" in settings:
+        return _extract_user_cutoffs(settings)
+    return None, None
+
+
 def apply_processing_pipeline(
     signal: np.ndarray,
     sample_rate: Optional[float],
@@ -227,12 +245,7 @@ def apply_processing_pipeline(
     if sample_rate is None or sample_rate <= 0:
         return signal_arr.copy()
 
-    settings = dict(filter_settings or {})
-    user_highpass = None
-    user_lowpass = None
-    if bool(settings.get("enabled", False)) or "user_highpass_hz" in settings or "user_lowpass_hz" in settings:
-        user_highpass, user_lowpass = _extract_user_cutoffs(settings)
-
+    user_highpass, user_lowpass = _pipeline_user_cutoffs(filter_settings)
     processed, _hp, _lp, _messages = apply_robust_filtering(
         signal_arr,
         float(sample_rate),
@@ -244,6 +257,61 @@ def apply_processing_pipeline(
     return processed
 
 
+def conditioning_pad_samples(
+    sample_rate: Optional[float],
+    remove_mean: bool = False,
+    mean_window_seconds: float = 1.0,
+) -> int:
+    """
+    Context samples needed on each side of a span so that conditioning the
+    span alone matches conditioning the whole signal.
+
+    Covers the settling time of the baseline highpass (the lowest cutoff the
+    pipeline applies) plus, with running-mean removal, one mean window.
+    """
+    if sample_rate is None or not np.isfinite(sample_rate) or sample_rate <= 0:
+        return 0
+    seconds = CONDITIONING_PAD_HIGHPASS_CYCLES / BASELINE_HIGHPASS_HZ
+    if remove_mean:
+        seconds += max(0.0, float(mean_window_seconds))
+    return int(np.ceil(seconds * float(sample_rate)))
+
+
+def apply_processing_pipeline_to_span(
+    signal,
+    start: int,
+    end: int,
+    sample_rate: Optional[float],
+    filter_settings: Optional[Mapping[str, object]] = None,
+    remove_mean: bool = False,
+    mean_window_seconds: float = 1.0,
+) -> np.ndarray:
+    """
+    Condition samples ``[start, end)`` of a long signal, reading only a padded span.
+
+    ``signal`` may be any sliceable array, such as an ``h5py.Dataset``. The
+    span is conditioned together with :func:`conditioning_pad_samples` of
+    surrounding samples (clipped to the signal) and trimmed, so adjacent
+    spans join without filter edge transients.
+    """
+    total = len(signal)
+    start = max(0, int(start))
+    end = min(total, int(end))
+    if end <= start:
+        return np.empty(0, dtype=np.float64)
+    pad = conditioning_pad_samples(sample_rate, remove_mean, mean_window_seconds)
+    read_start = max(0, start - pad)
+    read_end = min(total, end + pad)
+    processed = apply_processing_pipeline(
+        np.asarray(signal[read_start:read_end], dtype=np.float64),
+        sample_rate,
+        filter_settings=filter_settings,
+        remove_mean=remove_mean,
+        mean_window_seconds=mean_window_seconds,
+    )
+    return processed[start - read_start:end - read_start]
+
+
 def build_processing_note(
     filter_settings: Optional[Mapping[str, object]],
     remove_mean: bool,
@@ -278,3 +346,229 @@ def build_processing_note(
         mean_note = RUNNING_MEAN_NOT_REMOVED
 
     return f"{filter_note} | {mean_note}"
+
+
+# Session-wide cache of conditioned signals. Every analysis window opened in
+# this process conditions channels through it, so a channel filtered for the
+# PSD is not filtered again for the spectrogram or statistics views.
+# Applied-filter info lives exactly as long as its cached array.
+_filter_info = {}  # cache key -> (applied_highpass_hz, applied_lowpass_hz, info_messages)
+_conditioned_cache = ArrayLRUCache(
+    CONDITIONED_CACHE_BYTES, on_evict=lambda key: _filter_info.pop(key, None)
+)
+_array_tokens = {}  # id(ndarray or handle) -> token, while the object is alive
+_dead_tokens = []  # tokens of collected objects whose entries are still cached
+_token_counter = itertools.count()
+
+
+def conditioned_signal_cache() -> ArrayLRUCache:
+    """The session-wide cache of conditioned signals (resize it to change the budget)."""
+    return _conditioned_cache
+
+
+def _object_token(obj) -> Optional[int]:
+    """Token identifying ``obj`` until it is garbage collected (None if it cannot be tracked)."""
+    token = _array_tokens.get(id(obj))
+    if token is None:
+        try:
+            weakref.ref(obj)
+        except TypeError:
+            return None
+        token = next(_token_counter)
+        _array_tokens[id(obj)] = token
+        weakref.finalize(obj, _forget_token, id(obj), token)
+    return token
+
+
+def _forget_token(object_id: int, token: int) -> None:
+    # Runs from the garbage collector, possibly while the cache lock is held,
+    # so the entries are dropped on the next cache access instead
+    if _array_tokens.get(object_id) == token:
+        del _array_tokens[object_id]
+    _dead_tokens.append(token)
+
+
+def _drop_dead_entries() -> None:
+    if not _dead_tokens:
+        return
+    dead = set()
+    while _dead_tokens:
+        dead.add(_dead_tokens.pop())
+    _conditioned_cache.discard_where(lambda key: key[1][0] == "object" and key[1][1] in dead)
+
+
+def channel_identity(signal) -> Optional[Hashable]:
+    """
+    Hashable identity of a channel's samples, shared by every window that holds them.
+
+    HDF5-backed channels (``h5py.Dataset`` or a ``LazyArray`` with a
+    ``source``) are identified by file and dataset path. In-memory arrays are
+    identified by the array owning their memory plus the view's offset,
+    stride and dtype, for as long as that array is alive. Returns None for
+    objects that cannot be tracked.
+    """
+    source = getattr(signal, "source", None)
+    if source is not None:
+        return source
+    if hasattr(signal, "file") and hasattr(signal, "name"):
+        return ("hdf5", signal.file.filename, signal.name)
+    if isinstance(signal, np.ndarray):
+        root = signal
+        while isinstance(root.base, np.ndarray):
+            root = root.base
+        token = _object_token(root)
+        offset = signal.__array_interface__["data"][0] - root.__array_interface__["data"][0]
+        return None if token is None else ("object", token, offset, signal.strides, signal.dtype.str)
+    token = _object_token(signal)
+    return None if token is None else ("object", token)
+
+
+def _conditioned_key(signal, sample_rate, user_highpass, user_lowpass, mean_window_seconds) -> Optional[tuple]:
+    identity = channel_identity(signal)
+    if identity is None:
+        return None
+    return (
+        "conditioned",
+        identity,
+        len(signal),
+        float(sample_rate),
+        _coerce_optional_float(user_highpass),
+        _coerce_optional_float(user_lowpass),
+        None if mean_window_seconds is None else float(mean_window_seconds),
+    )
+
+
+def cached_robust_filtering(
+    signal,
+    sample_rate: float,
+    user_highpass: Optional[float] = None,
+    user_lowpass: Optional[float] = None,
+    samples: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, float, float, list[str]]:
+    """
+    :func:`apply_robust_filtering` through the session-wide conditioned-signal cache.
+
+    ``signal`` may be an array, ``LazyArray`` or ``h5py.Dataset``; it is only
+    read on a cache miss, unless its samples are passed as ``samples``. The
+    returned array is shared and read-only.
+    """
+    _drop_dead_entries()
+    key = _conditioned_key(signal, sample_rate, user_highpass, user_lowpass, None)
+    if key is None:
+        return apply_robust_filtering(
+            materialize(signal), sample_rate, user_highpass=user_highpass, user_lowpass=user_lowpass
+        )
+    filtered = _conditioned_cache.get(key)
+    info = _filter_info.get(key)
+    if filtered is None or info is None:
+        data = samples if samples is not None else materialize(signal)
+        filtered, applied_highpass, applied_lowpass, messages = apply_robust_filtering(
+            data, sample_rate, user_highpass=user_highpass, user_lowpass=user_lowpass
+        )
+        filtered.setflags(write=False)
+        info = (float(applied_highpass), float(applied_lowpass), list(messages))
+        _filter_info[key] = info
+        _conditioned_cache.put(key, filtered)
+    applied_highpass, applied_lowpass, messages = info
+    return filtered, applied_highpass, applied_lowpass, list(messages)
+
+
+def peek_conditioned_signal(
+    signal,
+    sample_rate: Optional[float],
+    filter_settings: Optional[Mapping[str, object]] = None,
+    remove_mean: bool = False,
+    mean_window_seconds: float = 1.0,
+) -> Optional[np.ndarray]:
+    """
+    The :func:`cached_processing_pipeline` result for ``signal`` if it is already cached, else None.
+
+    Never conditions or reads the signal, so callers that can work span by
+    span use the shared array only when another view has paid for it.
+    """
+    if sample_rate is None or sample_rate <= 0:
+        return None
+    _drop_dead_entries()
+    user_highpass, user_lowpass = _pipeline_user_cutoffs(filter_settings)
+    key = _conditioned_key(
+        signal, sample_rate, user_highpass, user_lowpass, mean_window_seconds if remove_mean else None
+    )
+    return None if key is None else _conditioned_cache.get(key)
+
+
+def cached_processing_pipeline(
+    signal,
+    sample_rate: Optional[float],
+    filter_settings: Optional[Mapping[str, object]] = None,
+    remove_mean: bool = False,
+    mean_window_seconds: float = 1.0,
+) -> np.ndarray:
+    """
+    :func:`apply_processing_pipeline` through the session-wide conditioned-signal cache.
+
+    The filtered signal is cached before running-mean removal too, so views
+    that differ only in mean removal share the filtering. The returned
+    array is shared and read-only.
+    """
+    if len(signal) == 0 or sample_rate is None or sample_rate <= 0 or channel_identity(signal) is None:
+        return apply_processing_pipeline(materialize(signal), sample_rate, filter_settings,
+                                         remove_mean, mean_window_seconds)
+
+    user_highpass, user_lowpass = _pipeline_user_cutoffs(filter_settings)
+    if not remove_mean:
+        return cached_robust_filtering(signal, float(sample_rate), user_highpass, user_lowpass)[0]
+
+    _drop_dead_entries()
+    key = _conditioned_key(signal, sample_rate, user_highpass, user_lowpass, mean_window_seconds)
+    processed = _conditioned_cache.get(key)
+    if processed is None:
+        filtered = cached_robust_filtering(signal, float(sample_rate), user_highpass, user_lowpass)[0]
+        processed = remove_running_mean(filtered, sample_rate, mean_window_seconds)
+        processed.setflags(write=False)
+        _conditioned_cache.put(key, processed)
+    return processed
+
+
+def conditioned_signal_array(
+    signal,
+    sample_rate: float,
+    user_highpass: Optional[float] = None,
+    user_lowpass: Optional[float] = None,
+):
+    """
+    Lazy handle on the conditioned ``signal`` held in the session-wide cache.
+
+    The handle re-conditions the signal through :func:`cached_robust_filtering`
+    after eviction, so callers keep no copy of their own outside the
+    session budget. Signals that cannot be tracked are conditioned at once
+    and returned as an array.
+    """
+    key = _conditioned_key(signal, sample_rate, user_highpass, user_lowpass, None)
+    if key is None:
+        return cached_robust_filtering(signal, sample_rate, user_highpass, user_lowpass)[0]
+    return LazyArray(
+        _conditioned_cache,
+        key,
+        lambda: cached_robust_filtering(signal, sample_rate, user_highpass, user_lowpass)[0],
+        len(signal),
+    )
+
+
+def discard_conditioned_signals(
+    signals,
+    user_highpass: Optional[float] = None,
+    user_lowpass: Optional[float] = None,
+) -> None:
+    """
+    Drop cached conditioned versions of ``signals`` made with other user cutoffs.
+
+    Used when the filter settings of a view change, so conditioned arrays of
+    the previous settings do not hold the session budget until they age out.
+    """
+    _drop_dead_entries()
+    identities = {identity for identity in map(channel_identity, signals) if identity is not None}
+    cutoffs = (_coerce_optional_float(user_highpass), _coerce_optional_float(user_lowpass))
+
+    _conditioned_cache.discard_where(
+        lambda key: key[1] in identities and (key[4], key[5]) != cutoffs
+    )
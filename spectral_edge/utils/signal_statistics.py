@@ -0,0 +1,467 @@
+"""Shared statistics engine for batch reports and the statistics window."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+from spectral_edge.utils.signal_conditioning import apply_processing_pipeline_to_span, peek_conditioned_signal
+from spectral_edge.utils.statistics_overlays import fit_rayleigh_from_power, fit_rayleigh_from_signal
+
+# Samples processed per block by the streaming/blocked computations
+DEFAULT_BLOCK_SAMPLES = 1 << 20
+
+# Windows with variance below this are treated as constant (skew/kurtosis = 0)
+_MIN_VARIANCE = 1e-30
+
+_RUNNING_KEYS = ("mean", "std", "skewness", "kurtosis")
+
+
+class StreamingMoments:
+    """
+    Exact single-pass accumulator for mean, std, skewness, kurtosis and extrema.
+
+    Blocks are combined with the pairwise central-moment update (Chan/Pebay),
+    which stays accurate for long signals with large offsets. Skewness and
+    kurtosis follow ``scipy.stats.skew``/``kurtosis`` defaults (biased,
+    Fisher kurtosis).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._m3 = 0.0
+        self._m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, block: np.ndarray) -> None:
+        """Fold a block of samples into the running moments."""
+        values = np.asarray(block, dtype=np.float64).ravel()
+        nb = values.size
+        if nb == 0:
+            return
+
+        mean_b = float(np.mean(values))
+        dev = values - mean_b
+        dev2 = dev * dev
+        m2_b = float(np.sum(dev2))
+        m3_b = float(np.sum(dev2 * dev))
+        m4_b = float(np.sum(dev2 * dev2))
+        self.min = min(self.min, float(np.min(values)))
+        self.max = max(self.max, float(np.max(values)))
+
+        na = self.count
+        if na == 0:
+            self.count, self.mean = nb, mean_b
+            self._m2, self._m3, self._m4 = m2_b, m3_b, m4_b
+            return
+
+        n = na + nb
+        delta = mean_b - self.mean
+        m2_a, m3_a, m4_a = self._m2, self._m3, self._m4
+        self._m4 = (
+            m4_a + m4_b
+            + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+            + 6.0 * delta ** 2 * (na * na * m2_b + nb * nb * m2_a) / n ** 2
+            + 4.0 * delta * (na * m3_b - nb * m3_a) / n
+        )
+        self._m3 = (
+            m3_a + m3_b
+            + delta ** 3 * na * nb * (na - nb) / n ** 2
+            + 3.0 * delta * (na * m2_b - nb * m2_a) / n
+        )
+        self._m2 = m2_a + m2_b + delta ** 2 * na * nb / n
+        self.mean += delta * nb / n
+        self.count = n
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(max(self.variance, 0.0)))
+
+    @property
+    def skewness(self) -> float:
+        if self.count == 0 or self.variance <= _MIN_VARIANCE:
+            return 0.0
+        return float((self._m3 / self.count) / self.variance ** 1.5)
+
+    @property
+    def kurtosis(self) -> float:
+        if self.count == 0 or self.variance <= _MIN_VARIANCE:
+            return 0.0
+        return float((self._m4 / self.count) / self.variance ** 2 - 3.0)
+
+    @property
+    def rms(self) -> float:
+        return float(np.sqrt(self.mean ** 2 + self.variance)) if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return overall statistics in the report/window summary format."""
+        rms = self.rms
+        peak = max(abs(self.min), abs(self.max)) if self.count else 0.0
+        return {
+            "mean": float(self.mean),
+            "std": self.std,
+            "skewness": self.skewness,
+            "kurtosis": self.kurtosis,
+            "min": float(self.min) if self.count else 0.0,
+            "max": float(self.max) if self.count else 0.0,
+            "rms": rms,
+            "crest_factor": float(peak / rms) if rms > 1e-12 else 0.0,
+        }
+
+
+def overall_moments(signal: np.ndarray, block_samples: int = DEFAULT_BLOCK_SAMPLES) -> StreamingMoments:
+    """Accumulate exact overall moments of ``signal`` in one blocked pass."""
+    values = np.asarray(signal)
+    moments = StreamingMoments()
+    for start in range(0, values.size, block_samples):
+        moments.update(values[start:start + block_samples])
+    return moments
+
+
+def running_moments(
+    signal: np.ndarray,
+    window_samples: int,
+    block_samples: int = DEFAULT_BLOCK_SAMPLES,
+) -> Dict[str, np.ndarray]:
+    """
+    Running mean, std, skewness and kurtosis for every window position.
+
+    Windows are centered and the signal edges are extended with the nearest
+    value, matching ``scipy.ndimage.uniform_filter1d(mode="nearest")``. Window
+    power sums come from cumulative sums computed per block about the block
+    mean, so precision depends on the block length rather than the signal
+    length.
+
+    Returns
+    -------
+    dict
+        'mean', 'std', 'skewness', 'kurtosis' arrays, each the length of ``signal``.
+    """
+    values = np.asarray(signal, dtype=np.float64)
+    n = values.size
+    window = int(window_samples)
+    if n == 0 or window < 1:
+        empty = np.array([], dtype=np.float64)
+        return {key: empty for key in _RUNNING_KEYS}
+
+    pad_left = window // 2
+    padded = np.pad(values, (pad_left, window - 1 - pad_left), mode="edge")
+
+    out = {key: np.empty(n, dtype=np.float64) for key in _RUNNING_KEYS}
+    block = max(int(block_samples), 1)
+    cumulative = np.zeros(min(n, block) + window, dtype=np.float64)
+    for start in range(0, n, block):
+        stop = min(n, start + block)
+        moments = _window_moments(padded[start:stop + window - 1], window, cumulative)
+        for key in _RUNNING_KEYS:
+            out[key][start:stop] = moments[key]
+
+    return out
+
+
+def _window_moments(
+    segment: np.ndarray,
+    window: int,
+    cumulative: np.ndarray,
+    positions: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Moments of every full ``window`` in ``segment`` (or only at ``positions``).
+
+    Power sums are taken about the segment mean; ``cumulative`` is a scratch
+    buffer of at least ``segment.size + 1`` samples.
+    """
+    shift = float(np.mean(segment))
+    x1 = segment - shift
+    x2 = x1 * x1
+
+    length = segment.size
+    sums = []
+    for power in (x1, x2, x2 * x1, x2 * x2):
+        np.cumsum(power, out=cumulative[1:length + 1])
+        if positions is None:
+            window_sums = cumulative[window:length + 1] - cumulative[:length + 1 - window]
+        else:
+            window_sums = cumulative[positions + window] - cumulative[positions]
+        sums.append(window_sums / window)
+    m1, m2, m3, m4 = sums
+
+    m1_sq = m1 * m1
+    var = np.maximum(m2 - m1_sq, 0.0)
+    mu3 = m3 - m1 * (3.0 * m2 - 2.0 * m1_sq)
+    mu4 = m4 - m1 * (4.0 * m3 - m1 * (6.0 * m2 - 3.0 * m1_sq))
+    valid = var > _MIN_VARIANCE
+    safe_var = np.where(valid, var, 1.0)
+
+    return {
+        "mean": m1 + shift,
+        "std": np.sqrt(var),
+        "skewness": np.where(valid, mu3 / (safe_var * np.sqrt(safe_var)), 0.0),
+        "kurtosis": np.where(valid, mu4 / (safe_var * safe_var) - 3.0, 0.0),
+    }
+
+
+def _plot_step(n_samples: int, max_plot_points: int) -> int:
+    """Stride used to decimate running traces to ``max_plot_points``."""
+    if max_plot_points and n_samples > max_plot_points:
+        return max(1, n_samples // int(max_plot_points))
+    return 1
+
+
+def compute_signal_statistics(
+    signal: np.ndarray,
+    sample_rate: float,
+    n_bins: int = 50,
+    window_seconds: float = 1.0,
+    max_plot_points: int = 5000,
+    block_samples: int = DEFAULT_BLOCK_SAMPLES,
+) -> Dict[str, Dict]:
+    """
+    Compute PDF, running statistics and exact overall statistics for a signal.
+
+    Returns
+    -------
+    dict with keys:
+      pdf: bins, counts, mean, std, rayleigh_scale, rayleigh_x_max
+      running: time, mean, std, skewness_time, skewness, kurtosis
+        (empty when the signal is shorter than one window)
+      overall: mean, std, skewness, kurtosis, min, max, rms, crest_factor
+    """
+    signal = np.asarray(signal)
+    moments = overall_moments(signal, block_samples=block_samples)
+    overall = moments.as_dict()
+
+    counts, bin_edges = np.histogram(signal, bins=int(n_bins), density=True)
+    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
+    rayleigh_scale, rayleigh_x_max = fit_rayleigh_from_signal(signal)
+
+    window_samples = max(10, int(window_seconds * sample_rate))
+    running: Dict[str, np.ndarray] = {}
+    if len(signal) >= window_samples:
+        traces = running_moments(signal, window_samples, block_samples=block_samples)
+
+        # Downsample for plotting
+        step = _plot_step(len(signal), max_plot_points)
+        time = np.arange(0, len(signal), step) / sample_rate
+        running["time"] = time
+        running["skewness_time"] = time
+        for key in _RUNNING_KEYS:
+            running[key] = traces[key][::step]
+
+    return {
+        "pdf": {
+            "bins": bin_centers,
+            "counts": counts,
+            "mean": overall["mean"],
+            "std": overall["std"],
+            "rayleigh_scale": rayleigh_scale,
+            "rayleigh_x_max": rayleigh_x_max,
+        },
+        "running": running,
+        "overall": overall,
+    }
+
+
+
+def _read_padded(
+    read_block: Callable[[int, int], np.ndarray],
+    n_samples: int,
+    start: int,
+    stop: int,
+) -> np.ndarray:
+    """Read samples ``[start, stop)``, extending past either end with the edge value."""
+    lo = max(start, 0)
+    hi = min(stop, n_samples)
+    data = np.asarray(read_block(lo, hi), dtype=np.float64).ravel()
+    if start < lo or stop > hi:
+        data = np.pad(data, (lo - start, stop - hi), mode="edge")
+    return data
+
+
+def compute_streaming_statistics(
+    read_block: Callable[[int, int], np.ndarray],
+    n_samples: int,
+    sample_rate: float,
+    n_bins: int = 50,
+    window_seconds: float = 1.0,
+    max_plot_points: int = 5000,
+    block_samples: int = DEFAULT_BLOCK_SAMPLES,
+    value_range: Optional[Tuple[float, float]] = None,
+) -> Dict[str, Dict]:
+    """
+    Out-of-core variant of :func:`compute_signal_statistics`.
+
+    The signal is never held in memory: ``read_block(start, stop)`` is called
+    for consecutive blocks of ``block_samples`` (plus one running window of
+    halo), so memory use is independent of the signal length. Results match
+    the in-memory engine for the same ``block_samples``.
+
+    The histogram range defaults to the signal min/max, which costs one extra
+    read pass. Passing a known ``value_range`` makes the computation a single
+    pass.
+
+    Returns
+    -------
+    dict
+        Same layout as :func:`compute_signal_statistics`.
+    """
+    n = int(n_samples)
+    block = max(int(block_samples), 1)
+    window = max(10, int(window_seconds * sample_rate))
+    has_running = n >= window
+    pad_left = window // 2
+
+    moments = StreamingMoments()
+    finite_count = 0
+    sum_squares = 0.0
+    peak_amplitude = 0.0
+
+    def accumulate(values: np.ndarray) -> None:
+        nonlocal finite_count, sum_squares, peak_amplitude
+        moments.update(values)
+        finite = values if np.isfinite(values).all() else values[np.isfinite(values)]
+        if finite.size:
+            finite_count += finite.size
+            sum_squares += float(np.dot(finite, finite))
+            peak_amplitude = max(peak_amplitude, float(np.max(np.abs(finite))))
+
+    single_pass = value_range is not None
+    if not single_pass:
+        for start in range(0, n, block):
+            accumulate(_read_padded(read_block, n, start, min(n, start + block)))
+        value_range = (moments.min, moments.max) if moments.count else (0.0, 1.0)
+
+    n_bins = int(n_bins)
+    counts = np.zeros(n_bins, dtype=np.int64)
+    bin_edges = np.histogram_bin_edges(np.array([], dtype=np.float64), bins=n_bins, range=value_range)
+
+    step = _plot_step(n, max_plot_points)
+    traces = {key: [] for key in _RUNNING_KEYS}
+    cumulative = np.zeros(min(n, block) + window, dtype=np.float64) if has_running else None
+
+    for start in range(0, n, block):
+        stop = min(n, start + block)
+        if has_running:
+            segment = _read_padded(read_block, n, start - pad_left, stop + window - 1 - pad_left)
+            values = segment[pad_left:pad_left + stop - start]
+        else:
+            values = _read_padded(read_block, n, start, stop)
+        if single_pass:
+            accumulate(values)
+        counts += np.histogram(values, bins=n_bins, range=value_range)[0]
+
+        if has_running:
+            first = -(-start // step) * step
+            positions = np.arange(first, stop, step, dtype=np.int64) - start
+            if positions.size:
+                block_moments = _window_moments(segment, window, cumulative, positions)
+                for key in _RUNNING_KEYS:
+                    traces[key].append(block_moments[key])
+
+    total = counts.sum()
+    density = counts / np.diff(bin_edges) / total if total else counts.astype(np.float64)
+    overall = moments.as_dict()
+    mean_square = sum_squares / finite_count if finite_count else 0.0
+    rayleigh_scale, rayleigh_x_max = fit_rayleigh_from_power(finite_count, mean_square, peak_amplitude)
+
+    running: Dict[str, np.ndarray] = {}
+    if has_running:
+        time = np.arange(0, n, step) / sample_rate
+        running["time"] = time
+        running["skewness_time"] = time
+        for key in _RUNNING_KEYS:
+            running[key] = np.concatenate(traces[key])
+
+    return {
+        "pdf": {
+            "bins": (bin_edges[:-1] + bin_edges[1:]) / 2,
+            "counts": density,
+            "mean": overall["mean"],
+            "std": overall["std"],
+            "rayleigh_scale": rayleigh_scale,
+            "rayleigh_x_max": rayleigh_x_max,
+        },
+        "running": running,
+        "overall": overall,
+    }
+
+
+def compute_conditioned_statistics(
+    signal,
+    sample_rate: float,
+    conditioning: Optional[Mapping[str, object]] = None,
+    start: int = 0,
+    end: Optional[int] = None,
+    **kwargs,
+) -> Dict[str, Dict]:
+    """
+    Block-streamed statistics of samples ``[start, end)`` of a channel.
+
+    ``signal`` may be any sliceable 1-D array, such as a ``LazyArray`` or an
+    ``h5py.Dataset``. ``conditioning`` holds keyword arguments of
+    :func:`apply_processing_pipeline_to_span` (``filter_settings``,
+    ``remove_mean``, ``mean_window_seconds``); each block the engine reads
+    is then conditioned with padding from the surrounding channel, so the
+    conditioned channel is never held in memory. When the session cache
+    already holds the whole conditioned channel, blocks are sliced from it
+    instead. Remaining keyword arguments are passed to
+    :func:`compute_streaming_statistics`.
+    """
+    total = len(signal)
+    start = min(max(0, int(start)), total)
+    end = total if end is None else min(max(start, int(end)), total)
+    source = signal
+    if conditioning is not None:
+        conditioned = peek_conditioned_signal(signal, sample_rate, **conditioning)
+        if conditioned is not None:
+            source, conditioning = conditioned, None
+
+    def read_block(block_start: int, block_stop: int) -> np.ndarray:
+        if conditioning is None:
+            return source[start + block_start:start + block_stop]
+        return apply_processing_pipeline_to_span(
+            source, start + block_start, start + block_stop, sample_rate, **conditioning
+        )
+
+    return compute_streaming_statistics(read_block, end - start, sample_rate, **kwargs)
+
+
+def compute_hdf5_channel_statistics(
+    loader,
+    flight_key: str,
+    channel_key: str,
+    start_time: Optional[float] = None,
+    end_time: Optional[float] = None,
+    conditioning: Optional[Mapping[str, object]] = None,
+    **kwargs,
+) -> Dict[str, Dict]:
+    """
+    Block-streamed statistics for an HDF5 channel (optionally a time range).
+
+    ``loader`` is an ``HDF5FlightDataLoader``. With ``conditioning`` the
+    blocks are conditioned as in :func:`compute_conditioned_statistics`,
+    padded with samples from outside the time range where the channel has
+    them. Remaining keyword arguments are passed to
+    :func:`compute_streaming_statistics`.
+    """
+    start_idx, end_idx, sample_rate = loader.get_sample_range(
+        flight_key, channel_key, start_time=start_time, end_time=end_time
+    )
+    if conditioning is not None:
+        return compute_conditioned_statistics(
+            loader.get_channel_dataset(flight_key, channel_key), sample_rate, conditioning,
+            start=start_idx, end=end_idx, **kwargs
+        )
+
+    def read_block(start: int, stop: int) -> np.ndarray:
+        return loader.read_channel_samples(flight_key, channel_key, start_idx + start, start_idx + stop)
+
+    return compute_streaming_statistics(read_block, end_idx - start_idx, sample_rate, **kwargs)
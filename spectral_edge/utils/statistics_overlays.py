@@ -27,12 +27,33 @@ def fit_rayleigh_from_signal(signal: np.ndarray) -> Tuple[Optional[float], Optio
     if amplitudes.size < 2:
         return None, None
 
-    rms_amp = float(np.sqrt(np.mean(amplitudes ** 2)))
+    return fit_rayleigh_from_power(
+        amplitudes.size,
+        float(np.mean(amplitudes ** 2)),
+        float(np.max(amplitudes)),
+    )
+
+
+def fit_rayleigh_from_power(
+    count: int,
+    mean_square: float,
+    peak_amplitude: float,
+) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Rayleigh fit from accumulated amplitude power, for block-streamed signals.
+
+    ``mean_square`` and ``peak_amplitude`` are the mean of ``x**2`` and the
+    largest ``|x|`` over the ``count`` finite samples.
+    """
+    if count < 2:
+        return None, None
+
+    rms_amp = float(np.sqrt(mean_square))
     scale = rms_amp / np.sqrt(2.0)
     if not np.isfinite(scale) or scale <= 0:
         return None, None
 
-    x_max = float(max(np.max(amplitudes), scale * 6.0))
+    x_max = float(max(peak_amplitude, scale * 6.0))
     if not np.isfinite(x_max) or x_max <= 0:
         return None, None
 
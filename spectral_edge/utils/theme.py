@@ -342,14 +342,17 @@ def _build_pyqtgraph_tool_stylesheet(object_name: str) -> str:
     outline: 0;
 }}
 {root_selector} QTreeWidget::item,
+{root_selector} QTreeView::item,
 {root_selector} QListWidget::item {{
     padding: 3px 6px;
 }}
 {root_selector} QTreeWidget::item:hover,
+{root_selector} QTreeView::item:hover,
 {root_selector} QListWidget::item:hover {{
     background-color: #1f2937;
 }}
 {root_selector} QTreeWidget::item:selected,
+{root_selector} QTreeView::item:selected,
 {root_selector} QListWidget::item:selected {{
     background-color: #2563eb;
     color: #ffffff;
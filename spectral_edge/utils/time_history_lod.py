@@ -0,0 +1,268 @@
+"""Peak-preserving level-of-detail decimation for time-history plots.
+
+Plain striding (``signal[::step]``) drops short transients, so every display
+path decimates through this module instead:
+
+* :func:`minmax_decimate` keeps the minimum and maximum of each bucket, so
+  the plotted envelope matches the full-resolution trace at screen scale.
+* :func:`lttb_decimate` (largest-triangle-three-buckets) keeps one visually
+  significant sample per bucket for line-shape fidelity at low point counts.
+* :class:`MinMaxPyramid` caches min/max levels of a whole channel (in memory
+  or an on-disk HDF5 dataset) so zoom/pan can be re-rendered at screen
+  resolution without rescanning the samples.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+DEFAULT_DISPLAY_POINTS = 10000
+
+
+def _bucket_extrema(values: np.ndarray, bucket: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Positions of the min and max of each ``bucket``-sample bucket."""
+    n = values.size
+    n_full = n // bucket
+    positions_min = np.empty(n_full + (1 if n % bucket else 0), dtype=np.int64)
+    positions_max = np.empty_like(positions_min)
+    if n_full:
+        blocks = values[: n_full * bucket].reshape(n_full, bucket)
+        offsets = np.arange(n_full, dtype=np.int64) * bucket
+        positions_min[:n_full] = offsets + np.argmin(blocks, axis=1)
+        positions_max[:n_full] = offsets + np.argmax(blocks, axis=1)
+    if n % bucket:
+        tail = values[n_full * bucket:]
+        positions_min[-1] = n_full * bucket + int(np.argmin(tail))
+        positions_max[-1] = n_full * bucket + int(np.argmax(tail))
+    return positions_min, positions_max
+
+
+def _interleave(positions_min: np.ndarray, positions_max: np.ndarray) -> np.ndarray:
+    """Merge per-bucket min/max positions in time order, dropping duplicates."""
+    first = np.minimum(positions_min, positions_max)
+    second = np.maximum(positions_min, positions_max)
+    merged = np.column_stack((first, second)).ravel()
+    if merged.size > 1:
+        keep = np.ones(merged.size, dtype=bool)
+        keep[1:] = merged[1:] != merged[:-1]
+        merged = merged[keep]
+    return merged
+
+
+def minmax_indices(signal: np.ndarray, max_points: int = DEFAULT_DISPLAY_POINTS) -> np.ndarray:
+    """
+    Indices of a min/max envelope of ``signal`` with at most ``max_points``.
+
+    Each bucket contributes its minimum and maximum sample in time order, so
+    every peak of the full-resolution signal survives decimation.
+    """
+    values = np.asarray(signal)
+    n = values.size
+    if n <= max_points or max_points < 2:
+        return np.arange(n, dtype=np.int64)
+    bucket = int(np.ceil(n / (max_points // 2)))
+    return _interleave(*_bucket_extrema(values, bucket))
+
+
+def minmax_decimate(
+    time: np.ndarray,
+    signal: np.ndarray,
+    max_points: int = DEFAULT_DISPLAY_POINTS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Peak-preserving decimation of ``(time, signal)`` to ``max_points``."""
+    if time is None or signal is None:
+        return time, signal
+    if len(signal) <= max_points:
+        return time, signal
+    indices = minmax_indices(signal, max_points)
+    return np.asarray(time)[indices], np.asarray(signal)[indices]
+
+
+def lttb_indices(time: np.ndarray, signal: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Largest-triangle-three-buckets sample selection.
+
+    Keeps the first and last samples and, for every interior bucket, the
+    sample forming the largest triangle with the previously kept sample and
+    the mean of the next bucket.
+    """
+    x = np.asarray(time, dtype=np.float64)
+    y = np.asarray(signal, dtype=np.float64)
+    n = y.size
+    if n <= max_points or max_points < 3:
+        return np.arange(n, dtype=np.int64)
+
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_start = stop
+        next_stop = edges[bucket + 2] if bucket + 2 < edges.size else n
+        mean_x = x[next_start:next_stop].mean()
+        mean_y = y[next_start:next_stop].mean()
+        area = np.abs(
+            (x[previous] - mean_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (mean_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def lttb_decimate(
+    time: np.ndarray,
+    signal: np.ndarray,
+    max_points: int = DEFAULT_DISPLAY_POINTS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """LTTB decimation of ``(time, signal)`` to ``max_points``."""
+    if time is None or signal is None or len(signal) <= max_points:
+        return time, signal
+    indices = lttb_indices(time, signal, max_points)
+    return np.asarray(time)[indices], np.asarray(signal)[indices]
+
+
+class MinMaxPyramid:
+    """
+    Cached min/max decimation levels of one channel for zoom/pan rendering.
+
+    Level ``k`` stores the position and value of the minimum and maximum of
+    every ``base_bucket * 2**k`` samples. :meth:`view` answers a time window
+    from the finest level that fits the requested point budget, and reads
+    the raw samples once the window is narrow enough to show them directly.
+
+    ``signal`` may be an in-memory array or any sliceable dataset (such as an
+    ``h5py.Dataset``); it is scanned once in blocks. ``data`` may pass its
+    samples when they are already in memory, so the scan skips re-reading
+    ``signal``. Sample times come from ``time`` when given, otherwise from
+    ``start_time`` and ``sample_rate``.
+    """
+
+    def __init__(
+        self,
+        signal,
+        time: Optional[np.ndarray] = None,
+        sample_rate: Optional[float] = None,
+        start_time: float = 0.0,
+        base_bucket: int = 64,
+        block_samples: int = 1 << 20,
+        data: Optional[np.ndarray] = None,
+    ):
+        if time is None and not sample_rate:
+            raise ValueError("MinMaxPyramid needs either a time vector or a sample rate")
+        self._signal = signal
+        self._time = None if time is None else np.asarray(time, dtype=np.float64)
+        self._sample_rate = float(sample_rate) if sample_rate else None
+        self._start_time = float(start_time)
+        self.n_samples = int(len(signal))
+        self.base_bucket = max(2, int(base_bucket))
+        block = max(self.base_bucket, int(block_samples) // self.base_bucket * self.base_bucket)
+
+        source = signal if data is None else data
+        mins, maxs = [], []
+        for start in range(0, self.n_samples, block):
+            values = np.asarray(source[start:start + block], dtype=np.float64)
+            pos_min, pos_max = _bucket_extrema(values, self.base_bucket)
+            mins.append((pos_min + start, values[pos_min]))
+            maxs.append((pos_max + start, values[pos_max]))
+
+        level = (
+            np.concatenate([p for p, _ in mins]) if mins else np.empty(0, dtype=np.int64),
+            np.concatenate([v for _, v in mins]) if mins else np.empty(0),
+            np.concatenate([p for p, _ in maxs]) if maxs else np.empty(0, dtype=np.int64),
+            np.concatenate([v for _, v in maxs]) if maxs else np.empty(0),
+        )
+        self.levels = [level]
+        while level[0].size > 1:
+            level = self._coarsen(*level)
+            self.levels.append(level)
+
+    @staticmethod
+    def _coarsen(pos_min, val_min, pos_max, val_max):
+        """Merge adjacent bucket pairs into the next level."""
+        if pos_min.size % 2:
+            pos_min, val_min = np.append(pos_min, pos_min[-1]), np.append(val_min, val_min[-1])
+            pos_max, val_max = np.append(pos_max, pos_max[-1]), np.append(val_max, val_max[-1])
+        left_min = val_min[0::2] <= val_min[1::2]
+        left_max = val_max[0::2] >= val_max[1::2]
+        return (
+            np.where(left_min, pos_min[0::2], pos_min[1::2]),
+            np.where(left_min, val_min[0::2], val_min[1::2]),
+            np.where(left_max, pos_max[0::2], pos_max[1::2]),
+            np.where(left_max, val_max[0::2], val_max[1::2]),
+        )
+
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """``(t_min, t_max, y_min, y_max)`` of the whole channel."""
+        if self.n_samples == 0:
+            return 0.0, 0.0, 0.0, 0.0
+        t_first, t_last = self._times(np.array([0, self.n_samples - 1]))
+        _, val_min, _, val_max = self.levels[-1]
+        return float(t_first), float(t_last), float(val_min[0]), float(val_max[0])
+
+    def _times(self, indices: np.ndarray) -> np.ndarray:
+        if self._time is not None:
+            return self._time[indices]
+        return self._start_time + indices / self._sample_rate
+
+    def _index_range(self, start_time: Optional[float], end_time: Optional[float]) -> Tuple[int, int]:
+        """Sample range covering ``[start_time, end_time]`` plus one neighbour."""
+        n = self.n_samples
+        if self._time is not None:
+            lo = 0 if start_time is None else int(np.searchsorted(self._time, start_time, side="left"))
+            hi = n if end_time is None else int(np.searchsorted(self._time, end_time, side="right"))
+        else:
+            lo = 0 if start_time is None else int(np.floor((start_time - self._start_time) * self._sample_rate))
+            hi = n if end_time is None else int(np.ceil((end_time - self._start_time) * self._sample_rate)) + 1
+        # Keep one sample either side so lines run off the edge of the view
+        return max(0, lo - 1), min(n, max(hi + 1, lo))
+
+    def view(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        max_points: int = DEFAULT_DISPLAY_POINTS,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Peak-preserving ``(time, signal)`` for a time window.
+
+        Returns at most about ``max_points`` samples; ``None`` bounds mean
+        the start/end of the channel.
+        """
+        lo, hi = self._index_range(start_time, end_time)
+        if hi <= lo:
+            return np.empty(0), np.empty(0)
+        n = hi - lo
+        max_points = max(2, int(max_points))
+        if n <= max_points:
+            indices = np.arange(lo, hi, dtype=np.int64)
+            values = np.asarray(self._signal[lo:hi], dtype=np.float64)
+            return self._times(indices), values
+
+        bucket = n / (max_points // 2)
+        if bucket < self.base_bucket:
+            # Finer than the cached levels: decimate the raw window directly
+            values = np.asarray(self._signal[lo:hi], dtype=np.float64)
+            indices = minmax_indices(values, max_points)
+            return self._times(indices + lo), values[indices]
+
+        level_index = min(len(self.levels) - 1, int(np.ceil(np.log2(bucket / self.base_bucket))))
+        size = self.base_bucket << level_index
+        pos_min, val_min, pos_max, val_max = self.levels[level_index]
+        first, last = lo // size, min(pos_min.size, -(-hi // size))
+        pos_min, pos_max = pos_min[first:last], pos_max[first:last]
+        min_first = pos_min <= pos_max
+        positions = np.column_stack(
+            (np.where(min_first, pos_min, pos_max), np.where(min_first, pos_max, pos_min))
+        ).ravel()
+        values = np.column_stack(
+            (
+                np.where(min_first, val_min[first:last], val_max[first:last]),
+                np.where(min_first, val_max[first:last], val_min[first:last]),
+            )
+        ).ravel()
+        return self._times(positions), values
@@ -16,3 +16,51 @@ from tests.test_data_contracts import ContractValidator
 def validator():
     """Provide a ContractValidator instance for tests."""
     return ContractValidator()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_hdf5_catalog(tmp_path_factory):
+    """Keep the shared HDF5 catalog of the test session out of the user's home."""
+    from spectral_edge.utils.hdf5_catalog import CATALOG_PATH_ENV
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv(CATALOG_PATH_ENV, str(tmp_path_factory.mktemp("catalog") / "catalog.sqlite"))
+        yield
+
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """
+    The QApplication shared by every GUI test.
+
+    Session-scoped so Qt is never torn down and re-created between modules
+    while objects of an earlier application are still alive. Windows still
+    open at the end of the session are closed before the interpreter exits.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+
+    application = QApplication.instance()
+    if application is None:
+        application = QApplication([])
+    yield application
+    application.closeAllWindows()
+    application.processEvents()
+
+
+@pytest.fixture
+def app(qapp):
+    """
+    Provide the QApplication and close every top-level widget the test opened.
+
+    Closing runs each window's ``closeEvent``, which stops its executors and
+    worker threads; ``deleteLater`` then frees the widget before the next test.
+    """
+    existing = set(map(id, qapp.topLevelWidgets()))
+    yield qapp
+    for widget in qapp.topLevelWidgets():
+        if id(widget) not in existing:
+            widget.close()
+            widget.deleteLater()
+    qapp.processEvents()
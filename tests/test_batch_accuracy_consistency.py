@@ -7,7 +7,7 @@ import pytest
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
-from PyQt6.QtWidgets import QApplication, QFileDialog
+from PyQt6.QtWidgets import QFileDialog
 
 from spectral_edge.batch.config import BatchConfig, EventDefinition, OutputConfig, PSDConfig
 from spectral_edge.batch.csv_output import _create_event_csv
@@ -21,14 +21,6 @@ from spectral_edge.batch.processor import BatchProcessor
 from spectral_edge.gui.batch_processor_window import BatchProcessorWindow
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 def test_output_config_defaults_excel_and_powerpoint_only():
     config = OutputConfig()
     assert config.excel_enabled is True
@@ -258,5 +258,57 @@ class TestBatchProcessor:
             sample_config.validate()
 
 
+class TestOutputSpectrumCache:
+    """Test the shared output-spectrum layer on BatchProcessingResult."""
+
+    def _make_result(self):
+        from spectral_edge.batch.processor import BatchProcessingResult
+        result = BatchProcessingResult()
+        frequencies = np.arange(0.0, 2001.0, 1.0)
+        psd = np.full(frequencies.shape, 0.01)
+        result.add_psd_result("flight_1", "chan_1", "event_1", frequencies, psd, {})
+        return result
+
+    def test_octave_conversion_runs_once_across_writers(self, monkeypatch):
+        """Repeated requests for the same spacing reuse one conversion."""
+        import spectral_edge.batch.output_psd as output_psd
+        from spectral_edge.batch.output_psd import resolve_output_spectrum
+
+        calls = []
+        original = output_psd.convert_psd_to_octave_bands
+
+        def counting_convert(*args, **kwargs):
+            calls.append(1)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(output_psd, "convert_psd_to_octave_bands", counting_convert)
+        result = self._make_result()
+        psd_config = PSDConfig(frequency_spacing="1/3", freq_min=20.0, freq_max=2000.0)
+
+        first = resolve_output_spectrum(result, "flight_1", "chan_1", "event_1", psd_config)
+        second = resolve_output_spectrum(result, "flight_1", "chan_1", "event_1", psd_config)
+        assert len(calls) == 1
+        assert first[0] is second[0]
+        assert not first[1].flags.writeable
+
+        psd_config.frequency_spacing = "1/6"
+        resolve_output_spectrum(result, "flight_1", "chan_1", "event_1", psd_config)
+        assert len(calls) == 2
+
+    def test_replacing_result_invalidates_cached_spectrum(self):
+        """A new PSD for the same event must not return the stale spectrum."""
+        result = self._make_result()
+        psd_config = PSDConfig(frequency_spacing="constant_bandwidth")
+        _, psd_before = result.get_output_spectrum("flight_1", "chan_1", "event_1", psd_config)
+
+        frequencies = np.arange(0.0, 2001.0, 1.0)
+        result.add_psd_result(
+            "flight_1", "chan_1", "event_1", frequencies, np.full(frequencies.shape, 0.02), {}
+        )
+        _, psd_after = result.get_output_spectrum("flight_1", "chan_1", "event_1", psd_config)
+        assert np.allclose(psd_before, 0.01)
+        assert np.allclose(psd_after, 0.02)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
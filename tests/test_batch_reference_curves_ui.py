@@ -5,21 +5,12 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWidgets import QGridLayout
 
 from spectral_edge.gui.batch_processor_window import BatchProcessorWindow
 from spectral_edge.batch.config import ReferenceCurveConfig
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 def test_batch_reference_curve_controls_exist_and_builtin_toggle(app):
     window = BatchProcessorWindow()
     window.show()
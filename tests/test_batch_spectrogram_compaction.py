@@ -0,0 +1,95 @@
+"""
+Tests for compact batch spectrogram storage (band cropping, time pooling, dtype).
+"""
+
+import numpy as np
+import pytest
+
+from spectral_edge.batch.config import BatchConfig, DisplayConfig, PSDConfig, SpectrogramConfig
+from spectral_edge.batch.processor import BatchProcessor
+from spectral_edge.batch.spectrogram_generator import compact_spectrogram, spectrogram_to_db
+
+
+@pytest.fixture
+def spectrogram_arrays():
+    rng = np.random.default_rng(7)
+    frequencies = np.arange(0.0, 513.0)
+    times = np.arange(5000) * 0.01
+    Sxx = rng.random((frequencies.size, times.size)) + 1e-3
+    Sxx[200, 3001] = 1e4  # short transient
+    return frequencies, times, Sxx
+
+
+def test_compact_spectrogram_crops_band_and_max_pools_time(spectrogram_arrays):
+    frequencies, times, Sxx = spectrogram_arrays
+    compact = compact_spectrogram(
+        frequencies, times, Sxx, freq_min=20.0, freq_max=400.0, max_time_columns=500
+    )
+    assert compact["frequencies"][0] == 20.0
+    assert compact["frequencies"][-1] == 400.0
+    assert compact["Sxx"].shape == (381, 500)
+    assert compact["times"].size == 500
+    assert compact["times"][0] == pytest.approx(np.mean(times[:10]))
+    # Max pooling keeps the transient visible
+    assert compact["Sxx"].max() == pytest.approx(1e4)
+
+
+def test_compact_spectrogram_mean_pooling_preserves_average(spectrogram_arrays):
+    frequencies, times, Sxx = spectrogram_arrays
+    compact = compact_spectrogram(frequencies, times, Sxx, max_time_columns=1000, time_pooling="mean")
+    np.testing.assert_allclose(compact["Sxx"].mean(axis=1), Sxx.mean(axis=1), rtol=1e-10)
+
+
+def test_compact_spectrogram_storage_options(spectrogram_arrays):
+    frequencies, times, Sxx = spectrogram_arrays
+    as_float32 = compact_spectrogram(frequencies, times, Sxx, storage="float32")
+    assert as_float32["Sxx"].dtype == np.float32
+
+    quantized = compact_spectrogram(frequencies, times, Sxx, storage="db_uint8")
+    assert quantized["Sxx"].dtype == np.uint8
+    reference_db = 10 * np.log10(Sxx + 1e-12)
+    decoded_db = spectrogram_to_db(quantized)
+    assert np.max(np.abs(decoded_db - reference_db)) <= quantized["db_scale"] / 2 + 1e-9
+
+
+def test_spectrogram_config_rejects_unknown_compaction_options():
+    with pytest.raises(ValueError):
+        SpectrogramConfig(enabled=True, time_pooling="median").validate()
+    with pytest.raises(ValueError):
+        SpectrogramConfig(enabled=True, storage="int4").validate()
+
+
+def test_process_event_stores_cropped_pooled_spectrogram():
+    sample_rate = 4096.0
+    t = np.arange(0.0, 30.0, 1.0 / sample_rate)
+    signal = np.random.default_rng(3).standard_normal(t.size)
+    cfg = BatchConfig(
+        source_type="csv",
+        source_files=["dummy.csv"],
+        psd_config=PSDConfig(method="welch", desired_df=8.0),
+        spectrogram_config=SpectrogramConfig(
+            enabled=True,
+            desired_df=8.0,
+            overlap_percent=75.0,
+            freq_min=20.0,
+            freq_max=1000.0,
+            max_time_columns=100,
+            storage="float32",
+        ),
+        display_config=DisplayConfig(
+            spectrogram_auto_scale=False,
+            spectrogram_freq_min=10.0,
+            spectrogram_freq_max=1500.0,
+        ),
+    )
+    processor = BatchProcessor(cfg)
+    processor._process_event("flight_1", "chan_1", "full_duration", t, signal, sample_rate, "g")
+
+    spectrogram = processor.result.channel_results[("flight_1", "chan_1")]["full_duration"]["spectrogram"]
+    # Band is widened to cover the manual display limits
+    assert spectrogram["frequencies"][0] >= 10.0
+    assert spectrogram["frequencies"][0] < 20.0
+    assert spectrogram["frequencies"][-1] <= 1500.0
+    assert spectrogram["frequencies"][-1] > 1000.0
+    assert spectrogram["Sxx"].shape == (spectrogram["frequencies"].size, 100)
+    assert spectrogram["Sxx"].dtype == np.float32
@@ -10,7 +10,7 @@ pytest.importorskip("pyqtgraph")
 
 import pyqtgraph as pg
 from pyqtgraph.GraphicsScene.exportDialog import ExportDialog
-from PyQt6.QtWidgets import QApplication, QMenu
+from PyQt6.QtWidgets import QMenu
 
 from spectral_edge.gui.global_styles import apply_global_stylesheet
 from spectral_edge.utils.theme import (
@@ -22,14 +22,6 @@ from spectral_edge.utils.theme import (
 )
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 def test_apply_context_menu_style_styles_viewbox_menu_and_submenus(app):
     plot_widget = pg.PlotWidget()
     apply_context_menu_style(plot_widget)
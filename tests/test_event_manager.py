@@ -6,19 +6,10 @@ os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QApplication
 
 from spectral_edge.gui.event_manager import Event, EventManagerWindow
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 def test_event_manager_preserves_enabled_state_on_table_refresh(app):
     manager = EventManagerWindow(max_time=20.0, min_time=0.0)
     manager.events = [
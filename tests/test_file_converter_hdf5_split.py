@@ -99,3 +99,97 @@ def test_split_hdf5_by_time_slices_validates_against_common_duration(tmp_path):
             str(output_dir),
             time_slices=[(0.0, 9.0)],  # flight_002 is only 8.0s
         )
+
+
+def test_split_hdf5_by_count_copies_compressed_chunks_verbatim(tmp_path, monkeypatch):
+    from spectral_edge.utils import hdf5_chunks
+    from spectral_edge.utils.hdf5_overview import get_channel_overview, index_hdf5_file
+
+    chunk = 4000
+    n_samples = 100_000
+    values = np.cumsum(np.random.default_rng(2).standard_normal(n_samples))
+    input_file = tmp_path / "compressed.h5"
+    with h5py.File(input_file, "w") as f:
+        flight = f.create_group("flight_001")
+        flight.create_group("metadata").attrs["flight_id"] = "flight_001"
+        channel = flight.create_group("channels").create_group("accel_x")
+        channel.attrs["sample_rate"] = 1000.0
+        for name, data in (("data", values), ("time", np.arange(n_samples) / 1000.0)):
+            channel.create_dataset(name, data=data, chunks=(chunk,), compression="gzip", compression_opts=4)
+    index_hdf5_file(str(input_file))
+
+    # Nominal boundaries (33333, 66666) snap to the chunk grid; nothing is
+    # re-encoded in Python and whole chunks are byte-identical to the source
+    fail = lambda *_args, **_kwargs: pytest.fail("chunk was re-encoded")
+    monkeypatch.setattr(hdf5_chunks, "encode_chunk", fail)
+    monkeypatch.setattr(hdf5_chunks, "decode_chunk", fail)
+    output_files = split_hdf5_by_count(
+        str(input_file), str(tmp_path / "out"), num_segments=3, align_to_chunks=True
+    )
+
+    starts = [0, 32_000, 68_000]
+    pieces = []
+    with h5py.File(input_file, "r") as src:
+        source = src["flight_001/channels/accel_x/data"]
+        for output_file, start in zip(output_files, starts):
+            with h5py.File(output_file, "r") as f:
+                channel = f["flight_001/channels/accel_x"]
+                data = channel["data"]
+                assert data.chunks == (chunk,) and data.compression == "gzip"
+                assert channel["time"][0] == pytest.approx(start / 1000.0)
+                for offset in range(0, len(data) // chunk * chunk, chunk):
+                    assert data.id.read_direct_chunk((offset,)) == source.id.read_direct_chunk((start + offset,))
+                pieces.append(data[:])
+
+                # The overview comes from the source's rows plus the tail
+                overview = get_channel_overview(channel)
+                assert overview is not None
+                piece = pieces[-1]
+                level_0 = overview["level_0"][:]
+                expected = [piece[i:i + 256] for i in range(0, len(piece), 256)]
+                np.testing.assert_allclose(level_0[:, 2], [bucket.mean() for bucket in expected])
+                np.testing.assert_array_equal(level_0[:, 1], [bucket.max() for bucket in expected])
+
+    np.testing.assert_array_equal(np.concatenate(pieces), values)
+
+
+@pytest.mark.parametrize(
+    "fast_chunk, align_to_chunks, boundaries",
+    [
+        (1000, False, [0.0, 100 / 3, 200 / 3, 100.0]),
+        (1000, True, [0.0, 30.0, 70.0, 100.0]),
+        # 30 s and 70 s are not chunk edges of the fast channel
+        (900, True, [0.0, 100 / 3, 200 / 3, 100.0]),
+    ],
+)
+def test_split_hdf5_by_count_keeps_channels_of_a_segment_on_one_window(
+    tmp_path, fast_chunk, align_to_chunks, boundaries
+):
+    input_file = tmp_path / "multirate.h5"
+    with h5py.File(input_file, "w") as f:
+        flight = f.create_group("flight_001")
+        flight.create_group("metadata").attrs["flight_id"] = "flight_001"
+        channels = flight.create_group("channels")
+        for name, sample_rate, chunk in (("slow", 100.0, 1000), ("fast", 1000.0, fast_chunk)):
+            channel = channels.create_group(name)
+            channel.attrs["sample_rate"] = sample_rate
+            n_samples = int(100 * sample_rate)
+            channel.create_dataset("data", data=np.arange(n_samples, dtype=np.float64),
+                                   chunks=(chunk,), compression="gzip")
+            channel.create_dataset("time", data=np.arange(n_samples) / sample_rate)
+
+    output_files = split_hdf5_by_count(
+        str(input_file), str(tmp_path / "out"), num_segments=3, align_to_chunks=align_to_chunks
+    )
+
+    for output_file, start_time, end_time in zip(output_files, boundaries, boundaries[1:]):
+        with h5py.File(output_file, "r") as f:
+            metadata = f["flight_001/metadata"].attrs
+            assert metadata["split_start_time"] == pytest.approx(start_time)
+            assert metadata["split_end_time"] == pytest.approx(end_time)
+            for name in ("slow", "fast"):
+                channel = f[f"flight_001/channels/{name}"]
+                sample_period = 1.0 / channel.attrs["sample_rate"]
+                time = channel["time"][:]
+                assert time[0] == pytest.approx(start_time, abs=sample_period)
+                assert time[-1] + sample_period == pytest.approx(end_time, abs=sample_period)
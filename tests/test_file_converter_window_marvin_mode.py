@@ -5,19 +5,11 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication, QFileDialog
+from PyQt6.QtWidgets import QFileDialog
 
 from spectral_edge.gui.file_converter_window import FileConverterWindow
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 def test_marvin_mode_visible_and_toggles_sections(app):
     window = FileConverterWindow()
     window.show()
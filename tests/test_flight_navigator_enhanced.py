@@ -6,20 +6,12 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt
 
 import spectral_edge.gui.flight_navigator_enhanced as navigator_module
 from spectral_edge.gui.flight_navigator_enhanced import FlightNavigator
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 class _LoaderStub:
     def __init__(self):
         self._flight_keys = ["flight_a", "flight_b"]
@@ -151,9 +143,8 @@ def test_enhanced_navigator_missing_metadata_renders_without_failure(app):
     app.processEvents()
 
     channel_data = _find_channel_data(window, "MissingMeta")
-    item = window._create_channel_item(channel_data)
     visible_columns = [column.name for column in window.columns if column.visible]
-    rendered = {name: item.text(index) for index, name in enumerate(visible_columns)}
+    rendered = {name: window._channel_column_text(channel_data, name) for name in visible_columns}
 
     assert rendered["units"] == "N/A"
     assert rendered["sample_rate"] == "N/A"
@@ -175,13 +166,14 @@ def test_enhanced_navigator_tree_default_always_expanded_and_toggle(app):
     app.processEvents()
 
     assert window.always_expanded_check.isChecked() is True
-    top_level_count = window.tree.topLevelItemCount()
+    model = window.tree_model
+    top_level_count = model.rowCount()
     assert top_level_count > 0
-    assert all(window.tree.topLevelItem(i).isExpanded() for i in range(top_level_count))
+    assert all(window.tree.isExpanded(model.index(i, 0)) for i in range(top_level_count))
 
     window.always_expanded_check.setChecked(False)
     app.processEvents()
-    assert all(not window.tree.topLevelItem(i).isExpanded() for i in range(top_level_count))
+    assert all(not window.tree.isExpanded(model.index(i, 0)) for i in range(top_level_count))
 
     window.close()
 
@@ -233,3 +225,38 @@ def test_enhanced_navigator_selection_limit_blocks_accept(monkeypatch, app):
     assert window.result() == 0
 
     window.close()
+
+
+def test_enhanced_navigator_model_checks_survive_filtering_and_regrouping(app):
+    window = FlightNavigator(_LoaderStub())
+    window.show()
+    app.processEvents()
+
+    model = window.tree_model
+    flight_a = model.index(0, 0)
+    assert model.data(flight_a) == "flight_a (3 channels)"
+    assert [model.data(model.index(r, 0, flight_a)) for r in range(model.rowCount(flight_a))] == [
+        "Accel_G", "Press_PSIA", "Press_RMS",
+    ]
+
+    model.setData(model.index(0, 0, flight_a), Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+    assert model.data(flight_a, Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.PartiallyChecked
+    assert window.get_selected_channels() == [("flight_a", "Accel_G")]
+
+    window.sensor_type_checks["Pressure"].setChecked(True)
+    window._apply_filters()
+    window.view_mode_group[navigator_module.ViewMode.BY_LOCATION].setChecked(True)
+    app.processEvents()
+    assert [model.data(model.index(i, 0)) for i in range(model.rowCount())] == [
+        "Cabin Bay (1 channels)", "Nose (1 channels)",
+    ]
+    assert window.get_selected_channels() == [("flight_a", "Accel_G")]
+
+    window._select_all()
+    assert sorted(window.get_selected_channels()) == [
+        ("flight_a", "Accel_G"), ("flight_a", "Press_PSIA"), ("flight_a", "Press_RMS"),
+    ]
+    window._deselect_all()
+    assert window.get_selected_channels() == []
+
+    window.close()
@@ -6,21 +6,13 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication, QAbstractSpinBox, QComboBox
+from PyQt6.QtWidgets import QAbstractSpinBox, QComboBox
 
 from spectral_edge.gui.file_converter_window import FileConverterWindow
 from spectral_edge.gui.psd_window import PSDAnalysisWindow
 from spectral_edge.gui.spectrogram_window import SpectrogramWindow
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 def test_spectrogram_spinboxes_use_up_down_arrows(app):
     time_data = np.linspace(0.0, 1.0, 200, endpoint=False)
     signal = np.sin(2.0 * np.pi * 10.0 * time_data)
@@ -0,0 +1,125 @@
+"""
+Tests for the persistent HDF5 flight/channel catalog.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+
+from spectral_edge.utils import hdf5_catalog
+from spectral_edge.utils.hdf5_catalog import HDF5Catalog, build_flight_file_map
+from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+
+
+def _write_flight_file(path, flight_key, channel_keys, sample_rate=100.0, duration=2.0):
+    t = np.arange(0.0, duration, 1.0 / sample_rate) + 5.0
+    with h5py.File(path, "w") as f:
+        f.create_group("metadata").attrs["campaign"] = "test"
+        flight = f.create_group(flight_key)
+        meta = flight.create_group("metadata")
+        meta.attrs["flight_id"] = flight_key.upper()
+        meta.attrs["duration"] = np.float64(duration)
+        channels = flight.create_group("channels")
+        for channel_key in channel_keys:
+            ch = channels.create_group(channel_key)
+            ch.create_dataset("time", data=t)
+            ch.create_dataset("data", data=np.sin(t))
+            ch.attrs["units"] = "g"
+            ch.attrs["sample_rate"] = np.float64(sample_rate)
+            ch.attrs["location"] = b"wing"
+    return str(path)
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return HDF5Catalog(str(tmp_path / "catalog" / "catalog.sqlite"))
+
+
+def test_catalog_loader_matches_scanned_loader(tmp_path, catalog, monkeypatch):
+    path = _write_flight_file(tmp_path / "a.h5", "flight_001", ["accel_x", "accel_y"])
+
+    plain = HDF5FlightDataLoader(path)
+    HDF5FlightDataLoader(path, catalog=catalog).close()
+
+    # Second open is served from the catalog without walking the file
+    def _fail(_h5file):
+        raise AssertionError("catalog hit should not rescan the file")
+
+    monkeypatch.setattr(hdf5_catalog, "scan_hdf5_file", _fail)
+    cached = HDF5FlightDataLoader(path, catalog=catalog)
+    try:
+        assert cached.get_flight_keys() == plain.get_flight_keys()
+        assert cached.file_metadata == {"campaign": "test"}
+        assert str(cached.get_flight_info("flight_001")) == str(plain.get_flight_info("flight_001"))
+        for channel_key in plain.get_channel_keys("flight_001"):
+            expected = plain.get_channel_info("flight_001", channel_key)
+            actual = cached.get_channel_info("flight_001", channel_key)
+            assert actual.get_display_name() == expected.get_display_name()
+            assert actual.location == "wing"
+            assert cached.get_time_range("flight_001", channel_key) == plain.get_time_range(
+                "flight_001", channel_key
+            )
+        data = cached.load_channel_data("flight_001", "accel_x", decimate_for_display=False)
+        np.testing.assert_array_equal(data["data_full"], plain.load_channel_data(
+            "flight_001", "accel_x", decimate_for_display=False
+        )["data_full"])
+    finally:
+        cached.close()
+        plain.close()
+
+
+def test_catalog_rescans_modified_files(tmp_path, catalog):
+    path = _write_flight_file(tmp_path / "a.h5", "flight_001", ["accel_x"])
+    entry = catalog.get_entry(path)
+    assert list(entry["channels"]["flight_001"]) == ["accel_x"]
+    assert entry["channels"]["flight_001"]["accel_x"]["n_samples"] == 200
+
+    stat = os.stat(path)
+    _write_flight_file(tmp_path / "a.h5", "flight_001", ["accel_x", "accel_z"])
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    entry = catalog.get_entry(path)
+    assert sorted(entry["channels"]["flight_001"]) == ["accel_x", "accel_z"]
+
+
+def test_flight_file_map_uses_catalog(tmp_path, catalog):
+    first = _write_flight_file(tmp_path / "a.h5", "flight_001", ["accel_x"])
+    second = _write_flight_file(tmp_path / "b.h5", "flight_002", ["accel_x"])
+    missing = str(tmp_path / "missing.h5")
+
+    mapping = build_flight_file_map([first, second, missing], catalog=catalog)
+    assert mapping == {"flight_001": first, "flight_002": second}
+
+
+def test_catalog_drops_entries_of_deleted_files(tmp_path, catalog):
+    first = _write_flight_file(tmp_path / "a.h5", "flight_001", ["accel_x"])
+    second = _write_flight_file(tmp_path / "b.h5", "flight_002", ["accel_x"])
+    catalog.get_entry(first)
+    catalog.get_entry(second)
+
+    def catalogued():
+        with catalog._connect() as conn:
+            return {path for (path,) in conn.execute("SELECT path FROM files")}
+
+    os.remove(first)
+    with pytest.raises(FileNotFoundError):
+        catalog.get_entry(first)
+    assert catalogued() == {os.path.abspath(second)}
+
+    os.remove(second)
+    assert build_flight_file_map([], catalog=catalog) == {}
+    assert catalogued() == set()
+
+
+def test_default_catalog_location_can_be_overridden(tmp_path, monkeypatch):
+    db_path = tmp_path / "override" / "catalog.sqlite"
+    monkeypatch.setenv(hdf5_catalog.CATALOG_PATH_ENV, str(db_path))
+    catalog = hdf5_catalog.get_default_catalog()
+    assert catalog.db_path == str(db_path) and db_path.exists()
+    assert hdf5_catalog.get_default_catalog() is catalog
+
+    monkeypatch.setenv(hdf5_catalog.CATALOG_PATH_ENV, "")
+    assert hdf5_catalog.get_default_catalog() is None
@@ -0,0 +1,127 @@
+"""
+Tests for parallel decompression of compressed HDF5 channels.
+"""
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+
+from spectral_edge.utils import hdf5_chunks
+from spectral_edge.utils.hdf5_chunks import (
+    ParallelChunkWriter,
+    chunk_filters,
+    copy_dataset_slice,
+    read_samples,
+    write_compressed_dataset,
+)
+from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+
+
+@pytest.fixture
+def decoded_chunks(monkeypatch):
+    """Force the chunked path for small test data and count decoded chunks."""
+    monkeypatch.setattr(hdf5_chunks, "PARALLEL_READ_MIN_BYTES", 0)
+    calls = []
+    real_decode = hdf5_chunks.decode_chunk
+    monkeypatch.setattr(
+        hdf5_chunks, "decode_chunk",
+        lambda *args: calls.append(args[1]) or real_decode(*args),
+    )
+    return calls
+
+
+def test_read_samples_matches_hdf5_filter_pipeline(tmp_path, decoded_chunks):
+    values = np.cumsum(np.random.default_rng(3).standard_normal(100_003))
+    with h5py.File(tmp_path / "c.h5", "w") as f:
+        f.create_dataset("gzip", data=values, chunks=(4096,), compression="gzip", compression_opts=4)
+        f.create_dataset("shuffled", data=values.astype(">f4"), chunks=(1000,),
+                         compression="gzip", shuffle=True)
+        f.create_dataset("sparse", shape=(50_000,), dtype="f8", chunks=(4096,), compression="gzip", fillvalue=2.5)
+        f["sparse"][10_000:10_100] = 1.0
+        f.create_dataset("contiguous", data=values)
+
+    with h5py.File(tmp_path / "c.h5", "r") as f:
+        assert chunk_filters(f["shuffled"]) == (h5py.h5z.FILTER_SHUFFLE, h5py.h5z.FILTER_DEFLATE)
+        assert chunk_filters(f["contiguous"]) is None
+        for name in f:
+            dataset = f[name]
+            for start, end in [(0, None), (4095, 40_961), (7, 7)]:
+                for workers in (1, 3):
+                    result = read_samples(dataset, start, end, max_workers=workers)
+                    expected = dataset[start:end]
+                    assert result.dtype == expected.dtype
+                    np.testing.assert_array_equal(result, expected)
+    assert decoded_chunks
+
+
+def test_loader_reads_compressed_channels_through_chunk_path(tmp_path, decoded_chunks):
+    time = np.arange(60_000) / 1000.0
+    data = np.sin(time * 7.0)
+    path = tmp_path / "flight.h5"
+    with h5py.File(path, "w") as f:
+        channel = f.create_group("flight_001/channels/accel_x")
+        f["flight_001"].create_group("metadata")
+        channel.create_dataset("time", data=time, compression="gzip", compression_opts=4)
+        channel.create_dataset("data", data=data, compression="gzip", compression_opts=4)
+        channel.attrs["sample_rate"] = 1000.0
+
+    with HDF5FlightDataLoader(str(path)) as loader:
+        result = loader.load_channel_data("flight_001", "accel_x", decimate_for_display=False)
+        np.testing.assert_array_equal(result["data_full"], data)
+        np.testing.assert_array_equal(result["time_full"], time)
+        np.testing.assert_array_equal(
+            loader.read_channel_samples("flight_001", "accel_x", 100, 50_100), data[100:50_100]
+        )
+    assert decoded_chunks
+
+
+def test_parallel_writer_output_reads_through_standard_filters(tmp_path):
+    values = np.cumsum(np.random.default_rng(4).standard_normal(50_001))
+    matrix = np.arange(3009.0).reshape(1003, 3)
+    with h5py.File(tmp_path / "w.h5", "w") as f:
+        write_compressed_dataset(f, "gzip", values, chunk_samples=4096, max_workers=3)
+        write_compressed_dataset(f, "shuffled", values.astype("f4"), chunk_samples=1000, shuffle=True)
+        with ParallelChunkWriter(f, "blocks", matrix.shape, chunk_samples=100, max_workers=2) as writer:
+            for start in range(0, len(matrix), 77):
+                writer.write(matrix[start:start + 77])
+            with pytest.raises(ValueError, match="overflows"):
+                writer.write(matrix[:1])
+
+    # Reading with h5py's own filter pipeline checks the stored chunks
+    with h5py.File(tmp_path / "w.h5", "r") as f:
+        assert f["gzip"].compression == "gzip" and f["gzip"].compression_opts == 4
+        assert f["shuffled"].shuffle and f["blocks"].chunks == (100, 3)
+        np.testing.assert_array_equal(f["gzip"][:], values)
+        np.testing.assert_array_equal(f["shuffled"][:], values.astype("f4"))
+        np.testing.assert_array_equal(f["blocks"][:], matrix)
+
+
+def test_aligned_slices_copy_compressed_chunks_verbatim(tmp_path, monkeypatch):
+    values = np.cumsum(np.random.default_rng(6).standard_normal(20_000))
+    with h5py.File(tmp_path / "src.h5", "w") as f:
+        f.create_dataset("data", data=values, chunks=(1000,), compression="gzip",
+                         compression_opts=6, shuffle=True)
+
+    with h5py.File(tmp_path / "src.h5", "r") as src, h5py.File(tmp_path / "out.h5", "w") as out:
+        # Unaligned slices are re-encoded with the source's chunking and filters
+        copy = copy_dataset_slice(src["data"], out, "shifted", 1500, 9100)
+        np.testing.assert_array_equal(copy[:], values[1500:9100])
+        assert copy.chunks == (1000,) and copy.compression_opts == 6 and copy.shuffle
+
+        # Aligned slices neither decode nor encode whole chunks in Python
+        fail = lambda *_args, **_kwargs: pytest.fail("chunk was re-encoded")
+        real_decode = hdf5_chunks.decode_chunk
+        monkeypatch.setattr(hdf5_chunks, "decode_chunk", fail)
+        monkeypatch.setattr(hdf5_chunks, "encode_chunk", fail)
+        blocks = []
+        copy = copy_dataset_slice(src["data"], out, "aligned", 3000, 12_345)
+        np.testing.assert_array_equal(copy[:], values[3000:12_345])
+
+        # Callers that summarize the copy still get every sample, in order
+        monkeypatch.setattr(hdf5_chunks, "decode_chunk", real_decode)
+        copy_dataset_slice(src["data"], out, "observed", 3000, 12_345, on_values=blocks.append,
+                           block_samples=2000)
+        np.testing.assert_array_equal(np.concatenate(blocks), values[3000:12_345])
+        assert len(blocks) > 1
+        assert copy.id.read_direct_chunk((2000,)) == src["data"].id.read_direct_chunk((5000,))
@@ -0,0 +1,133 @@
+"""
+Tests for HDF5 display overview pyramids.
+"""
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+
+from spectral_edge.utils import hdf5_overview
+from spectral_edge.utils.file_converter import split_hdf5_by_count
+from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+from spectral_edge.utils.hdf5_overview import (
+    get_channel_overview,
+    index_hdf5_file,
+)
+
+
+def _write_file(path, n_samples=400_000, sample_rate=1000.0, names=("accel_x", "short")):
+    rng = np.random.default_rng(3)
+    data = 0.5 * rng.standard_normal(n_samples)
+    data[123_456] = 12.0
+    data[300_001] = -9.0
+    time = 10.0 + np.arange(n_samples) / sample_rate
+    with h5py.File(path, "w") as f:
+        channels = f.create_group("flight_001").create_group("channels")
+        for name in names:
+            ch = channels.create_group(name)
+            n = n_samples if name == "accel_x" else 100
+            ch.create_dataset("data", data=data[:n])
+            ch.create_dataset("time", data=time[:n])
+            ch.attrs["units"] = "g"
+            ch.attrs["sample_rate"] = sample_rate
+    return str(path), data, time
+
+
+def test_index_writes_consistent_levels(tmp_path):
+    path, data, _time = _write_file(tmp_path / "a.h5")
+    assert index_hdf5_file(path) == 1
+    assert index_hdf5_file(path) == 0
+
+    with h5py.File(path, "r") as f:
+        overview = get_channel_overview(f["flight_001/channels/accel_x"])
+        assert overview is not None
+        assert get_channel_overview(f["flight_001/channels/short"]) is None
+        base = int(overview.attrs["base_bucket"])
+        level_0 = overview["level_0"][:]
+        expected = data[: (data.size // base) * base].reshape(-1, base)
+        np.testing.assert_array_equal(level_0[: expected.shape[0], 0], expected.min(axis=1))
+        np.testing.assert_array_equal(level_0[: expected.shape[0], 1], expected.max(axis=1))
+        for name in overview:
+            level = overview[name][:]
+            assert level[:, 0].min() == data.min()
+            assert level[:, 1].max() == data.max()
+            assert level[:, 2].mean() == pytest.approx(data.mean(), abs=1e-3)
+
+
+def test_loader_serves_display_from_overview(tmp_path, monkeypatch):
+    path, data, _time = _write_file(tmp_path / "a.h5")
+    loader = HDF5FlightDataLoader(path)
+    try:
+        fallback = loader.load_display_data("flight_001", "accel_x", max_points=2000)
+        assert fallback["from_overview"] is False
+    finally:
+        loader.close()
+
+    index_hdf5_file(path)
+    loader = HDF5FlightDataLoader(path)
+    try:
+        view = loader.load_display_data("flight_001", "accel_x", max_points=2000)
+        assert view["from_overview"] is True
+        assert view["data_display"].size <= 2002
+        assert view["data_display"].max() == 12.0 and view["data_display"].min() == -9.0
+        assert view["time_display"][0] >= 10.0 and np.all(np.diff(view["time_display"]) > 0)
+
+        # A narrow window needs finer detail than the overview holds
+        narrow = loader.load_display_data("flight_001", "accel_x", 133.0, 133.5, max_points=2000)
+        assert narrow["from_overview"] is False
+        assert narrow["data_display"].max() == 12.0
+    finally:
+        loader.close()
+
+
+def test_split_converter_writes_overviews(tmp_path):
+    path, _data, _time = _write_file(tmp_path / "a.h5", names=("accel_x",))
+    output_files = split_hdf5_by_count(path, str(tmp_path / "out"), 2)
+    with h5py.File(output_files[0], "r") as f:
+        assert get_channel_overview(f["flight_001/channels/accel_x"]) is not None
+
+
+def test_overview_is_stale_after_same_length_rewrite(tmp_path):
+    path, data, _time = _write_file(tmp_path / "a.h5")
+    index_hdf5_file(path)
+    with h5py.File(path, "r+") as f:
+        channel = f["flight_001/channels/accel_x"]
+        assert get_channel_overview(channel) is not None
+        channel["data"][:] = data[::-1]
+        assert get_channel_overview(channel) is None
+    assert index_hdf5_file(path) == 1
+
+
+def test_converter_writes_overview_while_writing(tmp_path, monkeypatch):
+    import ctypes
+    from types import SimpleNamespace
+
+    import hdf5_writer  # on sys.path once the file converter is imported
+    from DWDataReaderHeader import DWChannelType, DWStatus
+
+    values = np.cumsum(np.random.default_rng(8).standard_normal(250_001))
+
+    def get_scaled_samples(_reader, _index, start, count, samples, _timestamps):
+        ctypes.memmove(samples, values[start:start + count].ctypes.data, count * 8)
+        return DWStatus.DWSTAT_OK
+
+    lib = SimpleNamespace(DWIGetScaledSamples=get_scaled_samples)
+    channel = SimpleNamespace(name="accel_x", unit="g", array_size=1, index=0)
+    # The whole-file overview pass is not needed after writing
+    monkeypatch.setattr(hdf5_overview, "compute_overview_levels", lambda *a, **k: pytest.fail("re-read"))
+    output = str(tmp_path / "converted.h5")
+    hdf5_writer.write_hdf5_file_chunked(
+        lib, None, output, [(channel, values.size, DWChannelType.DW_CH_TYPE_SYNC)],
+        {"sample_rate": 1000.0, "duration": values.size / 1000.0}, chunk_size=30_000,
+    )
+
+    with h5py.File(output, "r") as f:
+        channel_group = f["flight_001/channels/accel_x"]
+        np.testing.assert_array_equal(channel_group["data"][:], values)
+        overview = get_channel_overview(channel_group)
+        assert overview is not None
+        level_0 = overview["level_0"][:]
+        assert level_0.shape[0] == -(-values.size // 256)
+        assert level_0[:, 1].max() == values.max() and level_0[:, 0].min() == values.min()
+        assert level_0[-1, 2] == pytest.approx(values[(values.size // 256) * 256:].mean())
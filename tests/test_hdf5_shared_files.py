@@ -0,0 +1,76 @@
+"""
+Tests for the process-wide pool of shared HDF5 file handles.
+"""
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+
+from spectral_edge.utils import hdf5_loader
+from spectral_edge.utils.hdf5_loader import (
+    HDF5FlightDataLoader,
+    open_shared_file,
+    release_shared_file,
+    shared_file_count,
+)
+
+
+def _write_file(path, sample_rate=100.0):
+    t = np.arange(0.0, 2.0, 1.0 / sample_rate)
+    with h5py.File(path, "w") as f:
+        flight = f.create_group("flight_001")
+        flight.create_group("metadata").attrs["duration"] = 2.0
+        channel = flight.create_group("channels").create_group("accel_x")
+        channel.create_dataset("time", data=t)
+        channel.create_dataset("data", data=np.sin(t))
+        channel.attrs["units"] = "g"
+        channel.attrs["sample_rate"] = sample_rate
+    return str(path)
+
+
+def test_loaders_of_one_file_share_handle_and_metadata(tmp_path, monkeypatch):
+    path = _write_file(tmp_path / "flight.h5")
+    open_files = shared_file_count()
+    first = HDF5FlightDataLoader(path)
+
+    # The second loader reuses the parsed metadata instead of walking the file
+    monkeypatch.setattr(
+        HDF5FlightDataLoader, "_parse_metadata",
+        lambda self: pytest.fail("metadata parsed twice"),
+    )
+    second = HDF5FlightDataLoader(str(tmp_path / "." / "flight.h5"))
+    try:
+        assert second.h5file is first.h5file
+        assert second.channels is first.channels
+        assert second.get_channel_info("flight_001", "accel_x").units == "g"
+        cache_bytes = first.h5file.id.get_access_plist().get_cache()[2]
+        assert cache_bytes == hdf5_loader.CHUNK_CACHE_BYTES
+        assert shared_file_count() == open_files + 1
+    finally:
+        first.close()
+        second.close()
+
+
+def test_shared_file_closes_when_last_user_releases_it(tmp_path):
+    path = _write_file(tmp_path / "flight.h5")
+    open_files = shared_file_count()
+    loader = HDF5FlightDataLoader(path)
+    handle = open_shared_file(path)
+    assert handle is loader.h5file
+
+    loader.close()
+    loader.close()  # Closing twice releases the file once
+    assert handle.id.valid
+    np.testing.assert_allclose(handle["flight_001/channels/accel_x/data"][:3], np.sin([0.0, 0.01, 0.02]))
+
+    release_shared_file(path)
+    assert not handle.id.valid
+    assert shared_file_count() == open_files
+
+    # A fresh loader opens the file again
+    reopened = HDF5FlightDataLoader(path)
+    try:
+        assert reopened.h5file.id.valid and reopened.h5file is not handle
+    finally:
+        reopened.close()
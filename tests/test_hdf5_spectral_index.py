@@ -0,0 +1,141 @@
+"""
+Tests for segment-spectrum indexes stored in HDF5 files.
+"""
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+
+from spectral_edge.batch.config import (
+    BatchConfig, EventDefinition, FilterConfig, OutputConfig, PSDConfig, SpectrogramConfig,
+)
+from spectral_edge.batch.processor import BatchProcessor
+from spectral_edge.core.segment_index import SegmentSpectrumIndex
+from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+from spectral_edge.utils.hdf5_spectral_index import (
+    get_channel_spectral_index,
+    index_hdf5_file_spectra,
+    maximax_geometry,
+)
+from spectral_edge.utils.signal_conditioning import apply_robust_filtering
+
+SAMPLE_RATE = 1000.0
+
+
+def _write_file(path, duration=60.0):
+    rng = np.random.default_rng(11)
+    n = int(duration * SAMPLE_RATE)
+    time = np.arange(n) / SAMPLE_RATE
+    data = rng.standard_normal(n) + 2.0 * np.sin(2 * np.pi * 120.0 * time)
+    data[int(40 * SAMPLE_RATE):int(41 * SAMPLE_RATE)] *= 6.0
+    with h5py.File(path, "w") as f:
+        flight = f.create_group("flight_001")
+        flight.create_group("metadata").attrs["duration"] = duration
+        channel = flight.create_group("channels").create_group("accel_x")
+        channel.create_dataset("time", data=time)
+        channel.create_dataset("data", data=data)
+        channel.attrs["sample_rate"] = SAMPLE_RATE
+        channel.attrs["units"] = "g"
+    return str(path), data
+
+
+def test_stored_index_matches_in_memory_index(tmp_path):
+    path, data = _write_file(tmp_path / "a.h5")
+    assert index_hdf5_file_spectra(path, df=10.0) == 1
+    assert index_hdf5_file_spectra(path, df=10.0) == 0
+
+    conditioned, _hp, _lp, _messages = apply_robust_filtering(data, SAMPLE_RATE)
+    memory = SegmentSpectrumIndex(conditioned, SAMPLE_RATE, 128)
+    window_samples, step_samples = maximax_geometry(SAMPLE_RATE, 1.0, 50.0)
+    with h5py.File(path, "r") as f:
+        channel = f["flight_001/channels/accel_x"]
+        stored = get_channel_spectral_index(channel, 128, 64)
+        assert stored is not None
+        assert get_channel_spectral_index(channel, 128, 64, user_highpass=5.0) is None
+        np.testing.assert_allclose(stored.frequencies, memory.frequencies)
+
+        for start, end in [(0, 60_000), (1_000, 9_000), (12_345, 45_678), (39_500, 41_700)]:
+            np.testing.assert_allclose(stored.welch(start, end), memory.welch(start, end), rtol=1e-9)
+            # Stored pyramid geometry and a scanned geometry both match the sparse table
+            np.testing.assert_allclose(
+                stored.maximax(start, end, window_samples, step_samples),
+                memory.maximax(start, end, window_samples, step_samples),
+                rtol=1e-9,
+            )
+            np.testing.assert_allclose(
+                stored.maximax(start, end, 2000, 500),
+                memory.maximax(start, end, 2000, 500),
+                rtol=1e-9,
+            )
+
+
+def _batch_config(path, output_dir, method, use_spectral_index):
+    return BatchConfig(
+        source_type="hdf5",
+        source_files=[path],
+        selected_channels=[("flight_001", "accel_x")],
+        process_full_duration=True,
+        events=[
+            EventDefinition(name="burst", start_time=38.0, end_time=44.0),
+            EventDefinition(name="quiet", start_time=5.0, end_time=25.0),
+            EventDefinition(name="blip", start_time=30.0, end_time=30.5),
+        ],
+        psd_config=PSDConfig(method=method, desired_df=10.0, use_spectral_index=use_spectral_index),
+        filter_config=FilterConfig(enabled=False),
+        spectrogram_config=SpectrogramConfig(enabled=False),
+        output_config=OutputConfig(
+            excel_enabled=False, csv_enabled=True, powerpoint_enabled=False,
+            hdf5_writeback_enabled=False, output_directory=str(output_dir),
+        ),
+    )
+
+
+@pytest.mark.parametrize("method", ["welch", "maximax"])
+def test_batch_answers_events_from_index(tmp_path, monkeypatch, method):
+    path, _data = _write_file(tmp_path / "a.h5")
+    raw = BatchProcessor(_batch_config(path, tmp_path, method, False)).process()
+    assert not raw.errors
+
+    index_hdf5_file_spectra(path, df=10.0)
+    loads = []
+    original_load = HDF5FlightDataLoader.load_channel_data
+
+    def counting_load(self, *args, **kwargs):
+        loads.append((args, kwargs))
+        return original_load(self, *args, **kwargs)
+
+    monkeypatch.setattr(HDF5FlightDataLoader, "load_channel_data", counting_load)
+    indexed = BatchProcessor(_batch_config(path, tmp_path, method, True)).process()
+    assert not indexed.errors
+
+    raw_events = raw.channel_results[("flight_001", "accel_x")]
+    indexed_events = indexed.channel_results[("flight_001", "accel_x")]
+    for name in ("full_duration", "burst", "quiet"):
+        metadata = indexed_events[name]["metadata"]
+        assert metadata["from_spectral_index"] is True
+        assert metadata["rms"] == pytest.approx(raw_events[name]["metadata"]["rms"], rel=0.05)
+
+    # Welch answers the half-second event too; maximax needs a full window,
+    # so that event alone falls back to (and fails on) the raw path
+    if method == "welch":
+        assert indexed_events["blip"]["metadata"]["from_spectral_index"] is True
+        assert loads == []
+    else:
+        assert "blip" not in indexed_events
+        assert len(loads) == 1
+
+
+def test_index_rejects_events_outside_data_like_raw_path(tmp_path):
+    path, _data = _write_file(tmp_path / "a.h5")
+    index_hdf5_file_spectra(path, df=10.0)
+    results = []
+    for use_spectral_index in (False, True):
+        config = _batch_config(path, tmp_path, "welch", use_spectral_index)
+        config.events = [EventDefinition(name="overrun", start_time=55.0, end_time=70.0)]
+        results.append(BatchProcessor(config).process())
+
+    raw, indexed = results
+    assert "overrun" not in indexed.channel_results.get(("flight_001", "accel_x"), {})
+    assert indexed.warnings == raw.warnings
+    assert any("outside data range" in warning for warning in indexed.warnings)
@@ -141,15 +141,6 @@ class IntegrationTester:
             os.remove(self.test_hdf5_file)
 
 
-@pytest.fixture(scope="module")
-def app():
-    """Provide a QApplication instance for GUI integration tests."""
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 @pytest.fixture(scope="module")
 def tester():
     """Provide a shared integration tester with prepared HDF5 test data."""
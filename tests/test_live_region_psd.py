@@ -0,0 +1,114 @@
+"""
+Tests for the live region PSD of the PSD window.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt6")
+
+
+from spectral_edge.gui import psd_window as psd_module
+from spectral_edge.utils.channel_cache import ArrayLRUCache, LazyArray
+
+
+@pytest.fixture(autouse=True)
+def _disable_psd_context_menu_styler(monkeypatch):
+    monkeypatch.setattr(
+        "spectral_edge.gui.psd_window.apply_context_menu_style",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+@pytest.fixture
+def window(app):
+    window = psd_module.PSDAnalysisWindow()
+    sample_rate = 200.0
+    time = np.arange(0.0, 10.0, 1.0 / sample_rate)
+    signal = np.sin(2.0 * np.pi * 12.0 * time)
+
+    window.channel_names = ["Accel_X"]
+    window.channel_units = ["g"]
+    window.channel_flight_names = ["flight_001"]
+    window.channel_time_full = [time]
+    window.channel_signal_full = [signal]
+    window.channel_sample_rates = [sample_rate]
+    window.sample_rate = sample_rate
+    yield window
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_live_region_psd_updates_from_segment_index(monkeypatch, window):
+    window._create_channel_checkboxes()
+    window.maximax_checkbox.setChecked(False)
+    window.df_spin.setValue(5.0)
+    window.freq_min_spin.setValue(1.0)
+    window.freq_max_spin.setValue(80.0)
+    window.time_plot_widget.setXRange(0.0, 10.0, padding=0)
+
+    window.live_region_checkbox.setChecked(True)
+    window._wait_for_live_region_indexes()
+    assert "Accel_X" in window.psd_results
+
+    # Dragging reuses the index; no new spectral estimation
+    monkeypatch.setattr(psd_module, "calculate_psd_welch", lambda *_a, **_k: pytest.fail("recomputed"))
+    window._live_region.setRegion((2.0, 8.0))
+    frequencies = window.frequencies["Accel_X"]
+    psd = window.psd_results["Accel_X"]
+    assert frequencies[np.argmax(psd)] == pytest.approx(12.0, abs=5.0)
+    assert window.rms_values["Accel_X"] == pytest.approx(np.sqrt(0.5), rel=0.05)
+
+    window.live_region_checkbox.setChecked(False)
+    assert window._live_region is None
+    assert window.psd_results == {}
+
+
+def test_live_region_index_ignores_maximax_window_changes(monkeypatch, window):
+    window._create_channel_checkboxes()
+    window.maximax_checkbox.setChecked(True)
+    window.df_spin.setValue(5.0)
+    window.time_plot_widget.setXRange(0.0, 10.0, padding=0)
+    window.live_region_checkbox.setChecked(True)
+    window._wait_for_live_region_indexes()
+    index = window._live_region_indexes[0][1]
+    assert index is not None
+
+    # Query-time settings reuse the index instead of rebuilding it
+    monkeypatch.setattr(psd_module, "SegmentSpectrumIndex", lambda *_a, **_k: pytest.fail("index rebuilt"))
+    window.maximax_window_spin.setValue(window.maximax_window_spin.value() + 0.5)
+    window.maximax_overlap_spin.setValue(25)
+    assert window._live_index_thread is None
+    assert window._live_region_indexes[0][1] is index
+    assert "Accel_X" in window.psd_results
+
+
+def test_live_region_drag_reads_no_full_lazy_channel(window):
+    time = window.channel_time_full[0]
+    signal = window.channel_signal_full[0]
+    loads = []
+    cache = ArrayLRUCache(10 * signal.nbytes)
+    window.channel_time_full = [LazyArray(
+        cache, "time", lambda: pytest.fail("time vector read"), len(time), read_slice=lambda index: time[index]
+    )]
+    window.channel_signal_full = [LazyArray(cache, "signal", lambda: loads.append(1) or signal, len(signal))]
+    window._create_channel_checkboxes()
+    window.maximax_checkbox.setChecked(False)
+    window.df_spin.setValue(5.0)
+    window.time_plot_widget.setXRange(0.0, 10.0, padding=0)
+    window.live_region_checkbox.setChecked(True)
+    window._wait_for_live_region_indexes()
+    cache.clear()
+    loads.clear()
+
+    for end_time in (6.0, 7.0, 8.0):
+        window._live_region.setRegion((2.0, end_time))
+        assert "Accel_X" in window.psd_results
+    assert loads == []
+    assert window._time_span_indices(window.channel_time_full[0], 2.0, 8.0, 200.0) == (
+        int(np.searchsorted(time, 2.0, side="left")), int(np.searchsorted(time, 8.0, side="right"))
+    )
@@ -6,20 +6,11 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication
 
 from spectral_edge.gui.psd_window import PSDAnalysisWindow
 from spectral_edge.utils.signal_conditioning import apply_robust_filtering
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 @pytest.fixture(autouse=True)
 def _disable_psd_context_menu_styler(monkeypatch):
     monkeypatch.setattr(
@@ -199,3 +190,41 @@ def test_psd_defaults_and_buttons_render_with_expected_labels_and_icons(app):
     assert "QScrollBar:vertical" in stylesheet
     assert "background: #111827;" in stylesheet
     window.close()
+
+
+def test_decimated_time_history_rerenders_peaks_on_zoom(app):
+    window = PSDAnalysisWindow()
+    sample_rate = 1000.0
+    time_full = np.arange(0.0, 600.0, 1.0 / sample_rate)
+    signal_full = np.sin(2.0 * np.pi * 3.0 * time_full)
+    signal_full[321_234] = 40.0
+    step = time_full.size // 10000
+
+    window.channel_names = ["Accel_X"]
+    window.channel_units = ["g"]
+    window.channel_flight_names = ["flight_001"]
+    window.channel_sample_rates = [sample_rate]
+    window.sample_rate = sample_rate
+    window.channel_time_full = [time_full]
+    window.channel_signal_full = [signal_full]
+    window.channel_time_display = [time_full[::step]]
+    window.channel_signal_display = [signal_full[::step]]
+    window._create_channel_checkboxes()
+    window.raw_radio.setChecked(True)
+    window._build_time_history_cache()
+    window._plot_time_history()
+
+    (item,) = window._time_history_items.values()
+    window.time_plot_widget.getPlotItem().vb.autoRange(padding=0)
+    window._refresh_time_history_lod()
+    x, y = item.getData()
+    assert x.min() < 1.0 and x.max() > time_full[-1] - 1.0
+    assert y.max() == pytest.approx(40.0)
+
+    window.time_plot_widget.setXRange(321.0, 321.5, padding=0)
+    window._refresh_time_history_lod()
+    x, y = item.getData()
+    assert x.min() <= 321.0 and x.max() >= 321.5
+    assert x.size < 600 and np.all(np.diff(x) == pytest.approx(1.0 / sample_rate))
+    assert y.max() == pytest.approx(40.0)
+    window.close()
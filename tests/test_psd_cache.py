@@ -0,0 +1,81 @@
+"""
+Tests for PSD and derived-view caching in the PSD window.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt6")
+
+
+from spectral_edge.gui import psd_window as psd_module
+
+
+@pytest.fixture(autouse=True)
+def _disable_psd_context_menu_styler(monkeypatch):
+    monkeypatch.setattr(
+        "spectral_edge.gui.psd_window.apply_context_menu_style",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+@pytest.fixture
+def window(app):
+    window = psd_module.PSDAnalysisWindow()
+    sample_rate = 200.0
+    time = np.arange(0.0, 10.0, 1.0 / sample_rate)
+    signal = np.sin(2.0 * np.pi * 12.0 * time)
+
+    window.channel_names = ["Accel_X"]
+    window.channel_units = ["g"]
+    window.channel_flight_names = ["flight_001"]
+    window.channel_time_full = [time]
+    window.channel_signal_full = [signal]
+    window.channel_sample_rates = [sample_rate]
+    window.sample_rate = sample_rate
+    yield window
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_psd_cache_skips_recomputation_for_display_changes(monkeypatch, window):
+    window.maximax_checkbox.setChecked(False)
+    window.events = []
+    monkeypatch.setattr(window, "_update_plot", lambda: None)
+
+    welch_calls = []
+    original_welch = psd_module.calculate_psd_welch
+    monkeypatch.setattr(
+        psd_module,
+        "calculate_psd_welch",
+        lambda *args, **kwargs: welch_calls.append(kwargs) or original_welch(*args, **kwargs),
+    )
+
+    window.freq_min_spin.setValue(5.0)
+    window.freq_max_spin.setValue(80.0)
+    window._calculate_psd()
+    window._wait_for_psd_calculation()
+    assert len(welch_calls) == 1
+    rms_wide = window.rms_values["Accel_X"]
+
+    # A narrower band re-derives RMS from the cached spectrum
+    window.freq_min_spin.setValue(20.0)
+    assert len(welch_calls) == 1
+    assert "Accel_X" in window.psd_results
+    assert window.rms_values["Accel_X"] < rms_wide
+
+    # Spectral parameters recompute; returning to earlier ones hits the cache
+    df = window.df_spin.value()
+    window.df_spin.setValue(df * 2)
+    window._calculate_psd()
+    window._wait_for_psd_calculation()
+    assert len(welch_calls) == 2
+    window.df_spin.setValue(df)
+    window._calculate_psd()
+    window._wait_for_psd_calculation()
+    assert len(welch_calls) == 2
+    assert window.rms_values["Accel_X"] < rms_wide
@@ -7,20 +7,11 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication
 
 from spectral_edge.gui import psd_window as psd_module
 from spectral_edge.gui.event_manager import Event
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 @pytest.fixture(autouse=True)
 def _disable_psd_context_menu_styler(monkeypatch):
     monkeypatch.setattr(
@@ -67,6 +58,7 @@ def test_event_psd_uses_maximax_when_enabled(monkeypatch, app):
     )
 
     window._calculate_event_psds(events=[Event("E1", 1.0, 3.0)])
+    window._wait_for_psd_calculation()
 
     assert len(maximax_calls) == 1
     assert maximax_calls[0]["use_efficient_fft"] is True
@@ -95,6 +87,7 @@ def test_event_psd_uses_welch_when_maximax_disabled(monkeypatch, app):
     )
 
     window._calculate_event_psds(events=[Event("E1", 1.0, 3.0)])
+    window._wait_for_psd_calculation()
 
     assert len(welch_calls) == 1
     assert welch_calls[0]["use_efficient_fft"] is True
@@ -148,6 +141,7 @@ def test_calculate_psd_full_path_forwards_efficient_fft(monkeypatch, app):
     )
 
     window._calculate_psd()
+    window._wait_for_psd_calculation()
 
     assert len(welch_calls) == 1
     assert welch_calls[0]["use_efficient_fft"] is True
@@ -0,0 +1,234 @@
+"""
+Tests for memory-bounded lazy channel storage in the PSD window.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt6")
+h5py = pytest.importorskip("h5py")
+
+
+from spectral_edge.gui import psd_window as psd_module
+from spectral_edge.utils import signal_conditioning
+from spectral_edge.utils.channel_cache import ArrayLRUCache, LazyArray
+from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+from spectral_edge.utils.signal_conditioning import (
+    CONDITIONED_CACHE_BYTES,
+    apply_robust_filtering,
+    channel_identity,
+    conditioned_signal_cache,
+)
+from spectral_edge.utils.signal_statistics import compute_conditioned_statistics
+
+
+@pytest.fixture(autouse=True)
+def _quiet_dialogs(monkeypatch):
+    monkeypatch.setattr(psd_module, "apply_context_menu_style", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(psd_module, "show_information", lambda *_args, **_kwargs: None)
+
+
+def test_array_lru_cache_evicts_to_budget():
+    cache = ArrayLRUCache(max_bytes=3 * 800)
+    loads = []
+    arrays = [
+        LazyArray(cache, ("raw", i), lambda i=i: loads.append(i) or np.full(100, float(i)), 100)
+        for i in range(4)
+    ]
+    for array in arrays:
+        assert np.asarray(array)[0] == float(array.key[1])
+    assert cache.nbytes <= cache.max_bytes
+    assert ("raw", 0) not in cache and ("raw", 3) in cache
+
+    # Touching a cached entry keeps it; the least recently used one goes next
+    np.asarray(arrays[1])
+    np.asarray(arrays[0])
+    assert ("raw", 1) in cache and ("raw", 2) not in cache
+    assert loads == [0, 1, 2, 3, 0]
+
+    # Arrays over the whole budget are returned but never cached
+    cache.resize(500)
+    assert len(cache) == 0
+    assert np.asarray(arrays[2]).size == 100 and len(cache) == 0
+
+
+def _write_file(path, n_channels=3, n_samples=200_000, sample_rate=2000.0):
+    rng = np.random.default_rng(5)
+    time = 3.0 + np.arange(n_samples) / sample_rate
+    signals = {}
+    with h5py.File(path, "w") as f:
+        flight = f.create_group("flight_001")
+        flight.create_group("metadata").attrs["duration"] = n_samples / sample_rate
+        channels = flight.create_group("channels")
+        for index in range(n_channels):
+            name = f"accel_{index}"
+            signals[name] = rng.standard_normal(n_samples) * (index + 1)
+            channel = channels.create_group(name)
+            channel.create_dataset("time", data=time)
+            channel.create_dataset("data", data=signals[name])
+            channel.attrs["sample_rate"] = sample_rate
+            channel.attrs["units"] = "g"
+    return str(path), signals
+
+
+def _channel_bytes_held(window):
+    """Full-resolution bytes held for the window, raw and conditioned."""
+    return window._channel_cache.nbytes + conditioned_signal_cache().nbytes
+
+
+def test_hdf5_channels_load_lazily_within_memory_budget(tmp_path, monkeypatch, app):
+    path, signals = _write_file(tmp_path / "flight.h5")
+    window = psd_module.PSDAnalysisWindow()
+    monkeypatch.setattr(window, "_update_plot", lambda: None)
+    loader = HDF5FlightDataLoader(str(path))
+    window.hdf5_loader = loader
+    conditioned_signal_cache().clear()
+    channel_bytes = next(iter(signals.values())).nbytes
+    budget = int(2.5 * channel_bytes)
+    window.set_channel_memory_budget(budget)
+    try:
+        assert window._channel_cache.max_bytes + conditioned_signal_cache().max_bytes == budget
+        window._on_hdf5_data_selected(
+            [("flight_001", name, loader.channels["flight_001"][name]) for name in signals]
+        )
+        window._wait_for_channel_loading()
+        assert all(isinstance(signal, LazyArray) for signal in window.channel_signal_full)
+        assert window.signal_data_full is None
+        assert window._get_time_bounds()[0] == pytest.approx(3.0)
+        assert _channel_bytes_held(window) <= budget
+        assert conditioned_signal_cache().nbytes > 0
+
+        # Filtered time history conditions each channel on first use
+        cache = window.time_history_cache[2]
+        expected, _hp, _lp, _messages = apply_robust_filtering(signals["accel_2"], 2000.0)
+        np.testing.assert_allclose(np.asarray(cache["signal_full_filtered"]), expected)
+        np.testing.assert_allclose(
+            cache["signal_decimated_filtered"], expected[cache["display_indices"]]
+        )
+
+        window.maximax_checkbox.setChecked(False)
+        window._calculate_psd()
+        window._wait_for_psd_calculation()
+        assert set(window.psd_results) == set(signals)
+        assert _channel_bytes_held(window) <= budget
+        # Conditioned arrays are never duplicated into the channel cache
+        assert all(key[0] != "conditioned" for key in window._channel_cache._arrays)
+        rms = [window.rms_values[name] for name in signals]
+        assert rms[0] < rms[1] < rms[2]
+
+        time_full, signal_full, _rate = window._get_channel_full(0)
+        np.testing.assert_array_equal(signal_full, signals["accel_0"])
+        assert time_full[0] == pytest.approx(3.0)
+    finally:
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+        loader.close()
+        conditioned_signal_cache().clear()
+        conditioned_signal_cache().resize(CONDITIONED_CACHE_BYTES)
+
+
+def test_channel_selection_loads_in_background(tmp_path, monkeypatch, app):
+    path, signals = _write_file(tmp_path / "flight.h5")
+    window = psd_module.PSDAnalysisWindow()
+    monkeypatch.setattr(window, "_update_plot", lambda: None)
+    loader = HDF5FlightDataLoader(str(path))
+    window.hdf5_loader = loader
+    items = [("flight_001", name, loader.channels["flight_001"][name]) for name in signals]
+    try:
+        # A new selection replaces a load still in flight
+        window._on_hdf5_data_selected(items)
+        assert window._channel_load_thread is not None
+        assert not window.calc_button.isEnabled()
+        window._on_hdf5_data_selected(items[1:])
+        window._wait_for_channel_loading()
+        for thread in list(window._retired_channel_load_threads):
+            thread.wait()
+
+        assert window.channel_names == ["accel_1", "accel_2"]
+        assert window.calc_button.isEnabled()
+        assert len(window.time_plot_widget.listDataItems()) == 2
+        for channel_idx, name in enumerate(window.channel_names):
+            cache = window.time_history_cache[channel_idx]
+            assert not cache["full_resolution_pending"]
+            assert "lod_raw" in cache and "lod_filtered" in cache
+            expected, _hp, _lp, _messages = apply_robust_filtering(signals[name], 2000.0)
+            np.testing.assert_allclose(np.asarray(cache["signal_full_filtered"]), expected)
+            np.testing.assert_allclose(
+                cache["signal_decimated_filtered"], expected[cache["display_indices"]]
+            )
+    finally:
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+        loader.close()
+
+
+def test_conditioned_channels_are_shared_with_other_views(tmp_path, monkeypatch, app):
+    path, signals = _write_file(tmp_path / "flight.h5", n_channels=2)
+    window = psd_module.PSDAnalysisWindow()
+    monkeypatch.setattr(window, "_update_plot", lambda: None)
+    loader = HDF5FlightDataLoader(str(path))
+    window.hdf5_loader = loader
+    conditioned_signal_cache().clear()
+    captured = {}
+
+    class _FakeWindow:
+        def __init__(self, *args, **kwargs):
+            captured["args"] = args
+
+        def show(self):
+            pass
+
+        def isVisible(self):
+            return True
+
+    def _fake_statistics_window(channels_data, *args, **kwargs):
+        captured["statistics"] = channels_data
+        captured["conditioning"] = kwargs["conditioning"]
+        return _FakeWindow()
+
+    monkeypatch.setattr(psd_module, "SpectrogramWindow", _FakeWindow)
+    monkeypatch.setattr(psd_module, "create_statistics_window", _fake_statistics_window)
+    try:
+        window._on_hdf5_data_selected(
+            [("flight_001", name, loader.channels["flight_001"][name]) for name in signals]
+        )
+        window._wait_for_channel_loading()
+
+        # Channels conditioned while loading are not filtered again by the
+        # PSD, statistics or spectrogram views
+        calls = []
+        real_filtering = signal_conditioning.apply_robust_filtering
+        monkeypatch.setattr(
+            signal_conditioning, "apply_robust_filtering",
+            lambda *args, **kwargs: calls.append(args) or real_filtering(*args, **kwargs),
+        )
+        window.maximax_checkbox.setChecked(False)
+        window._calculate_psd()
+        window._wait_for_psd_calculation()
+        assert set(window.psd_results) == set(signals)
+        window._open_statistics()
+        expected, _hp, _lp, _messages = apply_robust_filtering(signals["accel_1"], 2000.0)
+        statistics = compute_conditioned_statistics(
+            captured["statistics"][1][1], 2000.0, captured["conditioning"]
+        )
+        assert statistics["overall"]["std"] == pytest.approx(np.std(expected), rel=1e-9)
+        assert calls == []
+
+        for checkbox in window.channel_checkboxes:
+            checkbox.setChecked(True)
+        window._open_spectrogram()
+        _time, channels_data, _rates = captured["args"]
+        assert [channel_identity(data) for _name, data, _unit, _flight in channels_data] == [
+            ("hdf5", path, f"/flight_001/channels/{name}/data") for name in signals
+        ]
+    finally:
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+        loader.close()
+        conditioned_signal_cache().clear()
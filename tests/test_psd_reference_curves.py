@@ -6,21 +6,12 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWidgets import QVBoxLayout, QCheckBox
 
 from spectral_edge.gui.psd_window import PSDAnalysisWindow
 from spectral_edge.utils.reference_curves import sanitize_reference_curve
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 def test_psd_builtin_reference_curves_toggle_and_dedupe(app):
     window = PSDAnalysisWindow()
     window.show()
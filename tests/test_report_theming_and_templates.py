@@ -6,21 +6,13 @@ import pytest
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
-from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtWidgets import QWidget
 
 from spectral_edge.gui.psd_window import PSDReportOptionsDialog
 from spectral_edge.gui import statistics_window as statistics_module
 from spectral_edge.utils.report_generator import ReportGenerator, PPTX_AVAILABLE
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 def _build_png_bytes():
     import matplotlib.pyplot as plt
 
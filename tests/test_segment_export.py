@@ -0,0 +1,96 @@
+"""
+Tests for headless parallel export of segmented spectrograms.
+"""
+
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from spectral_edge.batch.segment_export import (
+    SegmentExportTask,
+    SegmentRenderSettings,
+    compute_segment_spectrogram,
+    export_segments,
+    render_spectrogram_png,
+)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _tasks(tmp_path, n_segments, segment_samples):
+    return [
+        SegmentExportTask(
+            segment_idx=i,
+            start_idx=i * segment_samples,
+            end_idx=(i + 1) * segment_samples,
+            nperseg=256,
+            noverlap=128,
+            output_path=str(tmp_path / f"spectrogram_segment_{i + 1:03d}.png"),
+            title=f"Segment {i + 1}",
+        )
+        for i in range(n_segments)
+    ]
+
+
+def _is_png(path):
+    with open(path, "rb") as f:
+        return f.read(8) == PNG_SIGNATURE
+
+
+def test_export_segments_in_process_reports_progress(tmp_path):
+    signal_data = np.random.default_rng(1).standard_normal(4000)
+    settings = SegmentRenderSettings(sample_rate=500.0, freq_max=200.0, figsize=(4, 3))
+    progress = []
+    written, errors = export_segments(
+        signal_data, _tasks(tmp_path, 4, 1000), settings, max_workers=1,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+    assert errors == []
+    assert sorted(written) == [task.output_path for task in _tasks(tmp_path, 4, 1000)]
+    assert all(_is_png(path) for path in written)
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+def test_export_segments_cancel_stops_before_remaining_segments(tmp_path):
+    signal_data = np.random.default_rng(2).standard_normal(4000)
+    settings = SegmentRenderSettings(sample_rate=500.0, figsize=(4, 3))
+    cancel = threading.Event()
+    written, errors = export_segments(
+        signal_data, _tasks(tmp_path, 4, 1000), settings, max_workers=1,
+        progress_callback=lambda done, _total: done == 2 and cancel.set(),
+        cancel_event=cancel,
+    )
+    assert len(written) == 2 and errors == []
+    assert not os.path.exists(tmp_path / "spectrogram_segment_003.png")
+
+
+def test_export_segments_reads_hdf5_in_worker_processes(tmp_path):
+    h5py = pytest.importorskip("h5py")
+    signal_data = np.random.default_rng(3).standard_normal(6000)
+    path = tmp_path / "channel.h5"
+    with h5py.File(path, "w") as f:
+        f.create_dataset("flight_001/channels/accel_x/data", data=signal_data)
+
+    settings = SegmentRenderSettings(
+        sample_rate=1000.0, conditioning={"remove_mean": True}, figsize=(4, 3)
+    )
+    tasks = _tasks(tmp_path, 3, 2000)
+    tasks[2].end_idx = tasks[2].start_idx + 1  # too short to transform
+    with h5py.File(path, "r") as f:
+        written, errors = export_segments(
+            f["flight_001/channels/accel_x/data"], tasks, settings, max_workers=2
+        )
+    assert sorted(written) == [tasks[0].output_path, tasks[1].output_path]
+    assert all(_is_png(path) for path in written)
+    assert [idx for idx, _message in errors] == [2]
+
+
+def test_render_spectrogram_png_handles_empty_frequency_range(tmp_path):
+    f, t, sxx = compute_segment_spectrogram(
+        np.random.default_rng(4).standard_normal(2000), 0, 2000, 500.0, {}, 256, 128, "hann"
+    )
+    settings = SegmentRenderSettings(sample_rate=500.0, freq_min=400.0, figsize=(4, 3))
+    path = render_spectrogram_png(f, t, sxx, 0.0, str(tmp_path / "empty.png"), settings)
+    assert _is_png(path)
@@ -0,0 +1,63 @@
+"""
+Tests for prefix-summed segment spectra used by live region PSDs.
+"""
+
+import numpy as np
+import pytest
+
+from spectral_edge.core.psd import calculate_psd_maximax, calculate_psd_welch
+from spectral_edge.core.segment_index import SegmentSpectrumIndex
+
+
+@pytest.fixture
+def signal_data():
+    rng = np.random.default_rng(11)
+    sample_rate = 1000.0
+    t = np.arange(60_000) / sample_rate
+    data = rng.standard_normal(t.size) + np.sin(2 * np.pi * 50.0 * t) * (t > 30.0)
+    return data, sample_rate
+
+
+@pytest.mark.parametrize("window,noverlap", [("hann", 100), ("hamming", 50)])
+def test_welch_span_matches_direct_calculation(signal_data, window, noverlap):
+    data, sample_rate = signal_data
+    nperseg = 200
+    index = SegmentSpectrumIndex(data, sample_rate, nperseg, noverlap, window=window)
+    hop = nperseg - noverlap
+    for start, end in [(0, data.size), (10 * hop, 10 * hop + 7_777), (150 * hop, 40_000)]:
+        freqs, expected = calculate_psd_welch(
+            data[start:end], sample_rate, window=window, nperseg=nperseg, noverlap=noverlap
+        )
+        np.testing.assert_allclose(index.frequencies, freqs)
+        np.testing.assert_allclose(index.welch(start, end), expected, rtol=1e-9, atol=1e-15)
+
+    with pytest.raises(ValueError):
+        index.welch(1_000, 1_150)
+
+
+def test_maximax_span_matches_direct_calculation(signal_data):
+    data, sample_rate = signal_data
+    index = SegmentSpectrumIndex(data, sample_rate, nperseg=200)
+    window_samples, step_samples = 1000, 500
+    for start, end in [(0, data.size), (5_000, 17_300), (29_500, 31_000)]:
+        _freqs, expected = calculate_psd_maximax(
+            data[start:end], sample_rate, df=5.0, maximax_window=1.0, overlap_percent=50.0
+        )
+        np.testing.assert_allclose(
+            index.maximax(start, end, window_samples, step_samples), expected, rtol=1e-9, atol=1e-15
+        )
+
+
+def test_maximax_without_full_sparse_table_matches(signal_data):
+    data, sample_rate = signal_data
+    full = SegmentSpectrumIndex(data, sample_rate, nperseg=200)
+    # Budget covers the prefix sums but only the first table levels
+    limited = SegmentSpectrumIndex(data, sample_rate, nperseg=200, max_bytes=full.nbytes + 250_000)
+    for start, end in [(0, data.size), (2_000, 45_000)]:
+        np.testing.assert_array_equal(
+            limited.maximax(start, end, 1000, 500), full.maximax(start, end, 1000, 500)
+        )
+    assert len(limited._maximax_tables[(1000, 500)]) < len(full._maximax_tables[(1000, 500)])
+
+    with pytest.raises(ValueError):
+        SegmentSpectrumIndex(data, sample_rate, nperseg=200, max_bytes=1_000)
@@ -6,19 +6,10 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication
 
 from spectral_edge.gui import segmented_spectrogram_viewer as segmented_module
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 class _DummySignal:
     def connect(self, _callback):
         return None
@@ -71,3 +62,150 @@ def test_segmented_viewer_applies_conditioning_before_generation(monkeypatch, ap
     assert abs(np.mean(conditioned)) < abs(np.mean(signal_data))
 
     window.close()
+
+
+def test_segmented_viewer_reads_segments_from_hdf5(tmp_path, monkeypatch, app):
+    h5py = pytest.importorskip("h5py")
+    from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+    from spectral_edge.utils.signal_conditioning import apply_processing_pipeline
+
+    sample_rate = 400.0
+    rng = np.random.default_rng(9)
+    data = 2.0 + rng.standard_normal(int(90 * sample_rate))
+    path = tmp_path / "long.h5"
+    with h5py.File(path, "w") as f:
+        channel = f.create_group("flight_001").create_group("channels").create_group("accel_x")
+        channel.create_dataset("time", data=np.arange(data.size) / sample_rate)
+        channel.create_dataset("data", data=data)
+        channel.attrs["sample_rate"] = sample_rate
+
+    captured = []
+
+    class _FakeGenerator:
+        def __init__(self, signal_data, *_args):
+            captured.append(np.asarray(signal_data, dtype=np.float64))
+            self.segment_idx = 0
+            self.generation_complete = _DummySignal()
+            self.generation_error = _DummySignal()
+
+        def start(self):
+            return None
+
+    monkeypatch.setattr(segmented_module, "SpectrogramGenerator", _FakeGenerator)
+    window = segmented_module.SegmentedSpectrogramViewer()
+    window.prefetch_count = 0
+    loader = HDF5FlightDataLoader(str(path))
+    window.hdf5_loader = loader
+    window.file_path_edit.setText(str(path))
+    try:
+        window._apply_selected_channel("flight_001", "accel_x", loader.channels["flight_001"]["accel_x"])
+        assert isinstance(window.signal_data, h5py.Dataset)
+        window.conditioning_remove_mean_checkbox.setChecked(True)
+        window.segment_duration_spin.setValue(30.0)
+        window.segment_overlap_spin.setValue(0)
+        window._on_generate_clicked()
+        window._display_segment(1)
+
+        # Segments are conditioned with padding, so they join the whole-channel result
+        whole = apply_processing_pipeline(
+            data, sample_rate, window._build_conditioning_filter_settings(), remove_mean=True
+        )
+        (start0, end0), (start1, end1) = window.segments[:2]
+        np.testing.assert_allclose(captured[0], whole[start0:end0], atol=1e-4 * np.std(whole))
+        np.testing.assert_allclose(captured[1], whole[start1:end1], atol=1e-4 * np.std(whole))
+    finally:
+        window.close()
+        loader.close()
+
+
+def test_spectrogram_cache_is_bounded_by_bytes():
+    spec = (np.zeros(10), np.zeros(5), np.zeros((10, 5)))
+    size = sum(array.nbytes for array in spec)
+    cache = segmented_module.SpectrogramCache(max_bytes=2 * size)
+    for idx in range(3):
+        cache.put(idx, spec)
+    assert 0 not in cache and len(cache) == 2
+    assert cache.capacity() == 2
+
+    # Oversized spectrograms are returned by the caller but never cached
+    big = (np.zeros(10), np.zeros(5), np.zeros((100, 50)))
+    cache.put(5, big)
+    assert 5 not in cache and len(cache) == 2
+
+
+def test_segmented_viewer_prefetches_neighbouring_segments(monkeypatch, app):
+    class _FakeGenerator:
+        def __init__(self, *_args):
+            self.segment_idx = 0
+            self.generation_complete = _DummySignal()
+            self.generation_error = _DummySignal()
+
+        def start(self):
+            return None
+
+    monkeypatch.setattr(segmented_module, "SpectrogramGenerator", _FakeGenerator)
+    window = segmented_module.SegmentedSpectrogramViewer()
+    window.prefetch_count = 2
+    sample_rate = 200.0
+    window.signal_data = np.random.default_rng(3).standard_normal(int(60 * sample_rate))
+    window.sample_rate = sample_rate
+    window.channel_name = "Test_Channel"
+    window.segments = [(i * 1000, (i + 1) * 1000) for i in range(12)]
+    window.current_segment_idx = 5
+    try:
+        window._display_segment(5)
+        deadline = 200
+        while len(window.spectrogram_cache) < 4 and deadline:
+            app.processEvents()
+            window.prefetcher._executor.submit(lambda: None).result()
+            deadline -= 1
+        assert {3, 4, 6, 7} <= set(window.spectrogram_cache.cache)
+        assert 5 not in window.spectrogram_cache
+
+        # Prefetched results match a direct computation of the segment
+        f, t, sxx = window.spectrogram_cache.get(6)
+        f_ref, t_ref, sxx_ref = window._segment_job(6)()
+        np.testing.assert_allclose(sxx, sxx_ref)
+
+        # Results tagged with an older generation are dropped
+        window._invalidate_segments()
+        window._on_segment_prefetched(0, 6, (f, t, sxx))
+        assert len(window.spectrogram_cache) == 0
+    finally:
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+
+def test_export_all_runs_in_background_thread(tmp_path, monkeypatch, app):
+    messages = []
+    monkeypatch.setattr(
+        segmented_module.QFileDialog, "getExistingDirectory", lambda *_args, **_kwargs: str(tmp_path)
+    )
+    monkeypatch.setattr(
+        segmented_module, "show_information", lambda _parent, title, _text: messages.append(title)
+    )
+    window = segmented_module.SegmentedSpectrogramViewer()
+    window.prefetch_count = 0
+    window.signal_data = np.random.default_rng(6).standard_normal(3000)
+    window.sample_rate = 500.0
+    window.channel_name = "Test_Channel"
+    window.segments = [(0, 1000), (1000, 2000), (2000, 3000)]
+    try:
+        window._on_export_all_clicked()
+        thread = window.export_thread
+        assert thread is not None
+        thread.wait()
+        app.processEvents()
+
+        assert window.export_thread is None
+        assert messages == ["Export Complete"]
+        assert sorted(os.listdir(tmp_path)) == [
+            f"spectrogram_segment_{i:03d}.png" for i in (1, 2, 3)
+        ]
+        # The viewer's current segment and cache are untouched by the export
+        assert window.current_segment_idx == 0 and len(window.spectrogram_cache) == 0
+    finally:
+        window.close()
+        window.deleteLater()
+        app.processEvents()
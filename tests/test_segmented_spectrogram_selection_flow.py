@@ -6,19 +6,11 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication, QDialog
+from PyQt6.QtWidgets import QDialog
 
 from spectral_edge.gui import segmented_spectrogram_viewer as segmented_module
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 class _LoaderStub:
     def __init__(self, _path):
         self.path = _path
@@ -27,12 +19,11 @@ class _LoaderStub:
     def close(self):
         self.closed = True
 
-    def load_channel_data(self, _flight_key, _channel_key, decimate_for_display=False):
-        assert decimate_for_display is False
-        return {
-            "data_full": [0.0, 1.0, 0.5, -0.2],
-            "sample_rate": 200.0,
-        }
+    def get_channel_dataset(self, _flight_key, _channel_key):
+        return [0.0, 1.0, 0.5, -0.2]
+
+    def get_sample_rate(self, _flight_key, _channel_key):
+        return 200.0
 
 
 class _NavigatorStub:
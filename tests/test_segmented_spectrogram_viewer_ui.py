@@ -6,19 +6,11 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication, QAbstractSpinBox, QGroupBox
+from PyQt6.QtWidgets import QAbstractSpinBox, QGroupBox
 
 from spectral_edge.gui.segmented_spectrogram_viewer import SegmentedSpectrogramViewer
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 def test_segmented_viewer_spinboxes_use_up_down_and_df_controls(app):
     window = SegmentedSpectrogramViewer()
     window.show()
@@ -0,0 +1,88 @@
+"""
+Tests for the shared STFT used by batch PSD and spectrogram generation.
+"""
+
+import numpy as np
+import pytest
+
+from spectral_edge.batch.config import BatchConfig, PSDConfig, SpectrogramConfig
+from spectral_edge.batch.processor import BatchProcessor
+from spectral_edge.batch.shared_stft import compute_psd_and_spectrogram
+from spectral_edge.batch.spectrogram_generator import generate_spectrogram
+from spectral_edge.core.psd import calculate_psd_maximax, calculate_psd_welch
+
+
+@pytest.fixture
+def noisy_signal():
+    rng = np.random.default_rng(1234)
+    sample_rate = 1024.0
+    t = np.arange(0.0, 12.0, 1.0 / sample_rate)
+    signal = rng.standard_normal(t.size) + np.sin(2.0 * np.pi * 100.0 * t) + 0.2
+    return signal, sample_rate
+
+
+@pytest.mark.parametrize("method", ["welch", "maximax"])
+@pytest.mark.parametrize("spec_overlap", [50.0, 75.0])
+def test_shared_stft_matches_independent_calculations(noisy_signal, method, spec_overlap):
+    signal, sample_rate = noisy_signal
+    psd_config = PSDConfig(method=method, desired_df=4.0, use_efficient_fft=True)
+    spec_config = SpectrogramConfig(
+        enabled=True, desired_df=4.0, overlap_percent=spec_overlap, snr_threshold=40.0
+    )
+
+    shared = compute_psd_and_spectrogram(signal, sample_rate, psd_config, spec_config)
+    assert shared is not None
+    frequencies, psd, (spec_f, spec_t, Sxx) = shared
+
+    if method == "welch":
+        ref_f, ref_psd = calculate_psd_welch(
+            signal, sample_rate, window="hann", df=4.0, use_efficient_fft=True
+        )
+    else:
+        ref_f, ref_psd = calculate_psd_maximax(
+            signal, sample_rate, window="hann", overlap_percent=50.0, df=4.0, use_efficient_fft=True
+        )
+    ref_spec_f, ref_spec_t, ref_Sxx = generate_spectrogram(
+        signal, sample_rate, desired_df=4.0, overlap_percent=spec_overlap, snr_threshold=40.0
+    )
+
+    np.testing.assert_allclose(frequencies, ref_f)
+    np.testing.assert_allclose(psd, ref_psd, rtol=1e-10)
+    np.testing.assert_allclose(spec_f, ref_spec_f)
+    np.testing.assert_allclose(spec_t, ref_spec_t)
+    np.testing.assert_allclose(Sxx, ref_Sxx, rtol=1e-10)
+
+
+def test_shared_stft_declines_incompatible_segments(noisy_signal):
+    signal, sample_rate = noisy_signal
+    spec_config = SpectrogramConfig(enabled=True, desired_df=2.0)
+    assert compute_psd_and_spectrogram(
+        signal, sample_rate, PSDConfig(method="welch", desired_df=4.0), spec_config
+    ) is None
+    assert compute_psd_and_spectrogram(
+        signal,
+        sample_rate,
+        PSDConfig(method="welch", desired_df=2.0, window="flattop"),
+        spec_config,
+    ) is None
+
+
+def test_process_event_uses_shared_stft_results(noisy_signal):
+    signal, sample_rate = noisy_signal
+    t = np.arange(signal.size) / sample_rate
+    cfg = BatchConfig(
+        source_type="csv",
+        source_files=["dummy.csv"],
+        psd_config=PSDConfig(method="maximax", desired_df=4.0, use_efficient_fft=True),
+        spectrogram_config=SpectrogramConfig(enabled=True, desired_df=4.0, snr_threshold=0.0),
+    )
+    processor = BatchProcessor(cfg)
+    processor._process_event("flight_1", "chan_1", "full_duration", t, signal, sample_rate, "g")
+
+    entry = processor.result.channel_results[("flight_1", "chan_1")]["full_duration"]
+    assert entry["metadata"]["spectrogram_generated"] is True
+    conditioned = entry["conditioned_signal"]
+    _, ref_psd = processor._calculate_psd(conditioned, sample_rate)
+    np.testing.assert_allclose(entry["psd"], ref_psd, rtol=1e-10)
+    spectrogram = entry["spectrogram"]
+    assert spectrogram["Sxx"].shape == (spectrogram["frequencies"].size, spectrogram["times"].size)
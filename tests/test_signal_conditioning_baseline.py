@@ -1,10 +1,19 @@
+import gc
+
 import numpy as np
 import pytest
 
+from spectral_edge.utils import signal_conditioning
 from spectral_edge.utils.signal_conditioning import (
     apply_processing_pipeline,
+    apply_processing_pipeline_to_span,
     apply_robust_filtering,
+    cached_processing_pipeline,
+    cached_robust_filtering,
     calculate_baseline_filters,
+    conditioned_signal_array,
+    conditioned_signal_cache,
+    discard_conditioned_signals,
 )
 
 
@@ -61,3 +70,106 @@ def test_apply_processing_pipeline_applies_baseline_by_default():
     )
     assert processed.shape == signal.shape
     assert abs(np.mean(processed)) < abs(np.mean(signal))
+
+
+def test_apply_processing_pipeline_to_span_matches_whole_signal():
+    rng = np.random.default_rng(3)
+    sample_rate = 500.0
+    signal = 3.0 + rng.standard_normal(int(60 * sample_rate))
+    settings = {"enabled": True, "filter_type": "bandpass", "user_highpass_hz": 2.0, "user_lowpass_hz": 150.0}
+    whole = apply_processing_pipeline(signal, sample_rate, settings, remove_mean=True)
+
+    # Interior, channel-edge and adjacent spans all line up with the whole signal
+    for start, end in [(10_000, 15_000), (0, 4_000), (26_000, 30_000), (15_000, 20_000)]:
+        span = apply_processing_pipeline_to_span(signal, start, end, sample_rate, settings, remove_mean=True)
+        assert span.shape == (end - start,)
+        np.testing.assert_allclose(span, whole[start:end], atol=1e-4 * np.std(whole))
+
+
+def test_conditioned_signal_cache_is_shared_between_views(monkeypatch):
+    rng = np.random.default_rng(4)
+    signal = 2.0 + rng.standard_normal(20_000)
+    settings = {"enabled": True, "user_highpass_hz": 5.0, "user_lowpass_hz": 200.0}
+    expected_filtered = apply_robust_filtering(signal, 1000.0, 5.0, 200.0)[0]
+    expected_demeaned = apply_processing_pipeline(signal, 1000.0, settings, remove_mean=True)
+    conditioned_signal_cache().clear()
+
+    calls = []
+    real_filtering = signal_conditioning.apply_robust_filtering
+
+    def counting_filtering(data, *args, **kwargs):
+        calls.append(len(data))
+        return real_filtering(data, *args, **kwargs)
+
+    monkeypatch.setattr(signal_conditioning, "apply_robust_filtering", counting_filtering)
+
+    # The PSD's filtering is reused by pipeline views with the same cutoffs,
+    # including the filtering step of a mean-removed view
+    filtered, hp, lp, messages = cached_robust_filtering(signal, 1000.0, 5.0, 200.0)
+    assert (hp, lp, messages) == (5.0, 200.0, [])
+    np.testing.assert_array_equal(filtered, expected_filtered)
+    assert cached_processing_pipeline(signal, 1000.0, settings) is filtered
+    demeaned = cached_processing_pipeline(signal, 1000.0, settings, remove_mean=True)
+    np.testing.assert_allclose(demeaned, expected_demeaned)
+    assert cached_processing_pipeline(signal, 1000.0, settings, remove_mean=True) is demeaned
+    assert calls == [20_000]
+    assert not filtered.flags.writeable
+
+    # Other settings, other spans and other arrays are conditioned separately
+    cached_robust_filtering(signal, 1000.0, 10.0, 200.0)
+    cached_robust_filtering(signal[1000:5000], 1000.0, 5.0, 200.0)
+    cached_robust_filtering(signal.copy(), 1000.0, 5.0, 200.0)
+    assert calls == [20_000, 20_000, 4000, 20_000]
+
+    # Entries of collected arrays are dropped
+    entries = len(conditioned_signal_cache())
+    del signal
+    gc.collect()
+    cached_robust_filtering(np.ones(10), 1000.0)
+    assert len(conditioned_signal_cache()) < entries
+    conditioned_signal_cache().clear()
+
+
+def test_conditioned_signal_handles_and_stale_settings_share_the_session_cache():
+    rng = np.random.default_rng(8)
+    signal = rng.standard_normal(10_000)
+    other = rng.standard_normal(10_000)
+    conditioned_signal_cache().clear()
+
+    handle = conditioned_signal_array(signal, 1000.0, 5.0, 200.0)
+    np.testing.assert_array_equal(np.asarray(handle), apply_robust_filtering(signal, 1000.0, 5.0, 200.0)[0])
+    assert handle.cache is conditioned_signal_cache()
+    assert len(conditioned_signal_cache()) == 1
+
+    # Changing the cutoffs drops the signal's other settings, not other signals
+    cached_robust_filtering(signal, 1000.0, 10.0, 200.0)
+    cached_robust_filtering(other, 1000.0, 5.0, 200.0)
+    discard_conditioned_signals([signal], 10.0, 200.0)
+    assert handle.key not in conditioned_signal_cache()
+    assert len(conditioned_signal_cache()) == 2
+    np.testing.assert_array_equal(np.asarray(handle), apply_robust_filtering(signal, 1000.0, 5.0, 200.0)[0])
+    conditioned_signal_cache().clear()
+
+
+def test_filter_info_leaves_the_session_cache_with_its_array():
+    signals = [np.random.default_rng(seed).standard_normal(10_000) for seed in range(4)]
+    cache = conditioned_signal_cache()
+    budget = cache.max_bytes
+    cache.clear()
+    assert signal_conditioning._filter_info == {}
+    try:
+        cache.resize(2 * signals[0].nbytes)
+        for signal in signals:
+            cached_robust_filtering(signal, 1000.0, 5.0, 200.0)
+        assert len(cache) == 2
+        assert set(signal_conditioning._filter_info) == set(cache._arrays)
+
+        # A hit after eviction re-conditions and reports the same filters
+        assert cached_robust_filtering(signals[0], 1000.0, 5.0, 200.0)[1:] == (
+            apply_robust_filtering(signals[0], 1000.0, 5.0, 200.0)[1:]
+        )
+        cache.resize(signals[0].nbytes // 2)
+        assert len(cache) == 0 and signal_conditioning._filter_info == {}
+    finally:
+        cache.resize(budget)
+        cache.clear()
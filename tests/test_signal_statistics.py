@@ -0,0 +1,199 @@
+"""
+Tests for the shared statistics engine used by batch reports and the statistics window.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from spectral_edge.utils import signal_statistics
+from spectral_edge.utils.hdf5_loader import HDF5FlightDataLoader
+from spectral_edge.utils.signal_conditioning import apply_processing_pipeline, cached_processing_pipeline
+from spectral_edge.utils.signal_statistics import (
+    StreamingMoments,
+    compute_conditioned_statistics,
+    compute_hdf5_channel_statistics,
+    compute_signal_statistics,
+    compute_streaming_statistics,
+    overall_moments,
+    running_moments,
+)
+
+
+@pytest.fixture
+def skewed_signal():
+    rng = np.random.default_rng(42)
+    return 3.0 + 0.5 * rng.standard_normal(250_000) ** 3
+
+
+def test_overall_moments_are_exact_across_blocks(skewed_signal):
+    moments = overall_moments(skewed_signal, block_samples=9_973)
+    assert moments.count == skewed_signal.size
+    assert moments.mean == pytest.approx(np.mean(skewed_signal), rel=1e-12)
+    assert moments.std == pytest.approx(np.std(skewed_signal), rel=1e-12)
+    assert moments.skewness == pytest.approx(stats.skew(skewed_signal), rel=1e-10)
+    assert moments.kurtosis == pytest.approx(stats.kurtosis(skewed_signal), rel=1e-10)
+    assert moments.rms == pytest.approx(np.sqrt(np.mean(skewed_signal ** 2)), rel=1e-12)
+    assert moments.min == np.min(skewed_signal)
+    assert moments.max == np.max(skewed_signal)
+
+
+def test_streaming_moments_constant_signal_has_zero_shape_stats():
+    moments = StreamingMoments()
+    moments.update(np.full(1000, 2.5))
+    summary = moments.as_dict()
+    assert summary["std"] == 0.0
+    assert summary["skewness"] == 0.0
+    assert summary["kurtosis"] == 0.0
+    assert summary["crest_factor"] == pytest.approx(1.0)
+
+
+def test_running_moments_match_direct_window_statistics(skewed_signal):
+    window = 501
+    traces = running_moments(skewed_signal[:20_000], window, block_samples=3_000)
+    padded = np.pad(skewed_signal[:20_000], (window // 2, window - 1 - window // 2), mode="edge")
+    for index in (0, 137, 2_999, 3_000, 12_345, 19_999):
+        segment = padded[index:index + window]
+        assert traces["mean"][index] == pytest.approx(np.mean(segment), rel=1e-10)
+        assert traces["std"][index] == pytest.approx(np.std(segment), rel=1e-9)
+        assert traces["skewness"][index] == pytest.approx(stats.skew(segment), rel=1e-7, abs=1e-9)
+        assert traces["kurtosis"][index] == pytest.approx(stats.kurtosis(segment), rel=1e-7, abs=1e-9)
+
+
+def test_compute_signal_statistics_is_deterministic(skewed_signal):
+    first = compute_signal_statistics(skewed_signal, 1000.0, n_bins=40, window_seconds=1.0)
+    second = compute_signal_statistics(skewed_signal, 1000.0, n_bins=40, window_seconds=1.0)
+    assert first["overall"] == second["overall"]
+    assert first["overall"]["kurtosis"] == pytest.approx(stats.kurtosis(skewed_signal), rel=1e-10)
+
+    running = first["running"]
+    assert running["time"].size <= 5000 + 1
+    for key in ("mean", "std", "skewness", "kurtosis"):
+        assert running[key].size == running["time"].size
+    np.testing.assert_array_equal(running["skewness_time"], running["time"])
+    assert first["pdf"]["counts"].size == 40
+
+
+def test_compute_signal_statistics_skips_running_for_short_signal():
+    result = compute_signal_statistics(np.arange(50, dtype=float), 1000.0, window_seconds=1.0)
+    assert result["running"] == {}
+    assert result["overall"]["max"] == 49.0
+
+
+def _assert_statistics_equal(actual, expected):
+    for section in ("pdf", "running", "overall"):
+        assert actual[section].keys() == expected[section].keys()
+        for key, value in expected[section].items():
+            if value is None:
+                assert actual[section][key] is None
+            else:
+                np.testing.assert_allclose(actual[section][key], value, rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("block_samples", [4_096, 65_536])
+def test_streaming_statistics_match_in_memory_engine(skewed_signal, block_samples):
+    requested = []
+
+    def read_block(start, stop):
+        requested.append(stop - start)
+        return skewed_signal[start:stop]
+
+    streamed = compute_streaming_statistics(
+        read_block, skewed_signal.size, 1000.0, n_bins=40, window_seconds=0.5,
+        max_plot_points=777, block_samples=block_samples,
+    )
+    expected = compute_signal_statistics(
+        skewed_signal, 1000.0, n_bins=40, window_seconds=0.5,
+        max_plot_points=777, block_samples=block_samples,
+    )
+    _assert_statistics_equal(streamed, expected)
+    # Reads are bounded by one block plus one running window of halo
+    assert max(requested) <= block_samples + 500
+
+
+def test_streaming_statistics_single_pass_with_known_range(skewed_signal):
+    value_range = (float(skewed_signal.min()), float(skewed_signal.max()))
+    reads = []
+
+    def read_block(start, stop):
+        reads.append(start)
+        return skewed_signal[start:stop]
+
+    streamed = compute_streaming_statistics(
+        read_block, skewed_signal.size, 1000.0, block_samples=50_000, value_range=value_range
+    )
+    assert len(reads) == 5
+    _assert_statistics_equal(
+        streamed, compute_signal_statistics(skewed_signal, 1000.0, block_samples=50_000)
+    )
+
+
+def test_hdf5_channel_statistics_stream_from_loader(tmp_path, skewed_signal):
+    h5py = pytest.importorskip("h5py")
+    sample_rate = 2000.0
+    t = np.arange(skewed_signal.size) / sample_rate
+    path = tmp_path / "flight.h5"
+    with h5py.File(path, "w") as f:
+        channel = f.create_group("flight_001/channels/accel_x")
+        channel.create_dataset("time", data=t)
+        channel.create_dataset("data", data=skewed_signal, chunks=(8192,))
+        channel.attrs["sample_rate"] = sample_rate
+
+    loader = HDF5FlightDataLoader(str(path))
+    try:
+        streamed = compute_hdf5_channel_statistics(
+            loader, "flight_001", "accel_x", start_time=10.0, end_time=100.0,
+            block_samples=30_000,
+        )
+        start_idx, end_idx, _ = loader.get_sample_range("flight_001", "accel_x", 10.0, 100.0)
+    finally:
+        loader.close()
+
+    assert (start_idx, end_idx) == (20_000, 200_000)
+    expected = compute_signal_statistics(
+        skewed_signal[start_idx:end_idx], sample_rate, block_samples=30_000
+    )
+    _assert_statistics_equal(streamed, expected)
+
+
+def test_conditioned_statistics_condition_padded_blocks(tmp_path, monkeypatch, skewed_signal):
+    h5py = pytest.importorskip("h5py")
+    sample_rate = 2000.0
+    settings = {"enabled": True, "user_highpass_hz": 5.0, "user_lowpass_hz": 400.0}
+    conditioning = {"filter_settings": settings, "remove_mean": False}
+    path = tmp_path / "flight.h5"
+    with h5py.File(path, "w") as f:
+        channel = f.create_group("flight_001/channels/accel_x")
+        channel.create_dataset("time", data=np.arange(skewed_signal.size) / sample_rate)
+        channel.create_dataset("data", data=skewed_signal, chunks=(8192,))
+        channel.attrs["sample_rate"] = sample_rate
+
+    # Blocks conditioned with context from the channel match conditioning
+    # the whole channel and taking the range
+    loader = HDF5FlightDataLoader(str(path))
+    try:
+        streamed = compute_hdf5_channel_statistics(
+            loader, "flight_001", "accel_x", start_time=10.0, end_time=100.0,
+            conditioning=conditioning, block_samples=30_000,
+        )
+    finally:
+        loader.close()
+    whole = apply_processing_pipeline(skewed_signal, sample_rate, settings)
+    expected = compute_signal_statistics(whole[20_000:200_000], sample_rate, block_samples=30_000)
+    for key in ("mean", "std", "skewness", "kurtosis", "rms"):
+        assert streamed["overall"][key] == pytest.approx(
+            expected["overall"][key], rel=1e-3, abs=1e-4 * expected["overall"]["std"]
+        )
+    np.testing.assert_allclose(
+        streamed["running"]["std"], expected["running"]["std"], rtol=1e-3
+    )
+
+    # A channel another view has already conditioned is sliced, not re-conditioned
+    in_memory = skewed_signal.copy()
+    conditioned = cached_processing_pipeline(in_memory, sample_rate, settings)
+    monkeypatch.setattr(
+        signal_statistics, "apply_processing_pipeline_to_span",
+        lambda *_args, **_kwargs: pytest.fail("block was re-conditioned"),
+    )
+    cached = compute_conditioned_statistics(in_memory, sample_rate, conditioning, block_samples=30_000)
+    _assert_statistics_equal(cached, compute_signal_statistics(conditioned, sample_rate, block_samples=30_000))
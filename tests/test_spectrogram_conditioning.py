@@ -6,20 +6,13 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication, QCheckBox
+from PyQt6.QtWidgets import QCheckBox
 
 from spectral_edge.gui import psd_window as psd_module
+from spectral_edge.gui import spectrogram_window as spectrogram_module
 from spectral_edge.gui.spectrogram_window import SpectrogramWindow
 
 
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
-
-
 @pytest.fixture(autouse=True)
 def _disable_context_menu_styling(monkeypatch):
     monkeypatch.setattr("spectral_edge.gui.spectrogram_window.apply_context_menu_style", lambda *_args, **_kwargs: None)
@@ -178,3 +171,96 @@ def test_psd_open_spectrogram_reused_window_syncs_conditioning_defaults(monkeypa
     assert update_call["recalculate"] is True
 
     window.close()
+
+
+def test_spectrogram_window_refines_tiles_when_zoomed(app):
+    sample_rate = 1000.0
+    time_data = np.arange(1_200_000) / sample_rate
+    signal = np.sin(2.0 * np.pi * 120.0 * time_data)
+    window = SpectrogramWindow(
+        time_data=time_data,
+        channels_data=[("Ch1", signal, "g", "")],
+        sample_rates=[sample_rate],
+        df=1.0,
+        freq_min=20,
+        freq_max=400,
+    )
+    try:
+        window.resize(1700, 900)
+        window.show()
+        window._wait_for_spectrograms()
+        pyramid = window.pyramids[0]
+        overview = set(window.tile_items[0])
+        assert overview and all(tile[0] > 0 for tile in overview)
+        min_power, max_power = window.power_levels[0]
+        assert max_power - min_power == window.snr_spin.value()
+
+        # Zooming to one second asks for full-resolution tiles in the background
+        window.plot_widgets[0].setXRange(600.0, 601.0, padding=0)
+        window.plot_widgets[0].setYRange(100.0, 140.0, padding=0)
+        window._refresh_tiles()
+        wanted = window.wanted_tiles[0]
+        assert wanted and all(tile[0] == 0 and tile[1] == 0 for tile in wanted)
+        for _attempt in range(200):
+            if wanted <= set(window.tile_items[0]):
+                break
+            window.tile_loader._executor.submit(lambda: None).result()
+            app.processEvents()
+        assert wanted <= set(window.tile_items[0])
+        assert overview <= set(window.tile_items[0])
+
+        # New settings invalidate everything computed for the old ones
+        generation = window.tile_generation
+        window._calculate_spectrograms()
+        window._wait_for_spectrograms()
+        assert window.tile_generation == generation + 1
+        assert window.pyramids[0] is not pyramid
+        window._on_tile_ready(generation, (0, next(iter(wanted))), np.zeros((1, 1), dtype=np.float32))
+        assert all(item.zValue() < 0 for item in window.tile_items[0].values())
+    finally:
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+
+def test_spectrogram_window_computes_channels_in_background(app):
+    sample_rate = 1000.0
+    time_data = np.arange(20_000) / sample_rate
+    channels = [
+        (f"Ch{i}", np.sin(2.0 * np.pi * (50.0 + 50.0 * i) * time_data), "g", "flight_001")
+        for i in range(3)
+    ]
+    window = SpectrogramWindow(
+        time_data=time_data,
+        channels_data=channels,
+        sample_rates=[sample_rate] * 3,
+        freq_min=20,
+        freq_max=400,
+        remove_mean=True,
+    )
+    try:
+        # Nothing is drawn on the GUI thread until a channel's result arrives
+        assert window.pyramids == [None, None, None]
+        window._wait_for_spectrograms()
+        assert all(pyramid is not None for pyramid in window.pyramids)
+        assert all(window.tile_items[i] for i in range(3))
+        lut, _colormap = spectrogram_module._colormap_lut("viridis")
+        assert window._lut is lut
+
+        # Switching colormap redraws from cached tiles with one new table
+        window.colormap_combo.setCurrentText("plasma")
+        assert window._lut is spectrogram_module._colormap_lut("plasma")[0]
+        assert all(window.tile_items[i] for i in range(3))
+
+        # Results of superseded settings are dropped
+        stale = window.tile_generation
+        window._calculate_spectrograms()
+        window._on_channel_ready(stale, 1, object())
+        window._on_channel_failed(stale, 1, "stale")
+        window._wait_for_spectrograms()
+        assert "stale" not in window.plot_widgets[1].plotItem.titleLabel.text
+        assert all(window.power_levels[i] is not None for i in range(3))
+    finally:
+        window.close()
+        window.deleteLater()
+        app.processEvents()
@@ -0,0 +1,130 @@
+"""
+Tests for the tiled multi-resolution spectrogram pyramid.
+"""
+
+import numpy as np
+import pytest
+from scipy import signal as scipy_signal
+
+from spectral_edge.core.spectrogram_tiles import TILE_COLUMNS, TILE_ROWS, SpectrogramPyramid
+from spectral_edge.utils.channel_cache import ArrayLRUCache
+
+
+@pytest.fixture(scope="module")
+def long_signal():
+    rng = np.random.default_rng(11)
+    sample_rate = 1000.0
+    time = np.arange(1_200_000) / sample_rate
+    return sample_rate, np.sin(2 * np.pi * 120.0 * time) + 0.1 * rng.standard_normal(time.size)
+
+
+def test_level_zero_tiles_match_scipy_spectrogram(long_signal):
+    sample_rate, data = long_signal
+    pyramid = SpectrogramPyramid(data, sample_rate, 1024, 512)
+    freqs, times, sxx = scipy_signal.spectrogram(
+        data, fs=sample_rate, window="hann", nperseg=1024, noverlap=512, scaling="density"
+    )
+    assert pyramid.n_frames == times.size
+    assert pyramid.time_bounds() == pytest.approx((times[0], times[-1]))
+
+    tile = pyramid.tile((0, 0, 1, 1))
+    expected = 10 * np.log10(sxx[TILE_ROWS:2 * TILE_ROWS, TILE_COLUMNS:2 * TILE_COLUMNS] + 1e-20)
+    np.testing.assert_allclose(tile, expected, atol=1e-3)
+
+    x, y, width, height = pyramid.tile_rect((0, 0, 1, 1))
+    frame_seconds = 512 / sample_rate
+    assert x + frame_seconds / 2 == pytest.approx(times[TILE_COLUMNS])
+    assert y + pyramid.df / 2 == pytest.approx(freqs[TILE_ROWS])
+    assert width == pytest.approx(TILE_COLUMNS * frame_seconds)
+    assert height == pytest.approx(TILE_ROWS * pyramid.df)
+
+
+def test_coarse_tiles_average_frames_and_bins(long_signal):
+    sample_rate, data = long_signal
+    pyramid = SpectrogramPyramid(data, sample_rate, 1024, 512)
+    _freqs, _times, sxx = scipy_signal.spectrogram(
+        data, fs=sample_rate, window="hann", nperseg=1024, noverlap=512, scaling="density"
+    )
+    tile = pyramid.tile((2, 1, 0, 0))
+    pooled = sxx[:2 * TILE_ROWS, :4 * TILE_COLUMNS].reshape(TILE_ROWS, 2, TILE_COLUMNS, 4).mean(axis=(1, 3))
+    np.testing.assert_allclose(tile, 10 * np.log10(pooled), atol=1e-3)
+
+    # The tone stands out at every level
+    top = pyramid.tile((pyramid.max_level, pyramid.max_freq_level, 0, 0))
+    assert top.shape[1] <= TILE_COLUMNS and top.shape[0] <= TILE_ROWS
+    tone_row = int(120.0 / pyramid.df) >> pyramid.max_freq_level
+    assert np.all(top[tone_row] > np.median(top, axis=0) + 10)
+
+
+def test_coarse_columns_keep_transients_and_peak_power():
+    rng = np.random.default_rng(12)
+    sample_rate = 1000.0
+    data = 0.01 * rng.standard_normal(700_000)
+    burst = slice(333_000, 333_300)
+    data[burst] += 5.0 * np.sin(2 * np.pi * 300.0 * np.arange(300) / sample_rate)
+    pyramid = SpectrogramPyramid(data, sample_rate, 256, 128)
+    freqs, _times, sxx = scipy_signal.spectrogram(
+        data, fs=sample_rate, window="hann", nperseg=256, noverlap=128, scaling="density"
+    )
+
+    # Every frame is averaged into its column, including a short final column
+    level = pyramid.max_level
+    top = pyramid.tile((level, 0, 0, 0))
+    span = 1 << level
+    starts = np.arange(0, pyramid.n_frames, span)
+    pooled = np.add.reduceat(sxx[:TILE_ROWS], starts, axis=1) / np.diff(np.append(starts, pyramid.n_frames))
+    np.testing.assert_allclose(top, 10 * np.log10(pooled), atol=1e-3)
+
+    # The burst lasts a few frames yet lifts its column over all the others
+    burst_column = (burst.start // 128) >> level
+    tone_row = int(round(300.0 / pyramid.df))
+    assert np.argmax(top[tone_row]) == burst_column
+    assert top[tone_row, burst_column] > np.median(top[tone_row]) + 20
+
+    # The colour-scale peak is the loudest single frame and bin, at any level
+    full = pyramid.time_bounds()
+    band = (freqs >= 250.0) & (freqs <= 350.0)
+    loudest = 10 * np.log10(sxx[band].max())
+    for tile_level in (0, level):
+        tiles = pyramid.tiles_in_view(tile_level, 0, full, (250.0, 350.0))
+        assert pyramid.peak_power_db(tiles, (250.0, 350.0)) == pytest.approx(loudest, abs=1e-3)
+    assert float(np.max(top)) < loudest - 3
+
+
+def test_tiles_in_view_follow_zoom(long_signal):
+    sample_rate, data = long_signal
+    pyramid = SpectrogramPyramid(data, sample_rate, 1024, 512)
+    full = pyramid.time_bounds()
+    level = pyramid.level_for(full[1] - full[0], 100)
+    assert level == pyramid.max_level
+    assert pyramid.tiles_in_view(level, 1, full, (0, 400)) == [(level, 1, 0, 0)]
+    assert len(pyramid.tiles_in_view(level, 1, full, (0, 500))) == 2
+
+    # One second around t=200 s at 800 px needs full resolution and one tile
+    assert pyramid.level_for(1.0, 800) == 0
+    assert pyramid.tiles_in_view(0, 0, (200.0, 201.0), (100.0, 140.0)) == [(0, 0, 1, 0)]
+    assert pyramid.tiles_in_view(0, 0, (1300.0, 1400.0), (0.0, 100.0)) == []
+
+    power_db = pyramid.tile((0, 0, 1, 0))
+    cropped, (_x, y, _width, height) = pyramid.crop_to_frequencies((0, 0, 1, 0), power_db, (100.0, 140.0))
+    first_bin, last_bin = int(np.ceil(100.0 / pyramid.df)), int(np.floor(140.0 / pyramid.df))
+    np.testing.assert_array_equal(cropped, power_db[first_bin:last_bin + 1])
+    assert y == pytest.approx((first_bin - 0.5) * pyramid.df)
+    assert height == pytest.approx(cropped.shape[0] * pyramid.df)
+    assert pyramid.crop_to_frequencies((0, 0, 1, 0), power_db, (600.0, 700.0)) is None
+
+
+def test_tiles_are_cached_within_budget(long_signal):
+    sample_rate, data = long_signal
+    tile_bytes = TILE_ROWS * TILE_COLUMNS * 4
+    cache = ArrayLRUCache(max_bytes=4 * tile_bytes)
+    pyramid = SpectrogramPyramid(data, sample_rate, 1024, 512, cache=cache, key="ch0")
+    first = pyramid.tile((0, 0, 0, 0))
+    # Computing a time tile caches its other frequency tiles too
+    assert pyramid.cached_tile((0, 0, 0, 1)) is not None
+    assert pyramid.tile((0, 0, 0, 0)) is first
+
+    for time_tile in range(1, 4):
+        pyramid.tile((0, 0, time_tile, 0))
+    assert cache.nbytes <= cache.max_bytes
+    assert pyramid.cached_tile((0, 0, 0, 0)) is None
@@ -1,4 +1,5 @@
 import os
+from types import SimpleNamespace
 
 import numpy as np
 import pytest
@@ -6,21 +7,15 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtWidgets import QWidget
 import matplotlib.pyplot as plt
 
+from spectral_edge.batch.powerpoint_output import _stream_channel_statistics
 from spectral_edge.batch.statistics import compute_statistics, plot_pdf
 from spectral_edge.gui import psd_window as psd_module
 from spectral_edge.gui.statistics_window import create_statistics_window
-from spectral_edge.utils.signal_conditioning import build_processing_note
-
-
-@pytest.fixture(scope="module")
-def app():
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    return application
+from spectral_edge.utils.signal_conditioning import apply_processing_pipeline, build_processing_note
+from spectral_edge.utils.signal_statistics import compute_conditioned_statistics
 
 
 @pytest.fixture(autouse=True)
@@ -91,7 +86,7 @@ def test_statistics_window_shows_conditioning_note_and_dark_channel_panel(app):
     window.close()
 
 
-def test_psd_statistics_window_receives_conditioned_signal(monkeypatch, app):
+def test_psd_statistics_window_conditions_raw_channels_while_streaming(monkeypatch, app):
     captured = {}
 
     class _FakeStatisticsWindow:
@@ -110,11 +105,13 @@ def test_psd_statistics_window_receives_conditioned_signal(monkeypatch, app):
         def activateWindow(self):
             pass
 
-    def _fake_factory(channels_data, sample_rate, parent=None, processing_note="", processing_flags=None):
+    def _fake_factory(channels_data, sample_rate, parent=None, processing_note="", processing_flags=None,
+                      conditioning=None):
         captured["channels_data"] = channels_data
         captured["sample_rate"] = sample_rate
         captured["processing_note"] = processing_note
         captured["processing_flags"] = processing_flags or {}
+        captured["conditioning"] = conditioning
         return _FakeStatisticsWindow()
 
     monkeypatch.setattr(psd_module, "create_statistics_window", _fake_factory)
@@ -134,10 +131,48 @@ def test_psd_statistics_window_receives_conditioned_signal(monkeypatch, app):
     window._open_statistics()
     app.processEvents()
 
-    conditioned_signal = captured["channels_data"][0][1]
-    assert conditioned_signal.shape == signal.shape
-    assert not np.allclose(conditioned_signal, signal)
-    assert abs(np.mean(conditioned_signal)) < abs(np.mean(signal))
+    # The window gets the raw channel and conditions it block by block
+    assert captured["channels_data"][0][1] is signal
+    conditioning = captured["conditioning"]
+    assert conditioning["filter_settings"] == {"enabled": False}
+    statistics = compute_conditioned_statistics(signal, 100.0, conditioning)
+    conditioned_signal = apply_processing_pipeline(signal, 100.0, {"enabled": False})
+    assert statistics["overall"]["mean"] == pytest.approx(np.mean(conditioned_signal), abs=1e-9)
+    assert abs(statistics["overall"]["mean"]) < abs(np.mean(signal))
     assert "Running Mean Not Removed" in captured["processing_note"]
     assert captured["processing_flags"]["running_mean_removed"] is False
     window.close()
+
+
+def test_report_statistics_stream_conditioned_blocks_from_hdf5(tmp_path):
+    h5py = pytest.importorskip("h5py")
+    rng = np.random.default_rng(7)
+    sample_rate = 500.0
+    signal = 2.0 + rng.standard_normal(40_000)
+    path = tmp_path / "flight.h5"
+    with h5py.File(path, "w") as f:
+        channel = f.create_group("flight_001/channels/accel_x")
+        channel.create_dataset("time", data=np.arange(signal.size) / sample_rate)
+        channel.create_dataset("data", data=signal)
+        channel.attrs["sample_rate"] = sample_rate
+
+    config = SimpleNamespace(statistics_config=_StatsConfig())
+    conditioning = {"filter_settings": {"enabled": False}, "remove_mean": False}
+    loaders = {}
+    flight_map = {"flight_001": str(path)}
+    try:
+        stats_dict = _stream_channel_statistics(
+            loaders, flight_map, "flight_001", "accel_x", 20.0, 60.0, config, conditioning
+        )
+        assert _stream_channel_statistics(
+            loaders, flight_map, "flight_002", "accel_x", 20.0, 60.0, config, conditioning
+        ) is None
+    finally:
+        for loader in loaders.values():
+            loader.close()
+
+    conditioned = apply_processing_pipeline(signal, sample_rate, {"enabled": False})
+    expected = compute_statistics(conditioned[10_000:30_000], sample_rate, _StatsConfig())
+    assert list(loaders) == [str(path)]
+    for key in ("mean", "std", "kurtosis"):
+        assert stats_dict["overall"][key] == pytest.approx(expected["overall"][key], abs=1e-3)
@@ -0,0 +1,76 @@
+"""
+Tests for peak-preserving time-history decimation.
+"""
+
+import numpy as np
+import pytest
+
+from spectral_edge.batch.powerpoint_output import _decimate_time_series
+from spectral_edge.utils.time_history_lod import (
+    MinMaxPyramid,
+    lttb_decimate,
+    minmax_decimate,
+)
+
+
+@pytest.fixture
+def spiky_signal():
+    rng = np.random.default_rng(7)
+    sample_rate = 1000.0
+    signal = 0.1 * rng.standard_normal(1_000_003)
+    signal[123_457] = 25.0
+    signal[654_321] = -30.0
+    time = np.arange(signal.size) / sample_rate
+    return time, signal, sample_rate
+
+
+def test_minmax_decimation_keeps_transients_that_striding_drops(spiky_signal):
+    time, signal, _ = spiky_signal
+    step = signal.size // 10000
+    assert signal[::step].max() < 1.0
+
+    t_dec, y_dec = minmax_decimate(time, signal, 10000)
+    assert y_dec.size <= 10000
+    assert np.all(np.diff(t_dec) > 0)
+    assert y_dec.max() == 25.0 and y_dec.min() == -30.0
+
+    t_ppt, y_ppt = _decimate_time_series(time, signal)
+    np.testing.assert_array_equal(y_ppt, y_dec)
+
+
+def test_lttb_keeps_endpoints_and_point_budget(spiky_signal):
+    time, signal, _ = spiky_signal
+    t_dec, y_dec = lttb_decimate(time[:50_000], signal[:50_000], 500)
+    assert y_dec.size == 500
+    assert t_dec[0] == time[0] and t_dec[-1] == time[49_999]
+    assert np.all(np.diff(t_dec) > 0)
+
+
+@pytest.mark.parametrize("window", [(None, None), (100.0, 900.0), (123.0, 124.5), (654.3, 654.33)])
+def test_pyramid_view_matches_window_extrema(spiky_signal, window):
+    time, signal, _ = spiky_signal
+    pyramid = MinMaxPyramid(signal, time=time)
+    start, end = window
+    t_view, y_view = pyramid.view(start, end, max_points=2000)
+
+    lo = 0 if start is None else np.searchsorted(time, start)
+    hi = signal.size if end is None else np.searchsorted(time, end, side="right")
+    assert y_view.size <= 2000 + 4
+    assert y_view.max() >= signal[lo:hi].max()
+    assert y_view.min() <= signal[lo:hi].min()
+    # Every point is a real sample at its real time
+    np.testing.assert_array_equal(y_view, signal[np.searchsorted(time, t_view)])
+
+
+def test_pyramid_reads_on_disk_datasets(tmp_path, spiky_signal):
+    h5py = pytest.importorskip("h5py")
+    time, signal, sample_rate = spiky_signal
+    in_memory = MinMaxPyramid(signal, time=time)
+    with h5py.File(tmp_path / "lod.h5", "w") as f:
+        dataset = f.create_dataset("data", data=signal, chunks=(65536,))
+        on_disk = MinMaxPyramid(dataset, sample_rate=sample_rate, block_samples=300_000)
+        for start, end in [(None, None), (600.0, 700.0), (654.3, 654.33)]:
+            t_mem, y_mem = in_memory.view(start, end, 3000)
+            t_disk, y_disk = on_disk.view(start, end, 3000)
+            np.testing.assert_allclose(t_disk, t_mem)
+            np.testing.assert_array_equal(y_disk, y_mem)